@@ -0,0 +1,431 @@
+#!/usr/bin/env python3
+"""
+Agent Monitor — micro-benchmarks for the server hot paths.
+
+Each benchmark runs against a throwaway OPENCLAW_DIR/RUN_HISTORY_DB in a temp
+directory, so it never touches real data.
+
+Usage:
+  python3 bench.py ingest [--runs 20000] [--batch 1000] [--gzip]
+  python3 bench.py sanitize [--strings 20000] [--secret-rate 0.05] [--rules sanitize_rules.json]
+  python3 bench.py load [--tabs 1,2,4,8,16,32,64] [--duration 30] [--interval 10] [--engine http]
+"""
+
+import argparse
+import gzip
+import http.client
+import json
+import os
+import random
+import re
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from datetime import date
+from pathlib import Path
+from urllib.parse import urlencode, urlparse
+
+_TMP = tempfile.TemporaryDirectory(prefix="agent-monitor-bench-")
+os.environ["OPENCLAW_DIR"] = _TMP.name
+os.environ["RUN_HISTORY_DB"] = str(Path(_TMP.name) / "run_history.db")
+os.environ.setdefault("RUN_HISTORY_RETENTION_DAYS", "unlimited")
+
+sys.path.insert(0, str(Path(__file__).parent))
+import server  # noqa: E402
+
+AGENTS = ["main", "coder", "research", "ops", "writer", "qa"]
+MODELS = ["claude-sonnet", "claude-opus", "gpt-5", "local-llama"]
+OUTCOMES = ["ok", "ok", "ok", "ok", "error", "timeout"]
+
+
+def synthetic_run(i: int, now_ms: int, span_days: int = 30) -> dict:
+    """A runs.json-shaped entry with realistic field variety."""
+    rng = random.Random(i)
+    agent = rng.choice(AGENTS)
+    started = now_ms - rng.randint(0, span_days * 24 * 60 * 60 * 1000)
+    running = rng.random() < 0.02
+    run = {
+        "runId": f"bench-{i:08d}",
+        "label": f"{agent}-task-{i % 97}",
+        "childSessionKey": f"agent:{agent}:subagent:{i:08d}",
+        "model": rng.choice(MODELS),
+        "task": f"Investigate issue #{i % 500} and summarise the findings. " * rng.randint(1, 20),
+        "createdAt": started,
+        "startedAt": started,
+        "runTimeoutSeconds": 900,
+    }
+    if not running:
+        run["endedAt"] = started + int(rng.lognormvariate(10.5, 1.2))
+        run["outcome"] = {"status": rng.choice(OUTCOMES)}
+        run["usage"] = {"inputTokens": rng.randint(500, 80000), "outputTokens": rng.randint(50, 8000)}
+    return run
+
+
+def ndjson_batch(runs, compress: bool) -> bytes:
+    body = "\n".join(json.dumps(r) for r in runs).encode()
+    return gzip.compress(body) if compress else body
+
+
+def bench_ingest(args):
+    now_ms = int(time.time() * 1000)
+    server.init_db()
+    runs = [synthetic_run(i, now_ms) for i in range(args.runs)]
+    batches = [ndjson_batch(runs[i : i + args.batch], args.gzip) for i in range(0, len(runs), args.batch)]
+    encoding = "gzip" if args.gzip else ""
+    wire_bytes = sum(len(b) for b in batches)
+
+    for label in ("insert", "re-upsert"):
+        started = time.perf_counter()
+        accepted = 0
+        for body in batches:
+            parsed, errors = server.parse_ingest_batch(body, encoding)
+            assert not errors, errors[:3]
+            accepted += server.ingest_runs(parsed)["accepted"]
+        elapsed = time.perf_counter() - started
+        print(
+            f"ingest/{label:<9} runs={accepted} batches={len(batches)} batch={args.batch} "
+            f"wire={wire_bytes / 1e6:.1f}MB elapsed={elapsed:.2f}s → {accepted / elapsed:,.0f} runs/s"
+        )
+
+
+WORDS = ("the agent read config files and ran the test suite before reporting results to main "
+         "function return value error retry timeout branch commit merge request review").split()
+KEYWORD_MENTIONS = ["the token budget", "primary key", "secret santa", "password reset flow", "Bearer of bad news"]
+
+
+def synthetic_text(rng: random.Random, secret_rate: float, keyword_rate: float = 0.0) -> str:
+    """A transcript-message-sized string. ``secret_rate`` of them embed a credential,
+    ``keyword_rate`` a harmless mention of a rule keyword that the prefilter lets through."""
+    text = " ".join(rng.choice(WORDS) for _ in range(rng.randint(20, 400)))
+    if rng.random() < keyword_rate:
+        text += " " + rng.choice(KEYWORD_MENTIONS)
+    if rng.random() < secret_rate:
+        token = "".join(rng.choice("abcdefghijklmnopqrstuvwxyz0123456789") for _ in range(40))
+        secret = rng.choice([
+            f"Authorization: Bearer {token}",
+            f"API_KEY={token}",
+            f"password: '{token}'",
+            f"eyJ{token}{token}.eyJ{token}.{token}",
+        ])
+        words = text.split(" ")
+        words.insert(rng.randint(0, len(words)), secret)
+        text = " ".join(words)
+    return text
+
+
+def legacy_sanitize(text: str) -> str:
+    """The uncompiled, unfiltered re.sub passes sanitize() used before the Sanitizer engine."""
+    text = re.sub(r"Bearer\s+[A-Za-z0-9\-_.]+", "Bearer [REDACTED]", text)
+    text = re.sub(
+        r"(api[_-]?key|secret|password|token)\s*[=:]\s*[\"']?[A-Za-z0-9\-_.]{20,}[\"']?",
+        r"\1=[REDACTED]",
+        text,
+        flags=re.IGNORECASE,
+    )
+    return re.sub(r"eyJ[A-Za-z0-9\-_]{50,}\.eyJ[A-Za-z0-9\-_]+\.[A-Za-z0-9\-_]+", "[JWT_REDACTED]", text)
+
+
+def bench_sanitize(args):
+    rng = random.Random(0)
+    corpus = [synthetic_text(rng, args.secret_rate, args.keyword_rate) for _ in range(args.strings)]
+    total_mb = sum(len(t) for t in corpus) / 1e6
+    sanitizer = server.Sanitizer(server.load_sanitize_rules(Path(args.rules))) if args.rules else server.SANITIZER
+    unfiltered = server.Sanitizer([{**rule, "keywords": []} for rule in sanitizer.rules])
+    candidates = [("legacy", legacy_sanitize), ("no-prefilter", unfiltered), ("prefiltered", sanitizer)]
+    skipped = sum(not sanitizer.might_match(t) for t in corpus)
+    print(
+        f"sanitize: {args.strings} strings, {total_mb:.1f}MB, {args.secret_rate:.0%} with secrets, "
+        f"{args.keyword_rate:.0%} with keyword mentions, {len(sanitizer.rules)} rules, prefilter skips {skipped / len(corpus):.0%}"
+    )
+    for label, fn in candidates:
+        best = None
+        for _ in range(args.repeat):
+            started = time.perf_counter()
+            for text in corpus:
+                fn(text)
+            elapsed = time.perf_counter() - started
+            best = elapsed if best is None else min(best, elapsed)
+        print(f"sanitize/{label:<12} {total_mb / best:7.1f} MB/s  {len(corpus) / best:>10,.0f} strings/s")
+    if not args.rules:
+        differing = sum(legacy_sanitize(t) != sanitizer(t) for t in corpus)
+        print(f"output differs from legacy on {differing} of {len(corpus)} strings")
+
+
+# Mirrors the constants and load() polling in src/App.tsx.
+RUNS_PAGE_SIZE = 250
+REPORT_MAX_POINTS = 180
+
+
+def dashboard_requests():
+    """The two requests a monitor tab issues on every refresh."""
+    today = date.today()
+    start = today.replace(day=1)
+    runs = {"limit": RUNS_PAGE_SIZE, "offset": 0, "taskMaxLen": 600, "format": "columnar"}
+    report = {
+        "days": 1,
+        "period": "daily",
+        "bucketCount": (today - start).days + 1,
+        "scope": "all",
+        "includeRunning": 1,
+        "includeStaleRunning": 1,
+        "startDate": start.isoformat(),
+        "endDate": today.isoformat(),
+        "tz": server.REPORT_TZ,
+        "maxPoints": REPORT_MAX_POINTS,
+        "format": "columnar",
+    }
+    return [("runs", "/api/runs?" + urlencode(runs)), ("dashboard", "/api/reports/dashboard?" + urlencode(report))]
+
+
+def process_cpu_seconds(pid):
+    """utime + stime of a local process from /proc, or None where that is unavailable."""
+    try:
+        fields = Path(f"/proc/{pid}/stat").read_text().rsplit(")", 1)[1].split()
+        return (int(fields[11]) + int(fields[12])) / os.sysconf("SC_CLK_TCK")
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+def percentile(sorted_values, q):
+    if not sorted_values:
+        return None
+    return sorted_values[min(len(sorted_values) - 1, int(q * len(sorted_values)))]
+
+
+class LoadLevel:
+    """N virtual tabs polling one server for a fixed duration."""
+
+    def __init__(self, base_url, tabs, args, run_ids):
+        self.url = urlparse(base_url)
+        self.tabs = tabs
+        self.args = args
+        self.run_ids = run_ids
+        self.requests = dashboard_requests()
+        self.latencies = {}
+        self.errors = {}
+        self.refreshes = 0
+        self.lock = threading.Lock()
+
+    def record(self, name, elapsed_ms, ok):
+        with self.lock:
+            self.latencies.setdefault(name, []).append(elapsed_ms)
+            if not ok:
+                self.errors[name] = self.errors.get(name, 0) + 1
+
+    def fetch(self, conn, name, path):
+        started = time.perf_counter()
+        ok = False
+        try:
+            conn.request("GET", path, headers={"Accept-Encoding": "gzip"})
+            res = conn.getresponse()
+            res.read()
+            ok = res.status < 400
+            if res.will_close:
+                conn.close()
+        except (OSError, http.client.HTTPException):
+            conn.close()
+        self.record(name, (time.perf_counter() - started) * 1000, ok)
+
+    def tab(self, seed, deadline):
+        """One tab: refresh every interval (setInterval), sometimes opening a run's details."""
+        rng = random.Random(seed)
+        conn = http.client.HTTPConnection(self.url.hostname, self.url.port, timeout=self.args.timeout)
+        tick = time.monotonic() + rng.uniform(0, self.args.interval)
+        while True:
+            time.sleep(max(0.0, tick - time.monotonic()))
+            if time.monotonic() >= deadline:
+                break
+            started = time.perf_counter()
+            for name, path in self.requests:
+                self.fetch(conn, name, path)
+            if self.run_ids and rng.random() < self.args.detail_rate:
+                self.fetch(conn, "detail", f"/api/runs/{rng.choice(self.run_ids)}")
+            self.record("refresh", (time.perf_counter() - started) * 1000, True)
+            with self.lock:
+                self.refreshes += 1
+            # A refresh that overruns the interval starts the next one immediately.
+            tick = max(tick + self.args.interval, time.monotonic())
+        conn.close()
+
+    def run(self, server_pid=None):
+        cpu_before = process_cpu_seconds(server_pid) if server_pid else None
+        started = time.monotonic()
+        deadline = started + self.args.duration
+        threads = [threading.Thread(target=self.tab, args=(i, deadline), daemon=True) for i in range(self.tabs)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        elapsed = time.monotonic() - started
+        cpu_after = process_cpu_seconds(server_pid) if server_pid else None
+
+        endpoints = {}
+        for name, values in sorted(self.latencies.items()):
+            values.sort()
+            endpoints[name] = {
+                "count": len(values),
+                "errors": self.errors.get(name, 0),
+                "p50": percentile(values, 0.50),
+                "p95": percentile(values, 0.95),
+                "p99": percentile(values, 0.99),
+            }
+        requests = sum(e["count"] for name, e in endpoints.items() if name != "refresh")
+        errors = sum(self.errors.values())
+        offered = self.tabs * self.args.duration / self.args.interval
+        return {
+            "tabs": self.tabs,
+            "elapsedS": round(elapsed, 2),
+            "requests": requests,
+            "reqPerS": round(requests / elapsed, 2),
+            "refreshes": self.refreshes,
+            "refreshRatio": round(self.refreshes / offered, 3) if offered else None,
+            "errorRate": round(errors / requests, 4) if requests else 0.0,
+            "serverCpuPct": round((cpu_after - cpu_before) / elapsed * 100, 1) if cpu_before is not None and cpu_after is not None else None,
+            "endpoints": endpoints,
+        }
+
+
+def saturation_reason(result, args):
+    """Why a level counts as saturated, or None while the server keeps up."""
+    if result["errorRate"] > args.max_error_rate:
+        return f"error rate {result['errorRate']:.1%}"
+    if result["refreshRatio"] is not None and result["refreshRatio"] < args.min_refresh_ratio:
+        return f"tabs completed only {result['refreshRatio']:.0%} of their refreshes"
+    p95 = result["endpoints"].get("refresh", {}).get("p95")
+    if p95 is not None and p95 > args.slo_ms:
+        return f"refresh p95 {p95:.0f}ms > {args.slo_ms:.0f}ms"
+    return None
+
+
+def free_port():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def start_server(args):
+    """Seed the throwaway DB with synthetic runs and serve it from a child server.py."""
+    now_ms = int(time.time() * 1000)
+    server.init_db()
+    runs = [synthetic_run(i, now_ms) for i in range(args.runs)]
+    for i in range(0, len(runs), 2000):
+        server.ingest_runs({r["runId"]: r for r in runs[i : i + 2000]})
+    port = free_port()
+    env = {**os.environ, "PORT": str(port), "SERVER_ENGINE": args.engine, "BACKUP_INTERVAL_HOURS": "0"}
+    proc = subprocess.Popen(
+        [sys.executable, str(Path(__file__).parent / "server.py")],
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    base_url = f"http://127.0.0.1:{port}"
+    for _ in range(200):
+        try:
+            conn = http.client.HTTPConnection("127.0.0.1", port, timeout=2)
+            conn.request("GET", "/api/ingest/progress")
+            if json.loads(conn.getresponse().read()).get("state") != "running":
+                return proc, base_url
+        except OSError:
+            pass
+        time.sleep(0.1)
+    proc.kill()
+    raise SystemExit("server did not come up")
+
+
+def bench_load(args):
+    proc = None
+    server_pid = args.server_pid
+    if args.url:
+        base_url = args.url.rstrip("/")
+    else:
+        proc, base_url = start_server(args)
+        server_pid = proc.pid
+    try:
+        url = urlparse(base_url)
+        conn = http.client.HTTPConnection(url.hostname, url.port, timeout=args.timeout)
+        conn.request("GET", "/api/runs?" + urlencode({"limit": 500, "fields": "runId"}))
+        run_ids = [item["runId"] for item in json.loads(conn.getresponse().read())["items"]]
+        conn.close()
+
+        print(
+            f"load: {base_url} interval={args.interval}s duration={args.duration}s "
+            f"detailRate={args.detail_rate} slo=p95<{args.slo_ms:.0f}ms"
+        )
+        results = []
+        saturated = None
+        for tabs in args.tabs:
+            result = LoadLevel(base_url, tabs, args, run_ids).run(server_pid)
+            results.append(result)
+            refresh = result["endpoints"].get("refresh", {})
+            cpu = f"{result['serverCpuPct']:.0f}%" if result["serverCpuPct"] is not None else "n/a"
+            print(
+                f"load/tabs={tabs:<4} req/s={result['reqPerS']:<7} refreshes={result['refreshRatio']:.0%} "
+                f"refresh p50={refresh.get('p50') or 0:.0f}ms p95={refresh.get('p95') or 0:.0f}ms "
+                f"p99={refresh.get('p99') or 0:.0f}ms errors={result['errorRate']:.1%} server_cpu={cpu}"
+            )
+            for name in ("runs", "dashboard", "detail"):
+                e = result["endpoints"].get(name)
+                if e:
+                    print(f"  {name:<10} n={e['count']:<6} p50={e['p50']:.0f}ms p95={e['p95']:.0f}ms p99={e['p99']:.0f}ms errors={e['errors']}")
+            reason = saturation_reason(result, args)
+            if reason:
+                saturated = {"tabs": tabs, "reason": reason}
+                break
+
+        if saturated:
+            good = [r["tabs"] for r in results if r["tabs"] < saturated["tabs"]]
+            print(f"saturated at {saturated['tabs']} tabs ({saturated['reason']}); last sustained level: {good[-1] if good else 'none'}")
+        else:
+            print(f"not saturated up to {args.tabs[-1]} tabs")
+        if args.json:
+            Path(args.json).write_text(json.dumps({"results": results, "saturated": saturated}, indent=2))
+    finally:
+        if proc:
+            proc.terminate()
+            proc.wait(timeout=10)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    sub = parser.add_subparsers(dest="bench", required=True)
+
+    p = sub.add_parser("ingest", help="POST /api/ingest decode + batched upsert throughput")
+    p.add_argument("--runs", type=int, default=20000)
+    p.add_argument("--batch", type=int, default=1000)
+    p.add_argument("--gzip", action="store_true")
+    p.set_defaults(func=bench_ingest)
+
+    p = sub.add_parser("sanitize", help="secret redaction throughput: legacy re.sub passes vs the prefiltered Sanitizer")
+    p.add_argument("--strings", type=int, default=20000)
+    p.add_argument("--secret-rate", type=float, default=0.05, help="share of strings that contain a credential")
+    p.add_argument("--keyword-rate", type=float, default=0.2, help="share of strings that mention a rule keyword harmlessly")
+    p.add_argument("--rules", help="benchmark a SANITIZE_RULES_FILE-style rules file instead of the configured rules")
+    p.add_argument("--repeat", type=int, default=3, help="timed passes per engine; the best one is reported")
+    p.set_defaults(func=bench_sanitize)
+
+    p = sub.add_parser("load", help="virtual dashboard tabs polling a server; finds the saturation point")
+    p.add_argument("--tabs", type=lambda v: [int(n) for n in v.split(",")], default=[1, 2, 4, 8, 16, 32, 64],
+                   help="comma-separated tab counts to step through (default: 1,2,4,8,16,32,64)")
+    p.add_argument("--duration", type=float, default=30, help="seconds per level (default: 30)")
+    p.add_argument("--interval", type=float, default=10, help="refresh interval per tab, as intervalSec (default: 10)")
+    p.add_argument("--detail-rate", type=float, default=0.1, help="chance a refresh also opens a run's details")
+    p.add_argument("--slo-ms", type=float, default=1000, help="refresh p95 above this counts as saturated")
+    p.add_argument("--min-refresh-ratio", type=float, default=0.9, help="completed/scheduled refreshes below this counts as saturated")
+    p.add_argument("--max-error-rate", type=float, default=0.01)
+    p.add_argument("--timeout", type=float, default=30, help="per-request timeout in seconds")
+    p.add_argument("--runs", type=int, default=20000, help="synthetic runs to seed (ignored with --url)")
+    p.add_argument("--engine", choices=("http", "async"), default="http", help="SERVER_ENGINE of the spawned server")
+    p.add_argument("--url", help="load an already running server instead of spawning one")
+    p.add_argument("--server-pid", type=int, help="with --url: pid of a local server, for CPU accounting")
+    p.add_argument("--json", help="also write per-level results to this file")
+    p.set_defaults(func=bench_load)
+
+    args = parser.parse_args()
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()
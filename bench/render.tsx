@@ -0,0 +1,108 @@
+// Render benchmark for LanesBoard: 10k runs, list + lanes, full replace vs keyed merge.
+// Run with `npm run bench:render` (opens /bench/render.html on the Vite dev server).
+import { Profiler, useState } from 'react'
+import { createRoot } from 'react-dom/client'
+import { flushSync } from 'react-dom'
+import '../src/styles.css'
+import { LanesBoard } from '../src/components/LanesBoard'
+import type { Run } from '../src/lib/types'
+import { mergeRuns } from '../src/lib/utils'
+
+const RUNS = 10_000
+const CHANGED_PER_REFRESH = 50
+const REFRESHES = 10
+const agents = ['main', 'coder', 'research', 'ops', 'writer', 'qa']
+
+function syntheticRuns(n: number, now = Date.now()): Run[] {
+  return Array.from({ length: n }, (_, i): Run => {
+    const startedAt = now - i * 45_000
+    const running = i < 20
+    return {
+      runId: `bench-${i}`,
+      label: `task-${i % 97}`,
+      agentId: agents[i % agents.length],
+      model: i % 3 ? 'claude-sonnet' : 'claude-opus',
+      status: running ? 'running' : i % 11 ? 'done' : 'failed',
+      startedAt,
+      endedAt: running ? undefined : startedAt + 30_000,
+      runtimeMs: running ? now - startedAt : 30_000,
+      task: `Investigate issue #${i % 500} and summarise the findings for the operator.`,
+      sessionKey: `agent:${agents[i % agents.length]}:subagent:${i}`,
+      totalTokens: 1000 + (i % 5000),
+      outcome: { status: running ? undefined : 'ok' },
+    }
+  })
+}
+
+// Simulates a poll: fresh objects for every run (as JSON.parse yields), a few actually changed.
+function refreshed(runs: Run[]): Run[] {
+  return runs.map((r, i) => ({ ...r, runtimeMs: i < CHANGED_PER_REFRESH ? r.runtimeMs + 5000 : r.runtimeMs }))
+}
+
+let commitMs = 0
+let setRunsExternal: (runs: Run[]) => void = () => {}
+let setModeExternal: (m: 'lanes' | 'list') => void = () => {}
+
+function Harness({ initial }: { initial: Run[] }) {
+  const [runs, setRuns] = useState(initial)
+  const [mode, setMode] = useState<'lanes' | 'list'>('list')
+  setRunsExternal = setRuns
+  setModeExternal = setMode
+  return (
+    <Profiler id="board" onRender={(_id, _phase, actual) => (commitMs += actual)}>
+      <LanesBoard runs={runs} laneMode={mode} onSelect={noop} />
+    </Profiler>
+  )
+}
+
+const noop = () => {}
+
+function measure(fn: () => void) {
+  commitMs = 0
+  const t0 = performance.now()
+  flushSync(fn)
+  return { wall: performance.now() - t0, commit: commitMs }
+}
+
+async function main() {
+  const out = document.getElementById('results')!
+  const log = (line: string) => {
+    out.textContent += line + '\n'
+    console.log(line)
+  }
+  const fmt = (label: string, r: { wall: number; commit: number }) =>
+    log(`${label.padEnd(34)} wall=${r.wall.toFixed(1).padStart(7)}ms  react=${r.commit.toFixed(1).padStart(7)}ms`)
+
+  const initial = syntheticRuns(RUNS)
+  const root = createRoot(document.getElementById('root')!)
+  log(`runs=${RUNS} changed/refresh=${CHANGED_PER_REFRESH} refreshes=${REFRESHES}`)
+
+  for (const mode of ['list', 'lanes'] as const) {
+    root.render(<></>)
+    await new Promise((r) => setTimeout(r, 50))
+    fmt(`${mode}: initial mount`, measure(() => root.render(<Harness initial={initial} />)))
+    if (mode === 'lanes') fmt(`${mode}: switch mode`, measure(() => setModeExternal('lanes')))
+
+    let current = initial
+    let replace = { wall: 0, commit: 0 }
+    for (let i = 0; i < REFRESHES; i++) {
+      const next = refreshed(current)
+      const r = measure(() => setRunsExternal(next))
+      replace = { wall: replace.wall + r.wall, commit: replace.commit + r.commit }
+      current = next
+    }
+    fmt(`${mode}: refresh (replace array) avg`, { wall: replace.wall / REFRESHES, commit: replace.commit / REFRESHES })
+
+    let merged = { wall: 0, commit: 0 }
+    for (let i = 0; i < REFRESHES; i++) {
+      const next = mergeRuns(current, refreshed(current))
+      const r = measure(() => setRunsExternal(next))
+      merged = { wall: merged.wall + r.wall, commit: merged.commit + r.commit }
+      current = next
+    }
+    fmt(`${mode}: refresh (keyed merge) avg`, { wall: merged.wall / REFRESHES, commit: merged.commit / REFRESHES })
+    log(`${mode}: DOM buttons rendered = ${document.querySelectorAll('#root button').length}`)
+  }
+}
+
+main()
@@ -14,29 +14,128 @@ Serves:
   - GET /api/agents    → all agent IDs configured
   - GET /api/runs      → paginated run history + live status
   - GET /api/runs/:id  → single run detail with transcript excerpts
+  - GET /api/runs/batch?ids=a,b → many run details in one request
+  - GET /api/lanes?perAgent=N → the N most recent runs for every agent
+  - GET /api/reports/percentiles → merged runtime/token quantile sketches
+  - GET /api/reports/tools → per-tool call counts, error rates and latency
+  - GET /api/reports/concurrency → overlapping-runs timeline / heatmap and peak parallelism
+  - GET /api/events?since=N → recent change events (e.g. runs flagged stale)
+  - GET /api/alerts    → firing and resolved alerts from the incremental alert rules
+  - GET /api/transcripts/stats → storage used by compressed transcript snapshots
+  - GET /api/tasks/stats → task prompt dedup ratio and bytes saved
+  - GET /api/export    → streamed NDJSON/CSV export (chunked transfer encoding)
+  - POST /api/ingest   → push a (gzip) NDJSON batch of runs.json entries
+  - GET /api/ingest/progress → progress of the background runs.json backfill
+  - GET /api/migrations → schema version and progress of the background data backfills
+  - GET /api/backup/status → last scheduled online backup (duration, size) and retained files
+
+Commands:
+  python3 server.py                 serve the dashboard
+  python3 server.py reindex [-h]    rebuild transcript-derived data (snapshots, tool calls, token fallbacks)
 
 Environment:
   OPENCLAW_DIR                  path to .openclaw directory (default: ~/.openclaw)
   PORT                          server port (default: 8787)
   RUN_HISTORY_DB                sqlite file path (default: OPENCLAW_DIR/subagents/run_history.db)
   RUN_HISTORY_RETENTION_DAYS    history retention in days (default: 90, 0/unlimited disables pruning)
+  PRUNE_CHECK_SECONDS           interval of the background retention prune (default: 3600)
+  INGEST_MAX_BYTES              max POST /api/ingest body size in bytes (default: 64 MiB)
+  INGEST_TOKEN                  shared secret POST /api/ingest requires as "Authorization: Bearer <token>" (unset disables push ingestion)
+  SERVER_ENGINE                 "http" (default, stdlib ThreadingHTTPServer) or "async" (asyncio, HTTP/1.1 keep-alive)
+  ASYNC_WORKERS                 thread pool size for blocking work in async mode (default: min(8, cpus + 4))
+  ASYNC_IDLE_TIMEOUT            keep-alive idle timeout in seconds for async mode (default: 15)
+  API_GZIP_MIN_BYTES            gzip JSON API responses at least this large (default: 1024)
+  API_GZIP_LEVEL                gzip level for JSON API responses, 0 disables (default: 6)
+  REPORT_TZ                     IANA zone for the precomputed day/week/month buckets (default: server local time)
+  REPORT_EXTRA_TZS              comma-separated extra IANA zones to precompute buckets for (tz= request param)
+  STATIC_CACHE_MAX_BYTES        static files up to this size are held in memory (default: 4 MiB)
+  STALE_MINUTES                 running runs without a heartbeat for this long are flagged stale (default: 15)
+  STALE_CHECK_SECONDS           interval of the background stale-run detector, 0 disables (default: 60)
+  TRANSCRIPT_SNAPSHOT_MAX_BYTES cap on a run's stored message list (JSON bytes before compression), 0 disables (default: 1 MiB)
+  TRANSCRIPT_SNAPSHOT_SECONDS   interval of the background transcript snapshotter (default: 30)
+  BACKFILL_CHUNK_RUNS           runs.json entries imported per committed chunk by the startup backfill (default: 2000)
+  BACKUP_DIR                    where online backups are written (default: <db dir>/backups)
+  BACKUP_INTERVAL_HOURS         hours between scheduled backups, 0 disables (default: 24)
+  BACKUP_KEEP                   number of compressed backups to keep (default: 7)
+  BACKUP_PAGES_PER_STEP         pages copied per backup step (default: 256)
+  BACKUP_STEP_SLEEP_MS          pause between backup steps in ms (default: 20)
+  SANITIZE_RULES_FILE           JSON list of extra/overriding secret-redaction rules (default: <db dir>/sanitize_rules.json)
+  ALERT_RULES_FILE              JSON list of alert rules (default: <db dir>/alert_rules.json, built-in rules if missing)
+  ALERT_WEBHOOK_URL             POST each alert transition as JSON to this URL
+  ALERT_COMMAND                 run this command with each alert transition as JSON on stdin
+  ALERT_CHECK_SECONDS           interval of the background alert pass that syncs runs.json and resolves alerts (default: 30)
+  MIGRATION_BATCH_ROWS          rows per committed batch of the background data backfills run after upgrades (default: 2000)
+  MIGRATION_BATCH_SLEEP_MS      pause between data backfill batches in ms (default: 10)
 """
 
+import argparse
+import asyncio
+import csv
+import email.parser
+import gzip
+import hashlib
+import heapq
+import hmac
+import http.client
+import io
 import json
+import math
+import mimetypes
 import os
+import queue
 import re
+import shlex
+import shutil
 import sqlite3
+import subprocess
+import sys
+import threading
 import time
-from datetime import datetime
-from http.server import HTTPServer, SimpleHTTPRequestHandler
+import urllib.request
+import zlib
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from contextlib import closing
+from datetime import datetime, timedelta
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
-from urllib.parse import parse_qs, urlparse
+from urllib.parse import parse_qs, unquote, urlparse
+from zoneinfo import ZoneInfo
 
 OPENCLAW_DIR = Path(os.environ.get("OPENCLAW_DIR", os.path.expanduser("~/.openclaw")))
 STATIC_DIR = Path(__file__).parent / "static"
 DB_PATH = Path(os.environ.get("RUN_HISTORY_DB", str(OPENCLAW_DIR / "subagents" / "run_history.db")))
 RETENTION_RAW = os.environ.get("RUN_HISTORY_RETENTION_DAYS", "90").strip().lower()
+PRUNE_CHECK_SECONDS = float(os.environ.get("PRUNE_CHECK_SECONDS", "3600"))
 BASE_PATH = (os.environ.get("BASE_PATH", "").strip() or "/agent-monitor").rstrip("/")
+INGEST_MAX_BYTES = int(os.environ.get("INGEST_MAX_BYTES", str(64 * 1024 * 1024)))
+INGEST_TOKEN = os.environ.get("INGEST_TOKEN", "").strip()
+SERVER_ENGINE = os.environ.get("SERVER_ENGINE", "http").strip().lower()
+ASYNC_WORKERS = int(os.environ.get("ASYNC_WORKERS", str(min(8, (os.cpu_count() or 1) + 4))))
+ASYNC_IDLE_TIMEOUT = float(os.environ.get("ASYNC_IDLE_TIMEOUT", "15"))
+API_GZIP_MIN_BYTES = int(os.environ.get("API_GZIP_MIN_BYTES", "1024"))
+API_GZIP_LEVEL = int(os.environ.get("API_GZIP_LEVEL", "6"))
+REPORT_TZ = os.environ.get("REPORT_TZ", "").strip() or "local"
+REPORT_EXTRA_TZS = [t.strip() for t in os.environ.get("REPORT_EXTRA_TZS", "").split(",") if t.strip() and t.strip() != REPORT_TZ]
+STATIC_CACHE_MAX_BYTES = int(os.environ.get("STATIC_CACHE_MAX_BYTES", str(4 * 1024 * 1024)))
+STALE_MINUTES = max(1, int(os.environ.get("STALE_MINUTES", "15")))
+STALE_CHECK_SECONDS = float(os.environ.get("STALE_CHECK_SECONDS", "60"))
+TRANSCRIPT_SNAPSHOT_MAX_BYTES = int(os.environ.get("TRANSCRIPT_SNAPSHOT_MAX_BYTES", str(1024 * 1024)))
+TRANSCRIPT_SNAPSHOT_SECONDS = float(os.environ.get("TRANSCRIPT_SNAPSHOT_SECONDS", "30"))
+BACKFILL_CHUNK_RUNS = max(1, int(os.environ.get("BACKFILL_CHUNK_RUNS", "2000")))
+BACKUP_DIR = Path(os.environ.get("BACKUP_DIR", str(DB_PATH.parent / "backups")))
+BACKUP_INTERVAL_HOURS = float(os.environ.get("BACKUP_INTERVAL_HOURS", "24"))
+BACKUP_KEEP = max(1, int(os.environ.get("BACKUP_KEEP", "7")))
+BACKUP_PAGES_PER_STEP = max(1, int(os.environ.get("BACKUP_PAGES_PER_STEP", "256")))
+BACKUP_STEP_SLEEP_MS = max(0.0, float(os.environ.get("BACKUP_STEP_SLEEP_MS", "20")))
+SANITIZE_RULES_FILE = Path(os.environ.get("SANITIZE_RULES_FILE", str(DB_PATH.parent / "sanitize_rules.json")))
+ALERT_RULES_FILE = Path(os.environ.get("ALERT_RULES_FILE", str(DB_PATH.parent / "alert_rules.json")))
+ALERT_WEBHOOK_URL = os.environ.get("ALERT_WEBHOOK_URL", "").strip()
+ALERT_COMMAND = os.environ.get("ALERT_COMMAND", "").strip()
+ALERT_CHECK_SECONDS = float(os.environ.get("ALERT_CHECK_SECONDS", "30"))
+MIGRATION_BATCH_ROWS = max(1, int(os.environ.get("MIGRATION_BATCH_ROWS", "2000")))
+MIGRATION_BATCH_SLEEP_MS = max(0.0, float(os.environ.get("MIGRATION_BATCH_SLEEP_MS", "10")))
 
 
 def parse_retention_days(raw: str):
@@ -51,19 +150,151 @@ def parse_retention_days(raw: str):
 
 RETENTION_DAYS = parse_retention_days(RETENTION_RAW)
 _SESSION_TOKENS_CACHE = {}
+_TRANSCRIPT_CACHE = {}
+_TRANSCRIPT_CACHE_LOCK = threading.Lock()
+_TASK_HASHES = set()
+_SYNC_LOCK = threading.Lock()
+_SCHEMA_LOCK = threading.Lock()
+_schema_ready = False
+_MIGRATIONS = {}
+_MIGRATIONS_LOCK = threading.Lock()
+_synced_signature = None
+_max_run_span_ms = 0
+_run_span_scanned = False
+_RUN_SPAN_LOCK = threading.Lock()
+_stale_detector_running = False
+_BACKFILL = {"state": "idle", "total": 0, "done": 0, "resumedFrom": 0, "startedAt": None, "finishedAt": None, "error": None}
+_BACKFILL_LOCK = threading.Lock()
+_BACKUP = {"state": "idle", "startedAt": None, "finishedAt": None, "durationMs": None, "dbBytes": None, "sizeBytes": None, "path": None, "steps": 0, "restarts": 0, "error": None}
+_BACKUP_LOCK = threading.Lock()
+_EVENTS = deque(maxlen=500)
+_EVENT_LOCK = threading.Lock()
+_event_seq = 0
+ALERTS = None
+_ALERT_OUTBOX = queue.Queue(maxsize=1000)
+
+
+def emit_event(kind: str, **payload):
+    """Record a change event in the in-memory feed served by /api/events."""
+    global _event_seq
+    with _EVENT_LOCK:
+        _event_seq += 1
+        event = {"seq": _event_seq, "type": kind, "at": int(time.time() * 1000), **payload}
+        _EVENTS.append(event)
+    return event
+
+
+def recent_events(since=0, limit=200):
+    with _EVENT_LOCK:
+        items = [e for e in _EVENTS if e["seq"] > since][:limit]
+        return {"items": items, "latest": _event_seq}
+
+
+DEFAULT_SANITIZE_RULES = [
+    {"name": "bearer", "pattern": r"Bearer\s+[A-Za-z0-9\-_.]+", "replace": "Bearer [REDACTED]", "keywords": ["Bearer"]},
+    {
+        "name": "credential",
+        "pattern": r"(api[_-]?key|secret|password|token)\s*[=:]\s*[\"']?[A-Za-z0-9\-_.]{20,}[\"']?",
+        "replace": r"\1=[REDACTED]",
+        "ignoreCase": True,
+        "keywords": ["key", "secret", "password", "token"],
+    },
+    {"name": "jwt", "pattern": r"eyJ[A-Za-z0-9\-_]{50,}\.eyJ[A-Za-z0-9\-_]+\.[A-Za-z0-9\-_]+", "replace": "[JWT_REDACTED]", "keywords": ["eyJ"]},
+]
+
+
+class Sanitizer:
+    """Redacts secrets with precompiled rules, each gated by a substring prefilter.
+
+    A rule only runs its regex when the text contains one of its ``keywords``
+    (plain ``in`` checks, against a lowercased copy for ``ignoreCase`` rules), so
+    text without any ``Bearer``/``eyJ``/credential keyword is returned untouched
+    without a regex scan. Rules without keywords always run. Rules apply in order.
+    """
+
+    def __init__(self, rules):
+        self.rules = []
+        for rule in rules:
+            flags = re.IGNORECASE if rule.get("ignoreCase") else 0
+            keywords = [k.lower() if flags else k for k in rule.get("keywords") or []]
+            self.rules.append({**rule, "compiled": re.compile(rule["pattern"], flags), "keywords": keywords})
+        self.fingerprint = hashlib.blake2b(
+            json.dumps([{k: rule.get(k) for k in ("pattern", "replace", "ignoreCase")} for rule in rules]).encode(),
+            digest_size=8,
+        ).hexdigest()
+
+    def __call__(self, text: str) -> str:
+        if not text:
+            return text
+        lowered = None
+        for rule in self.rules:
+            keywords = rule["keywords"]
+            if keywords:
+                if rule.get("ignoreCase"):
+                    if lowered is None:
+                        lowered = text.lower()
+                    haystack = lowered
+                else:
+                    haystack = text
+                if not any(k in haystack for k in keywords):
+                    continue
+            redacted = rule["compiled"].sub(rule["replace"], text)
+            if redacted != text:
+                text = redacted
+                lowered = None
+        return text
+
+    def might_match(self, text: str) -> bool:
+        """Whether any rule's prefilter lets ``text`` through to its regex."""
+        lowered = text.lower()
+        return any(
+            not rule["keywords"] or any(k in (lowered if rule.get("ignoreCase") else text) for k in rule["keywords"])
+            for rule in self.rules
+        )
+
+
+def load_sanitize_rules(path: Path = SANITIZE_RULES_FILE):
+    """Built-in rules, overridden/extended by SANITIZE_RULES_FILE (a JSON list) when it exists.
+
+    A file rule replaces the built-in of the same name; ``"enabled": false`` drops it.
+    """
+    rules = {rule["name"]: rule for rule in DEFAULT_SANITIZE_RULES}
+    if path.exists():
+        extra = json.loads(path.read_text())
+        if not isinstance(extra, list):
+            raise ValueError(f"{path}: expected a JSON list of rules")
+        for rule in extra:
+            if not isinstance(rule, dict) or not rule.get("name"):
+                raise ValueError(f"{path}: every rule needs a name")
+            if rule.get("enabled", True) is False:
+                rules.pop(rule["name"], None)
+                continue
+            if not isinstance(rule.get("pattern"), str) or not isinstance(rule.get("replace"), str):
+                raise ValueError(f"{path}: {rule['name']} needs string 'pattern' and 'replace'")
+            re.compile(rule["pattern"])
+            rules[rule["name"]] = rule
+    return list(rules.values())
+
+
+def build_sanitizer():
+    try:
+        return Sanitizer(load_sanitize_rules())
+    except (OSError, ValueError, re.error) as e:
+        print(f"invalid sanitize rules, using the built-in set: {e}")
+        return Sanitizer(DEFAULT_SANITIZE_RULES)
+
+
+SANITIZER = build_sanitizer()
 
 
 def sanitize(text: str) -> str:
     """Strip potential secrets/tokens from text."""
-    text = re.sub(r"Bearer\s+[A-Za-z0-9\-_.]+", "Bearer [REDACTED]", text)
-    text = re.sub(
-        r"(api[_-]?key|secret|password|token)\s*[=:]\s*[\"']?[A-Za-z0-9\-_.]{20,}[\"']?",
-        r"\1=[REDACTED]",
-        text,
-        flags=re.IGNORECASE,
-    )
-    text = re.sub(r"eyJ[A-Za-z0-9\-_]{50,}\.eyJ[A-Za-z0-9\-_]+\.[A-Za-z0-9\-_]+", "[JWT_REDACTED]", text)
-    return text
+    return SANITIZER(text)
+
+
+def task_hash(text: str) -> str:
+    """Content address of a raw (pre-sanitize) task prompt in task_text."""
+    return hashlib.blake2b(text.encode(), digest_size=16).hexdigest()
 
 
 def get_configured_agents():
@@ -114,47 +345,465 @@ def normalize_request_path(path: str) -> str:
     return path
 
 
+_TZ_CACHE = {}
+
+
+def get_tz(name):
+    """Resolve a bucket timezone name; "local" means the server's local time (None)."""
+    if not name or name == "local":
+        return None
+    if name not in _TZ_CACHE:
+        _TZ_CACHE[name] = ZoneInfo(name)
+    return _TZ_CACHE[name]
+
+
+def bucket_keys(ms, tz_name=REPORT_TZ):
+    """Calendar bucket keys (day, week, month) of an epoch-ms timestamp in ``tz_name``."""
+    dt = datetime.fromtimestamp((ms or 0) / 1000, get_tz(tz_name))
+    return dt.strftime("%Y-%m-%d"), dt.strftime("%Y-W%W"), dt.strftime("%Y-%m")
+
+
+def extra_tz_buckets_ready():
+    """True once run_bucket holds every run for the configured REPORT_EXTRA_TZS."""
+    state = _MIGRATIONS.get("extra_tz_buckets", {}).get("state")
+    if state is not None:
+        return state == "done"
+    # Nothing was scheduled this process (or backfills are not run here): trust the marker.
+    with closing(sqlite3.connect(DB_PATH)) as conn:
+        return not extra_tz_buckets_pending(conn)
+
+
+def resolve_report_tz(requested):
+    """Pick the precomputed bucket set for a requested tz, falling back to REPORT_TZ."""
+    # Until the extra-zone buckets are backfilled, a partial set would under-count.
+    if requested and requested in REPORT_EXTRA_TZS and extra_tz_buckets_ready():
+        return requested
+    return REPORT_TZ
+
+
+def bucket_source(tz_name):
+    """FROM clause and bucket column names for grouping by the ``tz_name`` bucket set."""
+    if tz_name == REPORT_TZ:
+        return {
+            "from_sql": "run_history",
+            "from_args": [],
+            "day": "bucket_day",
+            "week": "bucket_week",
+            "month": "bucket_month",
+        }
+    return {
+        "from_sql": "run_history JOIN run_bucket b ON b.run_id = run_history.run_id AND b.tz = ?",
+        "from_args": [tz_name],
+        "day": "b.day",
+        "week": "b.week",
+        "month": "b.month",
+    }
+
+
+def backfill_bucket_keys(conn: sqlite3.Connection, cursor: dict, limit: int):
+    """Fill missing bucket columns; after a REPORT_TZ change every row is recomputed."""
+    full = conn.execute("SELECT value FROM meta WHERE key = 'bucket_tz'").fetchone() != (REPORT_TZ,)
+    rows = conn.execute(
+        f"""
+        SELECT run_id, started_at FROM run_history
+        WHERE run_id > ? AND started_at IS NOT NULL {"" if full else "AND bucket_day IS NULL"}
+        ORDER BY run_id LIMIT ?
+        """,
+        (cursor.get("after", ""), limit),
+    ).fetchall()
+    if not rows:
+        conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('bucket_tz', ?)", (REPORT_TZ,))
+        return None, 0
+    conn.executemany(
+        "UPDATE run_history SET bucket_day = ?, bucket_week = ?, bucket_month = ? WHERE run_id = ?",
+        [(*bucket_keys(started), run_id) for run_id, started in rows],
+    )
+    return {"after": rows[-1][0]}, len(rows)
+
+
+def bucket_keys_pending(conn: sqlite3.Connection):
+    return (
+        conn.execute("SELECT value FROM meta WHERE key = 'bucket_tz'").fetchone() != (REPORT_TZ,)
+        or conn.execute("SELECT 1 FROM run_history WHERE bucket_day IS NULL AND started_at IS NOT NULL LIMIT 1").fetchone() is not None
+    )
+
+
+def backfill_extra_tz_buckets(conn: sqlite3.Connection, cursor: dict, limit: int):
+    """Fill run_bucket for REPORT_EXTRA_TZS, after dropping rows of zones no longer configured."""
+    dropped = conn.execute(
+        "DELETE FROM run_bucket WHERE rowid IN (SELECT rowid FROM run_bucket WHERE tz NOT IN (%s) LIMIT ?)"
+        % ",".join("?" * len(REPORT_EXTRA_TZS)),
+        (*REPORT_EXTRA_TZS, limit),
+    ).rowcount
+    if dropped:
+        return cursor, dropped
+    rows = []
+    if REPORT_EXTRA_TZS:
+        rows = conn.execute(
+            "SELECT run_id, started_at FROM run_history WHERE run_id > ? AND started_at IS NOT NULL ORDER BY run_id LIMIT ?",
+            (cursor.get("after", ""), limit),
+        ).fetchall()
+    if not rows:
+        conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('bucket_extra_tzs', ?)", (",".join(REPORT_EXTRA_TZS),))
+        return None, 0
+    for tz_name in REPORT_EXTRA_TZS:
+        conn.executemany(
+            "INSERT OR IGNORE INTO run_bucket (tz, run_id, day, week, month) VALUES (?, ?, ?, ?, ?)",
+            [(tz_name, run_id, *bucket_keys(started, tz_name)) for run_id, started in rows],
+        )
+    return {"after": rows[-1][0]}, len(rows)
+
+
+def extra_tz_buckets_pending(conn: sqlite3.Connection):
+    return conn.execute("SELECT value FROM meta WHERE key = 'bucket_extra_tzs'").fetchone() != (",".join(REPORT_EXTRA_TZS),)
+
+
+def _add_column(conn: sqlite3.Connection, table: str, column: str, decl: str):
+    """ALTER TABLE ADD COLUMN, unless a database from before schema versioning already has it."""
+    if column not in {r[1] for r in conn.execute(f"PRAGMA table_info({table})")}:
+        conn.execute(f"ALTER TABLE {table} ADD COLUMN {column} {decl}")
+
+
+def migrate_1_run_history(conn: sqlite3.Connection):
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS run_history (
+            run_id TEXT PRIMARY KEY,
+            label TEXT,
+            agent_id TEXT,
+            model TEXT,
+            status TEXT,
+            started_at INTEGER,
+            ended_at INTEGER,
+            runtime_ms INTEGER,
+            timeout_seconds INTEGER,
+            task TEXT,
+            session_key TEXT,
+            outcome_status TEXT,
+            outcome_json TEXT,
+            raw_json TEXT,
+            input_tokens INTEGER,
+            output_tokens INTEGER,
+            total_tokens INTEGER,
+            last_heartbeat_at INTEGER,
+            created_at INTEGER,
+            updated_at INTEGER
+        )
+        """
+    )
+    for column in ("input_tokens", "output_tokens", "total_tokens", "last_heartbeat_at"):
+        _add_column(conn, "run_history", column, "INTEGER")
+    conn.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_run_history_started ON run_history(started_at DESC)")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_run_history_agent ON run_history(agent_id)")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_run_history_status ON run_history(status)")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_run_history_agent_started ON run_history(agent_id, started_at DESC)")
+
+
+def migrate_2_buckets(conn: sqlite3.Connection):
+    for column in ("bucket_day", "bucket_week", "bucket_month"):
+        _add_column(conn, "run_history", column, "TEXT")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_run_history_bucket_day ON run_history(bucket_day, agent_id)")
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS run_bucket (
+            tz TEXT NOT NULL,
+            run_id TEXT NOT NULL,
+            day TEXT NOT NULL,
+            week TEXT NOT NULL,
+            month TEXT NOT NULL,
+            PRIMARY KEY (tz, run_id)
+        )
+        """
+    )
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_run_bucket_day ON run_bucket(tz, day)")
+
+
+def migrate_3_sketches(conn: sqlite3.Connection):
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS run_sketch (
+            day TEXT NOT NULL,
+            agent_id TEXT NOT NULL,
+            model TEXT NOT NULL,
+            metric TEXT NOT NULL,
+            sketch TEXT NOT NULL,
+            PRIMARY KEY (day, agent_id, model, metric)
+        )
+        """
+    )
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS run_sketch_member (
+            run_id TEXT PRIMARY KEY,
+            day TEXT NOT NULL
+        )
+        """
+    )
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_run_sketch_member_day ON run_sketch_member(day)")
+
+
+def migrate_4_stale(conn: sqlite3.Connection):
+    _add_column(conn, "run_history", "stale_at", "INTEGER")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_run_history_stale ON run_history(stale_at) WHERE stale_at IS NOT NULL")
+
+
+def migrate_5_transcripts(conn: sqlite3.Connection):
+    # messages is a zlib-compressed JSON message list; NULL marks a finished run
+    # whose transcript was already gone when it was snapshotted.
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS run_transcript (
+            run_id TEXT PRIMARY KEY,
+            message_count INTEGER NOT NULL,
+            raw_bytes INTEGER NOT NULL,
+            stored_bytes INTEGER NOT NULL,
+            truncated INTEGER NOT NULL DEFAULT 0,
+            messages BLOB,
+            created_at INTEGER
+        )
+        """
+    )
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS tool_call (
+            run_id TEXT NOT NULL,
+            ordinal INTEGER NOT NULL,
+            agent_id TEXT,
+            tool TEXT NOT NULL,
+            call_id TEXT,
+            args_bytes INTEGER,
+            result_bytes INTEGER,
+            is_error INTEGER NOT NULL DEFAULT 0,
+            started_at INTEGER,
+            ended_at INTEGER,
+            duration_ms INTEGER,
+            PRIMARY KEY (run_id, ordinal)
+        )
+        """
+    )
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_tool_call_started ON tool_call(started_at, tool)")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_tool_call_agent ON tool_call(agent_id, started_at)")
+
+
+def migrate_6_alerts(conn: sqlite3.Connection):
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS alert (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            rule TEXT NOT NULL,
+            key TEXT NOT NULL,
+            type TEXT NOT NULL,
+            state TEXT NOT NULL,
+            value REAL,
+            threshold REAL,
+            message TEXT,
+            detail TEXT,
+            fired_at INTEGER NOT NULL,
+            resolved_at INTEGER
+        )
+        """
+    )
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_alert_open ON alert(rule, key) WHERE resolved_at IS NULL")
+
+
+def migrate_7_task_text(conn: sqlite3.Connection):
+    # Task prompts are stored once per distinct raw text; run_history.task is
+    # only read for rows the task_text backfill has not moved yet.
+    _add_column(conn, "run_history", "task_hash", "TEXT")
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS task_text (
+            hash TEXT PRIMARY KEY,
+            text TEXT NOT NULL,
+            raw_bytes INTEGER NOT NULL
+        )
+        """
+    )
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_run_history_task_hash ON run_history(task_hash) WHERE task_hash IS NOT NULL")
+
+
+def migrate_8_snapshot_at(conn: sqlite3.Connection):
+    # Finished runs still waiting for a transcript snapshot, so the snapshotter's
+    # steady-state tick reads a small index instead of anti-joining all history.
+    conn.execute("ALTER TABLE run_history ADD COLUMN snapshot_at INTEGER")
+    conn.execute(
+        """
+        CREATE INDEX idx_run_history_unsnapshotted ON run_history(ended_at DESC)
+        WHERE snapshot_at IS NULL AND status IN ('done','failed','timeout')
+        """
+    )
+
+
+# PRAGMA user_version is the number of entries applied. Append new migrations and
+# never edit applied ones; they should only change the schema (ALTER TABLE ADD
+# COLUMN is O(1)) and leave filling data to a DATA_BACKFILLS entry. Migrations 1-7
+# tolerate databases from before versioning, which already have some of their objects.
+SCHEMA_MIGRATIONS = [
+    migrate_1_run_history,
+    migrate_2_buckets,
+    migrate_3_sketches,
+    migrate_4_stale,
+    migrate_5_transcripts,
+    migrate_6_alerts,
+    migrate_7_task_text,
+    migrate_8_snapshot_at,
+]
+
+
 def init_db():
-    DB_PATH.parent.mkdir(parents=True, exist_ok=True)
-    with sqlite3.connect(DB_PATH) as conn:
+    """Apply pending SCHEMA_MIGRATIONS; a no-op after the first call in a process.
+
+    Each migration commits together with its user_version bump, so a crash
+    leaves the schema at a well-defined version.
+    """
+    global _schema_ready
+    if _schema_ready:
+        return
+    with _SCHEMA_LOCK:
+        if _schema_ready:
+            return
+        DB_PATH.parent.mkdir(parents=True, exist_ok=True)
+        with closing(sqlite3.connect(DB_PATH, isolation_level=None)) as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            version = conn.execute("PRAGMA user_version").fetchone()[0]
+            for target in range(version + 1, len(SCHEMA_MIGRATIONS) + 1):
+                conn.execute("BEGIN IMMEDIATE")
+                try:
+                    # Another process (e.g. reindex) may have migrated while we waited for the lock.
+                    if conn.execute("PRAGMA user_version").fetchone()[0] < target:
+                        SCHEMA_MIGRATIONS[target - 1](conn)
+                        conn.execute(f"PRAGMA user_version = {target}")
+                    conn.execute("COMMIT")
+                except BaseException:
+                    conn.execute("ROLLBACK")
+                    raise
+        _schema_ready = True
+
+
+def resanitize_stored_text(conn: sqlite3.Connection, cursor: dict, limit: int):
+    """Run the current sanitize rules over task_text, then the transcript snapshots.
+
+    The raw text is not kept, so this applies new or stricter rules on top of
+    the old output; it cannot bring back text an earlier rule redacted.
+    """
+    if cursor.get("phase", "prompts") == "prompts":
+        rows = conn.execute(
+            "SELECT hash, text FROM task_text WHERE hash > ? ORDER BY hash LIMIT ?", (cursor.get("after", ""), limit)
+        ).fetchall()
+        if not rows:
+            return {"phase": "snapshots"}, 0
+        conn.executemany(
+            "UPDATE task_text SET text = ? WHERE hash = ?",
+            [(safe, digest) for digest, text in rows if (safe := sanitize(text)) != text],
+        )
+        return {"phase": "prompts", "after": rows[-1][0]}, len(rows)
+
+    rows = conn.execute(
+        "SELECT run_id, messages FROM run_transcript WHERE run_id > ? AND messages IS NOT NULL ORDER BY run_id LIMIT ?",
+        (cursor.get("after", ""), max(1, limit // 4)),
+    ).fetchall()
+    if not rows:
+        conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('sanitize_rules', ?)", (SANITIZER.fingerprint,))
+        return None, 0
+    updates = []
+    for run_id, blob in rows:
+        messages = json.loads(zlib.decompress(blob))
+        changed = False
+        for message in messages:
+            fields = [(message, "text")] + [(call, k) for call in message.get("toolCalls") or [] for k in ("args", "argsPreview", "result", "resultPreview")]
+            for obj, key in fields:
+                if isinstance(obj.get(key), str):
+                    safe = sanitize(obj[key])
+                    changed |= safe != obj[key]
+                    obj[key] = safe
+        if changed:
+            raw = json.dumps(messages, ensure_ascii=False, separators=(",", ":")).encode()
+            compressed = zlib.compress(raw, 6)
+            updates.append((compressed, len(raw), len(compressed), run_id))
+    conn.executemany("UPDATE run_transcript SET messages = ?, raw_bytes = ?, stored_bytes = ? WHERE run_id = ?", updates)
+    return {"phase": "snapshots", "after": rows[-1][0]}, len(rows)
+
+
+def sanitize_rules_pending(conn: sqlite3.Connection):
+    # Data written before the fingerprint was recorded was sanitized with the built-in rules.
+    stored = conn.execute("SELECT value FROM meta WHERE key = 'sanitize_rules'").fetchone()
+    return (stored[0] if stored else Sanitizer(DEFAULT_SANITIZE_RULES).fingerprint) != SANITIZER.fingerprint
+
+
+def migrate_task_text(conn: sqlite3.Connection, cursor: dict, limit: int):
+    """Move inline task copies (run_history.task and raw_json) into task_text.
+
+    The raw prompt is recovered from raw_json so migrated rows share hashes with
+    freshly synced ones. The outcome is recorded under meta 'task_text'.
+    """
+    page_size = conn.execute("PRAGMA page_size").fetchone()[0]
+    free_pages = conn.execute("PRAGMA freelist_count").fetchone()[0]
+    cursor = {"freeBefore": free_pages, "moved": 0, **cursor}
+    rows = conn.execute(
+        """
+        SELECT run_id, task, raw_json FROM run_history
+        WHERE run_id > ? AND task_hash IS NULL AND task IS NOT NULL
+        ORDER BY run_id LIMIT ?
+        """,
+        (cursor.get("after", ""), limit),
+    ).fetchall()
+    if not rows:
+        freed = max(0, free_pages - cursor["freeBefore"]) * page_size
         conn.execute(
-            """
-            CREATE TABLE IF NOT EXISTS run_history (
-                run_id TEXT PRIMARY KEY,
-                label TEXT,
-                agent_id TEXT,
-                model TEXT,
-                status TEXT,
-                started_at INTEGER,
-                ended_at INTEGER,
-                runtime_ms INTEGER,
-                timeout_seconds INTEGER,
-                task TEXT,
-                session_key TEXT,
-                outcome_status TEXT,
-                outcome_json TEXT,
-                raw_json TEXT,
-                input_tokens INTEGER,
-                output_tokens INTEGER,
-                total_tokens INTEGER,
-                last_heartbeat_at INTEGER,
-                created_at INTEGER,
-                updated_at INTEGER
-            )
-            """
+            "INSERT OR REPLACE INTO meta (key, value) VALUES ('task_text', ?)",
+            (json.dumps({"migratedRuns": cursor["moved"], "freedBytes": freed, "at": int(time.time() * 1000)}),),
         )
-        conn.execute("CREATE INDEX IF NOT EXISTS idx_run_history_started ON run_history(started_at DESC)")
-        conn.execute("CREATE INDEX IF NOT EXISTS idx_run_history_agent ON run_history(agent_id)")
-        conn.execute("CREATE INDEX IF NOT EXISTS idx_run_history_status ON run_history(status)")
-        cols = {r[1] for r in conn.execute("PRAGMA table_info(run_history)").fetchall()}
-        if "input_tokens" not in cols:
-            conn.execute("ALTER TABLE run_history ADD COLUMN input_tokens INTEGER")
-        if "output_tokens" not in cols:
-            conn.execute("ALTER TABLE run_history ADD COLUMN output_tokens INTEGER")
-        if "total_tokens" not in cols:
-            conn.execute("ALTER TABLE run_history ADD COLUMN total_tokens INTEGER")
-        if "last_heartbeat_at" not in cols:
-            conn.execute("ALTER TABLE run_history ADD COLUMN last_heartbeat_at INTEGER")
+        if cursor["moved"]:
+            print(f"task_text: moved {cursor['moved']} inline task prompts, {freed / 1e6:.1f} MB freed (reclaim with VACUUM)")
+        return None, 0
+    texts = {}
+    updates = []
+    for run_id, task, raw_json in rows:
+        try:
+            raw = json.loads(raw_json or "{}")
+        except ValueError:
+            raw = {}
+        if not isinstance(raw, dict):
+            raw = {}
+        prompt = raw.pop("task", None)
+        if not isinstance(prompt, str):
+            prompt = task
+        digest = task_hash(prompt) if task else None
+        if digest:
+            texts.setdefault(digest, (task, len(prompt.encode())))
+        updates.append((digest, json.dumps(raw, default=str), run_id))
+    conn.executemany(
+        "INSERT OR IGNORE INTO task_text (hash, text, raw_bytes) VALUES (?, ?, ?)",
+        [(digest, text, raw_bytes) for digest, (text, raw_bytes) in texts.items()],
+    )
+    conn.executemany("UPDATE run_history SET task = NULL, task_hash = ?, raw_json = ? WHERE run_id = ?", updates)
+    return {**cursor, "after": rows[-1][0], "moved": cursor["moved"] + len(rows)}, len(rows)
+
+
+def task_text_pending(conn: sqlite3.Connection):
+    return conn.execute("SELECT 1 FROM meta WHERE key = 'task_text'").fetchone() is None
+
+
+def backfill_snapshot_marks(conn: sqlite3.Connection, cursor: dict, limit: int):
+    """Set run_history.snapshot_at for runs snapshotted before the column existed."""
+    rows = conn.execute(
+        "SELECT run_id, created_at FROM run_transcript WHERE run_id > ? ORDER BY run_id LIMIT ?",
+        (cursor.get("after", ""), limit),
+    ).fetchall()
+    if not rows:
+        conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('snapshot_marks', '1')")
+        return None, 0
+    now_ms = int(time.time() * 1000)
+    conn.executemany(
+        "UPDATE run_history SET snapshot_at = ? WHERE run_id = ? AND snapshot_at IS NULL",
+        [(created_at or now_ms, run_id) for run_id, created_at in rows],
+    )
+    return {"after": rows[-1][0]}, len(rows)
+
+
+def snapshot_marks_pending(conn: sqlite3.Connection):
+    return conn.execute("SELECT 1 FROM meta WHERE key = 'snapshot_marks'").fetchone() is None
 
 
 def as_int(value):
@@ -288,6 +937,34 @@ def get_tokens_from_session_index(session_key: str):
     return input_tokens, output_tokens, total_tokens
 
 
+def runs_file_signature():
+    """Size/mtime fingerprint of runs.json, or None when it does not exist."""
+    try:
+        st = (OPENCLAW_DIR / "subagents" / "runs.json").stat()
+    except OSError:
+        return None
+    return f"{st.st_size}:{st.st_mtime_ns}"
+
+
+def sync_signature():
+    """runs_file_signature plus the size/mtime of every agent's sessions.json.
+
+    The sessions files feed upsert_runs' token fallback, so a change to either
+    has to trigger a resync.
+    """
+    signature = runs_file_signature()
+    if signature is None:
+        return None
+    parts = [signature]
+    for sessions_file in sorted((OPENCLAW_DIR / "agents").glob("*/sessions/sessions.json")):
+        try:
+            st = sessions_file.stat()
+        except OSError:
+            continue
+        parts.append(f"{sessions_file.parent.parent.name}={st.st_size}:{st.st_mtime_ns}")
+    return "|".join(parts)
+
+
 def load_current_runs_file():
     runs_file = OPENCLAW_DIR / "subagents" / "runs.json"
     if not runs_file.exists():
@@ -305,92 +982,1267 @@ def prune_old_runs(conn: sqlite3.Connection):
         return
     now_ms = int(time.time() * 1000)
     cutoff = now_ms - RETENTION_DAYS * 24 * 60 * 60 * 1000
-    conn.execute(
+    deleted = conn.execute(
         "DELETE FROM run_history WHERE COALESCE(ended_at, started_at, created_at, 0) < ?",
         (cutoff,),
+    ).rowcount
+    if deleted:
+        conn.execute("DELETE FROM run_bucket WHERE run_id NOT IN (SELECT run_id FROM run_history)")
+        conn.execute("DELETE FROM run_transcript WHERE run_id NOT IN (SELECT run_id FROM run_history)")
+        conn.execute("DELETE FROM tool_call WHERE run_id NOT IN (SELECT run_id FROM run_history)")
+        conn.execute("DELETE FROM task_text WHERE hash NOT IN (SELECT task_hash FROM run_history WHERE task_hash IS NOT NULL)")
+        _TASK_HASHES.clear()
+    conn.execute("DELETE FROM alert WHERE resolved_at < ?", (cutoff,))
+    cutoff_day = sketch_day(cutoff)
+    conn.execute("DELETE FROM run_sketch WHERE day < ?", (cutoff_day,))
+    conn.execute("DELETE FROM run_sketch_member WHERE day < ?", (cutoff_day,))
+
+
+def prune_history():
+    """Apply the retention policy on its own timer, independent of runs.json changes."""
+    init_db()
+    with _SYNC_LOCK, sqlite3.connect(DB_PATH) as conn:
+        prune_old_runs(conn)
+        conn.commit()
+
+
+UPSERT_RUN_SQL = """
+    INSERT INTO run_history (
+        run_id, label, agent_id, model, status, started_at, ended_at,
+        runtime_ms, timeout_seconds, task, session_key, outcome_status,
+        outcome_json, raw_json, input_tokens, output_tokens, total_tokens, last_heartbeat_at,
+        created_at, updated_at, bucket_day, bucket_week, bucket_month, task_hash
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(run_id) DO UPDATE SET
+        label=excluded.label,
+        agent_id=excluded.agent_id,
+        model=excluded.model,
+        status=excluded.status,
+        started_at=excluded.started_at,
+        ended_at=excluded.ended_at,
+        runtime_ms=excluded.runtime_ms,
+        timeout_seconds=excluded.timeout_seconds,
+        task=excluded.task,
+        session_key=excluded.session_key,
+        outcome_status=excluded.outcome_status,
+        outcome_json=excluded.outcome_json,
+        raw_json=excluded.raw_json,
+        input_tokens=COALESCE(excluded.input_tokens, run_history.input_tokens),
+        output_tokens=COALESCE(excluded.output_tokens, run_history.output_tokens),
+        total_tokens=COALESCE(excluded.total_tokens, run_history.total_tokens),
+        last_heartbeat_at=excluded.last_heartbeat_at,
+        updated_at=excluded.updated_at,
+        bucket_day=excluded.bucket_day,
+        bucket_week=excluded.bucket_week,
+        bucket_month=excluded.bucket_month,
+        task_hash=excluded.task_hash,
+        stale_at=CASE WHEN excluded.status = 'running' THEN run_history.stale_at END
+"""
+
+
+def build_run_row(run_id: str, run: dict, now_ms: int):
+    """Map a runs.json entry onto a run_history row tuple (UPSERT_RUN_SQL order).
+
+    The task prompt is not stored inline: the row carries its task_hash and
+    upsert_runs writes the sanitized text to task_text.
+    """
+    status, outcome_status = compute_status(run)
+    started = run.get("startedAt", run.get("createdAt", 0))
+    ended = run.get("endedAt")
+    runtime_ms = (
+        (ended - started)
+        if ended and started
+        else (now_ms - started if started and status == "running" else 0)
+    )
+    outcome = run.get("outcome", {}) or {}
+    input_tokens, output_tokens, total_tokens = extract_token_usage(run, outcome)
+    session_key = run.get("childSessionKey", "")
+    if input_tokens is None and output_tokens is None and total_tokens is None:
+        input_tokens, output_tokens, total_tokens = get_tokens_from_session_index(session_key)
+    task = run.get("task") or ""
+
+    return (
+        run_id,
+        run.get("label", ""),
+        get_agent_id(session_key),
+        run.get("model", ""),
+        status,
+        started,
+        ended,
+        runtime_ms,
+        run.get("runTimeoutSeconds"),
+        None,
+        session_key,
+        outcome_status,
+        json.dumps(outcome, default=str),
+        json.dumps({k: v for k, v in run.items() if k != "task"}, default=str),
+        input_tokens,
+        output_tokens,
+        total_tokens,
+        as_int(run.get("lastHeartbeatAt") or run.get("last_heartbeat_at") or run.get("heartbeatAt")),
+        run.get("createdAt", started or now_ms),
+        now_ms,
+        *(bucket_keys(started) if started else (None, None, None)),
+        task_hash(task) if task else None,
+    )
+
+
+def upsert_runs(conn: sqlite3.Connection, runs: dict, now_ms: int | None = None):
+    """Idempotently upsert a {run_id: run} map. The caller owns the transaction.
+
+    Returns the alert transitions the runs raised; hand them to record_alerts
+    once the transaction is committed.
+    """
+    if now_ms is None:
+        now_ms = int(time.time() * 1000)
+    rows = [build_run_row(run_id, run, now_ms) for run_id, run in runs.items()]
+    store_task_texts(conn, {r[23]: runs[r[0]]["task"] for r in rows if r[23]})
+    conn.executemany(UPSERT_RUN_SQL, rows)
+    for tz_name in REPORT_EXTRA_TZS:
+        conn.executemany(
+            "INSERT OR REPLACE INTO run_bucket (tz, run_id, day, week, month) VALUES (?, ?, ?, ?, ?)",
+            [(tz_name, r[0], *bucket_keys(r[5], tz_name)) for r in rows if r[5]],
+        )
+    changes = [
+        {"run_id": r[0], "agent_id": r[2], "model": r[3], "status": r[4], "started_at": r[5], "ended_at": r[6],
+         "runtime_ms": r[7], "input_tokens": r[14], "output_tokens": r[15], "total_tokens": r[16]}
+        for r in rows
+    ]
+    note_run_spans(changes)
+    finished = update_run_sketches(conn, changes)
+    if ALERTS is None:
+        return []
+    return ALERTS.observe(finished, [r for r in changes if r["status"] == "running"], now_ms)
+
+
+def note_run_spans(changes):
+    """Raise the longest-finished-run bound query_concurrency uses to limit its scan."""
+    global _max_run_span_ms
+    spans = [
+        (r["ended_at"] or r["started_at"] + (r["runtime_ms"] or 0)) - r["started_at"]
+        for r in changes
+        if r["status"] != "running" and r["started_at"] is not None
+    ]
+    if spans:
+        with _RUN_SPAN_LOCK:
+            _max_run_span_ms = max(_max_run_span_ms, *spans)
+
+
+def max_run_span_ms(conn: sqlite3.Connection):
+    """Longest started-to-end span of any finished run, scanned once per process.
+
+    Later upserts raise it through note_run_spans, and pruning never lowers it,
+    so it stays an upper bound.
+    """
+    global _max_run_span_ms, _run_span_scanned
+    with _RUN_SPAN_LOCK:
+        if not _run_span_scanned:
+            scanned = conn.execute(
+                """
+                SELECT MAX(COALESCE(ended_at, started_at + COALESCE(runtime_ms, 0)) - started_at)
+                FROM run_history WHERE status != 'running' AND started_at IS NOT NULL
+                """
+            ).fetchone()[0]
+            _max_run_span_ms = max(_max_run_span_ms, scanned or 0)
+            _run_span_scanned = True
+        return _max_run_span_ms
+
+
+def record_alerts(conn: sqlite3.Connection, transitions):
+    """Persist and deliver the alert transitions upsert_runs returned, after its commit."""
+    if ALERTS is not None:
+        ALERTS.record(conn, transitions)
+
+
+def store_task_texts(conn: sqlite3.Connection, texts: dict):
+    """Sanitize and insert the ``{hash: raw_task}`` prompts task_text does not have yet.
+
+    Hashes already confirmed in the table are remembered per process, so
+    re-syncing an unchanged runs.json neither queries task_text nor runs sanitize.
+    """
+    unseen = [digest for digest in texts if digest not in _TASK_HASHES]
+    if not unseen:
+        return
+    known = set()
+    for i in range(0, len(unseen), 500):
+        chunk = unseen[i : i + 500]
+        placeholders = ",".join("?" * len(chunk))
+        known.update(r[0] for r in conn.execute(f"SELECT hash FROM task_text WHERE hash IN ({placeholders})", chunk))
+    conn.executemany(
+        "INSERT OR IGNORE INTO task_text (hash, text, raw_bytes) VALUES (?, ?, ?)",
+        [(digest, sanitize(texts[digest]), len(texts[digest].encode())) for digest in unseen if digest not in known],
+    )
+    # Only hashes read back from the table are cached: fresh inserts may still roll back.
+    if len(_TASK_HASHES) > 100_000:
+        _TASK_HASHES.clear()
+    _TASK_HASHES.update(known)
+
+
+def task_text_stats():
+    """Dedup ratio and bytes saved by storing task prompts once in task_text."""
+    with sqlite3.connect(DB_PATH) as conn:
+        runs, with_task, inline_bytes = conn.execute(
+            """
+            SELECT COUNT(*), COUNT(t.hash), SUM(LENGTH(CAST(t.text AS BLOB)) + t.raw_bytes)
+            FROM run_history r LEFT JOIN task_text t ON t.hash = r.task_hash
+            """
+        ).fetchone()
+        distinct, stored_bytes = conn.execute("SELECT COUNT(*), SUM(LENGTH(CAST(text AS BLOB))) FROM task_text").fetchone()
+        legacy = conn.execute("SELECT COUNT(*) FROM run_history WHERE task_hash IS NULL AND task IS NOT NULL").fetchone()[0]
+        page_size = conn.execute("PRAGMA page_size").fetchone()[0]
+        page_count = conn.execute("PRAGMA page_count").fetchone()[0]
+        free_pages = conn.execute("PRAGMA freelist_count").fetchone()[0]
+        migration = conn.execute("SELECT value FROM meta WHERE key = 'task_text'").fetchone()
+    return {
+        "runs": runs,
+        "runsWithTask": with_task,
+        "distinctTasks": distinct,
+        "dedupRatio": round(with_task / distinct, 2) if distinct else None,
+        "inlineBytes": inline_bytes or 0,
+        "storedBytes": stored_bytes or 0,
+        "savedBytes": (inline_bytes or 0) - (stored_bytes or 0),
+        "legacyInlineRuns": legacy,
+        "dbBytes": page_count * page_size,
+        "freeBytes": free_pages * page_size,
+        "migration": json.loads(migration[0]) if migration else None,
+    }
+
+
+SKETCH_ALPHA = 0.01
+SKETCH_METRICS = ("runtime_ms", "total_tokens")
+TERMINAL_STATUSES = ("done", "failed", "timeout")
+
+
+class DDSketch:
+    """Mergeable quantile sketch with relative-error guarantees (DDSketch).
+
+    Values land in logarithmic buckets of ratio ``gamma``, so any quantile is
+    answered within ``alpha`` relative error and two sketches merge by adding
+    bucket counts.
+    """
+
+    def __init__(self, alpha=SKETCH_ALPHA):
+        self.alpha = alpha
+        self.gamma = (1 + alpha) / (1 - alpha)
+        self._log_gamma = math.log(self.gamma)
+        self.bins = {}
+        self.zero_count = 0
+        self.count = 0
+        self.total = 0.0
+        self.min = None
+        self.max = None
+
+    def add(self, value, weight=1):
+        if value is None:
+            return
+        value = float(value)
+        if value < 1:
+            self.zero_count += weight
+        else:
+            key = math.ceil(math.log(value) / self._log_gamma)
+            self.bins[key] = self.bins.get(key, 0) + weight
+        self.count += weight
+        self.total += value * weight
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+
+    def merge(self, other: "DDSketch"):
+        for key, n in other.bins.items():
+            self.bins[key] = self.bins.get(key, 0) + n
+        self.zero_count += other.zero_count
+        self.count += other.count
+        self.total += other.total
+        if other.min is not None:
+            self.min = other.min if self.min is None else min(self.min, other.min)
+        if other.max is not None:
+            self.max = other.max if self.max is None else max(self.max, other.max)
+        return self
+
+    def quantile(self, q):
+        if not self.count:
+            return None
+        rank = q * (self.count - 1)
+        seen = self.zero_count
+        if rank < seen:
+            return 0.0
+        for key in sorted(self.bins):
+            seen += self.bins[key]
+            if seen > rank:
+                estimate = 2 * self.gamma**key / (self.gamma + 1)
+                return min(max(estimate, self.min), self.max)
+        return self.max
+
+    def to_json(self):
+        return json.dumps(
+            {"a": self.alpha, "n": self.count, "z": self.zero_count, "s": self.total, "lo": self.min, "hi": self.max, "b": self.bins},
+            separators=(",", ":"),
+        )
+
+    @classmethod
+    def from_json(cls, raw):
+        data = json.loads(raw)
+        sketch = cls(data.get("a", SKETCH_ALPHA))
+        sketch.bins = {int(k): int(v) for k, v in (data.get("b") or {}).items()}
+        sketch.zero_count = int(data.get("z") or 0)
+        sketch.count = int(data.get("n") or 0)
+        sketch.total = float(data.get("s") or 0)
+        sketch.min = data.get("lo")
+        sketch.max = data.get("hi")
+        return sketch
+
+
+def sketch_day(ms):
+    return bucket_keys(ms)[0]
+
+
+def _sketch_metric_values(run: dict):
+    total = run.get("total_tokens")
+    if total is None and (run.get("input_tokens") is not None or run.get("output_tokens") is not None):
+        total = (run.get("input_tokens") or 0) + (run.get("output_tokens") or 0)
+    return {"runtime_ms": run.get("runtime_ms"), "total_tokens": total}
+
+
+def update_run_sketches(conn: sqlite3.Connection, runs):
+    """Fold newly finished runs into the per day/agent/model sketches.
+
+    ``run_sketch_member`` records which runs were already counted, so re-syncing
+    or re-ingesting the same run never double-counts it. Returns the runs counted
+    for the first time.
+    """
+    finished = {r["run_id"]: r for r in runs if r["status"] in TERMINAL_STATUSES and r["started_at"]}
+    if not finished:
+        return []
+    ids = list(finished)
+    seen = set()
+    for i in range(0, len(ids), 500):
+        chunk = ids[i : i + 500]
+        placeholders = ",".join("?" * len(chunk))
+        seen.update(r[0] for r in conn.execute(f"SELECT run_id FROM run_sketch_member WHERE run_id IN ({placeholders})", chunk))
+    fresh = [finished[rid] for rid in ids if rid not in seen]
+    if not fresh:
+        return []
+
+    pending = {}
+    for run in fresh:
+        day = sketch_day(run["started_at"])
+        for metric, value in _sketch_metric_values(run).items():
+            if value is None:
+                continue
+            key = (day, run["agent_id"] or "unknown", run["model"] or "", metric)
+            pending.setdefault(key, DDSketch()).add(value)
+
+    for key, sketch in pending.items():
+        row = conn.execute(
+            "SELECT sketch FROM run_sketch WHERE day = ? AND agent_id = ? AND model = ? AND metric = ?", key
+        ).fetchone()
+        if row:
+            sketch = DDSketch.from_json(row[0]).merge(sketch)
+        conn.execute(
+            "INSERT OR REPLACE INTO run_sketch (day, agent_id, model, metric, sketch) VALUES (?, ?, ?, ?, ?)",
+            (*key, sketch.to_json()),
+        )
+    conn.executemany(
+        "INSERT OR IGNORE INTO run_sketch_member (run_id, day) VALUES (?, ?)",
+        [(run["run_id"], sketch_day(run["started_at"])) for run in fresh],
     )
+    return fresh
+
+
+def backfill_run_sketches(conn: sqlite3.Connection, cursor: dict, limit: int):
+    """Build sketches for history rows that predate the sketch tables."""
+    conn.row_factory = sqlite3.Row
+    try:
+        rows = conn.execute(
+            """
+            SELECT run_id, agent_id, model, status, started_at, runtime_ms,
+                   input_tokens, output_tokens, total_tokens
+            FROM run_history
+            WHERE run_id > ?
+            ORDER BY run_id
+            LIMIT ?
+            """,
+            (cursor.get("after", ""), limit),
+        ).fetchall()
+    finally:
+        conn.row_factory = None
+    if not rows:
+        return None, 0
+    update_run_sketches(conn, [dict(r) for r in rows])
+    return {"after": rows[-1]["run_id"]}, len(rows)
+
+
+def run_sketches_pending(conn: sqlite3.Connection):
+    return (
+        conn.execute("SELECT 1 FROM run_sketch_member LIMIT 1").fetchone() is None
+        and conn.execute("SELECT 1 FROM run_history WHERE status IN ('done', 'failed', 'timeout') LIMIT 1").fetchone() is not None
+    )
+
+
+def run_sketches_ready():
+    """True once run_sketch_member covers every finished run in history."""
+    state = _MIGRATIONS.get("run_sketches", {}).get("state")
+    if state is not None:
+        # A failed backfill is not retried before a restart; do not keep alerts off until then.
+        return state in ("done", "error")
+    with closing(sqlite3.connect(DB_PATH)) as conn:
+        resuming = conn.execute("SELECT 1 FROM meta WHERE key = 'backfill:run_sketches'").fetchone()
+        return not resuming and not run_sketches_pending(conn)
 
 
 def sync_runs_to_db():
+    """Upsert runs.json into the history DB when it or a sessions.json changed since the last sync.
+
+    While the startup backfill is importing it, requests serve what is already
+    in the DB instead.
+    """
+    global _synced_signature
+    if _BACKFILL["state"] == "running":
+        return
     init_db()
+    signature = sync_signature()
+    if signature is not None and signature == _synced_signature:
+        return
     runs = load_current_runs_file()
     if not runs:
         return
-    _SESSION_TOKENS_CACHE.clear()
+    with _SYNC_LOCK:
+        _SESSION_TOKENS_CACHE.clear()
+        with sqlite3.connect(DB_PATH) as conn:
+            alerts = upsert_runs(conn, runs)
+            conn.commit()
+            record_alerts(conn, alerts)
+        _synced_signature = signature
+
+
+def _set_backfill(**fields):
+    with _BACKFILL_LOCK:
+        _BACKFILL.update(fields)
+
+
+def backfill_progress():
+    with _BACKFILL_LOCK:
+        progress = dict(_BACKFILL)
     now_ms = int(time.time() * 1000)
+    started = progress["startedAt"]
+    elapsed = ((progress["finishedAt"] or now_ms) - started) if started else 0
+    imported = progress["done"] - progress["resumedFrom"]
+    rate = imported / (elapsed / 1000) if elapsed > 0 else 0
+    remaining = progress["total"] - progress["done"]
+    progress.update(
+        percent=round(100 * progress["done"] / progress["total"], 1) if progress["total"] else (100.0 if progress["state"] == "done" else 0.0),
+        elapsedMs=elapsed,
+        runsPerSec=round(rate, 1),
+        etaMs=int(remaining / rate * 1000) if progress["state"] == "running" and rate > 0 else None,
+    )
+    return progress
 
-    with sqlite3.connect(DB_PATH) as conn:
-        for run_id, run in runs.items():
-            status, outcome_status = compute_status(run)
-            started = run.get("startedAt", run.get("createdAt", 0))
-            ended = run.get("endedAt")
-            runtime_ms = (
-                (ended - started)
-                if ended and started
-                else (int(time.time() * 1000) - started if started and status == "running" else 0)
-            )
-            outcome = run.get("outcome", {}) or {}
-            input_tokens, output_tokens, total_tokens = extract_token_usage(run, outcome)
-            session_key = run.get("childSessionKey", "")
-            if input_tokens is None and output_tokens is None and total_tokens is None:
-                input_tokens, output_tokens, total_tokens = get_tokens_from_session_index(session_key)
 
-            conn.execute(
+def backfill_runs_file(chunk_runs=BACKFILL_CHUNK_RUNS):
+    """Import runs.json into the history DB in committed chunks, resumably.
+
+    The offset reached is checkpointed in ``meta`` together with the file's
+    size/mtime, so a restart against the same file continues where the last
+    one stopped; a changed file starts over (upserts are idempotent).
+    """
+    global _synced_signature
+    _set_backfill(state="running", startedAt=int(time.time() * 1000), finishedAt=None, error=None)
+    try:
+        signature = runs_file_signature()
+        synced = sync_signature()
+        items = list(load_current_runs_file().items())
+        with sqlite3.connect(DB_PATH) as conn:
+            row = conn.execute("SELECT value FROM meta WHERE key = 'backfill_checkpoint'").fetchone()
+        offset = 0
+        if row:
+            saved_signature, _, saved_offset = row[0].rpartition("|")
+            if saved_signature == signature:
+                offset = min(int(saved_offset), len(items))
+        _set_backfill(total=len(items), done=offset, resumedFrom=offset)
+
+        for start in range(offset, len(items), chunk_runs):
+            chunk = dict(items[start : start + chunk_runs])
+            with _SYNC_LOCK:
+                with sqlite3.connect(DB_PATH) as conn:
+                    alerts = upsert_runs(conn, chunk)
+                    conn.execute(
+                        "INSERT OR REPLACE INTO meta (key, value) VALUES ('backfill_checkpoint', ?)",
+                        (f"{signature}|{start + len(chunk)}",),
+                    )
+                    conn.commit()
+                    record_alerts(conn, alerts)
+            _set_backfill(done=start + len(chunk))
+
+        with _SYNC_LOCK:
+            with sqlite3.connect(DB_PATH) as conn:
+                prune_old_runs(conn)
+                conn.commit()
+            _synced_signature = synced
+        _set_backfill(state="done", finishedAt=int(time.time() * 1000))
+    except Exception as e:
+        print(f"backfill failed: {e}")
+        _set_backfill(state="error", error=str(e), finishedAt=int(time.time() * 1000))
+
+
+def start_backfill():
+    """Run backfill_runs_file on a daemon thread so the server can bind immediately."""
+    _set_backfill(state="running")
+    thread = threading.Thread(target=backfill_runs_file, name="runs-backfill", daemon=True)
+    thread.start()
+    return thread
+
+
+# Data backfills run after the schema migrations, in order, as (name, pending, step).
+# ``pending(conn)`` says whether there is work; ``step(conn, cursor, limit)`` processes
+# one batch and returns the next cursor (None when done) and the rows it touched.
+# Cursors are checkpointed in meta under ``backfill:<name>`` in the same transaction
+# as the batch, so an interrupted backfill resumes where it stopped.
+DATA_BACKFILLS = [
+    ("bucket_keys", bucket_keys_pending, backfill_bucket_keys),
+    ("extra_tz_buckets", extra_tz_buckets_pending, backfill_extra_tz_buckets),
+    ("run_sketches", run_sketches_pending, backfill_run_sketches),
+    ("task_text", task_text_pending, migrate_task_text),
+    ("resanitize", sanitize_rules_pending, resanitize_stored_text),
+    ("snapshot_marks", snapshot_marks_pending, backfill_snapshot_marks),
+]
+
+
+def _set_migration(name: str, **fields):
+    with _MIGRATIONS_LOCK:
+        _MIGRATIONS.setdefault(name, {}).update(fields)
+
+
+def run_data_backfills(batch_rows=MIGRATION_BATCH_ROWS, pause_ms=MIGRATION_BATCH_SLEEP_MS):
+    """Run pending DATA_BACKFILLS to completion in short, committed batches.
+
+    Each batch holds _SYNC_LOCK (and SQLite's write lock) only for itself, so
+    syncs, ingests and API reads interleave with a long backfill.
+    """
+    with closing(sqlite3.connect(DB_PATH)) as conn:
+        todo = []
+        for name, pending, step in DATA_BACKFILLS:
+            saved = conn.execute("SELECT value FROM meta WHERE key = ?", (f"backfill:{name}",)).fetchone()
+            if saved or pending(conn):
+                todo.append((name, step, json.loads(saved[0]) if saved else {"cursor": {}, "rows": 0}))
+                _set_migration(name, state="pending", rows=todo[-1][2]["rows"], resumed=bool(saved))
+    for name, step, checkpoint in todo:
+        cursor, rows = checkpoint["cursor"], checkpoint["rows"]
+        _set_migration(name, state="running", startedAt=int(time.time() * 1000))
+        try:
+            while cursor is not None:
+                with _SYNC_LOCK:
+                    with sqlite3.connect(DB_PATH) as conn:
+                        cursor, touched = step(conn, cursor, batch_rows)
+                        rows += touched
+                        if cursor is None:
+                            conn.execute("DELETE FROM meta WHERE key = ?", (f"backfill:{name}",))
+                        else:
+                            conn.execute(
+                                "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)",
+                                (f"backfill:{name}", json.dumps({"cursor": cursor, "rows": rows})),
+                            )
+                        conn.commit()
+                _set_migration(name, rows=rows)
+                if cursor is not None and pause_ms:
+                    time.sleep(pause_ms / 1000)
+        except Exception as e:
+            print(f"backfill {name} failed: {e}")
+            _set_migration(name, state="error", error=str(e), finishedAt=int(time.time() * 1000))
+            return
+        _set_migration(name, state="done", finishedAt=int(time.time() * 1000))
+
+
+def start_data_backfills():
+    """Run run_data_backfills on a daemon thread so the server can bind immediately."""
+    thread = threading.Thread(target=run_data_backfills, name="data-backfills", daemon=True)
+    thread.start()
+    return thread
+
+
+def migration_status():
+    with closing(sqlite3.connect(DB_PATH)) as conn:
+        version = conn.execute("PRAGMA user_version").fetchone()[0]
+    with _MIGRATIONS_LOCK:
+        backfills = {name: dict(state) for name, state in _MIGRATIONS.items()}
+    return {"schemaVersion": version, "latestVersion": len(SCHEMA_MIGRATIONS), "backfills": backfills}
+
+
+def detect_stale_runs(now_ms=None):
+    """Flag running runs whose heartbeat is older than STALE_MINUTES and clear recovered ones.
+
+    Emits a ``run.stale`` / ``run.recovered`` event per transition. Runs that finish
+    have their flag cleared by the upsert itself.
+    """
+    now_ms = now_ms or int(time.time() * 1000)
+    cutoff = now_ms - STALE_MINUTES * 60 * 1000
+    with _SYNC_LOCK:
+        with sqlite3.connect(DB_PATH) as conn:
+            stalled = conn.execute(
                 """
-                INSERT INTO run_history (
-                    run_id, label, agent_id, model, status, started_at, ended_at,
-                    runtime_ms, timeout_seconds, task, session_key, outcome_status,
-                    outcome_json, raw_json, input_tokens, output_tokens, total_tokens, last_heartbeat_at,
-                    created_at, updated_at
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                ON CONFLICT(run_id) DO UPDATE SET
-                    label=excluded.label,
-                    agent_id=excluded.agent_id,
-                    model=excluded.model,
-                    status=excluded.status,
-                    started_at=excluded.started_at,
-                    ended_at=excluded.ended_at,
-                    runtime_ms=excluded.runtime_ms,
-                    timeout_seconds=excluded.timeout_seconds,
-                    task=excluded.task,
-                    session_key=excluded.session_key,
-                    outcome_status=excluded.outcome_status,
-                    outcome_json=excluded.outcome_json,
-                    raw_json=excluded.raw_json,
-                    input_tokens=excluded.input_tokens,
-                    output_tokens=excluded.output_tokens,
-                    total_tokens=excluded.total_tokens,
-                    last_heartbeat_at=excluded.last_heartbeat_at,
-                    updated_at=excluded.updated_at
+                SELECT run_id, agent_id, COALESCE(last_heartbeat_at, started_at, 0)
+                FROM run_history
+                WHERE status = 'running' AND stale_at IS NULL AND COALESCE(last_heartbeat_at, started_at, 0) < ?
                 """,
-                (
-                    run_id,
-                    run.get("label", ""),
-                    get_agent_id(session_key),
-                    run.get("model", ""),
-                    status,
-                    started,
-                    ended,
-                    runtime_ms,
-                    run.get("runTimeoutSeconds"),
-                    sanitize(run.get("task", "")),
-                    session_key,
-                    outcome_status,
-                    json.dumps(outcome, default=str),
-                    json.dumps(run, default=str),
-                    input_tokens,
-                    output_tokens,
-                    total_tokens,
-                    as_int(run.get("lastHeartbeatAt") or run.get("last_heartbeat_at") or run.get("heartbeatAt")),
-                    run.get("createdAt", started or now_ms),
-                    now_ms,
-                ),
-            )
-        prune_old_runs(conn)
+                (cutoff,),
+            ).fetchall()
+            recovered = conn.execute(
+                """
+                SELECT run_id, agent_id, COALESCE(last_heartbeat_at, started_at, 0)
+                FROM run_history
+                WHERE stale_at IS NOT NULL AND (status != 'running' OR COALESCE(last_heartbeat_at, started_at, 0) >= ?)
+                """,
+                (cutoff,),
+            ).fetchall()
+            conn.executemany("UPDATE run_history SET stale_at = ? WHERE run_id = ?", [(now_ms, r[0]) for r in stalled])
+            conn.executemany("UPDATE run_history SET stale_at = NULL WHERE run_id = ?", [(r[0],) for r in recovered])
+            conn.commit()
+
+    for run_id, agent_id, heartbeat in stalled:
+        emit_event("run.stale", runId=run_id, agentId=agent_id, lastHeartbeatAt=heartbeat)
+    for run_id, agent_id, heartbeat in recovered:
+        emit_event("run.recovered", runId=run_id, agentId=agent_id, lastHeartbeatAt=heartbeat)
+    return {"stale": len(stalled), "recovered": len(recovered)}
+
+
+def run_periodically(name: str, interval: float, task):
+    """Call ``task()`` every ``interval`` seconds on a daemon thread (disabled when <= 0)."""
+    if interval <= 0:
+        return None
+
+    def loop():
+        while True:
+            try:
+                task()
+            except Exception as e:
+                # One bad pass (a malformed runs.json row, a failed backup write) must not end the loop.
+                print(f"{name} failed: {type(e).__name__}: {e}")
+            time.sleep(interval)
+
+    thread = threading.Thread(target=loop, name=name, daemon=True)
+    thread.start()
+    return thread
+
+
+def start_stale_detector(interval=STALE_CHECK_SECONDS):
+    """Run detect_stale_runs every ``interval`` seconds on a daemon thread."""
+    global _stale_detector_running
+    thread = run_periodically("stale-detector", interval, detect_stale_runs)
+    _stale_detector_running = thread is not None
+    return thread
+
+
+DEFAULT_ALERT_RULES = [
+    {"name": "agent-failure-rate", "type": "rate", "statuses": ["failed", "timeout"], "window": "1h", "threshold": 0.5, "minRuns": 5, "by": "agent"},
+    {"name": "timeout-storm", "type": "count", "statuses": ["timeout"], "window": "15m", "threshold": 5},
+    {"name": "slow-run", "type": "slow_run", "factor": 5, "minSamples": 20},
+]
+ALERT_BASELINE_DAYS = 7
+
+
+def parse_window_ms(raw) -> int:
+    """``90s``/``15m``/``1h``/``1d`` or plain seconds, in ms."""
+    match = re.fullmatch(r"\s*(\d+(?:\.\d+)?)\s*([smhd]?)\s*", str(raw))
+    if not match:
+        raise ValueError(f"invalid window: {raw!r}")
+    unit = {"": 1, "s": 1, "m": 60, "h": 3600, "d": 86400}[match.group(2)]
+    ms = int(float(match.group(1)) * unit * 1000)
+    if ms <= 0:
+        raise ValueError(f"window must be positive: {raw!r}")
+    return ms
+
+
+def validate_alert_rule(rule: dict) -> dict:
+    """Normalize one declarative rule, raising ValueError on anything malformed."""
+    if not isinstance(rule, dict) or not rule.get("name"):
+        raise ValueError("every rule needs a name")
+    kind = rule.get("type")
+    out = {"name": str(rule["name"]), "type": kind, "agent": rule.get("agent")}
+    if kind in ("rate", "count"):
+        statuses = rule.get("statuses") or (["failed", "timeout"] if kind == "rate" else ["timeout"])
+        unknown = set(statuses) - set(TERMINAL_STATUSES)
+        if unknown:
+            raise ValueError(f"{out['name']}: unknown statuses {sorted(unknown)}")
+        out.update(
+            statuses=list(statuses),
+            window=str(rule.get("window", "1h")),
+            windowMs=parse_window_ms(rule.get("window", "1h")),
+            threshold=float(rule["threshold"]),
+            minRuns=int(rule.get("minRuns", 1)),
+            by=rule.get("by"),
+        )
+        if out["by"] not in (None, "agent"):
+            raise ValueError(f"{out['name']}: 'by' must be 'agent' or omitted")
+    elif kind == "slow_run":
+        out.update(
+            factor=float(rule.get("factor", 5)),
+            minSamples=int(rule.get("minSamples", 20)),
+            minRuntimeMs=int(rule.get("minRuntimeMs", 60_000)),
+        )
+    else:
+        raise ValueError(f"{out['name']}: type must be rate, count or slow_run")
+    return out
+
+
+def load_alert_rules(path: Path = ALERT_RULES_FILE):
+    """Rules from ALERT_RULES_FILE (a JSON list), or DEFAULT_ALERT_RULES when it does not exist."""
+    raw = DEFAULT_ALERT_RULES
+    if path.exists():
+        raw = json.loads(path.read_text())
+        if not isinstance(raw, list):
+            raise ValueError(f"{path}: expected a JSON list of rules")
+    rules = [validate_alert_rule(rule) for rule in raw]
+    names = [rule["name"] for rule in rules]
+    if len(set(names)) != len(names):
+        raise ValueError(f"{path}: rule names must be unique")
+    return rules
+
+
+class WindowCounter:
+    """Sliding-window (total, hits) counter over fixed-width time slots.
+
+    The window is split into ``slots`` buckets, so it slides in steps of
+    window/slots and memory stays bounded however many runs are counted.
+    """
+
+    def __init__(self, window_ms: int, slots: int = 60):
+        self.window_ms = window_ms
+        self.width = max(1, window_ms // slots)
+        self.slots = {}
+
+    def add(self, ts: int, hit: bool):
+        slot = self.slots.setdefault(ts // self.width, [0, 0])
+        slot[0] += 1
+        slot[1] += int(hit)
+
+    def totals(self, now_ms: int):
+        floor = (now_ms - self.window_ms) // self.width
+        for key in [k for k in self.slots if k <= floor]:
+            del self.slots[key]
+        return sum(s[0] for s in self.slots.values()), sum(s[1] for s in self.slots.values())
+
+
+class AlertEngine:
+    """Evaluates alert rules incrementally over the run changes upsert_runs sees.
+
+    Windowed rules keep a WindowCounter per (rule, group), fed with each run as
+    it finishes; slow_run compares runtimes with a per-agent DDSketch baseline.
+    Nothing is re-queried per evaluation: state is seeded once from the DB in
+    ``load``. Evaluations only return firing/resolved transitions; ``record``
+    writes them to the ``alert`` table and notifies once the runs that caused
+    them are committed.
+    """
+
+    def __init__(self, rules):
+        self.rules = rules
+        self.counters = {}
+        self.baselines = {}
+        self.firing = {}
+        self.lock = threading.Lock()
+        self._staged = None
+
+    def load(self, conn: sqlite3.Connection, now_ms: int):
+        windows = [r["windowMs"] for r in self.rules if "windowMs" in r]
+        with self.lock:
+            if windows:
+                rows = conn.execute(
+                    f"""
+                    SELECT agent_id, status, ended_at FROM run_history
+                    WHERE ended_at >= ? AND status IN ({",".join("?" * len(TERMINAL_STATUSES))})
+                    """,
+                    (now_ms - max(windows), *TERMINAL_STATUSES),
+                ).fetchall()
+                for agent_id, status, ended_at in rows:
+                    self._count({"agent_id": agent_id, "status": status, "ended_at": ended_at}, now_ms)
+            since_day = sketch_day(now_ms - ALERT_BASELINE_DAYS * 24 * 60 * 60 * 1000)
+            for agent_id, raw in conn.execute(
+                "SELECT agent_id, sketch FROM run_sketch WHERE metric = 'runtime_ms' AND day >= ?", (since_day,)
+            ):
+                self.baselines.setdefault(agent_id, DDSketch()).merge(DDSketch.from_json(raw))
+            for alert_id, rule, key in conn.execute("SELECT id, rule, key FROM alert WHERE resolved_at IS NULL"):
+                self.firing[(rule, key)] = alert_id
+
+    def _count(self, run: dict, now_ms: int):
+        """Feed a finished run into every windowed rule it matches; returns the touched keys."""
+        touched = set()
+        agent_id = run["agent_id"] or "unknown"
+        for rule in self.rules:
+            if "windowMs" not in rule or rule["agent"] not in (None, agent_id):
+                continue
+            key = agent_id if rule["by"] == "agent" else "*"
+            counter = self.counters.setdefault((rule["name"], key), WindowCounter(rule["windowMs"]))
+            counter.add(run["ended_at"] or now_ms, run["status"] in rule["statuses"])
+            touched.add((rule["name"], key))
+        return touched
+
+    def observe(self, finished, running, now_ms: int):
+        """Evaluate newly finished runs and the currently running ones; returns the transitions."""
+        if not self.rules or not (finished or running):
+            return []
+        with self.lock:
+            self._staged = []
+            touched = set()
+            for run in finished:
+                touched |= self._count(run, now_ms)
+            for name, key in touched:
+                self._evaluate_window(name, key, now_ms)
+            self._evaluate_slow_runs(running, now_ms)
+            for rule in self.rules:
+                if rule["type"] == "slow_run":
+                    for run in finished:
+                        self._evaluate_slow(rule, run, run["runtime_ms"] or 0, now_ms)
+            for run in finished:
+                if run["runtime_ms"] is not None:
+                    self.baselines.setdefault(run["agent_id"] or "unknown", DDSketch()).add(run["runtime_ms"])
+            staged, self._staged = self._staged, None
+        return staged
+
+    def tick(self, conn: sqlite3.Connection, now_ms: int):
+        """Re-evaluate windowed rules so alerts resolve as their window slides past, and
+        running runs against slow_run, since a hung run no longer changes runs.json."""
+        running = []
+        if any(rule["type"] == "slow_run" for rule in self.rules):
+            conn.row_factory = sqlite3.Row
+            try:
+                running = conn.execute("SELECT run_id, agent_id, status, started_at FROM run_history WHERE status = 'running'").fetchall()
+            finally:
+                conn.row_factory = None
+        with self.lock:
+            self._staged = []
+            for name, key in list(self.counters):
+                self._evaluate_window(name, key, now_ms)
+            self._evaluate_slow_runs(running, now_ms)
+            staged, self._staged = self._staged, None
+        return staged
+
+    def _evaluate_slow_runs(self, running, now_ms):
+        for rule in self.rules:
+            if rule["type"] == "slow_run":
+                for run in running:
+                    self._evaluate_slow(rule, run, now_ms - (run["started_at"] or now_ms), now_ms)
+
+    def _is_firing(self, name, key):
+        for transition in reversed(self._staged):
+            if (transition["rule"], transition["key"]) == (name, key):
+                return transition["event"] == "alert.fired"
+        return (name, key) in self.firing
+
+    def _evaluate_window(self, name, key, now_ms):
+        rule = next((r for r in self.rules if r["name"] == name), None)
+        if rule is None:
+            return
+        total, hits = self.counters[(name, key)].totals(now_ms)
+        scope = "all agents" if key == "*" else key
+        if rule["type"] == "rate":
+            value = hits / total if total else 0.0
+            active = total >= rule["minRuns"] and value >= rule["threshold"]
+            message = f"{scope}: {hits}/{total} runs {'/'.join(rule['statuses'])} in the last {rule['window']} ({value:.0%})"
+        else:
+            value = hits
+            active = total >= rule["minRuns"] and hits >= rule["threshold"]
+            message = f"{scope}: {hits} {'/'.join(rule['statuses'])} runs in the last {rule['window']}"
+        detail = {"total": total, "hits": hits, "window": rule["window"]}
+        self._transition(rule, key, active, value, rule["threshold"], message, detail, now_ms)
+        if not total:
+            del self.counters[(name, key)]
+
+    def _evaluate_slow(self, rule, run, runtime_ms, now_ms):
+        agent_id = run["agent_id"] or "unknown"
+        if rule["agent"] not in (None, agent_id):
+            return
+        key = run["run_id"]
+        if self._is_firing(rule["name"], key):
+            if run["status"] != "running":
+                self._transition(rule, key, False, runtime_ms, None, "", {}, now_ms)
+            return
+        baseline = self.baselines.get(agent_id)
+        if baseline is None or baseline.count < rule["minSamples"] or runtime_ms < rule["minRuntimeMs"]:
+            return
+        median = baseline.quantile(0.5) or 0
+        limit = rule["factor"] * median
+        if median and runtime_ms > limit:
+            message = f"{agent_id}: run {key} has run {runtime_ms / 1000:.0f}s, {runtime_ms / median:.1f}× the agent's median"
+            detail = {"runId": key, "agentId": agent_id, "runtimeMs": runtime_ms, "medianMs": round(median), "status": run["status"]}
+            self._transition(rule, key, True, runtime_ms, limit, message, detail, now_ms)
+            if run["status"] != "running":
+                self._transition(rule, key, False, runtime_ms, limit, message, detail, now_ms)
+
+    def _transition(self, rule, key, active, value, threshold, message, detail, now_ms):
+        firing = self._is_firing(rule["name"], key)
+        if active and not firing:
+            self._staged.append({"event": "alert.fired", "rule": rule["name"], "key": key, "type": rule["type"], "value": value,
+                                 "threshold": threshold, "message": message, "detail": detail, "firedAt": now_ms})
+        elif not active and firing:
+            self._staged.append({"event": "alert.resolved", "rule": rule["name"], "key": key, "type": rule["type"],
+                                 "value": value, "resolvedAt": now_ms})
+
+    def record(self, conn: sqlite3.Connection, transitions):
+        """Write transitions to the ``alert`` table in their own transaction, then notify.
+
+        Call only after the data that raised them is committed, so a rolled-back
+        upsert never leaves a delivered alert behind.
+        """
+        if not transitions:
+            return
+        with self.lock:
+            firing = dict(self.firing)
+            written = []
+            for transition in transitions:
+                name_key = (transition["rule"], transition["key"])
+                if transition["event"] == "alert.fired" and name_key not in firing:
+                    firing[name_key] = conn.execute(
+                        """
+                        INSERT INTO alert (rule, key, type, state, value, threshold, message, detail, fired_at)
+                        VALUES (?, ?, ?, 'firing', ?, ?, ?, ?, ?)
+                        """,
+                        (transition["rule"], transition["key"], transition["type"], transition["value"], transition["threshold"],
+                         transition["message"], json.dumps(transition["detail"]), transition["firedAt"]),
+                    ).lastrowid
+                    written.append({"id": firing[name_key], **transition})
+                elif transition["event"] == "alert.resolved" and name_key in firing:
+                    alert_id = firing.pop(name_key)
+                    conn.execute("UPDATE alert SET state = 'resolved', resolved_at = ? WHERE id = ?", (transition["resolvedAt"], alert_id))
+                    written.append({"id": alert_id, **transition})
+            conn.commit()
+            self.firing = firing
+        for transition in written:
+            notify_alert(transition.pop("event"), transition)
+
+
+def notify_alert(kind: str, alert: dict):
+    """Publish an alert transition to the event feed and queue it for the webhook/command hooks."""
+    emit_event(kind, alertId=alert["id"], rule=alert["rule"], key=alert["key"], message=alert.get("message"))
+    if ALERT_WEBHOOK_URL or ALERT_COMMAND:
+        try:
+            _ALERT_OUTBOX.put_nowait({"event": kind, **alert})
+        except queue.Full:
+            print(f"alert outbox full, dropped {kind} for {alert['rule']}")
+
+
+def deliver_alerts():
+    """Drain the alert outbox into ALERT_WEBHOOK_URL (JSON POST) and ALERT_COMMAND (JSON on stdin)."""
+    while True:
+        payload = _ALERT_OUTBOX.get()
+        body = json.dumps(payload, default=str).encode()
+        if ALERT_WEBHOOK_URL:
+            try:
+                request = urllib.request.Request(ALERT_WEBHOOK_URL, data=body, headers={"Content-Type": "application/json"})
+                urllib.request.urlopen(request, timeout=10).close()
+            except (OSError, ValueError) as e:
+                print(f"alert webhook failed: {e}")
+        if ALERT_COMMAND:
+            try:
+                subprocess.run(shlex.split(ALERT_COMMAND), input=body, timeout=30, check=True, capture_output=True)
+            except (OSError, subprocess.SubprocessError) as e:
+                print(f"alert command failed: {e}")
+
+
+def check_alerts():
+    """Periodic pass: pick up runs.json changes, then let windowed alerts resolve."""
+    sync_runs_to_db()
+    if ALERTS is None:
+        return
+    with _SYNC_LOCK, sqlite3.connect(DB_PATH) as conn:
+        ALERTS.record(conn, ALERTS.tick(conn, int(time.time() * 1000)))
+
+
+def start_alerts():
+    """Load the alert rules and seed their state on a daemon thread; returns None if the rules are invalid.
+
+    ALERTS stays None, so upserts are not evaluated, until activate_alerts has
+    seeded the engine.
+    """
+    try:
+        rules = load_alert_rules()
+    except (OSError, ValueError, KeyError, TypeError) as e:
+        print(f"alerts disabled: {e}")
+        return None
+    engine = AlertEngine(rules)
+    threading.Thread(target=activate_alerts, args=(engine,), name="alert-load", daemon=True).start()
+    threading.Thread(target=deliver_alerts, name="alert-delivery", daemon=True).start()
+    return engine
+
+
+def activate_alerts(engine, poll=1.0):
+    """Seed ``engine`` from the DB and publish it as ALERTS once run_sketches is backfilled.
+
+    Until then a run the backfill has not reached yet would be counted by
+    ``load`` and again when its next upsert reports it as newly finished.
+    Seeding and publishing under _SYNC_LOCK means every run is either in the
+    DB when seeded or observed afterwards, never both.
+    """
+    global ALERTS
+    while not run_sketches_ready():
+        time.sleep(poll)
+    with _SYNC_LOCK, sqlite3.connect(DB_PATH) as conn:
+        engine.load(conn, int(time.time() * 1000))
+        ALERTS = engine
+
+
+def query_alerts(state=None, limit=100, since=0):
+    """Alert history, newest first; ``state=firing`` returns only unresolved alerts."""
+    where = ["id > ?"]
+    args = [since]
+    if state == "firing":
+        where.append("resolved_at IS NULL")
+    elif state == "resolved":
+        where.append("resolved_at IS NOT NULL")
+    with sqlite3.connect(DB_PATH) as conn:
+        conn.row_factory = sqlite3.Row
+        rows = conn.execute(
+            f"SELECT * FROM alert WHERE {' AND '.join(where)} ORDER BY id DESC LIMIT ?", [*args, limit]
+        ).fetchall()
+        firing = conn.execute("SELECT COUNT(*) FROM alert WHERE resolved_at IS NULL").fetchone()[0]
+    items = [
+        {
+            "id": r["id"],
+            "rule": r["rule"],
+            "key": r["key"],
+            "type": r["type"],
+            "state": r["state"],
+            "value": r["value"],
+            "threshold": r["threshold"],
+            "message": r["message"],
+            "detail": json.loads(r["detail"] or "{}"),
+            "firedAt": r["fired_at"],
+            "resolvedAt": r["resolved_at"],
+        }
+        for r in rows
+    ]
+    rules = [{k: v for k, v in rule.items() if k != "windowMs"} for rule in ALERTS.rules] if ALERTS else []
+    return {"items": items, "firing": firing, "enabled": ALERTS is not None, "rules": rules}
+
+
+class _BackupRestarted(Exception):
+    """Raised from the backup progress callback to give up on stepping after repeated restarts."""
+
+
+def _set_backup(**fields):
+    with _BACKUP_LOCK:
+        _BACKUP.update(fields)
+
+
+def list_backups():
+    """Retained backups, newest first."""
+    if not BACKUP_DIR.exists():
+        return []
+    files = sorted(BACKUP_DIR.glob("run_history-*.db.gz"), reverse=True)
+    return [{"name": f.name, "sizeBytes": f.stat().st_size, "createdAt": int(f.stat().st_mtime * 1000)} for f in files]
+
+
+def run_backup(max_restarts=3):
+    """Online backup of the history DB via the SQLite backup API, gzip-compressed and rotated.
+
+    Pages are copied BACKUP_PAGES_PER_STEP at a time with BACKUP_STEP_SLEEP_MS
+    pauses, so ingestion and reads continue in between. A write from another
+    connection restarts the copy; after ``max_restarts`` of those the rest is
+    copied in one pass (which only holds a WAL read lock, not a write lock).
+    """
+    with _BACKUP_LOCK:
+        if _BACKUP["state"] == "running":
+            return dict(_BACKUP)
+        _BACKUP.update(state="running", startedAt=int(time.time() * 1000), steps=0, restarts=0, error=None)
+    started = time.perf_counter()
+    BACKUP_DIR.mkdir(parents=True, exist_ok=True)
+    name = f"run_history-{datetime.now().strftime('%Y%m%d-%H%M%S')}.db"
+    raw_path = BACKUP_DIR / f"{name}.tmp"
+    gz_path = BACKUP_DIR / f"{name}.gz"
+    progress = {"steps": 0, "restarts": 0, "remaining": None}
+
+    def on_step(status, remaining, total):
+        if progress["remaining"] is not None and remaining > progress["remaining"]:
+            progress["restarts"] += 1
+            if progress["restarts"] > max_restarts:
+                raise _BackupRestarted()
+        progress["steps"] += 1
+        progress["remaining"] = remaining
+        if remaining and BACKUP_STEP_SLEEP_MS:
+            time.sleep(BACKUP_STEP_SLEEP_MS / 1000)
+
+    try:
+        with closing(sqlite3.connect(DB_PATH)) as src, closing(sqlite3.connect(raw_path)) as dst:
+            try:
+                src.backup(dst, pages=BACKUP_PAGES_PER_STEP, progress=on_step)
+            except _BackupRestarted:
+                src.backup(dst)
+        db_bytes = raw_path.stat().st_size
+        tmp_gz = gz_path.with_suffix(".gz.tmp")
+        with open(raw_path, "rb") as f_in, gzip.open(tmp_gz, "wb", compresslevel=6) as f_out:
+            shutil.copyfileobj(f_in, f_out, 1024 * 1024)
+        os.replace(tmp_gz, gz_path)
+        for old in list_backups()[BACKUP_KEEP:]:
+            (BACKUP_DIR / old["name"]).unlink(missing_ok=True)
+        _set_backup(
+            state="done",
+            dbBytes=db_bytes,
+            sizeBytes=gz_path.stat().st_size,
+            path=str(gz_path),
+        )
+    except Exception as e:
+        print(f"backup failed: {e}")
+        _set_backup(state="error", error=str(e))
+    finally:
+        raw_path.unlink(missing_ok=True)
+        _set_backup(
+            finishedAt=int(time.time() * 1000),
+            durationMs=round((time.perf_counter() - started) * 1000),
+            steps=progress["steps"],
+            restarts=progress["restarts"],
+        )
+    return dict(_BACKUP)
+
+
+def backup_if_due():
+    """Run a backup when the newest retained one is older than BACKUP_INTERVAL_HOURS."""
+    latest = list_backups()[:1]
+    if latest and time.time() * 1000 - latest[0]["createdAt"] < BACKUP_INTERVAL_HOURS * 3600 * 1000:
+        return None
+    return run_backup()
+
+
+def backup_status():
+    with _BACKUP_LOCK:
+        status = dict(_BACKUP)
+    backups = list_backups()
+    status.update(
+        enabled=BACKUP_INTERVAL_HOURS > 0,
+        intervalHours=BACKUP_INTERVAL_HOURS,
+        keep=BACKUP_KEEP,
+        dir=str(BACKUP_DIR),
+        nextDueAt=int(backups[0]["createdAt"] + BACKUP_INTERVAL_HOURS * 3600 * 1000) if backups and BACKUP_INTERVAL_HOURS > 0 else None,
+        backups=backups,
+    )
+    return status
+
+
+class IngestError(ValueError):
+    """Raised when a pushed ingest batch cannot be decoded at all."""
+
+
+class IngestTooLarge(IngestError):
+    """Raised when a compressed ingest batch expands beyond INGEST_MAX_BYTES."""
+
+
+def gunzip_bounded(body: bytes, limit: int) -> bytes:
+    """Decompress a (possibly multi-member) gzip body without producing more than ``limit`` bytes."""
+    out = []
+    size = 0
+    while body:
+        decoder = zlib.decompressobj(16 + zlib.MAX_WBITS)
+        try:
+            chunk = decoder.decompress(body, limit - size + 1)
+        except zlib.error as exc:
+            raise IngestError(f"invalid gzip body: {exc}") from exc
+        size += len(chunk)
+        if size > limit:
+            raise IngestTooLarge(f"decompressed body exceeds {limit} bytes")
+        if not decoder.eof:
+            raise IngestError("invalid gzip body: truncated")
+        out.append(chunk)
+        body = decoder.unused_data
+    return b"".join(out)
+
+
+RUN_FIELD_TYPES = (
+    (("startedAt", "endedAt", "createdAt", "lastHeartbeatAt", "last_heartbeat_at", "heartbeatAt", "runTimeoutSeconds"), (int, float), "a number"),
+    (("task", "label", "model", "childSessionKey"), str, "a string"),
+    (("outcome", "usage"), dict, "an object"),
+)
+
+
+def run_entry_error(run: dict):
+    """Why a runs.json entry cannot be stored (a field of the wrong type), or None."""
+    for keys, types, expected in RUN_FIELD_TYPES:
+        for key in keys:
+            value = run.get(key)
+            if value is not None and (not isinstance(value, types) or isinstance(value, bool)):
+                return f"{key} must be {expected}"
+    return None
+
+
+def parse_ingest_batch(body: bytes, content_encoding: str = ""):
+    """Decode an (optionally gzip-compressed) NDJSON batch of runs.json entries.
+
+    Each line is one run object carrying its id as ``runId`` (or ``run_id``).
+    Returns ``(runs, errors)`` where ``runs`` maps run_id -> run; later lines win.
+    """
+    encoding = (content_encoding or "").strip().lower()
+    if encoding in ("gzip", "x-gzip") or body[:2] == b"\x1f\x8b":
+        body = gunzip_bounded(body, INGEST_MAX_BYTES)
+    elif encoding not in ("", "identity"):
+        raise IngestError(f"unsupported Content-Encoding: {encoding}")
+
+    runs = {}
+    errors = []
+    for lineno, line in enumerate(body.splitlines(), start=1):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            run = json.loads(line)
+        except ValueError as exc:
+            errors.append({"line": lineno, "error": f"invalid JSON: {exc}"})
+            continue
+        if not isinstance(run, dict):
+            errors.append({"line": lineno, "error": "expected a JSON object"})
+            continue
+        run_id = run.get("runId") or run.get("run_id")
+        if not run_id or not isinstance(run_id, str):
+            errors.append({"line": lineno, "error": "missing runId"})
+            continue
+        error = run_entry_error(run)
+        if error:
+            errors.append({"line": lineno, "runId": run_id, "error": error})
+            continue
+        runs[run_id] = run
+    return runs, errors
+
+
+def ingest_runs(runs: dict):
+    """Commit a pushed batch of runs in a single transaction."""
+    init_db()
+    started = time.perf_counter()
+    with _SYNC_LOCK, sqlite3.connect(DB_PATH) as conn:
+        alerts = upsert_runs(conn, runs)
         conn.commit()
+        record_alerts(conn, alerts)
+    return {"accepted": len(runs), "elapsedMs": round((time.perf_counter() - started) * 1000, 2)}
+
 
+RUN_LIST_COLUMNS = """
+    run_id, label, agent_id, model, status, started_at, ended_at,
+    runtime_ms, timeout_seconds, session_key, outcome_status,
+    input_tokens, output_tokens, total_tokens, last_heartbeat_at, stale_at,
+    COALESCE((SELECT text FROM task_text WHERE hash = run_history.task_hash), run_history.task) AS task
+"""
+
+
+def run_row_to_item(row, now_ms: int):
+    """Shape a RUN_LIST_COLUMNS row into the /api/runs item dict."""
+    runtime = row["runtime_ms"]
+    if row["status"] == "running" and row["started_at"]:
+        runtime = now_ms - row["started_at"]
 
-def query_runs(limit=200, offset=0, agent_id=None, status=None):
+    return {
+        "runId": row["run_id"],
+        "label": row["label"] or "",
+        "agentId": row["agent_id"] or "unknown",
+        "model": row["model"] or "",
+        "status": row["status"] or "unknown",
+        "startedAt": row["started_at"],
+        "endedAt": row["ended_at"],
+        "runtimeMs": runtime or 0,
+        "timeoutSeconds": row["timeout_seconds"],
+        "task": row["task"] or "",
+        "sessionKey": row["session_key"] or "",
+        "inputTokens": row["input_tokens"],
+        "outputTokens": row["output_tokens"],
+        "totalTokens": row["total_tokens"],
+        "lastHeartbeatAt": row["last_heartbeat_at"],
+        "staleAt": row["stale_at"],
+        "outcome": {"status": row["outcome_status"] or "unknown"},
+    }
+
+
+def query_runs(limit=200, offset=0, agent_id=None, status=None, fields=None, task_max_len=None):
     sync_runs_to_db()
     with sqlite3.connect(DB_PATH) as conn:
         conn.row_factory = sqlite3.Row
@@ -401,55 +2253,235 @@ def query_runs(limit=200, offset=0, agent_id=None, status=None):
             where.append("agent_id = ?")
             args.append(agent_id)
         if status:
-            where.append("status = ?")
-            args.append(status)
+            clause, clause_args = status_filter(status)
+            where.append(clause)
+            args.extend(clause_args)
 
         where_sql = ("WHERE " + " AND ".join(where)) if where else ""
 
         total = conn.execute(f"SELECT COUNT(*) FROM run_history {where_sql}", args).fetchone()[0]
 
-        rows = conn.execute(
+        rows = conn.execute(
+            f"""
+            SELECT {RUN_LIST_COLUMNS}
+            FROM run_history
+            {where_sql}
+            ORDER BY started_at DESC
+            LIMIT ? OFFSET ?
+            """,
+            [*args, limit, offset],
+        ).fetchall()
+
+        now_ms = int(time.time() * 1000)
+        items = [project_run_item(run_row_to_item(row, now_ms), fields, task_max_len) for row in rows]
+
+        return {"items": items, "total": total, "limit": limit, "offset": offset}
+
+
+RUN_ITEM_FIELDS = (
+    "runId",
+    "label",
+    "agentId",
+    "model",
+    "status",
+    "startedAt",
+    "endedAt",
+    "runtimeMs",
+    "timeoutSeconds",
+    "task",
+    "sessionKey",
+    "inputTokens",
+    "outputTokens",
+    "totalTokens",
+    "lastHeartbeatAt",
+    "staleAt",
+    "outcome",
+)
+
+
+def parse_fields_param(raw):
+    """Parse a comma-separated ?fields= value into known item keys (None = all)."""
+    if not raw:
+        return None
+    wanted = {f.strip() for f in raw.split(",") if f.strip()}
+    fields = [f for f in RUN_ITEM_FIELDS if f in wanted]
+    if fields and "runId" not in fields:
+        fields.insert(0, "runId")
+    return fields or None
+
+
+def project_run_item(item: dict, fields=None, task_max_len=None):
+    if task_max_len is not None and len(item.get("task") or "") > task_max_len:
+        item["task"] = item["task"][:task_max_len] + "…"
+    if fields:
+        item = {k: item[k] for k in fields if k in item}
+    return item
+
+
+COLUMNAR_DICT_FIELDS = {"agentId", "model", "status"}
+COLUMNAR_DELTA_FIELDS = {"startedAt", "endedAt", "lastHeartbeatAt", "staleAt"}
+
+
+def columnar(rows):
+    """Encode a list of dicts as one array per field (``?format=columnar``).
+
+    agentId/model/status columns are dictionary-encoded (``{"dict", "codes"}``),
+    timestamps delta-encoded against the previous non-null value (``{"delta"}``),
+    nested objects and lists of objects become nested tables (``{"obj"}`` /
+    ``{"rows", "lens"}``); anything else is a plain array.
+    """
+    keys = list(dict.fromkeys(k for row in rows for k in row))
+    return {"n": len(rows), "cols": {k: _columnar_column(k, [row.get(k) for row in rows]) for k in keys}}
+
+
+def _columnar_column(key, values):
+    if key in COLUMNAR_DICT_FIELDS:
+        index = {}
+        codes = [index.setdefault(v, len(index)) for v in values]
+        return {"dict": list(index), "codes": codes}
+    if key in COLUMNAR_DELTA_FIELDS:
+        prev = 0
+        deltas = []
+        for v in values:
+            if v is None:
+                deltas.append(None)
+            else:
+                deltas.append(v - prev)
+                prev = v
+        return {"delta": deltas}
+    if values and all(isinstance(v, dict) for v in values):
+        return {"obj": columnar(values)}
+    if values and all(isinstance(v, list) and all(isinstance(x, dict) for x in v) for v in values):
+        return {"rows": columnar([x for v in values for x in v]), "lens": [len(v) for v in values]}
+    return values
+
+
+def query_lanes(per_agent=25, status=None, fields=None, task_max_len=None):
+    """Top ``per_agent`` most recent runs for every agent in one windowed query."""
+    sync_runs_to_db()
+    where = []
+    args = []
+    if status:
+        clause, clause_args = status_filter(status)
+        where.append(clause)
+        args.extend(clause_args)
+    where_sql = ("WHERE " + " AND ".join(where)) if where else ""
+
+    with sqlite3.connect(DB_PATH) as conn:
+        conn.row_factory = sqlite3.Row
+        rows = conn.execute(
+            f"""
+            SELECT * FROM (
+                SELECT {RUN_LIST_COLUMNS},
+                       ROW_NUMBER() OVER (PARTITION BY agent_id ORDER BY started_at DESC) AS lane_rank
+                FROM run_history
+                {where_sql}
+            )
+            WHERE lane_rank <= ?
+            ORDER BY agent_id ASC, lane_rank ASC
+            """,
+            [*args, per_agent],
+        ).fetchall()
+        totals = {
+            row[0]: row[1]
+            for row in conn.execute(
+                f"SELECT agent_id, COUNT(*) FROM run_history {where_sql} GROUP BY agent_id",
+                args,
+            )
+        }
+
+    now_ms = int(time.time() * 1000)
+    lanes = {}
+    for row in rows:
+        aid = row["agent_id"]
+        if aid not in lanes:
+            lanes[aid] = {"agentId": aid or "unknown", "total": totals.get(aid, 0), "items": []}
+        lanes[aid]["items"].append(project_run_item(run_row_to_item(row, now_ms), fields, task_max_len))
+
+    ordered = sorted(lanes.values(), key=lambda lane: lane["items"][0]["startedAt"] or 0, reverse=True)
+    return {"perAgent": per_agent, "lanes": ordered}
+
+
+EXPORT_CSV_FIELDS = (
+    "runId",
+    "label",
+    "agentId",
+    "model",
+    "status",
+    "outcomeStatus",
+    "startedAt",
+    "endedAt",
+    "runtimeMs",
+    "timeoutSeconds",
+    "inputTokens",
+    "outputTokens",
+    "totalTokens",
+    "lastHeartbeatAt",
+    "sessionKey",
+    "task",
+)
+
+
+def iter_export(fmt="ndjson", start_date=None, end_date=None, agent_id=None, chunk_rows=500):
+    """Yield an export of run_history as encoded text chunks.
+
+    Rows are pulled from the cursor ``chunk_rows`` at a time and each chunk is
+    encoded before the next is fetched, so memory stays flat for any range.
+    """
+    sync_runs_to_db()
+    where = ["started_at IS NOT NULL"]
+    args = []
+    start_ms = _parse_ymd_to_ms(start_date, end_of_day=False)
+    end_ms = _parse_ymd_to_ms(end_date, end_of_day=True)
+    if start_ms is not None:
+        where.append("started_at >= ?")
+        args.append(start_ms)
+    if end_ms is not None:
+        where.append("started_at <= ?")
+        args.append(end_ms)
+    if agent_id and agent_id != "all":
+        where.append("agent_id = ?")
+        args.append(agent_id)
+
+    now_ms = int(time.time() * 1000)
+    buf = io.StringIO()
+    writer = None
+    if fmt == "csv":
+        writer = csv.writer(buf, lineterminator="\n")
+        writer.writerow(EXPORT_CSV_FIELDS)
+
+    # check_same_thread=False: the async engine may resume this generator on any
+    # executor thread, though never concurrently.
+    with closing(sqlite3.connect(DB_PATH, check_same_thread=False)) as conn:
+        conn.row_factory = sqlite3.Row
+        cur = conn.execute(
             f"""
-            SELECT run_id, label, agent_id, model, status, started_at, ended_at,
-                   runtime_ms, timeout_seconds, task, session_key, outcome_status,
-                   input_tokens, output_tokens, total_tokens, last_heartbeat_at
+            SELECT {RUN_LIST_COLUMNS}
             FROM run_history
-            {where_sql}
-            ORDER BY started_at DESC
-            LIMIT ? OFFSET ?
+            WHERE {" AND ".join(where)}
+            ORDER BY started_at ASC
             """,
-            [*args, limit, offset],
-        ).fetchall()
-
-        now_ms = int(time.time() * 1000)
-        items = []
-        for row in rows:
-            runtime = row["runtime_ms"]
-            if row["status"] == "running" and row["started_at"]:
-                runtime = now_ms - row["started_at"]
-
-            items.append(
-                {
-                    "runId": row["run_id"],
-                    "label": row["label"] or "",
-                    "agentId": row["agent_id"] or "unknown",
-                    "model": row["model"] or "",
-                    "status": row["status"] or "unknown",
-                    "startedAt": row["started_at"],
-                    "endedAt": row["ended_at"],
-                    "runtimeMs": runtime or 0,
-                    "timeoutSeconds": row["timeout_seconds"],
-                    "task": row["task"] or "",
-                    "sessionKey": row["session_key"] or "",
-                    "inputTokens": row["input_tokens"],
-                    "outputTokens": row["output_tokens"],
-                    "totalTokens": row["total_tokens"],
-                    "lastHeartbeatAt": row["last_heartbeat_at"],
-                    "outcome": {"status": row["outcome_status"] or "unknown"},
-                }
-            )
-
-        return {"items": items, "total": total, "limit": limit, "offset": offset}
+            args,
+        )
+        while True:
+            rows = cur.fetchmany(chunk_rows)
+            if not rows:
+                break
+            for row in rows:
+                item = run_row_to_item(row, now_ms)
+                if writer:
+                    item["outcomeStatus"] = item.pop("outcome")["status"]
+                    writer.writerow([item[k] if item[k] is not None else "" for k in EXPORT_CSV_FIELDS])
+                else:
+                    buf.write(json.dumps(item, default=str))
+                    buf.write("\n")
+            yield buf.getvalue().encode()
+            buf.seek(0)
+            buf.truncate()
+
+    tail = buf.getvalue()
+    if tail:
+        yield tail.encode()
 
 
 def query_daily_stats(days=7):
@@ -463,7 +2495,7 @@ def query_daily_stats(days=7):
         rows = conn.execute(
             """
             SELECT
-                DATE(started_at / 1000, 'unixepoch', 'localtime') AS day,
+                bucket_day AS day,
                 COALESCE(agent_id, 'unknown') AS agent_id,
                 COUNT(*) AS run_count,
                 SUM(COALESCE(runtime_ms,
@@ -521,24 +2553,53 @@ def query_daily_stats(days=7):
     }
 
 
-
-
-def _parse_ymd_to_ms(value, end_of_day=False):
+def _parse_ymd_to_ms(value, end_of_day=False, tz_name=REPORT_TZ):
     if not value:
         return None
     try:
         dt = datetime.strptime(value, "%Y-%m-%d")
-        base = int(time.mktime(dt.timetuple()) * 1000)
-        return base + (24 * 60 * 60 * 1000 - 1 if end_of_day else 0)
+        if end_of_day:
+            dt += timedelta(days=1)
+        tz = get_tz(tz_name)
+        base = int((dt.replace(tzinfo=tz).timestamp() if tz else time.mktime(dt.timetuple())) * 1000)
+        return base - 1 if end_of_day else base
     except Exception:
         return None
 
 
-def _build_scope_filters(days=1, agent_id=None, status=None, scope="completed", include_running=False, include_stale=False, stale_minutes=15, start_date=None, end_date=None):
+def status_filter(status: str, now_ms: int | None = None):
+    """SQL for a status filter; ``stale`` selects hung running runs.
+
+    With the detector running that is the materialized flag; otherwise stale_at
+    is never set and the heartbeat is compared directly, as in stale_filter.
+    """
+    if status == "stale":
+        if _stale_detector_running:
+            return "stale_at IS NOT NULL", []
+        if now_ms is None:
+            now_ms = int(time.time() * 1000)
+        return "(status = 'running' AND COALESCE(last_heartbeat_at, started_at, 0) < ?)", [now_ms - STALE_MINUTES * 60 * 1000]
+    return "status = ?", [status]
+
+
+def stale_filter(stale_minutes, now_ms: int):
+    """SQL excluding stale running runs.
+
+    With the detector running, the default threshold reads the materialized flag
+    (up to STALE_CHECK_SECONDS behind); otherwise stale_at is never set and the
+    heartbeat is compared directly.
+    """
+    minutes = max(1, int(stale_minutes or STALE_MINUTES))
+    if minutes == STALE_MINUTES and _stale_detector_running:
+        return "stale_at IS NULL", []
+    return "(status != 'running' OR COALESCE(last_heartbeat_at, started_at, 0) >= ?)", [now_ms - minutes * 60 * 1000]
+
+
+def _build_scope_filters(days=1, agent_id=None, status=None, scope="completed", include_running=False, include_stale=False, stale_minutes=STALE_MINUTES, start_date=None, end_date=None, tz_name=REPORT_TZ):
     days = max(1, min(int(days or 1), 730))
     now_ms = int(time.time() * 1000)
-    start_ms = _parse_ymd_to_ms(start_date, end_of_day=False)
-    end_ms = _parse_ymd_to_ms(end_date, end_of_day=True)
+    start_ms = _parse_ymd_to_ms(start_date, end_of_day=False, tz_name=tz_name)
+    end_ms = _parse_ymd_to_ms(end_date, end_of_day=True, tz_name=tz_name)
 
     if end_ms is None:
         end_ms = now_ms
@@ -552,7 +2613,6 @@ def _build_scope_filters(days=1, agent_id=None, status=None, scope="completed",
         start_ms = end_ms
 
     days = max(1, int((end_ms - start_ms) / (24 * 60 * 60 * 1000)) + 1)
-    stale_cutoff = now_ms - max(1, int(stale_minutes or 15)) * 60 * 1000
 
     where = ["started_at IS NOT NULL", "started_at >= ?", "started_at <= ?"]
     args = [start_ms, end_ms]
@@ -562,8 +2622,9 @@ def _build_scope_filters(days=1, agent_id=None, status=None, scope="completed",
         args.append(agent_id)
 
     if status and status != "all":
-        where.append("status = ?")
-        args.append(status)
+        clause, clause_args = status_filter(status, now_ms)
+        where.append(clause)
+        args.extend(clause_args)
     else:
         if scope == "completed":
             where.append("status IN ('done','failed','timeout')")
@@ -573,8 +2634,9 @@ def _build_scope_filters(days=1, agent_id=None, status=None, scope="completed",
     if not include_running:
         where.append("status != 'running'")
     elif not include_stale:
-        where.append("(status != 'running' OR COALESCE(last_heartbeat_at, started_at, 0) >= ?)")
-        args.append(stale_cutoff)
+        clause, clause_args = stale_filter(stale_minutes, now_ms)
+        where.append(clause)
+        args.extend(clause_args)
 
     return {
         "days": days,
@@ -586,11 +2648,12 @@ def _build_scope_filters(days=1, agent_id=None, status=None, scope="completed",
         "scope": scope,
         "include_running": bool(include_running),
         "include_stale": bool(include_stale),
-        "stale_minutes": max(1, int(stale_minutes or 15)),
+        "stale_minutes": max(1, int(stale_minutes or STALE_MINUTES)),
+        "tz": tz_name,
     }
 
 
-def query_metric_summary(days=1, agent_id=None, status=None, scope="all", include_running=True, include_stale=True, stale_minutes=15, start_date=None, end_date=None):
+def query_metric_summary(days=1, agent_id=None, status=None, scope="all", include_running=True, include_stale=True, stale_minutes=STALE_MINUTES, start_date=None, end_date=None):
     sync_runs_to_db()
     cfg = _build_scope_filters(days, agent_id, status, scope, include_running, include_stale, stale_minutes, start_date, end_date)
 
@@ -637,9 +2700,36 @@ def query_metric_summary(days=1, agent_id=None, status=None, scope="all", includ
         },
     }
 
-def query_reporting_dashboard(days=1, agent_id=None, status=None, scope="all", include_running=True, include_stale=True, stale_minutes=15, period="daily", bucket_count=14, start_date=None, end_date=None):
+
+def rebucket_series(points, size: int):
+    """Sum-preserving downsampling of a per-day series into buckets of ``size`` days.
+
+    Each bucket keeps its first ``date``, gains an ``endDate`` and sums every numeric
+    field; ``agents`` lists (aligned across days) are summed per agent.
+    """
+    out = []
+    for i in range(0, len(points), size):
+        chunk = points[i : i + size]
+        merged = {"date": chunk[0]["date"], "endDate": chunk[-1]["date"]}
+        for key, value in chunk[0].items():
+            if key == "date":
+                continue
+            if key == "agents":
+                merged[key] = [
+                    {"agentId": agent["agentId"], **{k: sum(p[key][j][k] for p in chunk) for k in agent if k != "agentId"}}
+                    for j, agent in enumerate(value)
+                ]
+            else:
+                merged[key] = sum(p[key] for p in chunk)
+        out.append(merged)
+    return out
+
+
+def query_reporting_dashboard(days=1, agent_id=None, status=None, scope="all", include_running=True, include_stale=True, stale_minutes=STALE_MINUTES, period="daily", bucket_count=14, start_date=None, end_date=None, tz=None, max_points=None):
     sync_runs_to_db()
-    cfg = _build_scope_filters(days, agent_id, status, scope, include_running, include_stale, stale_minutes, start_date, end_date)
+    tz_name = resolve_report_tz(tz)
+    src = bucket_source(tz_name)
+    cfg = _build_scope_filters(days, agent_id, status, scope, include_running, include_stale, stale_minutes, start_date, end_date, tz_name)
     days = cfg["days"]
     now_ms = cfg["now_ms"]
     start_ms = cfg["start_ms"]
@@ -652,11 +2742,8 @@ def query_reporting_dashboard(days=1, agent_id=None, status=None, scope="all", i
         period = "daily"
     bucket_count = max(1, min(int(bucket_count or 14), 60))
 
-    period_sql = {
-        "daily": "strftime('%Y-%m-%d', started_at / 1000, 'unixepoch', 'localtime')",
-        "weekly": "strftime('%Y-W%W', started_at / 1000, 'unixepoch', 'localtime')",
-        "monthly": "strftime('%Y-%m', started_at / 1000, 'unixepoch', 'localtime')",
-    }[period]
+    period_sql = {"daily": src["day"], "weekly": src["week"], "monthly": src["month"]}[period]
+    bucket_args = [*src["from_args"], *args]
 
     with sqlite3.connect(DB_PATH) as conn:
         conn.row_factory = sqlite3.Row
@@ -664,7 +2751,7 @@ def query_reporting_dashboard(days=1, agent_id=None, status=None, scope="all", i
         daily_rows = conn.execute(
             f"""
             SELECT
-                DATE(started_at / 1000, 'unixepoch', 'localtime') AS day,
+                {src["day"]} AS day,
                 COALESCE(agent_id, 'unknown') AS agent_id,
                 COUNT(*) AS run_count,
                 SUM(COALESCE(runtime_ms,
@@ -686,12 +2773,12 @@ def query_reporting_dashboard(days=1, agent_id=None, status=None, scope="all", i
                         THEN 1
                     ELSE 0
                 END) AS token_runs
-            FROM run_history
+            FROM {src["from_sql"]}
             WHERE {where_sql}
             GROUP BY day, agent_id
             ORDER BY day ASC, agent_id ASC
             """,
-            args,
+            bucket_args,
         ).fetchall()
 
         usage_period_rows = conn.execute(
@@ -709,12 +2796,12 @@ def query_reporting_dashboard(days=1, agent_id=None, status=None, scope="all", i
                 )) AS token_total,
                 SUM(COALESCE(input_tokens, 0)) AS input_tokens,
                 SUM(COALESCE(output_tokens, 0)) AS output_tokens
-            FROM run_history
+            FROM {src["from_sql"]}
             WHERE {where_sql}
             GROUP BY period_key, agent_id
             ORDER BY period_key ASC, agent_id ASC
             """,
-            args,
+            bucket_args,
         ).fetchall()
 
         status_rows = conn.execute(
@@ -754,8 +2841,9 @@ def query_reporting_dashboard(days=1, agent_id=None, status=None, scope="all", i
             all_time_where.append("agent_id = ?")
             all_time_args.append(agent_id)
         if status and status != "all":
-            all_time_where.append("status = ?")
-            all_time_args.append(status)
+            clause, clause_args = status_filter(status, cfg["now_ms"])
+            all_time_where.append(clause)
+            all_time_args.extend(clause_args)
         elif scope == "completed":
             all_time_where.append("status IN ('done','failed','timeout')")
         elif scope == "active":
@@ -763,9 +2851,9 @@ def query_reporting_dashboard(days=1, agent_id=None, status=None, scope="all", i
         if not include_running:
             all_time_where.append("status != 'running'")
         elif not include_stale:
-            stale_cutoff = cfg["now_ms"] - max(1, int(stale_minutes or 15)) * 60 * 1000
-            all_time_where.append("(status != 'running' OR COALESCE(last_heartbeat_at, started_at, 0) >= ?)")
-            all_time_args.append(stale_cutoff)
+            clause, clause_args = stale_filter(stale_minutes, cfg["now_ms"])
+            all_time_where.append(clause)
+            all_time_args.extend(clause_args)
 
         all_time_where_sql = " AND ".join(all_time_where)
 
@@ -887,11 +2975,11 @@ def query_reporting_dashboard(days=1, agent_id=None, status=None, scope="all", i
     ]
 
     day_labels = []
-    for i in range(days):
-        ts = start_ms + i * 24 * 60 * 60 * 1000
-        if ts > end_ms:
-            break
-        day_labels.append(time.strftime("%Y-%m-%d", time.localtime(ts / 1000)))
+    day = datetime.strptime(bucket_keys(start_ms, tz_name)[0], "%Y-%m-%d")
+    last_day = bucket_keys(end_ms, tz_name)[0]
+    while len(day_labels) < days and day.strftime("%Y-%m-%d") <= last_day:
+        day_labels.append(day.strftime("%Y-%m-%d"))
+        day += timedelta(days=1)
 
     runtime_trend = [{"date": d, "runtimeMs": int(by_day.get(d, {}).get("runtimeMs", 0))} for d in day_labels]
     runs_trend = [{"date": d, "runCount": int(by_day.get(d, {}).get("runCount", 0))} for d in day_labels]
@@ -941,6 +3029,13 @@ def query_reporting_dashboard(days=1, agent_id=None, status=None, scope="all", i
         for row in all_time_agent_rows
     ]
 
+    bucket_days = 1
+    if max_points and len(day_labels) > max_points:
+        bucket_days = -(-len(day_labels) // max_points)
+        runtime_trend = rebucket_series(runtime_trend, bucket_days)
+        runs_trend = rebucket_series(runs_trend, bucket_days)
+        runtime_split = rebucket_series(runtime_split, bucket_days)
+
     totals = {
         "runCount": sum(v["runCount"] for v in agent_totals.values()),
         "runtimeMs": sum(v["runtimeMs"] for v in agent_totals.values()),
@@ -951,6 +3046,8 @@ def query_reporting_dashboard(days=1, agent_id=None, status=None, scope="all", i
         "runsWithTokens": sum(item["runsWithTokens"] for item in token_trend),
         "runsWithTokenData": sum(item["runsWithTokens"] for item in token_trend),
     }
+    if bucket_days > 1:
+        token_trend = rebucket_series(token_trend, bucket_days)
 
     return {
         "windowDays": days,
@@ -961,6 +3058,7 @@ def query_reporting_dashboard(days=1, agent_id=None, status=None, scope="all", i
             "includeRunning": cfg["include_running"],
             "includeStaleRunning": cfg["include_stale"],
             "staleMinutes": cfg["stale_minutes"],
+            "tz": tz_name,
         },
         "generatedAt": now_ms,
         "totals": totals,
@@ -969,6 +3067,7 @@ def query_reporting_dashboard(days=1, agent_id=None, status=None, scope="all", i
             "runtimeSplitByAgent": runtime_split,
             "runsTrend": runs_trend,
             "tokenTrend": token_trend,
+            "bucketDays": bucket_days,
             "usageStacked": {
                 "period": period,
                 "bucketCount": bucket_count,
@@ -993,15 +3092,755 @@ def query_reporting_dashboard(days=1, agent_id=None, status=None, scope="all", i
     }
 
 
+def _sketch_summary(sketch: DDSketch, quantiles):
+    summary = {
+        "count": sketch.count,
+        "mean": round(sketch.total / sketch.count, 2) if sketch.count else None,
+        "min": sketch.min,
+        "max": sketch.max,
+    }
+    for q in quantiles:
+        value = sketch.quantile(q)
+        summary[f"p{q * 100:g}"] = round(value, 2) if value is not None else None
+    return summary
+
+
+def parse_quantiles_param(raw):
+    quantiles = []
+    for part in (raw or "").split(","):
+        try:
+            q = float(part)
+        except ValueError:
+            continue
+        if q > 1:
+            q /= 100
+        if 0 <= q <= 1:
+            quantiles.append(q)
+    return sorted(set(quantiles)) or [0.5, 0.9, 0.99]
+
+
+def query_percentiles(days=1, agent_id=None, model=None, start_date=None, end_date=None, quantiles=(0.5, 0.9, 0.99)):
+    """Merge the stored per-day sketches for a window into p50/p90/p99-style summaries."""
+    sync_runs_to_db()
+    cfg = _build_scope_filters(days, start_date=start_date, end_date=end_date)
+
+    where = ["day >= ?", "day <= ?"]
+    args = [sketch_day(cfg["start_ms"]), sketch_day(cfg["end_ms"])]
+    if agent_id and agent_id != "all":
+        where.append("agent_id = ?")
+        args.append(agent_id)
+    if model and model != "all":
+        where.append("model = ?")
+        args.append(model)
+
+    with sqlite3.connect(DB_PATH) as conn:
+        rows = conn.execute(
+            f"SELECT agent_id, model, metric, sketch FROM run_sketch WHERE {' AND '.join(where)}",
+            args,
+        ).fetchall()
+
+    merged = {metric: {"overall": DDSketch(), "byAgent": {}, "byModel": {}} for metric in SKETCH_METRICS}
+    for aid, mdl, metric, raw in rows:
+        if metric not in merged:
+            continue
+        sketch = DDSketch.from_json(raw)
+        merged[metric]["overall"].merge(sketch)
+        merged[metric]["byAgent"].setdefault(aid, DDSketch()).merge(sketch)
+        merged[metric]["byModel"].setdefault(mdl, DDSketch()).merge(sketch)
+
+    def section(metric):
+        m = merged[metric]
+        return {
+            "overall": _sketch_summary(m["overall"], quantiles),
+            "byAgent": [{"agentId": aid, **_sketch_summary(sk, quantiles)} for aid, sk in sorted(m["byAgent"].items())],
+            "byModel": [{"model": mdl, **_sketch_summary(sk, quantiles)} for mdl, sk in sorted(m["byModel"].items())],
+        }
+
+    return {
+        "windowDays": cfg["days"],
+        "generatedAt": cfg["now_ms"],
+        "filters": {"agentId": agent_id or "all", "model": model or "all"},
+        "quantiles": list(quantiles),
+        "relativeAccuracy": SKETCH_ALPHA,
+        "runtimeMs": section("runtime_ms"),
+        "totalTokens": section("total_tokens"),
+    }
+
+
+def query_tool_stats(days=7, agent_id=None, start_date=None, end_date=None, quantiles=(0.5, 0.95)):
+    """Per-tool call counts, error rates, latency quantiles and payload sizes from tool_call."""
+    sync_runs_to_db()
+    cfg = _build_scope_filters(days, start_date=start_date, end_date=end_date)
+    where = ["started_at >= ?", "started_at <= ?"]
+    args = [cfg["start_ms"], cfg["end_ms"]]
+    if agent_id and agent_id != "all":
+        where.append("agent_id = ?")
+        args.append(agent_id)
+    where_sql = " AND ".join(where)
+
+    with sqlite3.connect(DB_PATH) as conn:
+        conn.row_factory = sqlite3.Row
+        rows = conn.execute(
+            f"""
+            SELECT tool,
+                   COUNT(*) AS calls,
+                   SUM(is_error) AS errors,
+                   COUNT(DISTINCT run_id) AS runs,
+                   AVG(args_bytes) AS avg_args_bytes,
+                   AVG(result_bytes) AS avg_result_bytes
+            FROM tool_call
+            WHERE {where_sql}
+            GROUP BY tool
+            ORDER BY calls DESC, tool ASC
+            """,
+            args,
+        ).fetchall()
+        latency = {}
+        for tool, duration in conn.execute(
+            f"SELECT tool, duration_ms FROM tool_call WHERE {where_sql} AND duration_ms IS NOT NULL",
+            args,
+        ):
+            latency.setdefault(tool, DDSketch()).add(duration)
+
+    tools = []
+    for row in rows:
+        tools.append({
+            "tool": row["tool"],
+            "calls": row["calls"],
+            "errors": row["errors"] or 0,
+            "errorRate": round((row["errors"] or 0) / row["calls"], 4),
+            "runs": row["runs"],
+            "latencyMs": _sketch_summary(latency.get(row["tool"], DDSketch()), quantiles),
+            "avgArgsBytes": round(row["avg_args_bytes"]) if row["avg_args_bytes"] is not None else None,
+            "avgResultBytes": round(row["avg_result_bytes"]) if row["avg_result_bytes"] is not None else None,
+        })
+
+    return {
+        "windowDays": cfg["days"],
+        "generatedAt": cfg["now_ms"],
+        "filters": {"agentId": agent_id or "all"},
+        "quantiles": list(quantiles),
+        "totals": {
+            "calls": sum(t["calls"] for t in tools),
+            "errors": sum(t["errors"] for t in tools),
+            "tools": len(tools),
+        },
+        "tools": tools,
+    }
+
+
+CONCURRENCY_RESOLUTIONS = {
+    "1m": 60_000,
+    "5m": 5 * 60_000,
+    "15m": 15 * 60_000,
+    "1h": 60 * 60_000,
+    "6h": 6 * 60 * 60_000,
+    "1d": 24 * 60 * 60_000,
+}
+CONCURRENCY_MAX_BUCKETS = 5000
+WEEKDAYS = ("Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun")
+
+
+def parse_resolution(raw, span_ms: int):
+    """Bucket width in ms from ``1m``/``5m``/.../``1d`` or seconds; ``auto`` targets <= 1000 buckets."""
+    raw = (raw or "auto").strip().lower()
+    if raw == "auto":
+        for step in sorted(CONCURRENCY_RESOLUTIONS.values()):
+            if span_ms / step <= 1000:
+                return step
+        return CONCURRENCY_RESOLUTIONS["1d"]
+    step = CONCURRENCY_RESOLUTIONS.get(raw)
+    if step is None:
+        step = int(raw) * 1000
+    if step <= 0:
+        raise ValueError("resolution must be positive")
+    if span_ms / step > CONCURRENCY_MAX_BUCKETS:
+        raise ValueError(f"resolution too fine: at most {CONCURRENCY_MAX_BUCKETS} buckets per request")
+    return step
+
+
+def sweep_concurrency(intervals, start_ms: int, end_ms: int, step_ms: int):
+    """Peak number of overlapping runs per ``step_ms`` bucket, overall and per agent.
+
+    ``intervals`` yields ``(agent_id, started, ended)`` ordered by ``started``; a run
+    is active on ``[started, ended)``. Each run is pushed once onto a heap of end
+    times, so the sweep is O(n log n) and only holds the runs active at the
+    current instant. A bucket's peak is its concurrency at the bucket start or at
+    any run start inside it, the only points where the count can rise.
+    """
+    n_buckets = max(1, -(-(end_ms - start_ms + 1) // step_ms))
+    peaks = [0] * n_buckets
+    active = []
+    agent_active = {}
+    agent_peaks = {}
+    overall = {"peak": 0, "at": None}
+    next_bucket = 0
+
+    def settle_buckets(until):
+        nonlocal next_bucket
+        while next_bucket < n_buckets and start_ms + next_bucket * step_ms <= until:
+            boundary = start_ms + next_bucket * step_ms
+            while active and active[0] <= boundary:
+                heapq.heappop(active)
+            peaks[next_bucket] = max(peaks[next_bucket], len(active))
+            next_bucket += 1
+
+    for agent_id, started, ended in intervals:
+        t = max(started, start_ms)
+        if ended <= t or t > end_ms:
+            continue
+        settle_buckets(t)
+        while active and active[0] <= t:
+            heapq.heappop(active)
+        heapq.heappush(active, ended)
+        count = len(active)
+        bucket = (t - start_ms) // step_ms
+        peaks[bucket] = max(peaks[bucket], count)
+        if count > overall["peak"]:
+            overall = {"peak": count, "at": t}
+
+        mine = agent_active.setdefault(agent_id, [])
+        while mine and mine[0] <= t:
+            heapq.heappop(mine)
+        heapq.heappush(mine, ended)
+        best = agent_peaks.setdefault(agent_id, {"peak": 0, "at": None})
+        if len(mine) > best["peak"]:
+            best["peak"], best["at"] = len(mine), t
+
+    settle_buckets(end_ms)
+    return peaks, overall, agent_peaks
+
+
+def query_concurrency(days=7, agent_id=None, start_date=None, end_date=None, resolution=None, view="timeline", tz=None):
+    """Concurrent-runs timeline (or weekday x hour-of-day heatmap) and peak parallelism for a window."""
+    sync_runs_to_db()
+    tz_name = resolve_report_tz(tz)
+    cfg = _build_scope_filters(days, start_date=start_date, end_date=end_date, tz_name=tz_name)
+    start_ms, end_ms, now_ms = cfg["start_ms"], cfg["end_ms"], cfg["now_ms"]
+    if view == "heatmap":
+        step_ms = CONCURRENCY_RESOLUTIONS["1h"]
+        start_ms -= start_ms % step_ms
+    else:
+        step_ms = parse_resolution(resolution, end_ms - start_ms + 1)
+
+    def intervals(cursor):
+        while True:
+            rows = cursor.fetchmany(2000)
+            if not rows:
+                return
+            yield from rows
+
+    with closing(sqlite3.connect(DB_PATH)) as conn:
+        # Finished runs end at ended_at (or started + runtime); running ones at "now",
+        # unless the stale detector flagged them, in which case at their last heartbeat.
+        # A finished run overlapping the window started at most max_run_span_ms before
+        # it, so only running rows are read from further back.
+        where = ["run_end > ?"]
+        args = [start_ms - max_run_span_ms(conn), end_ms, end_ms, start_ms]
+        if agent_id and agent_id != "all":
+            where.append("agent_id = ?")
+            args.append(agent_id)
+        cursor = conn.execute(
+            f"""
+            SELECT agent_id, started_at, run_end FROM (
+                SELECT COALESCE(agent_id, 'unknown') AS agent_id, started_at,
+                       CASE
+                           WHEN status = 'running' AND stale_at IS NULL THEN ?
+                           WHEN status = 'running' THEN COALESCE(last_heartbeat_at, started_at)
+                           ELSE COALESCE(ended_at, started_at + COALESCE(runtime_ms, 0))
+                       END AS run_end
+                FROM run_history
+                WHERE started_at BETWEEN ? AND ? OR (status = 'running' AND started_at <= ?)
+            )
+            WHERE {' AND '.join(where)}
+            ORDER BY started_at ASC
+            """,
+            [now_ms, *args],
+        )
+        peaks, overall, agent_peaks = sweep_concurrency(intervals(cursor), start_ms, end_ms, step_ms)
+
+    result = {
+        "windowDays": cfg["days"],
+        "generatedAt": now_ms,
+        "filters": {"agentId": agent_id or "all", "tz": tz_name},
+        "view": view,
+        "resolutionMs": step_ms,
+        "startMs": start_ms,
+        "endMs": end_ms,
+        "peak": overall["peak"],
+        "peakAt": overall["at"],
+        "byAgent": sorted(
+            ({"agentId": aid, "peak": v["peak"], "peakAt": v["at"]} for aid, v in agent_peaks.items()),
+            key=lambda a: (-a["peak"], a["agentId"]),
+        ),
+    }
+    if view == "heatmap":
+        tzinfo = get_tz(tz_name)
+        peak_grid = [[0] * 24 for _ in WEEKDAYS]
+        sum_grid = [[0] * 24 for _ in WEEKDAYS]
+        hours_grid = [[0] * 24 for _ in WEEKDAYS]
+        for i, peak in enumerate(peaks):
+            dt = datetime.fromtimestamp((start_ms + i * step_ms) / 1000, tzinfo)
+            wd, hour = dt.weekday(), dt.hour
+            peak_grid[wd][hour] = max(peak_grid[wd][hour], peak)
+            sum_grid[wd][hour] += peak
+            hours_grid[wd][hour] += 1
+        result["heatmap"] = {
+            "weekdays": list(WEEKDAYS),
+            "peak": peak_grid,
+            "avgPeak": [
+                [round(sum_grid[d][h] / hours_grid[d][h], 2) if hours_grid[d][h] else 0 for h in range(24)]
+                for d in range(len(WEEKDAYS))
+            ],
+        }
+    else:
+        result["timeline"] = [{"t": start_ms + i * step_ms, "peak": peak} for i, peak in enumerate(peaks)]
+    return result
+
+
 def get_run_detail(run_id):
     sync_runs_to_db()
     with sqlite3.connect(DB_PATH) as conn:
         conn.row_factory = sqlite3.Row
-        row = conn.execute("SELECT * FROM run_history WHERE run_id = ?", (run_id,)).fetchone()
+        row = conn.execute(f"SELECT {RUN_LIST_COLUMNS}, outcome_json FROM run_history WHERE run_id = ?", (run_id,)).fetchone()
+        if not row:
+            return None
+        return run_details_from_rows(conn, [row])[run_id]
+
+
+def get_run_details(run_ids):
+    """Resolve many run details with one DB query and one pass over sessions.json files."""
+    run_ids = list(dict.fromkeys(rid for rid in run_ids if rid))
+    if not run_ids:
+        return {"items": [], "missing": []}
+    sync_runs_to_db()
+    with sqlite3.connect(DB_PATH) as conn:
+        conn.row_factory = sqlite3.Row
+        placeholders = ",".join("?" * len(run_ids))
+        rows = conn.execute(
+            f"SELECT {RUN_LIST_COLUMNS}, outcome_json FROM run_history WHERE run_id IN ({placeholders})", run_ids
+        ).fetchall()
+        by_id = run_details_from_rows(conn, rows)
+
+    items = [by_id[rid] for rid in run_ids if rid in by_id]
+    return {"items": items, "missing": [rid for rid in run_ids if rid not in by_id]}
+
+
+def run_details_from_rows(conn: sqlite3.Connection, rows):
+    """Build run details, reading finished runs' messages from their stored snapshots.
+
+    Runs without a snapshot fall back to parsing the live transcript; finished
+    ones are snapshotted on the way so the next view skips the filesystem. With
+    snapshots disabled nothing marks a run as stored, so runs whose tool calls
+    and token fallbacks are already in place are not rewritten.
+    """
+    snapshots = load_transcript_snapshots(conn, [row["run_id"] for row in rows])
+    transcripts = find_transcripts(row["session_key"] for row in rows if snapshots.get(row["run_id"]) is None)
+    details = {}
+    fresh = []
+    for row in rows:
+        messages = snapshots.get(row["run_id"])
+        if messages is None:
+            transcript = transcripts.get(row["session_key"] or "")
+            parsed = parse_transcript_cached(transcript) if transcript else None
+            messages = parsed[0] if parsed else []
+            if parsed and row["status"] in TERMINAL_STATUSES:
+                fresh.append((row, parsed))
+        details[row["run_id"]] = run_detail_from_row(row, messages)
+    if fresh:
+        with _SYNC_LOCK:
+            if TRANSCRIPT_SNAPSHOT_MAX_BYTES <= 0:
+                fresh = unstored_transcript_results(conn, fresh)
+            if fresh:
+                store_transcript_results(conn, [(row["run_id"], row["agent_id"], row["started_at"], parsed) for row, parsed in fresh])
+                conn.commit()
+    return details
+
+
+def unstored_transcript_results(conn: sqlite3.Connection, results):
+    """The ``(row, parsed)`` pairs whose stored tool calls or token columns lag the transcript."""
+    placeholders = ",".join("?" * len(results))
+    counts = dict(
+        conn.execute(
+            f"SELECT run_id, COUNT(*) FROM tool_call WHERE run_id IN ({placeholders}) GROUP BY run_id",
+            [row["run_id"] for row, _ in results],
+        ).fetchall()
+    )
+    return [
+        (row, parsed)
+        for row, parsed in results
+        if counts.get(row["run_id"], 0) != len(parsed[1])
+        or any(n is not None and row[col] is None for n, col in zip(parsed[2], ("input_tokens", "output_tokens", "total_tokens")))
+    ]
+
+
+def encode_transcript_snapshot(messages):
+    """Compress a parsed message list for run_transcript, trimming it to TRANSCRIPT_SNAPSHOT_MAX_BYTES.
+
+    Over the cap, the oldest messages after the opening prompt are dropped.
+    Returns ``(blob, raw_bytes, message_count, truncated)``.
+    """
+    raw = json.dumps(messages, ensure_ascii=False, separators=(",", ":")).encode()
+    truncated = False
+    while len(raw) > TRANSCRIPT_SNAPSHOT_MAX_BYTES and len(messages) > 1:
+        drop = max(1, (len(messages) - 1) // 4)
+        messages = messages[:1] + messages[1 + drop :]
+        raw = json.dumps(messages, ensure_ascii=False, separators=(",", ":")).encode()
+        truncated = True
+    return zlib.compress(raw, 6), len(raw), len(messages), truncated
+
+
+def store_transcript_snapshots(conn: sqlite3.Connection, entries, now_ms=None):
+    """Persist ``(run_id, messages)`` pairs; ``messages=None`` records a missing transcript."""
+    if TRANSCRIPT_SNAPSHOT_MAX_BYTES <= 0:
+        return
+    now_ms = now_ms or int(time.time() * 1000)
+    rows = []
+    for run_id, messages in entries:
+        if messages is None:
+            rows.append((run_id, 0, 0, 0, 0, None, now_ms))
+            continue
+        blob, raw_bytes, count, truncated = encode_transcript_snapshot(messages)
+        rows.append((run_id, count, raw_bytes, len(blob), int(truncated), blob, now_ms))
+    conn.executemany(
+        """
+        INSERT OR REPLACE INTO run_transcript
+            (run_id, message_count, raw_bytes, stored_bytes, truncated, messages, created_at)
+        VALUES (?, ?, ?, ?, ?, ?, ?)
+        """,
+        rows,
+    )
+    conn.executemany("UPDATE run_history SET snapshot_at = ? WHERE run_id = ?", [(now_ms, row[0]) for row in rows])
+
+
+def store_transcript_results(conn: sqlite3.Connection, results):
+    """Persist parsed transcripts: message snapshot, tool calls and token fallbacks.
+
+    ``results`` holds ``(run_id, agent_id, run_started_at, parsed)`` tuples where
+    ``parsed`` is parse_transcript()'s output, or None for a missing transcript.
+    Transcript token usage only fills token columns that are still NULL.
+    """
+    store_transcript_snapshots(conn, [(run_id, parsed[0] if parsed else None) for run_id, _, _, parsed in results])
+    store_tool_calls(conn, [(run_id, agent_id, started, parsed[1]) for run_id, agent_id, started, parsed in results if parsed])
+    conn.executemany(
+        """
+        UPDATE run_history
+        SET input_tokens = COALESCE(input_tokens, ?),
+            output_tokens = COALESCE(output_tokens, ?),
+            total_tokens = COALESCE(total_tokens, ?)
+        WHERE run_id = ?
+        """,
+        [(*parsed[2], run_id) for run_id, _, _, parsed in results if parsed and any(n is not None for n in parsed[2])],
+    )
+
+
+def store_tool_calls(conn: sqlite3.Connection, entries):
+    """Replace the tool_call rows of each ``(run_id, agent_id, run_started_at, calls)`` entry.
+
+    Calls without a transcript timestamp are dated at the run's start so
+    window filters still place them.
+    """
+    rows = []
+    for run_id, agent_id, run_started, calls in entries:
+        for ordinal, call in enumerate(calls):
+            started = call["startedAt"] or run_started
+            ended = call["endedAt"]
+            duration = ended - call["startedAt"] if ended is not None and call["startedAt"] is not None and ended >= call["startedAt"] else None
+            rows.append((
+                run_id,
+                ordinal,
+                agent_id,
+                call["tool"][:200],
+                call["callId"],
+                call["argsBytes"],
+                call["resultBytes"],
+                int(call["isError"]),
+                started,
+                ended,
+                duration,
+            ))
+    conn.executemany("DELETE FROM tool_call WHERE run_id = ?", [(e[0],) for e in entries])
+    conn.executemany(
+        """
+        INSERT INTO tool_call
+            (run_id, ordinal, agent_id, tool, call_id, args_bytes, result_bytes, is_error, started_at, ended_at, duration_ms)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """,
+        rows,
+    )
+
+
+def load_transcript_snapshots(conn: sqlite3.Connection, run_ids) -> dict:
+    """Decompressed message lists by run_id (runs without a usable snapshot are absent)."""
+    run_ids = list(run_ids)
+    if not run_ids:
+        return {}
+    placeholders = ",".join("?" * len(run_ids))
+    rows = conn.execute(
+        f"SELECT run_id, messages FROM run_transcript WHERE run_id IN ({placeholders}) AND messages IS NOT NULL",
+        run_ids,
+    ).fetchall()
+    return {run_id: json.loads(zlib.decompress(blob)) for run_id, blob in rows}
+
+
+def snapshot_finished_transcripts(batch=200):
+    """Snapshot the transcripts of finished runs that have none yet, newest first.
+
+    Keeps going in batches until the backlog is drained; returns the number of
+    runs processed.
+    """
+    if TRANSCRIPT_SNAPSHOT_MAX_BYTES <= 0:
+        return 0
+    done = 0
+    while True:
+        with sqlite3.connect(DB_PATH) as conn:
+            # Pinned to idx_run_history_unsnapshotted (the planner prefers the status
+            # index, which covers all history); the NOT EXISTS only matters for
+            # runs snapshotted before snapshot_at existed, until snapshot_marks has run.
+            rows = conn.execute(
+                """
+                SELECT run_id, session_key, agent_id, started_at
+                FROM run_history INDEXED BY idx_run_history_unsnapshotted
+                WHERE snapshot_at IS NULL AND status IN ('done','failed','timeout')
+                  AND NOT EXISTS (SELECT 1 FROM run_transcript t WHERE t.run_id = run_history.run_id)
+                ORDER BY ended_at DESC
+                LIMIT ?
+                """,
+                (batch,),
+            ).fetchall()
+        if not rows:
+            return done
+        transcripts = find_transcripts(row[1] for row in rows)
+        results = [
+            (run_id, agent_id, started, parse_transcript(transcripts[sk]) if sk in transcripts else None)
+            for run_id, sk, agent_id, started in rows
+        ]
+        with _SYNC_LOCK, sqlite3.connect(DB_PATH) as conn:
+            store_transcript_results(conn, results)
+            conn.commit()
+        done += len(rows)
+        if len(rows) < batch:
+            return done
+
+
+def transcript_snapshot_stats():
+    with sqlite3.connect(DB_PATH) as conn:
+        runs, missing, truncated, messages, raw_bytes, stored_bytes = conn.execute(
+            """
+            SELECT COUNT(*), SUM(messages IS NULL), SUM(truncated), SUM(message_count),
+                   SUM(raw_bytes), SUM(stored_bytes)
+            FROM run_transcript
+            """
+        ).fetchone()
+    stored = runs - (missing or 0)
+    return {
+        "runs": runs,
+        "missing": missing or 0,
+        "truncated": truncated or 0,
+        "messages": messages or 0,
+        "rawBytes": raw_bytes or 0,
+        "storedBytes": stored_bytes or 0,
+        "avgStoredBytesPerRun": round((stored_bytes or 0) / stored) if stored else 0,
+        "compressionRatio": round((raw_bytes or 0) / stored_bytes, 2) if stored_bytes else None,
+        "maxBytes": TRANSCRIPT_SNAPSHOT_MAX_BYTES,
+    }
+
+
+def to_epoch_ms(value):
+    """Best-effort epoch-ms from a transcript timestamp (epoch s/ms or ISO-8601 string)."""
+    if value is None or isinstance(value, bool):
+        return None
+    if isinstance(value, (int, float)):
+        return int(value * 1000) if value < 1e11 else int(value)
+    if isinstance(value, str):
+        try:
+            return to_epoch_ms(float(value))
+        except ValueError:
+            pass
+        try:
+            return int(datetime.fromisoformat(value.replace("Z", "+00:00")).timestamp() * 1000)
+        except ValueError:
+            return None
+    return None
 
-    if not row:
+
+def _payload_bytes(value):
+    if value is None:
         return None
+    if isinstance(value, str):
+        return len(value.encode("utf-8", "replace"))
+    try:
+        return len(json.dumps(value, ensure_ascii=False, default=str).encode("utf-8", "replace"))
+    except Exception:
+        return len(str(value))
+
+
+def parse_transcript(transcript: Path):
+    """Extract sanitized messages, structured tool-call records and summed token usage from a session JSONL file.
+
+    Returns ``(messages, calls, (input_tokens, output_tokens, total_tokens))``. Tool-call records (``tool``, ``callId``, ``argsBytes``, ``resultBytes``,
+    ``isError``, ``startedAt``, ``endedAt``) pair each call with its result by
+    call id, whether the result arrives inline or as a separate toolResult message.
+    """
+    messages = []
+    calls = []
+    pending = {}
+    usage = [None, None, None]
+
+    def record_call(name, call_id, args_obj, ts):
+        rec = {
+            "tool": (name or "tool").strip() or "tool",
+            "callId": call_id,
+            "argsBytes": _payload_bytes(args_obj),
+            "resultBytes": None,
+            "isError": False,
+            "startedAt": ts,
+            "endedAt": None,
+        }
+        calls.append(rec)
+        if call_id:
+            pending[call_id] = rec
+        return rec
+
+    def record_result(name, call_id, result_obj, is_error, ts):
+        rec = pending.pop(call_id, None) if call_id else None
+        if rec is None:
+            rec = record_call(name or "tool_result", None, None, None)
+        rec["resultBytes"] = _payload_bytes(result_obj)
+        rec["isError"] = bool(is_error)
+        rec["endedAt"] = ts
 
+    try:
+        lines = transcript.read_text().strip().split("\n")
+        for line in lines:
+            try:
+                entry = json.loads(line)
+                msg = entry.get("message", entry)
+                role = msg.get("role")
+                ts = msg.get("timestamp", entry.get("timestamp"))
+                ts_ms = to_epoch_ms(ts)
+                if role in ("toolResult", "tool"):
+                    record_result(
+                        msg.get("toolName") or msg.get("name"),
+                        msg.get("toolCallId") or msg.get("tool_call_id"),
+                        msg.get("content"),
+                        msg.get("isError") or msg.get("is_error"),
+                        ts_ms,
+                    )
+                    continue
+                if role not in ("assistant", "user"):
+                    continue
+                if role == "assistant" and isinstance(msg.get("usage"), dict):
+                    for i, n in enumerate(extract_token_usage(msg, {})):
+                        if n is not None:
+                            usage[i] = (usage[i] or 0) + n
+
+                content = msg.get("content", "")
+                text = ""
+                tool_calls = []
+
+                def to_safe_text(value, max_len=4000):
+                    if value is None:
+                        return ""
+                    if isinstance(value, str):
+                        raw = value
+                    else:
+                        try:
+                            raw = json.dumps(value, ensure_ascii=False, default=str)
+                        except Exception:
+                            raw = str(value)
+                    safe = sanitize(raw)
+                    return safe[:max_len]
+
+                def add_tool_event(name, args_obj=None, result_obj=None):
+                    args_text = to_safe_text(args_obj)
+                    result_text = to_safe_text(result_obj)
+                    tool_calls.append(
+                        {
+                            "name": (name or "tool").strip() or "tool",
+                            "args": args_text,
+                            "argsPreview": (args_text[:240] + "…") if len(args_text) > 240 else args_text,
+                            "result": result_text,
+                            "resultPreview": (result_text[:240] + "…") if len(result_text) > 240 else result_text,
+                        }
+                    )
+
+                def add_call(c):
+                    name = c.get("name") or c.get("toolName") or c.get("tool")
+                    args_obj = c.get("arguments", c.get("args", c.get("input")))
+                    result_obj = c.get("result", c.get("output"))
+                    add_tool_event(name, args_obj, result_obj)
+                    rec = record_call(name, c.get("id") or c.get("toolCallId"), args_obj, ts_ms)
+                    if result_obj is not None:
+                        pending.pop(rec["callId"], None)
+                        rec.update(resultBytes=_payload_bytes(result_obj), isError=bool(c.get("isError") or c.get("is_error")), endedAt=ts_ms)
+
+                if isinstance(content, list):
+                    for c in content:
+                        if not isinstance(c, dict):
+                            continue
+                        ctype = c.get("type")
+                        if ctype == "text" and c.get("text", "").strip():
+                            text += c["text"] + "\n"
+                        elif ctype in ("toolCall", "tool_call", "tool-use"):
+                            add_call(c)
+                        elif ctype in ("toolResult", "tool_result"):
+                            name = c.get("name") or c.get("toolName") or c.get("tool") or "tool_result"
+                            result_obj = c.get("result", c.get("output", c.get("content")))
+                            add_tool_event(name, c.get("arguments", c.get("args", c.get("input"))), result_obj)
+                            record_result(
+                                name,
+                                c.get("toolCallId") or c.get("tool_use_id") or c.get("id"),
+                                result_obj,
+                                c.get("isError") or c.get("is_error"),
+                                ts_ms,
+                            )
+                elif isinstance(content, str):
+                    text = content
+
+                if isinstance(msg.get("toolCalls"), list):
+                    for tc in msg.get("toolCalls"):
+                        if not isinstance(tc, dict):
+                            continue
+                        add_call(tc)
+
+                if text.strip() or tool_calls:
+                    messages.append(
+                        {
+                            "role": role,
+                            "text": sanitize(text.strip()[:2000]),
+                            "toolCalls": tool_calls[:20],
+                            "timestamp": ts,
+                        }
+                    )
+            except Exception:
+                continue
+    except Exception:
+        pass
+    return messages, calls, tuple(usage)
+
+
+def parse_transcript_cached(transcript: Path, max_entries=64):
+    """parse_transcript() memoized on (path, size, mtime), so polling a live run's
+    details only re-parses and re-sanitizes its transcript after it changed."""
+    try:
+        st = transcript.stat()
+    except OSError:
+        return None
+    key = (st.st_size, st.st_mtime_ns)
+    hit = _TRANSCRIPT_CACHE.get(transcript)
+    if hit and hit[0] == key:
+        return hit[1]
+    parsed = parse_transcript(transcript)
+    with _TRANSCRIPT_CACHE_LOCK:
+        _TRANSCRIPT_CACHE.pop(transcript, None)
+        while len(_TRANSCRIPT_CACHE) >= max_entries:
+            _TRANSCRIPT_CACHE.pop(next(iter(_TRANSCRIPT_CACHE)))
+        _TRANSCRIPT_CACHE[transcript] = (key, parsed)
+    return parsed
+
+
+def run_detail_from_row(row, messages):
     session_key = row["session_key"] or ""
     started = row["started_at"]
     ended = row["ended_at"]
@@ -1012,95 +3851,6 @@ def get_run_detail(run_id):
     except Exception:
         outcome = {"status": row["outcome_status"]}
 
-    messages = []
-    transcript = find_transcript(session_key)
-    if transcript:
-        try:
-            lines = transcript.read_text().strip().split("\n")
-            for line in lines:
-                try:
-                    entry = json.loads(line)
-                    msg = entry.get("message", entry)
-                    role = msg.get("role")
-                    if role not in ("assistant", "user"):
-                        continue
-
-                    content = msg.get("content", "")
-                    text = ""
-                    tool_calls = []
-
-                    def to_safe_text(value, max_len=4000):
-                        if value is None:
-                            return ""
-                        if isinstance(value, str):
-                            raw = value
-                        else:
-                            try:
-                                raw = json.dumps(value, ensure_ascii=False, default=str)
-                            except Exception:
-                                raw = str(value)
-                        safe = sanitize(raw)
-                        return safe[:max_len]
-
-                    def add_tool_event(name, args_obj=None, result_obj=None):
-                        args_text = to_safe_text(args_obj)
-                        result_text = to_safe_text(result_obj)
-                        tool_calls.append(
-                            {
-                                "name": (name or "tool").strip() or "tool",
-                                "args": args_text,
-                                "argsPreview": (args_text[:240] + "…") if len(args_text) > 240 else args_text,
-                                "result": result_text,
-                                "resultPreview": (result_text[:240] + "…") if len(result_text) > 240 else result_text,
-                            }
-                        )
-
-                    if isinstance(content, list):
-                        for c in content:
-                            if not isinstance(c, dict):
-                                continue
-                            ctype = c.get("type")
-                            if ctype == "text" and c.get("text", "").strip():
-                                text += c["text"] + "\n"
-                            elif ctype in ("toolCall", "tool_call", "tool-use"):
-                                add_tool_event(
-                                    c.get("name") or c.get("toolName") or c.get("tool"),
-                                    c.get("arguments", c.get("args", c.get("input"))),
-                                    c.get("result", c.get("output")),
-                                )
-                            elif ctype in ("toolResult", "tool_result"):
-                                add_tool_event(
-                                    c.get("name") or c.get("toolName") or c.get("tool") or "tool_result",
-                                    c.get("arguments", c.get("args", c.get("input"))),
-                                    c.get("result", c.get("output", c.get("content"))),
-                                )
-                    elif isinstance(content, str):
-                        text = content
-
-                    if isinstance(msg.get("toolCalls"), list):
-                        for tc in msg.get("toolCalls"):
-                            if not isinstance(tc, dict):
-                                continue
-                            add_tool_event(
-                                tc.get("name") or tc.get("toolName") or tc.get("tool"),
-                                tc.get("arguments", tc.get("args", tc.get("input"))),
-                                tc.get("result", tc.get("output")),
-                            )
-
-                    if text.strip() or tool_calls:
-                        messages.append(
-                            {
-                                "role": role,
-                                "text": sanitize(text.strip()[:2000]),
-                                "toolCalls": tool_calls[:20],
-                                "timestamp": msg.get("timestamp", entry.get("timestamp")),
-                            }
-                        )
-                except Exception:
-                    continue
-        except Exception:
-            pass
-
     runtime_ms = (ended - started) if ended and started else 0
     if row["status"] == "running" and started:
         runtime_ms = int(time.time() * 1000) - started
@@ -1126,7 +3876,12 @@ def get_run_detail(run_id):
     }
 
 
-def find_transcript(session_key: str) -> Path | None:
+def find_transcripts(session_keys) -> dict:
+    """Resolve many session keys to transcript paths, reading each sessions.json once."""
+    wanted = {sk for sk in session_keys if sk}
+    found = {}
+    if not wanted:
+        return found
     for agent_dir in (OPENCLAW_DIR / "agents").glob("*/sessions"):
         sessions_json = agent_dir / "sessions.json"
         if not sessions_json.exists():
@@ -1134,92 +3889,795 @@ def find_transcript(session_key: str) -> Path | None:
         try:
             with open(sessions_json) as f:
                 sessions = json.load(f)
-            for sk, sess in sessions.items():
-                if sk == session_key:
-                    sid = sess.get("sessionId", "")
-                    transcript = agent_dir / f"{sid}.jsonl"
-                    if transcript.exists():
-                        return transcript
+            for sk in wanted.intersection(sessions.keys()) - found.keys():
+                sid = sessions[sk].get("sessionId", "")
+                transcript = agent_dir / f"{sid}.jsonl"
+                if transcript.exists():
+                    found[sk] = transcript
         except Exception:
             continue
-    return None
+        if len(found) == len(wanted):
+            break
+    return found
+
+
+def _reindex_parse(batch):
+    """Process-pool worker: parse ``(run_id, path)`` transcripts, returning ``(run_id, parsed, bytes)``."""
+    out = []
+    for run_id, path in batch:
+        transcript = Path(path)
+        try:
+            size = transcript.stat().st_size
+        except OSError:
+            out.append((run_id, None, 0))
+            continue
+        out.append((run_id, parse_transcript(transcript), size))
+    return out
+
+
+def reindex_transcripts(workers=None, chunk=16, batch=500, missing_only=False, report=print):
+    """Rebuild snapshots, tool calls and token fallbacks for finished runs from their transcripts.
+
+    Parsing and sanitizing run in a process pool with at most ``2 * workers``
+    chunks in flight; parsed results pass through a bounded queue to one writer
+    thread that commits every ``batch`` runs.
+    """
+    workers = workers or os.cpu_count() or 1
+    init_db()
+    with sqlite3.connect(DB_PATH) as conn:
+        rows = conn.execute(
+            f"""
+            SELECT h.run_id, h.session_key, h.agent_id, h.started_at, t.run_id IS NOT NULL
+            FROM run_history h
+            LEFT JOIN run_transcript t ON t.run_id = h.run_id
+            WHERE h.status IN ('done','failed','timeout')
+            {"AND t.run_id IS NULL" if missing_only else ""}
+            ORDER BY h.ended_at DESC
+            """
+        ).fetchall()
+    runs = {run_id: (agent_id, started) for run_id, _, agent_id, started, _ in rows}
+    transcripts = find_transcripts(sk for _, sk, _, _, _ in rows)
+    tasks = [(run_id, str(transcripts[sk])) for run_id, sk, _, _, _ in rows if sk in transcripts]
+    # Runs whose transcript is gone keep an existing snapshot; only unseen ones get a missing marker.
+    gone = [(run_id, None, 0) for run_id, sk, _, _, has_snapshot in rows if sk not in transcripts and not has_snapshot]
+    chunks = [tasks[i : i + chunk] for i in range(0, len(tasks), chunk)]
+
+    results = queue.Queue(maxsize=2 * workers)
+    stats = {"transcripts": 0, "bytes": 0, "written": 0}
+    started = time.perf_counter()
+    failure = []
+
+    def writer():
+        try:
+            write_results()
+        except BaseException as exc:
+            failure.append(exc)
+
+    def put(item):
+        # A dead writer never drains the queue; stop producing instead of blocking forever.
+        while not failure:
+            try:
+                results.put(item, timeout=0.5)
+                return
+            except queue.Full:
+                pass
+        raise failure[0]
+
+    def write_results():
+        with closing(sqlite3.connect(DB_PATH)) as conn:
+            pending = []
+
+            def flush():
+                store_transcript_results(conn, [(run_id, *runs[run_id], parsed) for run_id, parsed, _ in pending])
+                conn.commit()
+                stats["written"] += len(pending)
+                pending.clear()
+
+            while True:
+                item = results.get()
+                if item is None:
+                    break
+                pending.extend(item)
+                if len(pending) >= batch:
+                    flush()
+            if pending:
+                flush()
+
+    def line(prefix):
+        elapsed = max(time.perf_counter() - started, 1e-9)
+        return (
+            f"{prefix} {stats['transcripts']}/{len(tasks)} transcripts, {stats['bytes'] / 1e6:.1f} MB "
+            f"in {elapsed:.1f}s → {stats['transcripts'] / elapsed:,.1f} transcripts/s, {stats['bytes'] / 1e6 / elapsed:.1f} MB/s"
+        )
+
+    report(f"reindex: {len(tasks)} transcripts for {len(rows)} finished runs, {len(gone)} missing, {workers} workers")
+    write_thread = threading.Thread(target=writer, name="reindex-writer")
+    write_thread.start()
+    try:
+        if gone:
+            put(gone)
+        last_report = started
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            todo = iter(chunks)
+            in_flight = set()
+            while True:
+                while len(in_flight) < 2 * workers:
+                    nxt = next(todo, None)
+                    if nxt is None:
+                        break
+                    in_flight.add(pool.submit(_reindex_parse, nxt))
+                if not in_flight:
+                    break
+                done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                for fut in done:
+                    parsed = fut.result()
+                    stats["transcripts"] += len(parsed)
+                    stats["bytes"] += sum(size for _, _, size in parsed)
+                    put(parsed)
+                if time.perf_counter() - last_report >= 2:
+                    last_report = time.perf_counter()
+                    report(line("reindex:"))
+    finally:
+        if not failure:
+            try:
+                put(None)
+            except BaseException:
+                pass
+        write_thread.join()
+    if failure:
+        raise failure[0]
+    report(line(f"reindex: done, {stats['written']} runs written;"))
+    return stats
+
+
+def reindex_main(argv):
+    parser = argparse.ArgumentParser(
+        prog="server.py reindex",
+        description="Rebuild transcript snapshots, tool calls and token fallbacks for finished runs, parsing transcripts in a process pool.",
+    )
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="parser processes (default: cpu count)")
+    parser.add_argument("--chunk", type=int, default=16, help="transcripts per worker task (default: 16)")
+    parser.add_argument("--batch", type=int, default=500, help="runs per writer transaction (default: 500)")
+    parser.add_argument("--missing-only", action="store_true", help="only runs without a transcript snapshot yet")
+    args = parser.parse_args(argv)
+    reindex_transcripts(workers=args.workers, chunk=max(1, args.chunk), batch=max(1, args.batch), missing_only=args.missing_only)
+    return 0
+
+
+class Response:
+    """A transport-independent HTTP response rendered by both server engines.
+
+    Exactly one of ``data`` (JSON-encoded), ``body`` (raw bytes), ``chunks``
+    (an iterable of byte chunks, streamed) or ``file`` (a path sent with
+    os.sendfile) carries the payload.
+    """
+
+    def __init__(self, data=None, status=200, body=None, chunks=None, file=None, content_type="application/json", headers=None):
+        self.status = status
+        self.data = data
+        self.body = body
+        self.chunks = chunks
+        self.file = file
+        self.content_type = content_type
+        self.headers = headers or {}
+
+    def payload(self) -> bytes:
+        if self.body is None:
+            self.body = json.dumps(self.data, default=str).encode()
+        return self.body
+
+    def encoded(self, accept_encoding=None):
+        """Return ``(payload, extra_headers)`` gzip-compressing JSON bodies when negotiated."""
+        payload = self.payload()
+        if (
+            self.data is None
+            or API_GZIP_LEVEL <= 0
+            or len(payload) < API_GZIP_MIN_BYTES
+            or "Content-Encoding" in self.headers
+        ):
+            return payload, {}
+        if not accepts_gzip(accept_encoding):
+            return payload, {"Vary": "Accept-Encoding"}
+        return gzip.compress(payload, compresslevel=API_GZIP_LEVEL, mtime=0), {"Content-Encoding": "gzip", "Vary": "Accept-Encoding"}
+
+
+def _flag(q, key, default="1"):
+    return q.get(key, [default])[0] in ("1", "true", "yes")
+
+
+def gzip_chunks(chunks, level=6):
+    compressor = zlib.compressobj(level, zlib.DEFLATED, 31)
+    for chunk in chunks:
+        data = compressor.compress(chunk)
+        if data:
+            yield data
+    yield compressor.flush()
+
+
+def handle_api_get(path, q):
+    if path == "/api/agents":
+        return Response(get_configured_agents())
+    elif path == "/api/stats/daily":
+        days = int(q.get("days", ["7"])[0])
+        return Response(query_daily_stats(days=days))
+    elif path == "/api/reports/dashboard":
+        days = int(q.get("days", ["1"])[0])
+        agent_id = q.get("agentId", [None])[0]
+        status = q.get("status", [None])[0]
+        scope = q.get("scope", ["all"])[0]
+        period = q.get("period", ["daily"])[0]
+        bucket_count = int(q.get("bucketCount", ["14"])[0])
+        include_running = _flag(q, "includeRunning")
+        include_stale = _flag(q, "includeStaleRunning")
+        stale_minutes = int(q.get("staleMinutes", [str(STALE_MINUTES)])[0])
+        start_date = q.get("startDate", [None])[0]
+        end_date = q.get("endDate", [None])[0]
+        tz = q.get("tz", [None])[0]
+        max_points = max(0, int(q.get("maxPoints", ["0"])[0] or 0)) or None
+        result = query_reporting_dashboard(days=days, agent_id=agent_id, status=status, scope=scope, include_running=include_running, include_stale=include_stale, stale_minutes=stale_minutes, period=period, bucket_count=bucket_count, start_date=start_date, end_date=end_date, tz=tz, max_points=max_points)
+        if q.get("format", [""])[0] == "columnar":
+            series = result["series"]
+            for key in ("runtimeTrend", "runtimeSplitByAgent", "runsTrend", "tokenTrend"):
+                series[key] = columnar(series[key])
+            series["usageStacked"]["items"] = columnar(series["usageStacked"]["items"])
+            result["format"] = "columnar"
+        return Response(result)
+    elif path == "/api/reports/percentiles":
+        days = int(q.get("days", ["1"])[0])
+        agent_id = q.get("agentId", [None])[0]
+        model = q.get("model", [None])[0]
+        start_date = q.get("startDate", [None])[0]
+        end_date = q.get("endDate", [None])[0]
+        quantiles = parse_quantiles_param(q.get("q", [""])[0])
+        return Response(query_percentiles(days=days, agent_id=agent_id, model=model, start_date=start_date, end_date=end_date, quantiles=quantiles))
+    elif path == "/api/reports/tools":
+        days = int(q.get("days", ["7"])[0])
+        agent_id = q.get("agentId", [None])[0]
+        start_date = q.get("startDate", [None])[0]
+        end_date = q.get("endDate", [None])[0]
+        quantiles = parse_quantiles_param(q.get("q", ["50,95"])[0])
+        return Response(query_tool_stats(days=days, agent_id=agent_id, start_date=start_date, end_date=end_date, quantiles=quantiles))
+    elif path == "/api/reports/concurrency":
+        days = int(q.get("days", ["7"])[0])
+        agent_id = q.get("agentId", [None])[0]
+        start_date = q.get("startDate", [None])[0]
+        end_date = q.get("endDate", [None])[0]
+        resolution = q.get("resolution", ["auto"])[0]
+        view = "heatmap" if q.get("view", ["timeline"])[0] == "heatmap" else "timeline"
+        tz = q.get("tz", [None])[0]
+        return Response(query_concurrency(days=days, agent_id=agent_id, start_date=start_date, end_date=end_date, resolution=resolution, view=view, tz=tz))
+    elif path == "/api/metrics/summary":
+        days = int(q.get("days", ["1"])[0])
+        agent_id = q.get("agentId", [None])[0]
+        status = q.get("status", [None])[0]
+        scope = q.get("scope", ["all"])[0]
+        include_running = _flag(q, "includeRunning")
+        include_stale = _flag(q, "includeStaleRunning")
+        stale_minutes = int(q.get("staleMinutes", [str(STALE_MINUTES)])[0])
+        start_date = q.get("startDate", [None])[0]
+        end_date = q.get("endDate", [None])[0]
+        return Response(query_metric_summary(days=days, agent_id=agent_id, status=status, scope=scope, include_running=include_running, include_stale=include_stale, stale_minutes=stale_minutes, start_date=start_date, end_date=end_date))
+    elif path == "/api/runs":
+        limit = int(q.get("limit", ["200"])[0])
+        offset = int(q.get("offset", ["0"])[0])
+        limit = max(1, min(limit, 1000))
+        offset = max(0, offset)
+        agent_id = q.get("agentId", [None])[0]
+        status = q.get("status", [None])[0]
+        fields = parse_fields_param(q.get("fields", [None])[0])
+        task_max_len = q.get("taskMaxLen", [None])[0]
+        task_max_len = max(0, int(task_max_len)) if task_max_len else None
+        result = query_runs(limit=limit, offset=offset, agent_id=agent_id, status=status, fields=fields, task_max_len=task_max_len)
+        if q.get("format", [""])[0] == "columnar":
+            result.update(format="columnar", items=columnar(result["items"]))
+        return Response(result)
+    elif path == "/api/lanes":
+        per_agent = max(1, min(int(q.get("perAgent", ["25"])[0]), 500))
+        status = q.get("status", [None])[0]
+        fields = parse_fields_param(q.get("fields", [None])[0])
+        task_max_len = q.get("taskMaxLen", [None])[0]
+        task_max_len = max(0, int(task_max_len)) if task_max_len else None
+        return Response(query_lanes(per_agent=per_agent, status=status, fields=fields, task_max_len=task_max_len))
+    elif path == "/api/backup/status":
+        return Response(backup_status())
+    elif path == "/api/migrations":
+        return Response(migration_status())
+    elif path == "/api/ingest/progress":
+        return Response(backfill_progress())
+    elif path == "/api/tasks/stats":
+        return Response(task_text_stats())
+    elif path == "/api/transcripts/stats":
+        return Response(transcript_snapshot_stats())
+    elif path == "/api/events":
+        since = int(q.get("since", ["0"])[0])
+        limit = max(1, min(int(q.get("limit", ["200"])[0]), 500))
+        return Response(recent_events(since, limit))
+    elif path == "/api/alerts":
+        state = q.get("state", [None])[0]
+        if state not in (None, "all", "firing", "resolved"):
+            return Response({"error": "state must be firing, resolved or all"}, status=400)
+        since = int(q.get("since", ["0"])[0])
+        limit = max(1, min(int(q.get("limit", ["100"])[0]), 500))
+        return Response(query_alerts(state, limit, since))
+    elif path == "/api/runs/batch":
+        ids = [i.strip() for raw in q.get("ids", []) for i in raw.split(",") if i.strip()]
+        if len(ids) > 200:
+            return Response({"error": "at most 200 ids per batch"}, status=400)
+        return Response(get_run_details(ids))
+    elif path == "/api/export":
+        fmt = (q.get("format", ["ndjson"])[0] or "ndjson").lower()
+        if fmt not in ("ndjson", "csv"):
+            return Response({"error": "format must be ndjson or csv"}, status=400)
+        chunks = iter_export(
+            fmt=fmt,
+            start_date=q.get("startDate", [None])[0],
+            end_date=q.get("endDate", [None])[0],
+            agent_id=q.get("agentId", [None])[0],
+        )
+        use_gzip = _flag(q, "gzip", "0")
+        headers = {"Content-Disposition": f'attachment; filename="runs.{fmt}{".gz" if use_gzip else ""}"'}
+        if use_gzip:
+            chunks = gzip_chunks(chunks)
+            headers["Content-Encoding"] = "gzip"
+        content_type = "text/csv; charset=utf-8" if fmt == "csv" else "application/x-ndjson"
+        return Response(chunks=chunks, content_type=content_type, headers=headers)
+    elif path.startswith("/api/runs/"):
+        run_id = path.split("/api/runs/")[1]
+        detail = get_run_detail(run_id)
+        if detail:
+            return Response(detail)
+        return Response({"error": "run not found"}, status=404)
+    return Response({"error": "not found"}, status=404)
+
+
+def ingest_authorized(headers) -> bool:
+    """True if the request carries ``Authorization: Bearer <INGEST_TOKEN>``."""
+    if not INGEST_TOKEN:
+        return False
+    scheme, _, token = (headers.get("Authorization") or "").strip().partition(" ")
+    return scheme.lower() == "bearer" and hmac.compare_digest(token.strip().encode(), INGEST_TOKEN.encode())
+
+
+def handle_api_post(path, q, headers, body: bytes):
+    if path == "/api/ingest":
+        if not INGEST_TOKEN:
+            return Response({"error": "push ingestion is disabled; set INGEST_TOKEN"}, status=403)
+        if not ingest_authorized(headers):
+            return Response({"error": "missing or invalid ingest token"}, status=401, headers={"WWW-Authenticate": "Bearer"})
+        try:
+            runs, errors = parse_ingest_batch(body, headers.get("Content-Encoding", ""))
+        except IngestError as exc:
+            return Response({"error": str(exc)}, status=413 if isinstance(exc, IngestTooLarge) else 400)
+        result = ingest_runs(runs) if runs else {"accepted": 0, "elapsedMs": 0}
+        result["rejected"] = len(errors)
+        result["errors"] = errors[:50]
+        return Response(result, status=200 if runs or not errors else 400)
+    return Response({"error": "not found"}, status=404)
+
+
+def check_content_length(raw):
+    """Validate a request Content-Length header; returns (length, error Response or None)."""
+    try:
+        length = int(raw or 0)
+    except ValueError:
+        length = -1
+    if length < 0:
+        return 0, Response({"error": "invalid Content-Length"}, status=400)
+    if length > INGEST_MAX_BYTES:
+        return 0, Response({"error": f"request body exceeds {INGEST_MAX_BYTES} bytes"}, status=413)
+    return length, None
 
 
-class Handler(SimpleHTTPRequestHandler):
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, directory=str(STATIC_DIR), **kwargs)
+def dispatch_api(method, path, q, headers, body=b""):
+    try:
+        if method == "POST":
+            return handle_api_post(path, q, headers, body)
+        return handle_api_get(path, q)
+    except ValueError as exc:
+        return Response({"error": f"bad request: {exc}"}, status=400)
+    except Exception as exc:
+        return Response({"error": f"internal error: {exc}"}, status=500)
+
 
+class Handler(BaseHTTPRequestHandler):
     def do_GET(self):
         parsed = urlparse(self.path)
         path = normalize_request_path(parsed.path)
-        q = parse_qs(parsed.query)
-
-        if path == "/api/agents":
-            self.json_response(get_configured_agents())
-        elif path == "/api/stats/daily":
-            days = int(q.get("days", ["7"])[0])
-            self.json_response(query_daily_stats(days=days))
-        elif path == "/api/reports/dashboard":
-            days = int(q.get("days", ["1"])[0])
-            agent_id = q.get("agentId", [None])[0]
-            status = q.get("status", [None])[0]
-            scope = q.get("scope", ["all"])[0]
-            period = q.get("period", ["daily"])[0]
-            bucket_count = int(q.get("bucketCount", ["14"])[0])
-            include_running = q.get("includeRunning", ["1"])[0] in ("1", "true", "yes")
-            include_stale = q.get("includeStaleRunning", ["1"])[0] in ("1", "true", "yes")
-            stale_minutes = int(q.get("staleMinutes", ["15"])[0])
-            start_date = q.get("startDate", [None])[0]
-            end_date = q.get("endDate", [None])[0]
-            self.json_response(query_reporting_dashboard(days=days, agent_id=agent_id, status=status, scope=scope, include_running=include_running, include_stale=include_stale, stale_minutes=stale_minutes, period=period, bucket_count=bucket_count, start_date=start_date, end_date=end_date))
-        elif path == "/api/metrics/summary":
-            days = int(q.get("days", ["1"])[0])
-            agent_id = q.get("agentId", [None])[0]
-            status = q.get("status", [None])[0]
-            scope = q.get("scope", ["all"])[0]
-            include_running = q.get("includeRunning", ["1"])[0] in ("1", "true", "yes")
-            include_stale = q.get("includeStaleRunning", ["1"])[0] in ("1", "true", "yes")
-            stale_minutes = int(q.get("staleMinutes", ["15"])[0])
-            start_date = q.get("startDate", [None])[0]
-            end_date = q.get("endDate", [None])[0]
-            self.json_response(query_metric_summary(days=days, agent_id=agent_id, status=status, scope=scope, include_running=include_running, include_stale=include_stale, stale_minutes=stale_minutes, start_date=start_date, end_date=end_date))
-        elif path == "/api/runs":
-            limit = int(q.get("limit", ["200"])[0])
-            offset = int(q.get("offset", ["0"])[0])
-            limit = max(1, min(limit, 1000))
-            offset = max(0, offset)
-            agent_id = q.get("agentId", [None])[0]
-            status = q.get("status", [None])[0]
-            self.json_response(query_runs(limit=limit, offset=offset, agent_id=agent_id, status=status))
-        elif path.startswith("/api/runs/"):
-            run_id = path.split("/api/runs/")[1]
-            detail = get_run_detail(run_id)
-            if detail:
-                self.json_response(detail)
-            else:
-                self.send_error(404)
-        elif path in ("", "/", "/index.html"):
-            self.path = "/index.html"
-            super().do_GET()
+
+        if path.startswith("/api/"):
+            self.send_api_response(dispatch_api("GET", path, parse_qs(parsed.query), self.headers))
         else:
-            super().do_GET()
+            self.send_api_response(STATIC_ASSETS.response(path, self.headers))
 
-    def json_response(self, data):
-        payload = json.dumps(data, default=str)
-        self.send_response(200)
-        self.send_header("Content-Type", "application/json")
-        self.send_header("Access-Control-Allow-Origin", "*")
+    def do_HEAD(self):
+        parsed = urlparse(self.path)
+        path = normalize_request_path(parsed.path)
+        if path.startswith("/api/"):
+            self.send_error(405)
+            return
+        self.send_api_response(STATIC_ASSETS.response(path, self.headers), head_only=True)
+
+    def do_POST(self):
+        parsed = urlparse(self.path)
+        path = normalize_request_path(parsed.path)
+
+        if not path.startswith("/api/"):
+            self.send_error(404)
+            return
+        length, error = check_content_length(self.headers.get("Content-Length"))
+        if error:
+            self.send_api_response(error)
+            return
+        body = self.rfile.read(length) if length else b""
+        self.send_api_response(dispatch_api("POST", path, parse_qs(parsed.query), self.headers, body))
+
+    def send_api_response(self, resp: Response, head_only=False):
+        if resp.chunks is not None:
+            self.stream_response(resp)
+            return
+        if resp.file is not None:
+            self.sendfile_response(resp, head_only)
+            return
+        payload, extra = resp.encoded(self.headers.get("Accept-Encoding"))
+        self.send_response(resp.status)
+        self.send_header("Content-Type", resp.content_type)
+        self.send_cors_header()
+        for key, value in {**resp.headers, **extra}.items():
+            self.send_header(key, value)
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        if not head_only:
+            self.wfile.write(payload)
+
+    def sendfile_response(self, resp: Response, head_only=False):
+        try:
+            f = open(resp.file, "rb")
+        except OSError:
+            self.send_error(404)
+            return
+        with f:
+            size = os.fstat(f.fileno()).st_size
+            self.send_response(resp.status)
+            self.send_header("Content-Type", resp.content_type)
+            self.send_cors_header()
+            for key, value in resp.headers.items():
+                self.send_header(key, value)
+            self.send_header("Content-Length", str(size))
+            self.end_headers()
+            if head_only:
+                return
+            self.wfile.flush()
+            offset = 0
+            try:
+                while offset < size:
+                    sent = os.sendfile(self.connection.fileno(), f.fileno(), offset, size - offset)
+                    if not sent:
+                        break
+                    offset += sent
+            except (AttributeError, OSError):
+                f.seek(offset)
+                shutil.copyfileobj(f, self.wfile)
+
+    def stream_response(self, resp: Response):
+        """Stream a chunked Response, chunk-encoded for HTTP/1.1 clients.
+
+        HTTP/1.0 clients get the raw body delimited by connection close.
+        """
+        chunked = self.request_version == "HTTP/1.1"
+        if chunked:
+            self.protocol_version = "HTTP/1.1"
+        self.close_connection = True
+        self.send_response(resp.status)
+        self.send_header("Content-Type", resp.content_type)
+        self.send_cors_header()
+        self.send_header("Connection", "close")
+        for key, value in resp.headers.items():
+            self.send_header(key, value)
+        if chunked:
+            self.send_header("Transfer-Encoding", "chunked")
         self.end_headers()
-        self.wfile.write(payload.encode())
+
+        try:
+            for chunk in resp.chunks:
+                if not chunk:
+                    continue
+                if chunked:
+                    self.wfile.write(f"{len(chunk):X}\r\n".encode() + chunk + b"\r\n")
+                else:
+                    self.wfile.write(chunk)
+            if chunked:
+                self.wfile.write(b"0\r\n\r\n")
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+
+    def send_cors_header(self):
+        # Reads are open to any origin; writes (POST) must not be callable from other sites.
+        if self.command != "POST":
+            self.send_header("Access-Control-Allow-Origin", "*")
 
     def log_message(self, *a):
         pass
 
 
+HASHED_ASSET_RE = re.compile(r"[-.][A-Za-z0-9_-]{8,}\.(?:js|css|mjs|woff2?|svg|png|jpe?g|webp|ico)$")
+COMPRESSIBLE_TYPES = ("text/", "application/javascript", "application/json", "image/svg+xml", "application/xml", "application/manifest+json")
+
+
+def accepts_gzip(accept_encoding) -> bool:
+    """True if an Accept-Encoding header allows gzip (honouring q=0)."""
+    for part in (accept_encoding or "").split(","):
+        coding, _, params = part.strip().partition(";")
+        if coding.strip().lower() not in ("gzip", "*"):
+            continue
+        q = params.strip().lower()
+        if q.startswith("q="):
+            try:
+                return float(q[2:]) > 0
+            except ValueError:
+                return False
+        return True
+    return False
+
+
+class StaticAsset:
+    def __init__(self, path: Path, rel: str):
+        self.path = path
+        self.size = path.stat().st_size
+        self.content_type = mimetypes.guess_type(path.name)[0] or "application/octet-stream"
+        if self.content_type.startswith("text/"):
+            self.content_type += "; charset=utf-8"
+        if HASHED_ASSET_RE.search(rel) and rel.startswith("assets/"):
+            self.cache_control = "public, max-age=31536000, immutable"
+        elif rel == "index.html":
+            self.cache_control = "no-cache"
+        else:
+            self.cache_control = "public, max-age=3600"
+
+        self.body = None
+        self.gzip_body = None
+        self.etag = None
+        if self.size <= STATIC_CACHE_MAX_BYTES:
+            self.body = path.read_bytes()
+            self.etag = '"' + hashlib.sha1(self.body).hexdigest()[:20] + '"'
+            if self.content_type.startswith(COMPRESSIBLE_TYPES) and self.size >= 256:
+                packed = gzip.compress(self.body, compresslevel=9, mtime=0)
+                if len(packed) < self.size * 0.9:
+                    self.gzip_body = packed
+        else:
+            st = path.stat()
+            self.etag = f'"{st.st_mtime_ns:x}-{st.st_size:x}"'
+
+
+class StaticAssets:
+    """The ./static tree held in memory with gzip variants precomputed.
+
+    Loaded once at startup; files larger than STATIC_CACHE_MAX_BYTES stay on
+    disk and are sent with os.sendfile. Restart the server after ``npm run build``.
+    """
+
+    def __init__(self, root: Path):
+        self.root = root
+        self.assets = None
+        self._lock = threading.Lock()
+
+    def load(self):
+        assets = {}
+        if self.root.is_dir():
+            for path in sorted(self.root.rglob("*")):
+                if path.is_file():
+                    rel = path.relative_to(self.root).as_posix()
+                    assets[rel] = StaticAsset(path, rel)
+        self.assets = assets
+        return self
+
+    def lookup(self, path: str) -> StaticAsset | None:
+        if self.assets is None:
+            with self._lock:
+                if self.assets is None:
+                    self.load()
+        rel = unquote(path).strip("/")
+        if not rel:
+            rel = "index.html"
+        asset = self.assets.get(rel)
+        if asset is None:
+            asset = self.assets.get(f"{rel}/index.html")
+        return asset
+
+    def response(self, path: str, headers) -> "Response":
+        asset = self.lookup(path)
+        if asset is None:
+            return Response({"error": "not found"}, status=404)
+
+        out = {"Cache-Control": asset.cache_control, "ETag": asset.etag}
+        if asset.gzip_body is not None:
+            out["Vary"] = "Accept-Encoding"
+        if_none_match = headers.get("If-None-Match") if headers is not None else None
+        if if_none_match and asset.etag in [t.strip() for t in if_none_match.split(",")]:
+            return Response(status=304, body=b"", content_type=asset.content_type, headers=out)
+        if asset.body is None:
+            return Response(file=asset.path, content_type=asset.content_type, headers=out)
+        if asset.gzip_body is not None and accepts_gzip(headers.get("Accept-Encoding") if headers is not None else None):
+            out["Content-Encoding"] = "gzip"
+            return Response(body=asset.gzip_body, content_type=asset.content_type, headers=out)
+        return Response(body=asset.body, content_type=asset.content_type, headers=out)
+
+
+STATIC_ASSETS = StaticAssets(STATIC_DIR)
+
+
+class AsyncServer:
+    """Standard-library asyncio HTTP/1.1 server with keep-alive.
+
+    Connection handling runs on the event loop; routing goes through the same
+    dispatch_api/normalize_request_path as Handler, with the blocking SQLite and
+    file work pushed to a thread pool.
+    """
+
+    max_header_bytes = 64 * 1024
+
+    def __init__(self, host, port, workers=ASYNC_WORKERS, idle_timeout=ASYNC_IDLE_TIMEOUT):
+        self.host = host
+        self.port = port
+        self.idle_timeout = idle_timeout
+        self.executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="agent-monitor")
+
+    def serve_forever(self):
+        asyncio.run(self._serve())
+
+    async def _serve(self):
+        server = await asyncio.start_server(self._handle_connection, self.host, self.port, backlog=1024)
+        async with server:
+            await server.serve_forever()
+
+    async def _run(self, fn, *args):
+        return await asyncio.get_running_loop().run_in_executor(self.executor, fn, *args)
+
+    async def _read_head(self, reader):
+        try:
+            head = await asyncio.wait_for(reader.readuntil(b"\r\n\r\n"), self.idle_timeout)
+        except (asyncio.TimeoutError, asyncio.IncompleteReadError, asyncio.LimitOverrunError, ConnectionError):
+            return None
+        if len(head) > self.max_header_bytes:
+            return None
+        request_line, _, header_text = head.decode("latin-1").partition("\r\n")
+        parts = request_line.split()
+        if len(parts) != 3 or not parts[2].startswith("HTTP/"):
+            return None
+        headers = email.parser.Parser(_class=http.client.HTTPMessage).parsestr(header_text)
+        return parts[0].upper(), parts[1], parts[2], headers
+
+    async def _handle_connection(self, reader, writer):
+        try:
+            while True:
+                head = await self._read_head(reader)
+                if head is None:
+                    break
+                method, target, version, headers = head
+                connection = (headers.get("Connection") or "").lower()
+                keep_alive = "close" not in connection if version == "HTTP/1.1" else "keep-alive" in connection
+
+                body = b""
+                error = None
+                if method == "POST":
+                    length, error = check_content_length(headers.get("Content-Length"))
+                    if length and not error:
+                        body = await reader.readexactly(length)
+                if error:
+                    keep_alive = False
+                    resp = error
+                else:
+                    resp = await self._respond(method, target, headers, body)
+
+                keep_alive = await self._write_response(
+                    writer, resp, version, keep_alive, head_only=method == "HEAD", accept_encoding=headers.get("Accept-Encoding"), cors=method != "POST"
+                )
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+
+    async def _respond(self, method, target, headers, body):
+        parsed = urlparse(target)
+        path = normalize_request_path(parsed.path)
+        try:
+            if path.startswith("/api/"):
+                if method not in ("GET", "HEAD", "POST"):
+                    return Response({"error": "method not allowed"}, status=405)
+                return await self._run(dispatch_api, "POST" if method == "POST" else "GET", path, parse_qs(parsed.query), headers, body)
+            if method not in ("GET", "HEAD"):
+                return Response({"error": "method not allowed"}, status=405)
+            return STATIC_ASSETS.response(path, headers)
+        except Exception as exc:
+            return Response({"error": f"internal error: {exc}"}, status=500)
+
+    async def _write_response(self, writer, resp: Response, version, keep_alive, head_only=False, accept_encoding=None, cors=True):
+        reason = HTTPStatus(resp.status).phrase if resp.status in HTTPStatus._value2member_map_ else ""
+        streaming = resp.chunks is not None
+        chunked = streaming and version == "HTTP/1.1"
+        if streaming and not chunked:
+            keep_alive = False
+
+        lines = [
+            f"{version if version in ('HTTP/1.0', 'HTTP/1.1') else 'HTTP/1.1'} {resp.status} {reason}",
+            f"Content-Type: {resp.content_type}",
+            f"Connection: {'keep-alive' if keep_alive else 'close'}",
+        ]
+        if cors:
+            lines.append("Access-Control-Allow-Origin: *")
+        payload = b""
+        extra = {}
+        if not streaming and resp.file is None:
+            payload, extra = resp.encoded(accept_encoding)
+        lines.extend(f"{k}: {v}" for k, v in {**resp.headers, **extra}.items())
+        f = None
+        if chunked:
+            lines.append("Transfer-Encoding: chunked")
+        elif resp.file is not None:
+            try:
+                f = open(resp.file, "rb")
+            except OSError:
+                return await self._write_response(writer, Response({"error": "not found"}, status=404), version, keep_alive, head_only)
+            lines.append(f"Content-Length: {os.fstat(f.fileno()).st_size}")
+        elif not streaming:
+            lines.append(f"Content-Length: {len(payload)}")
+        writer.write(("\r\n".join(lines) + "\r\n\r\n").encode("latin-1"))
+
+        if f is not None:
+            with f:
+                if not head_only:
+                    await writer.drain()
+                    await asyncio.get_running_loop().sendfile(writer.transport, f)
+            await writer.drain()
+            return keep_alive
+        if head_only:
+            await writer.drain()
+            return keep_alive and not streaming
+        if not streaming:
+            writer.write(payload)
+            await writer.drain()
+            return keep_alive
+
+        chunks = iter(resp.chunks)
+        while True:
+            chunk = await self._run(next, chunks, None)
+            if chunk is None:
+                break
+            if not chunk:
+                continue
+            writer.write(f"{len(chunk):X}\r\n".encode() + chunk + b"\r\n" if chunked else chunk)
+            await writer.drain()
+        if chunked:
+            writer.write(b"0\r\n\r\n")
+        await writer.drain()
+        return keep_alive
+
+
 if __name__ == "__main__":
+    if sys.argv[1:2] == ["reindex"]:
+        sys.exit(reindex_main(sys.argv[2:]))
     init_db()
-    sync_runs_to_db()
+    start_data_backfills()
+    alerts = start_alerts()
+    start_backfill()
     port = int(os.environ.get("PORT", "8787"))
     retention = "unlimited" if RETENTION_DAYS is None else f"{RETENTION_DAYS}d"
-    print(f"Agent Monitor → http://0.0.0.0:{port} | db={DB_PATH} | retention={retention}")
-    HTTPServer(("0.0.0.0", port), Handler).serve_forever()
+    STATIC_ASSETS.load()
+    start_stale_detector()
+    if alerts is not None:
+        run_periodically("alerts", ALERT_CHECK_SECONDS, check_alerts)
+    run_periodically("transcript-snapshotter", TRANSCRIPT_SNAPSHOT_SECONDS, snapshot_finished_transcripts)
+    if RETENTION_DAYS is not None:
+        run_periodically("prune", PRUNE_CHECK_SECONDS, prune_history)
+    if BACKUP_INTERVAL_HOURS > 0:
+        run_periodically("backup", 60, backup_if_due)
+    print(f"Agent Monitor → http://0.0.0.0:{port} | db={DB_PATH} | retention={retention} | engine={SERVER_ENGINE}")
+    if SERVER_ENGINE == "async":
+        AsyncServer("0.0.0.0", port).serve_forever()
+    else:
+        ThreadingHTTPServer(("0.0.0.0", port), Handler).serve_forever()
@@ -1,16 +1,19 @@
-import { useEffect, useMemo, useState } from 'react'
-import { fetchReporting, fetchRunDetail, fetchRuns } from './lib/api'
-import type { Reporting, Run, RunDetail, RunState } from './lib/types'
+import { useCallback, useEffect, useMemo, useRef, useState } from 'react'
+import { fetchIngestProgress, fetchLanes, fetchReporting, fetchRunDetail, fetchRuns } from './lib/api'
+import type { IngestProgress, Reporting, Run, RunDetail, RunState } from './lib/types'
 import { HeaderControls } from './components/HeaderControls'
 import { AgentSidebar } from './components/AgentSidebar'
 import { MetricCards } from './components/MetricCards'
 import { LanesBoard } from './components/LanesBoard'
 import { DetailSheet } from './components/DetailSheet'
 import { ReportingChart } from './components/ReportingChart'
-import { runState } from './lib/utils'
+import { mergeRuns, runState } from './lib/utils'
 import { clampRange, daysBetweenInclusive, defaultRangeForPeriod, todayYmd, type DateRange, type Period } from './lib/reporting'
 
 const themeKey = 'agent-monitor-theme'
+const runsPageSize = 250
+const reportMaxPoints = 180
+const lanePerAgent = 50
 const filtersKey = 'agent-monitor-filters-v1'
 
 export default function App() {
@@ -27,6 +30,9 @@ export default function App() {
   const [laneMode, setLaneMode] = useState<'lanes' | 'list'>((params.get('laneMode') as 'lanes' | 'list') || (saved.laneMode as 'lanes' | 'list') || 'list')
   const [intervalSec, setIntervalSec] = useState(10)
   const [runs, setRuns] = useState<Run[]>([])
+  const [olderPages, setOlderPages] = useState(0)
+  const [hasOlder, setHasOlder] = useState(false)
+  const [loadingOlder, setLoadingOlder] = useState(false)
   const [reporting, setReporting] = useState<Reporting>()
   const [selectedRun, setSelectedRun] = useState<RunDetail>()
   const [selectedAgent, setSelectedAgent] = useState(params.get('agent') || saved.agent || 'all')
@@ -35,6 +41,8 @@ export default function App() {
   const [search, setSearch] = useState(params.get('q') || saved.q || '')
   const [timeWindow, setTimeWindow] = useState(params.get('window') || saved.window || '24')
   const [lastUpdate, setLastUpdate] = useState('')
+  const [backfill, setBackfill] = useState<IngestProgress>()
+  const backfillSettled = useRef(false)
   const [reportPeriod, setReportPeriod] = useState<Period>((params.get('period') as Period) || (saved.period as Period) || 'daily')
   const [reportRange, setReportRange] = useState<DateRange>(() => {
     const fallback = defaultRangeForPeriod((params.get('period') as Period) || (saved.period as Period) || 'daily')
@@ -72,9 +80,24 @@ export default function App() {
   }, [page, laneMode, selectedAgent, stateFilter, search, timeWindow, reportPeriod, reportRange])
 
   const load = async () => {
-    const runParams = new URLSearchParams({ limit: '250', offset: '0' })
-    const r = await fetchRuns(runParams)
-    setRuns(r.items)
+    if (!backfillSettled.current) {
+      fetchIngestProgress()
+        .then((p) => {
+          backfillSettled.current = p.state !== 'running'
+          setBackfill(p)
+        })
+        .catch(() => {})
+    }
+    if (laneMode === 'lanes') {
+      const l = await fetchLanes(new URLSearchParams({ perAgent: String(lanePerAgent), taskMaxLen: '600' }))
+      setRuns((prev) => mergeRuns(prev, l.lanes.flatMap((lane) => lane.items)))
+      setHasOlder(false)
+    } else {
+      const runParams = new URLSearchParams({ limit: String(runsPageSize), offset: '0', taskMaxLen: '600' })
+      const r = await fetchRuns(runParams)
+      setRuns((prev) => mergeRuns(prev, r.items, olderPages > 0))
+      if (olderPages === 0) setHasOlder(r.total > r.items.length)
+    }
     setLastUpdate(new Date().toLocaleTimeString())
 
     const clamped = clampRange(reportRange)
@@ -91,6 +114,8 @@ export default function App() {
       includeStaleRunning: '1',
       startDate: clamped.start,
       endDate: clamped.end,
+      tz: Intl.DateTimeFormat().resolvedOptions().timeZone,
+      maxPoints: String(reportMaxPoints),
     }))
     setReporting(rp)
   }
@@ -100,7 +125,26 @@ export default function App() {
     if (intervalSec <= 0) return
     const id = setInterval(load, intervalSec * 1000)
     return () => clearInterval(id)
-  }, [intervalSec, page, reportPeriod, reportRange])
+  }, [intervalSec, page, reportPeriod, reportRange, olderPages, laneMode])
+
+  useEffect(() => {
+    if (laneMode === 'lanes') setOlderPages(0)
+  }, [laneMode])
+
+  const loadOlder = async () => {
+    setLoadingOlder(true)
+    try {
+      const r = await fetchRuns(new URLSearchParams({ limit: String(runsPageSize), offset: String(runs.length), taskMaxLen: '600' }))
+      setRuns((prev) => {
+        const seen = new Set(prev.map((x) => x.runId))
+        return [...prev, ...r.items.filter((x) => !seen.has(x.runId))]
+      })
+      setHasOlder(runs.length + r.items.length < r.total)
+      setOlderPages((n) => n + 1)
+    } finally {
+      setLoadingOlder(false)
+    }
+  }
 
   const filteredRuns = useMemo(() => {
     let list = [...runs]
@@ -115,7 +159,7 @@ export default function App() {
     return list
   }, [runs, selectedAgent, stateFilter, timeWindow, search])
 
-  const openDetail = async (id: string) => setSelectedRun(await fetchRunDetail(id))
+  const openDetail = useCallback(async (id: string) => setSelectedRun(await fetchRunDetail(id)), [])
 
   const onPeriodChange = (p: Period) => {
     setReportPeriod(p)
@@ -149,6 +193,7 @@ export default function App() {
         toggleTheme={() => setDark((d) => !d)}
         refresh={load}
         lastUpdate={lastUpdate}
+        backfill={backfill}
       />
 
       <div className="flex gap-1 border-b border-[var(--border)] bg-[var(--surface)] px-4 py-2 md:px-8">
@@ -180,6 +225,13 @@ export default function App() {
               </div>
             </div>
             <LanesBoard runs={filteredRuns} laneMode={laneMode} onSelect={openDetail} />
+            {hasOlder ? (
+              <div className="mt-4 flex justify-center">
+                <button className="h-9 rounded-lg border border-[var(--border)] bg-[var(--surface-2)] px-4 font-mono text-[0.74rem] text-[var(--text-2)] disabled:opacity-50" disabled={loadingOlder} onClick={loadOlder}>
+                  {loadingOlder ? 'loading…' : 'Load older runs'}
+                </button>
+              </div>
+            ) : null}
           </main>
         </div>
       ) : (
@@ -1,3 +1,5 @@
+import type { IngestProgress } from '../lib/types'
+
 type Props = {
   laneMode: 'lanes' | 'list'
   setLaneMode: (m: 'lanes' | 'list') => void
@@ -7,6 +9,7 @@ type Props = {
   toggleTheme: () => void
   refresh: () => void
   lastUpdate: string
+  backfill?: IngestProgress
 }
 
 export function HeaderControls(props: Props) {
@@ -19,6 +22,11 @@ export function HeaderControls(props: Props) {
           <div className="flex items-center gap-1.5">
             <span className="h-1.5 w-1.5 rounded-full bg-[var(--green)] shadow-[0_0_6px_var(--green)]" />
             <span className="truncate font-mono text-[0.72rem] text-[var(--text-3)]">{props.lastUpdate ? `updated ${props.lastUpdate}` : 'loading…'}</span>
+            {props.backfill?.state === 'running' && (
+              <span className="truncate font-mono text-[0.72rem] text-[var(--orange)]" title={`${props.backfill.done} / ${props.backfill.total} runs imported`}>
+                · backfilling {props.backfill.percent.toFixed(0)}%
+              </span>
+            )}
           </div>
         </div>
       </div>
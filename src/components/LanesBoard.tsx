@@ -1,5 +1,7 @@
+import { memo, useMemo } from 'react'
 import type { Run } from '../lib/types'
 import { fmtDuration, runState } from '../lib/utils'
+import { useVirtualWindow } from '../lib/virtual'
 
 type Props = {
   runs: Run[]
@@ -37,38 +39,66 @@ function statusFor(run: Run) {
 }
 
 export function LanesBoard({ runs, laneMode, onSelect }: Props) {
-  if (laneMode === 'list') {
-    return <div className="flex flex-col gap-2.5">{runs.map((r) => <RunCard key={r.runId} run={r} onSelect={onSelect} />)}</div>
-  }
+  const lanes = useMemo(() => {
+    const byAgent = new Map<string, Run[]>()
+    for (const r of runs) {
+      const list = byAgent.get(r.agentId)
+      if (list) list.push(r)
+      else byAgent.set(r.agentId, [r])
+    }
+    return [...byAgent.entries()]
+  }, [runs])
+
+  if (laneMode === 'list') return <RunList runs={runs} onSelect={onSelect} />
 
-  const agentIds = Array.from(new Set(runs.map((r) => r.agentId)))
   return (
     <div className="flex gap-3 overflow-x-auto pb-3 max-lg:flex-col">
-      {agentIds.map((agentId) => {
-        const agentRuns = runs.filter((r) => r.agentId === agentId)
-        return (
-          <section
-            key={agentId}
-            className="min-w-[312px] max-w-[392px] flex-shrink-0 overflow-hidden rounded-xl border border-[var(--border)]/85 bg-[var(--surface)]/95 shadow-[inset_0_1px_0_rgba(255,255,255,0.015)] max-lg:max-w-none"
-          >
-            <header className="flex items-center justify-between border-b border-[var(--border)]/85 bg-[var(--surface-2)]/40 px-3.5 py-2.5">
-              <span className="truncate text-[0.79rem] font-semibold tracking-[0.01em] text-[var(--text-2)]">{agentId}</span>
-              <span className="font-mono text-[0.64rem] text-[var(--text-3)]">{agentRuns.length} runs</span>
-            </header>
-            <div className="flex max-h-[70vh] flex-col gap-2 overflow-y-auto p-2.5">{agentRuns.map((r) => <LaneCard key={r.runId} run={r} onSelect={onSelect} />)}</div>
-          </section>
-        )
-      })}
+      {lanes.map(([agentId, agentRuns]) => (
+        <Lane key={agentId} agentId={agentId} runs={agentRuns} onSelect={onSelect} />
+      ))}
     </div>
   )
 }
 
+function RunList({ runs, onSelect }: { runs: Run[]; onSelect: (id: string) => void }) {
+  const v = useVirtualWindow({ count: runs.length, estimateSize: 84, gap: 10, scroll: 'window' })
+  return (
+    <div ref={v.containerRef} className="flex flex-col gap-2.5" style={{ paddingTop: v.padTop, paddingBottom: v.padBottom }}>
+      {runs.slice(v.start, v.end).map((r, i) => (
+        <RunCard key={r.runId} run={r} onSelect={onSelect} measureRef={i === 0 ? v.measureRef : undefined} />
+      ))}
+    </div>
+  )
+}
+
+const Lane = memo(function Lane({ agentId, runs, onSelect }: { agentId: string; runs: Run[]; onSelect: (id: string) => void }) {
+  const v = useVirtualWindow({ count: runs.length, estimateSize: 70, gap: 8, scroll: 'element' })
+  return (
+    <section className="min-w-[312px] max-w-[392px] flex-shrink-0 overflow-hidden rounded-xl border border-[var(--border)]/85 bg-[var(--surface)]/95 shadow-[inset_0_1px_0_rgba(255,255,255,0.015)] max-lg:max-w-none">
+      <header className="flex items-center justify-between border-b border-[var(--border)]/85 bg-[var(--surface-2)]/40 px-3.5 py-2.5">
+        <span className="truncate text-[0.79rem] font-semibold tracking-[0.01em] text-[var(--text-2)]">{agentId}</span>
+        <span className="font-mono text-[0.64rem] text-[var(--text-3)]">{runs.length} runs</span>
+      </header>
+      <div ref={v.containerRef} className="max-h-[70vh] overflow-y-auto p-2.5">
+        <div className="flex flex-col gap-2" style={{ paddingTop: v.padTop, paddingBottom: v.padBottom }}>
+          {runs.slice(v.start, v.end).map((r, i) => (
+            <LaneCard key={r.runId} run={r} onSelect={onSelect} measureRef={i === 0 ? v.measureRef : undefined} />
+          ))}
+        </div>
+      </div>
+    </section>
+  )
+})
+
 const runCardShell = 'border border-[rgba(45,49,61,0.72)] rounded-xl shadow-none transition hover:border-[var(--border-hover)]'
 
-function RunCard({ run, onSelect }: { run: Run; onSelect: (id: string) => void }) {
+type CardProps = { run: Run; onSelect: (id: string) => void; measureRef?: (node: HTMLElement | null) => void }
+
+const RunCard = memo(function RunCard({ run, onSelect, measureRef }: CardProps) {
   const badge = statusFor(run)
   return (
     <button
+      ref={measureRef}
       type="button"
       className={`grid w-full grid-cols-[84px_1fr_auto] items-center gap-3 ${runCardShell} bg-[var(--surface)] px-4 py-3 text-left font-sans hover:bg-[var(--surface-2)]/40 max-lg:grid-cols-1 max-lg:gap-2 max-lg:px-3.5 max-lg:py-3`}
       onClick={() => onSelect(run.runId)}
@@ -91,12 +121,13 @@ function RunCard({ run, onSelect }: { run: Run; onSelect: (id: string) => void }
       <div className="font-mono text-[0.64rem] text-[var(--text-3)] max-lg:text-left">{new Date(run.startedAt).toLocaleString()}</div>
     </button>
   )
-}
+})
 
-function LaneCard({ run, onSelect }: { run: Run; onSelect: (id: string) => void }) {
+const LaneCard = memo(function LaneCard({ run, onSelect, measureRef }: CardProps) {
   const badge = statusFor(run)
   return (
     <button
+      ref={measureRef}
       type="button"
       className={`w-full ${runCardShell} bg-[var(--surface)] px-3 py-2.5 text-left font-sans hover:bg-[var(--surface-2)]/40`}
       onClick={() => onSelect(run.runId)}
@@ -117,4 +148,4 @@ function LaneCard({ run, onSelect }: { run: Run; onSelect: (id: string) => void
       </div>
     </button>
   )
-}
+})
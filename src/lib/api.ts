@@ -1,4 +1,4 @@
-import type { Reporting, RunDetail, RunsResponse } from './types'
+import type { IngestProgress, LanesResponse, Reporting, RunDetail, RunDetailsResponse, RunsResponse } from './types'
 
 const bases = ['','/agent-monitor']
 
@@ -10,7 +10,60 @@ async function api<T>(path: string): Promise<T> {
   throw new Error(`API failed: ${path}`)
 }
 
+/** `?format=columnar` payloads: one array per field, see `columnar()` in server.py. */
+type Column =
+  | unknown[]
+  | { dict: unknown[]; codes: number[] }
+  | { delta: Array<number | null> }
+  | { obj: ColumnarTable }
+  | { rows: ColumnarTable; lens: number[] }
+
+type ColumnarTable = { n: number; cols: Record<string, Column> }
+
+function decodeColumn(col: Column): unknown[] {
+  if (Array.isArray(col)) return col
+  if ('dict' in col) return col.codes.map((c) => col.dict[c])
+  if ('delta' in col) {
+    let prev = 0
+    return col.delta.map((d) => (d === null ? null : (prev += d)))
+  }
+  if ('obj' in col) return decodeTable(col.obj)
+  const flat = decodeTable(col.rows)
+  let i = 0
+  return col.lens.map((len) => flat.slice(i, (i += len)))
+}
+
+export function decodeTable<T = Record<string, unknown>>(table: ColumnarTable): T[] {
+  const rows = Array.from({ length: table.n }, () => ({}) as Record<string, unknown>)
+  for (const [key, col] of Object.entries(table.cols)) {
+    const values = decodeColumn(col)
+    for (let i = 0; i < table.n; i++) rows[i][key] = values[i]
+  }
+  return rows as T[]
+}
+
+const withColumnar = (params: URLSearchParams) => {
+  const q = new URLSearchParams(params)
+  q.set('format', 'columnar')
+  return q.toString()
+}
+
 export const fetchAgents = () => api<string[]>('/agents')
-export const fetchRuns = (params: URLSearchParams) => api<RunsResponse>(`/runs?${params.toString()}`)
+export const fetchRuns = async (params: URLSearchParams): Promise<RunsResponse> => {
+  const res = await api<Omit<RunsResponse, 'items'> & { items: ColumnarTable }>(`/runs?${withColumnar(params)}`)
+  return { ...res, items: decodeTable(res.items) }
+}
+export const fetchLanes = (params: URLSearchParams) => api<LanesResponse>(`/lanes?${params.toString()}`)
 export const fetchRunDetail = (runId: string) => api<RunDetail>(`/runs/${runId}`)
-export const fetchReporting = (params: URLSearchParams) => api<Reporting>(`/reports/dashboard?${params.toString()}`)
+export const fetchRunDetails = (runIds: string[]) => api<RunDetailsResponse>(`/runs/batch?ids=${runIds.map(encodeURIComponent).join(',')}`)
+export const fetchIngestProgress = () => api<IngestProgress>('/ingest/progress')
+export const fetchReporting = async (params: URLSearchParams): Promise<Reporting> => {
+  const res = await api<Reporting>(`/reports/dashboard?${withColumnar(params)}`)
+  const series = res.series as unknown as Record<string, unknown>
+  for (const key of ['runtimeTrend', 'runtimeSplitByAgent', 'runsTrend', 'tokenTrend']) {
+    series[key] = decodeTable(series[key] as ColumnarTable)
+  }
+  const usage = series.usageStacked as { items: unknown } | undefined
+  if (usage) usage.items = decodeTable(usage.items as ColumnarTable)
+  return res
+}
@@ -17,6 +17,7 @@ export type Run = {
   outputTokens?: number
   totalTokens?: number
   lastHeartbeatAt?: number
+  staleAt?: number | null
   outcome?: { status?: string }
 }
 
@@ -29,6 +30,16 @@ export type RunDetail = Run & {
   }>
 }
 
+export type LanesResponse = {
+  perAgent: number
+  lanes: Array<{ agentId: string; total: number; items: Run[] }>
+}
+
+export type RunDetailsResponse = {
+  items: RunDetail[]
+  missing: string[]
+}
+
 export type RunsResponse = {
   items: Run[]
   total: number
@@ -48,8 +59,10 @@ export type Reporting = {
   windowDays: number
   totals: { runCount: number; runtimeMs: number; agentCount: number; totalTokens?: number }
   series: {
-    runtimeTrend: Array<{ date: string; runtimeMs: number }>
-    runtimeSplitByAgent: Array<{ date: string; agents: Array<{ agentId: string; runtimeMs: number; runCount: number }> }>
+    /** Days folded into each trend point when the window exceeds `maxPoints`. */
+    bucketDays?: number
+    runtimeTrend: Array<{ date: string; endDate?: string; runtimeMs: number }>
+    runtimeSplitByAgent: Array<{ date: string; endDate?: string; agents: Array<{ agentId: string; runtimeMs: number; runCount: number }> }>
     usageStacked?: {
       period: 'daily' | 'weekly' | 'monthly'
       bucketCount: number
@@ -69,3 +82,13 @@ export type Reporting = {
   }
   agentIds: string[]
 }
+
+export type IngestProgress = {
+  state: 'idle' | 'running' | 'done' | 'error'
+  total: number
+  done: number
+  percent: number
+  runsPerSec: number
+  etaMs: number | null
+  error: string | null
+}
@@ -14,6 +14,7 @@ export const runState = (run: Run, now = Date.now()): RunState => {
   const hb = run.lastHeartbeatAt ?? run.startedAt ?? now
   const idleMs = now - hb
   if (run.status === 'running') {
+    if (run.staleAt) return 'stalled'
     if (idleMs < 2 * 60_000) return 'running'
     if (idleMs < 10 * 60_000) return 'quiet'
     return 'stalled'
@@ -27,3 +28,52 @@ export const stateTone: Record<RunState, string> = {
   stalled: 'status-stalled',
   dead: 'status-dead'
 }
+
+const runFields: Array<keyof Run> = [
+  'label',
+  'agentId',
+  'model',
+  'status',
+  'startedAt',
+  'endedAt',
+  'runtimeMs',
+  'timeoutSeconds',
+  'task',
+  'sessionKey',
+  'inputTokens',
+  'outputTokens',
+  'totalTokens',
+  'lastHeartbeatAt',
+  'staleAt',
+]
+
+export const sameRun = (a: Run, b: Run) => runFields.every((k) => a[k] === b[k]) && a.outcome?.status === b.outcome?.status
+
+/**
+ * Merge a refreshed page of runs into the loaded list by runId. Unchanged runs
+ * keep their previous object identity so memoized rows skip re-rendering, and
+ * with `keepOlder` runs from "Load older runs" pages beyond the refreshed page
+ * are retained. Returns `prev` itself when nothing changed.
+ */
+export function mergeRuns(prev: Run[], fresh: Run[], keepOlder = false): Run[] {
+  const byId = new Map(prev.map((r) => [r.runId, r]))
+  let changed = fresh.length !== prev.length && !keepOlder
+  const merged = fresh.map((run, i) => {
+    const old = byId.get(run.runId)
+    if (old && sameRun(old, run)) {
+      if (prev[i] !== old) changed = true
+      return old
+    }
+    changed = true
+    return run
+  })
+  if (keepOlder && fresh.length) {
+    const freshIds = new Set(fresh.map((r) => r.runId))
+    const oldest = fresh[fresh.length - 1].startedAt
+    for (const run of prev) {
+      if (!freshIds.has(run.runId) && run.startedAt <= oldest) merged.push(run)
+    }
+    changed = changed || merged.length !== prev.length
+  }
+  return changed ? merged : prev
+}
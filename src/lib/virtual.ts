@@ -0,0 +1,72 @@
+import { useCallback, useEffect, useLayoutEffect, useRef, useState } from 'react'
+
+type Options = {
+  count: number
+  /** Row height (including gap) used until the first row has been measured. */
+  estimateSize: number
+  /** Vertical gap between rows in px (flex `gap`), added to the measured height. */
+  gap?: number
+  overscan?: number
+  /** `window`: the list scrolls with the page. `element`: the container itself scrolls. */
+  scroll: 'window' | 'element'
+}
+
+/**
+ * Fixed-row-height windowing. Rows are uniform (single-line cards), so the first
+ * rendered row is measured and used as the stride for the whole list.
+ */
+export function useVirtualWindow({ count, estimateSize, gap = 0, overscan = 8, scroll }: Options) {
+  const containerRef = useRef<HTMLDivElement>(null)
+  const [rowSize, setRowSize] = useState(estimateSize)
+  const [range, setRange] = useState({ start: 0, end: Math.min(count, overscan * 3) })
+
+  const update = useCallback(() => {
+    const el = containerRef.current
+    if (!el) return
+    const viewTop = scroll === 'window' ? Math.max(0, -el.getBoundingClientRect().top) : el.scrollTop
+    const viewHeight = scroll === 'window' ? window.innerHeight : el.clientHeight
+    const start = Math.min(count, Math.max(0, Math.floor(viewTop / rowSize) - overscan))
+    const end = Math.min(count, Math.ceil((viewTop + viewHeight) / rowSize) + overscan)
+    setRange((prev) => (prev.start === start && prev.end === end ? prev : { start, end }))
+  }, [count, rowSize, overscan, scroll])
+
+  useLayoutEffect(update, [update])
+
+  useEffect(() => {
+    const target: Window | HTMLElement | null = scroll === 'window' ? window : containerRef.current
+    if (!target) return
+    let frame = 0
+    const onScroll = () => {
+      if (frame) return
+      frame = requestAnimationFrame(() => {
+        frame = 0
+        update()
+      })
+    }
+    target.addEventListener('scroll', onScroll, { passive: true })
+    window.addEventListener('resize', onScroll)
+    return () => {
+      if (frame) cancelAnimationFrame(frame)
+      target.removeEventListener('scroll', onScroll)
+      window.removeEventListener('resize', onScroll)
+    }
+  }, [update, scroll])
+
+  const measureRef = useCallback(
+    (node: HTMLElement | null) => {
+      if (!node) return
+      const size = node.getBoundingClientRect().height + gap
+      if (size > 0 && Math.abs(size - rowSize) > 0.5) setRowSize(size)
+    },
+    [gap, rowSize],
+  )
+
+  return {
+    containerRef,
+    measureRef,
+    start: range.start,
+    end: range.end,
+    padTop: range.start * rowSize,
+    padBottom: Math.max(0, (count - range.end) * rowSize),
+  }
+}
@@ -1,40 +0,0 @@
-(function(){const t=document.createElement("link").relList;if(t&&t.supports&&t.supports("modulepreload"))return;for(const l of document.querySelectorAll('link[rel="modulepreload"]'))r(l);new MutationObserver(l=>{for(const o of l)if(o.type==="childList")for(const u of o.addedNodes)u.tagName==="LINK"&&u.rel==="modulepreload"&&r(u)}).observe(document,{childList:!0,subtree:!0});function n(l){const o={};return l.integrity&&(o.integrity=l.integrity),l.referrerPolicy&&(o.referrerPolicy=l.referrerPolicy),l.crossOrigin==="use-credentials"?o.credentials="include":l.crossOrigin==="anonymous"?o.credentials="omit":o.credentials="same-origin",o}function r(l){if(l.ep)return;l.ep=!0;const o=n(l);fetch(l.href,o)}})();function kc(e){return e&&e.__esModule&&Object.prototype.hasOwnProperty.call(e,"default")?e.default:e}var rs={exports:{}},fl={},ls={exports:{}},D={};/**
- * @license React
- * react.production.min.js
- *
- * Copyright (c) Facebook, Inc. and its affiliates.
- *
- * This source code is licensed under the MIT license found in the
- * LICENSE file in the root directory of this source tree.
- */var lr=Symbol.for("react.element"),Sc=Symbol.for("react.portal"),Nc=Symbol.for("react.fragment"),Ec=Symbol.for("react.strict_mode"),Cc=Symbol.for("react.profiler"),jc=Symbol.for("react.provider"),_c=Symbol.for("react.context"),Pc=Symbol.for("react.forward_ref"),Tc=Symbol.for("react.suspense"),zc=Symbol.for("react.memo"),Lc=Symbol.for("react.lazy"),Qu=Symbol.iterator;function Rc(e){return e===null||typeof e!="object"?null:(e=Qu&&e[Qu]||e["@@iterator"],typeof e=="function"?e:null)}var os={isMounted:function(){return!1},enqueueForceUpdate:function(){},enqueueReplaceState:function(){},enqueueSetState:function(){}},us=Object.assign,is={};function mn(e,t,n){this.props=e,this.context=t,this.refs=is,this.updater=n||os}mn.prototype.isReactComponent={};mn.prototype.setState=function(e,t){if(typeof e!="object"&&typeof e!="function"&&e!=null)throw Error("setState(...): takes an object of state variables to update or a function which returns an object of state variables.");this.updater.enqueueSetState(this,e,t,"setState")};mn.prototype.forceUpdate=function(e){this.updater.enqueueForceUpdate(this,e,"forceUpdate")};function ss(){}ss.prototype=mn.prototype;function Zo(e,t,n){this.props=e,this.context=t,this.refs=is,this.updater=n||os}var Jo=Zo.prototype=new ss;Jo.constructor=Zo;us(Jo,mn.prototype);Jo.isPureReactComponent=!0;var Ku=Array.isArray,as=Object.prototype.hasOwnProperty,qo={current:null},cs={key:!0,ref:!0,__self:!0,__source:!0};function ds(e,t,n){var r,l={},o=null,u=null;if(t!=null)for(r in t.ref!==void 0&&(u=t.ref),t.key!==void 0&&(o=""+t.key),t)as.call(t,r)&&!cs.hasOwnProperty(r)&&(l[r]=t[r]);var i=arguments.length-2;if(i===1)l.children=n;else if(1<i){for(var s=Array(i),d=0;d<i;d++)s[d]=arguments[d+2];l.children=s}if(e&&e.defaultProps)for(r in i=e.defaultProps,i)l[r]===void 0&&(l[r]=i[r]);return{$$typeof:lr,type:e,key:o,ref:u,props:l,_owner:qo.current}}function Mc(e,t){return{$$typeof:lr,type:e.type,key:t,ref:e.ref,props:e.props,_owner:e._owner}}function bo(e){return typeof e=="object"&&e!==null&&e.$$typeof===lr}function Dc(e){var t={"=":"=0",":":"=2"};return"$"+e.replace(/[=:]/g,function(n){return t[n]})}var Yu=/\/+/g;function Pl(e,t){return typeof e=="object"&&e!==null&&e.key!=null?Dc(""+e.key):t.toString(36)}function Pr(e,t,n,r,l){var o=typeof e;(o==="undefined"||o==="boolean")&&(e=null);var u=!1;if(e===null)u=!0;else switch(o){case"string":case"number":u=!0;break;case"object":switch(e.$$typeof){case lr:case Sc:u=!0}}if(u)return u=e,l=l(u),e=r===""?"."+Pl(u,0):r,Ku(l)?(n="",e!=null&&(n=e.replace(Yu,"$&/")+"/"),Pr(l,t,n,"",function(d){return d})):l!=null&&(bo(l)&&(l=Mc(l,n+(!l.key||u&&u.key===l.key?"":(""+l.key).replace(Yu,"$&/")+"/")+e)),t.push(l)),1;if(u=0,r=r===""?".":r+":",Ku(e))for(var i=0;i<e.length;i++){o=e[i];var s=r+Pl(o,i);u+=Pr(o,t,n,s,l)}else if(s=Rc(e),typeof s=="function")for(e=s.call(e),i=0;!(o=e.next()).done;)o=o.value,s=r+Pl(o,i++),u+=Pr(o,t,n,s,l);else if(o==="object")throw t=String(e),Error("Objects are not valid as a React child (found: "+(t==="[object Object]"?"object with keys {"+Object.keys(e).join(", ")+"}":t)+"). If you meant to render a collection of children, use an array instead.");return u}function dr(e,t,n){if(e==null)return e;var r=[],l=0;return Pr(e,r,"","",function(o){return t.call(n,o,l++)}),r}function Ic(e){if(e._status===-1){var t=e._result;t=t(),t.then(function(n){(e._status===0||e._status===-1)&&(e._status=1,e._result=n)},function(n){(e._status===0||e._status===-1)&&(e._status=2,e._result=n)}),e._status===-1&&(e._status=0,e._result=t)}if(e._status===1)return e._result.default;throw e._result}var ce={current:null},Tr={transition:null},Oc={ReactCurrentDispatcher:ce,ReactCurrentBatchConfig:Tr,ReactCurrentOwner:qo};function fs(){throw Error("act(...) is not supported in production builds of React.")}D.Children={map:dr,forEach:function(e,t,n){dr(e,function(){t.apply(this,arguments)},n)},count:function(e){var t=0;return dr(e,function(){t++}),t},toArray:function(e){return dr(e,function(t){return t})||[]},only:function(e){if(!bo(e))throw Error("React.Children.only expected to receive a single React element child.");return e}};D.Component=mn;D.Fragment=Nc;D.Profiler=Cc;D.PureComponent=Zo;D.StrictMode=Ec;D.Suspense=Tc;D.__SECRET_INTERNALS_DO_NOT_USE_OR_YOU_WILL_BE_FIRED=Oc;D.act=fs;D.cloneElement=function(e,t,n){if(e==null)throw Error("React.cloneElement(...): The argument must be a React element, but you passed "+e+".");var r=us({},e.props),l=e.key,o=e.ref,u=e._owner;if(t!=null){if(t.ref!==void 0&&(o=t.ref,u=qo.current),t.key!==void 0&&(l=""+t.key),e.type&&e.type.defaultProps)var i=e.type.defaultProps;for(s in t)as.call(t,s)&&!cs.hasOwnProperty(s)&&(r[s]=t[s]===void 0&&i!==void 0?i[s]:t[s])}var s=arguments.length-2;if(s===1)r.children=n;else if(1<s){i=Array(s);for(var d=0;d<s;d++)i[d]=arguments[d+2];r.children=i}return{$$typeof:lr,type:e.type,key:l,ref:o,props:r,_owner:u}};D.createContext=function(e){return e={$$typeof:_c,_currentValue:e,_currentValue2:e,_threadCount:0,Provider:null,Consumer:null,_defaultValue:null,_globalName:null},e.Provider={$$typeof:jc,_context:e},e.Consumer=e};D.createElement=ds;D.createFactory=function(e){var t=ds.bind(null,e);return t.type=e,t};D.createRef=function(){return{current:null}};D.forwardRef=function(e){return{$$typeof:Pc,render:e}};D.isValidElement=bo;D.lazy=function(e){return{$$typeof:Lc,_payload:{_status:-1,_result:e},_init:Ic}};D.memo=function(e,t){return{$$typeof:zc,type:e,compare:t===void 0?null:t}};D.startTransition=function(e){var t=Tr.transition;Tr.transition={};try{e()}finally{Tr.transition=t}};D.unstable_act=fs;D.useCallback=function(e,t){return ce.current.useCallback(e,t)};D.useContext=function(e){return ce.current.useContext(e)};D.useDebugValue=function(){};D.useDeferredValue=function(e){return ce.current.useDeferredValue(e)};D.useEffect=function(e,t){return ce.current.useEffect(e,t)};D.useId=function(){return ce.current.useId()};D.useImperativeHandle=function(e,t,n){return ce.current.useImperativeHandle(e,t,n)};D.useInsertionEffect=function(e,t){return ce.current.useInsertionEffect(e,t)};D.useLayoutEffect=function(e,t){return ce.current.useLayoutEffect(e,t)};D.useMemo=function(e,t){return ce.current.useMemo(e,t)};D.useReducer=function(e,t,n){return ce.current.useReducer(e,t,n)};D.useRef=function(e){return ce.current.useRef(e)};D.useState=function(e){return ce.current.useState(e)};D.useSyncExternalStore=function(e,t,n){return ce.current.useSyncExternalStore(e,t,n)};D.useTransition=function(){return ce.current.useTransition()};D.version="18.3.1";ls.exports=D;var F=ls.exports;const Fc=kc(F);/**
- * @license React
- * react-jsx-runtime.production.min.js
- *
- * Copyright (c) Facebook, Inc. and its affiliates.
- *
- * This source code is licensed under the MIT license found in the
- * LICENSE file in the root directory of this source tree.
- */var $c=F,Uc=Symbol.for("react.element"),Ac=Symbol.for("react.fragment"),Vc=Object.prototype.hasOwnProperty,Bc=$c.__SECRET_INTERNALS_DO_NOT_USE_OR_YOU_WILL_BE_FIRED.ReactCurrentOwner,Wc={key:!0,ref:!0,__self:!0,__source:!0};function ps(e,t,n){var r,l={},o=null,u=null;n!==void 0&&(o=""+n),t.key!==void 0&&(o=""+t.key),t.ref!==void 0&&(u=t.ref);for(r in t)Vc.call(t,r)&&!Wc.hasOwnProperty(r)&&(l[r]=t[r]);if(e&&e.defaultProps)for(r in t=e.defaultProps,t)l[r]===void 0&&(l[r]=t[r]);return{$$typeof:Uc,type:e,key:o,ref:u,props:l,_owner:Bc.current}}fl.Fragment=Ac;fl.jsx=ps;fl.jsxs=ps;rs.exports=fl;var a=rs.exports,no={},ms={exports:{}},Se={},vs={exports:{}},hs={};/**
- * @license React
- * scheduler.production.min.js
- *
- * Copyright (c) Facebook, Inc. and its affiliates.
- *
- * This source code is licensed under the MIT license found in the
- * LICENSE file in the root directory of this source tree.
- */(function(e){function t(_,L){var N=_.length;_.push(L);e:for(;0<N;){var M=N-1>>>1,R=_[M];if(0<l(R,L))_[M]=L,_[N]=R,N=M;else break e}}function n(_){return _.length===0?null:_[0]}function r(_){if(_.length===0)return null;var L=_[0],N=_.pop();if(N!==L){_[0]=N;e:for(var M=0,R=_.length,Ee=R>>>1;M<Ee;){var ge=2*(M+1)-1,xn=_[ge],kt=ge+1,cr=_[kt];if(0>l(xn,N))kt<R&&0>l(cr,xn)?(_[M]=cr,_[kt]=N,M=kt):(_[M]=xn,_[ge]=N,M=ge);else if(kt<R&&0>l(cr,N))_[M]=cr,_[kt]=N,M=kt;else break e}}return L}function l(_,L){var N=_.sortIndex-L.sortIndex;return N!==0?N:_.id-L.id}if(typeof performance=="object"&&typeof performance.now=="function"){var o=performance;e.unstable_now=function(){return o.now()}}else{var u=Date,i=u.now();e.unstable_now=function(){return u.now()-i}}var s=[],d=[],h=1,v=null,m=3,k=!1,S=!1,E=!1,z=typeof setTimeout=="function"?setTimeout:null,f=typeof clearTimeout=="function"?clearTimeout:null,c=typeof setImmediate<"u"?setImmediate:null;typeof navigator<"u"&&navigator.scheduling!==void 0&&navigator.scheduling.isInputPending!==void 0&&navigator.scheduling.isInputPending.bind(navigator.scheduling);function p(_){for(var L=n(d);L!==null;){if(L.callback===null)r(d);else if(L.startTime<=_)r(d),L.sortIndex=L.expirationTime,t(s,L);else break;L=n(d)}}function y(_){if(E=!1,p(_),!S)if(n(s)!==null)S=!0,gn(g);else{var L=n(d);L!==null&&yn(y,L.startTime-_)}}function g(_,L){S=!1,E&&(E=!1,f(j),j=-1),k=!0;var N=m;try{for(p(L),v=n(s);v!==null&&(!(v.expirationTime>L)||_&&!ie());){var M=v.callback;if(typeof M=="function"){v.callback=null,m=v.priorityLevel;var R=M(v.expirationTime<=L);L=e.unstable_now(),typeof R=="function"?v.callback=R:v===n(s)&&r(s),p(L)}else r(s);v=n(s)}if(v!==null)var Ee=!0;else{var ge=n(d);ge!==null&&yn(y,ge.startTime-L),Ee=!1}return Ee}finally{v=null,m=N,k=!1}}var w=!1,C=null,j=-1,O=5,T=-1;function ie(){return!(e.unstable_now()-T<O)}function Y(){if(C!==null){var _=e.unstable_now();T=_;var L=!0;try{L=C(!0,_)}finally{L?Le():(w=!1,C=null)}}else w=!1}var Le;if(typeof c=="function")Le=function(){c(Y)};else if(typeof MessageChannel<"u"){var $t=new MessageChannel,ar=$t.port2;$t.port1.onmessage=Y,Le=function(){ar.postMessage(null)}}else Le=function(){z(Y,0)};function gn(_){C=_,w||(w=!0,Le())}function yn(_,L){j=z(function(){_(e.unstable_now())},L)}e.unstable_IdlePriority=5,e.unstable_ImmediatePriority=1,e.unstable_LowPriority=4,e.unstable_NormalPriority=3,e.unstable_Profiling=null,e.unstable_UserBlockingPriority=2,e.unstable_cancelCallback=function(_){_.callback=null},e.unstable_continueExecution=function(){S||k||(S=!0,gn(g))},e.unstable_forceFrameRate=function(_){0>_||125<_?console.error("forceFrameRate takes a positive int between 0 and 125, forcing frame rates higher than 125 fps is not supported"):O=0<_?Math.floor(1e3/_):5},e.unstable_getCurrentPriorityLevel=function(){return m},e.unstable_getFirstCallbackNode=function(){return n(s)},e.unstable_next=function(_){switch(m){case 1:case 2:case 3:var L=3;break;default:L=m}var N=m;m=L;try{return _()}finally{m=N}},e.unstable_pauseExecution=function(){},e.unstable_requestPaint=function(){},e.unstable_runWithPriority=function(_,L){switch(_){case 1:case 2:case 3:case 4:case 5:break;default:_=3}var N=m;m=_;try{return L()}finally{m=N}},e.unstable_scheduleCallback=function(_,L,N){var M=e.unstable_now();switch(typeof N=="object"&&N!==null?(N=N.delay,N=typeof N=="number"&&0<N?M+N:M):N=M,_){case 1:var R=-1;break;case 2:R=250;break;case 5:R=1073741823;break;case 4:R=1e4;break;default:R=5e3}return R=N+R,_={id:h++,callback:L,priorityLevel:_,startTime:N,expirationTime:R,sortIndex:-1},N>M?(_.sortIndex=N,t(d,_),n(s)===null&&_===n(d)&&(E?(f(j),j=-1):E=!0,yn(y,N-M))):(_.sortIndex=R,t(s,_),S||k||(S=!0,gn(g))),_},e.unstable_shouldYield=ie,e.unstable_wrapCallback=function(_){var L=m;return function(){var N=m;m=L;try{return _.apply(this,arguments)}finally{m=N}}}})(hs);vs.exports=hs;var Hc=vs.exports;/**
- * @license React
- * react-dom.production.min.js
- *
- * Copyright (c) Facebook, Inc. and its affiliates.
- *
- * This source code is licensed under the MIT license found in the
- * LICENSE file in the root directory of this source tree.
- */var Qc=F,ke=Hc;function x(e){for(var t="https://reactjs.org/docs/error-decoder.html?invariant="+e,n=1;n<arguments.length;n++)t+="&args[]="+encodeURIComponent(arguments[n]);return"Minified React error #"+e+"; visit "+t+" for the full message or use the non-minified dev environment for full errors and additional helpful warnings."}var gs=new Set,Vn={};function Ot(e,t){un(e,t),un(e+"Capture",t)}function un(e,t){for(Vn[e]=t,e=0;e<t.length;e++)gs.add(t[e])}var Ge=!(typeof window>"u"||typeof window.document>"u"||typeof window.document.createElement>"u"),ro=Object.prototype.hasOwnProperty,Kc=/^[:A-Z_a-z\u00C0-\u00D6\u00D8-\u00F6\u00F8-\u02FF\u0370-\u037D\u037F-\u1FFF\u200C-\u200D\u2070-\u218F\u2C00-\u2FEF\u3001-\uD7FF\uF900-\uFDCF\uFDF0-\uFFFD][:A-Z_a-z\u00C0-\u00D6\u00D8-\u00F6\u00F8-\u02FF\u0370-\u037D\u037F-\u1FFF\u200C-\u200D\u2070-\u218F\u2C00-\u2FEF\u3001-\uD7FF\uF900-\uFDCF\uFDF0-\uFFFD\-.0-9\u00B7\u0300-\u036F\u203F-\u2040]*$/,Xu={},Gu={};function Yc(e){return ro.call(Gu,e)?!0:ro.call(Xu,e)?!1:Kc.test(e)?Gu[e]=!0:(Xu[e]=!0,!1)}function Xc(e,t,n,r){if(n!==null&&n.type===0)return!1;switch(typeof t){case"function":case"symbol":return!0;case"boolean":return r?!1:n!==null?!n.acceptsBooleans:(e=e.toLowerCase().slice(0,5),e!=="data-"&&e!=="aria-");default:return!1}}function Gc(e,t,n,r){if(t===null||typeof t>"u"||Xc(e,t,n,r))return!0;if(r)return!1;if(n!==null)switch(n.type){case 3:return!t;case 4:return t===!1;case 5:return isNaN(t);case 6:return isNaN(t)||1>t}return!1}function de(e,t,n,r,l,o,u){this.acceptsBooleans=t===2||t===3||t===4,this.attributeName=r,this.attributeNamespace=l,this.mustUseProperty=n,this.propertyName=e,this.type=t,this.sanitizeURL=o,this.removeEmptyString=u}var ne={};"children dangerouslySetInnerHTML defaultValue defaultChecked innerHTML suppressContentEditableWarning suppressHydrationWarning style".split(" ").forEach(function(e){ne[e]=new de(e,0,!1,e,null,!1,!1)});[["acceptCharset","accept-charset"],["className","class"],["htmlFor","for"],["httpEquiv","http-equiv"]].forEach(function(e){var t=e[0];ne[t]=new de(t,1,!1,e[1],null,!1,!1)});["contentEditable","draggable","spellCheck","value"].forEach(function(e){ne[e]=new de(e,2,!1,e.toLowerCase(),null,!1,!1)});["autoReverse","externalResourcesRequired","focusable","preserveAlpha"].forEach(function(e){ne[e]=new de(e,2,!1,e,null,!1,!1)});"allowFullScreen async autoFocus autoPlay controls default defer disabled disablePictureInPicture disableRemotePlayback formNoValidate hidden loop noModule noValidate open playsInline readOnly required reversed scoped seamless itemScope".split(" ").forEach(function(e){ne[e]=new de(e,3,!1,e.toLowerCase(),null,!1,!1)});["checked","multiple","muted","selected"].forEach(function(e){ne[e]=new de(e,3,!0,e,null,!1,!1)});["capture","download"].forEach(function(e){ne[e]=new de(e,4,!1,e,null,!1,!1)});["cols","rows","size","span"].forEach(function(e){ne[e]=new de(e,6,!1,e,null,!1,!1)});["rowSpan","start"].forEach(function(e){ne[e]=new de(e,5,!1,e.toLowerCase(),null,!1,!1)});var eu=/[\-:]([a-z])/g;function tu(e){return e[1].toUpperCase()}"accent-height alignment-baseline arabic-form baseline-shift cap-height clip-path clip-rule color-interpolation color-interpolation-filters color-profile color-rendering dominant-baseline enable-background fill-opacity fill-rule flood-color flood-opacity font-family font-size font-size-adjust font-stretch font-style font-variant font-weight glyph-name glyph-orientation-horizontal glyph-orientation-vertical horiz-adv-x horiz-origin-x image-rendering letter-spacing lighting-color marker-end marker-mid marker-start overline-position overline-thickness paint-order panose-1 pointer-events rendering-intent shape-rendering stop-color stop-opacity strikethrough-position strikethrough-thickness stroke-dasharray stroke-dashoffset stroke-linecap stroke-linejoin stroke-miterlimit stroke-opacity stroke-width text-anchor text-decoration text-rendering underline-position underline-thickness unicode-bidi unicode-range units-per-em v-alphabetic v-hanging v-ideographic v-mathematical vector-effect vert-adv-y vert-origin-x vert-origin-y word-spacing writing-mode xmlns:xlink x-height".split(" ").forEach(function(e){var t=e.replace(eu,tu);ne[t]=new de(t,1,!1,e,null,!1,!1)});"xlink:actuate xlink:arcrole xlink:role xlink:show xlink:title xlink:type".split(" ").forEach(function(e){var t=e.replace(eu,tu);ne[t]=new de(t,1,!1,e,"http://www.w3.org/1999/xlink",!1,!1)});["xml:base","xml:lang","xml:space"].forEach(function(e){var t=e.replace(eu,tu);ne[t]=new de(t,1,!1,e,"http://www.w3.org/XML/1998/namespace",!1,!1)});["tabIndex","crossOrigin"].forEach(function(e){ne[e]=new de(e,1,!1,e.toLowerCase(),null,!1,!1)});ne.xlinkHref=new de("xlinkHref",1,!1,"xlink:href","http://www.w3.org/1999/xlink",!0,!1);["src","href","action","formAction"].forEach(function(e){ne[e]=new de(e,1,!1,e.toLowerCase(),null,!0,!0)});function nu(e,t,n,r){var l=ne.hasOwnProperty(t)?ne[t]:null;(l!==null?l.type!==0:r||!(2<t.length)||t[0]!=="o"&&t[0]!=="O"||t[1]!=="n"&&t[1]!=="N")&&(Gc(t,n,l,r)&&(n=null),r||l===null?Yc(t)&&(n===null?e.removeAttribute(t):e.setAttribute(t,""+n)):l.mustUseProperty?e[l.propertyName]=n===null?l.type===3?!1:"":n:(t=l.attributeName,r=l.attributeNamespace,n===null?e.removeAttribute(t):(l=l.type,n=l===3||l===4&&n===!0?"":""+n,r?e.setAttributeNS(r,t,n):e.setAttribute(t,n))))}var be=Qc.__SECRET_INTERNALS_DO_NOT_USE_OR_YOU_WILL_BE_FIRED,fr=Symbol.for("react.element"),Vt=Symbol.for("react.portal"),Bt=Symbol.for("react.fragment"),ru=Symbol.for("react.strict_mode"),lo=Symbol.for("react.profiler"),ys=Symbol.for("react.provider"),xs=Symbol.for("react.context"),lu=Symbol.for("react.forward_ref"),oo=Symbol.for("react.suspense"),uo=Symbol.for("react.suspense_list"),ou=Symbol.for("react.memo"),nt=Symbol.for("react.lazy"),ws=Symbol.for("react.offscreen"),Zu=Symbol.iterator;function wn(e){return e===null||typeof e!="object"?null:(e=Zu&&e[Zu]||e["@@iterator"],typeof e=="function"?e:null)}var Q=Object.assign,Tl;function Pn(e){if(Tl===void 0)try{throw Error()}catch(n){var t=n.stack.trim().match(/\n( *(at )?)/);Tl=t&&t[1]||""}return`
-`+Tl+e}var zl=!1;function Ll(e,t){if(!e||zl)return"";zl=!0;var n=Error.prepareStackTrace;Error.prepareStackTrace=void 0;try{if(t)if(t=function(){throw Error()},Object.defineProperty(t.prototype,"props",{set:function(){throw Error()}}),typeof Reflect=="object"&&Reflect.construct){try{Reflect.construct(t,[])}catch(d){var r=d}Reflect.construct(e,[],t)}else{try{t.call()}catch(d){r=d}e.call(t.prototype)}else{try{throw Error()}catch(d){r=d}e()}}catch(d){if(d&&r&&typeof d.stack=="string"){for(var l=d.stack.split(`
-`),o=r.stack.split(`
-`),u=l.length-1,i=o.length-1;1<=u&&0<=i&&l[u]!==o[i];)i--;for(;1<=u&&0<=i;u--,i--)if(l[u]!==o[i]){if(u!==1||i!==1)do if(u--,i--,0>i||l[u]!==o[i]){var s=`
-`+l[u].replace(" at new "," at ");return e.displayName&&s.includes("<anonymous>")&&(s=s.replace("<anonymous>",e.displayName)),s}while(1<=u&&0<=i);break}}}finally{zl=!1,Error.prepareStackTrace=n}return(e=e?e.displayName||e.name:"")?Pn(e):""}function Zc(e){switch(e.tag){case 5:return Pn(e.type);case 16:return Pn("Lazy");case 13:return Pn("Suspense");case 19:return Pn("SuspenseList");case 0:case 2:case 15:return e=Ll(e.type,!1),e;case 11:return e=Ll(e.type.render,!1),e;case 1:return e=Ll(e.type,!0),e;default:return""}}function io(e){if(e==null)return null;if(typeof e=="function")return e.displayName||e.name||null;if(typeof e=="string")return e;switch(e){case Bt:return"Fragment";case Vt:return"Portal";case lo:return"Profiler";case ru:return"StrictMode";case oo:return"Suspense";case uo:return"SuspenseList"}if(typeof e=="object")switch(e.$$typeof){case xs:return(e.displayName||"Context")+".Consumer";case ys:return(e._context.displayName||"Context")+".Provider";case lu:var t=e.render;return e=e.displayName,e||(e=t.displayName||t.name||"",e=e!==""?"ForwardRef("+e+")":"ForwardRef"),e;case ou:return t=e.displayName||null,t!==null?t:io(e.type)||"Memo";case nt:t=e._payload,e=e._init;try{return io(e(t))}catch{}}return null}function Jc(e){var t=e.type;switch(e.tag){case 24:return"Cache";case 9:return(t.displayName||"Context")+".Consumer";case 10:return(t._context.displayName||"Context")+".Provider";case 18:return"DehydratedFragment";case 11:return e=t.render,e=e.displayName||e.name||"",t.displayName||(e!==""?"ForwardRef("+e+")":"ForwardRef");case 7:return"Fragment";case 5:return t;case 4:return"Portal";case 3:return"Root";case 6:return"Text";case 16:return io(t);case 8:return t===ru?"StrictMode":"Mode";case 22:return"Offscreen";case 12:return"Profiler";case 21:return"Scope";case 13:return"Suspense";case 19:return"SuspenseList";case 25:return"TracingMarker";case 1:case 0:case 17:case 2:case 14:case 15:if(typeof t=="function")return t.displayName||t.name||null;if(typeof t=="string")return t}return null}function ht(e){switch(typeof e){case"boolean":case"number":case"string":case"undefined":return e;case"object":return e;default:return""}}function ks(e){var t=e.type;return(e=e.nodeName)&&e.toLowerCase()==="input"&&(t==="checkbox"||t==="radio")}function qc(e){var t=ks(e)?"checked":"value",n=Object.getOwnPropertyDescriptor(e.constructor.prototype,t),r=""+e[t];if(!e.hasOwnProperty(t)&&typeof n<"u"&&typeof n.get=="function"&&typeof n.set=="function"){var l=n.get,o=n.set;return Object.defineProperty(e,t,{configurable:!0,get:function(){return l.call(this)},set:function(u){r=""+u,o.call(this,u)}}),Object.defineProperty(e,t,{enumerable:n.enumerable}),{getValue:function(){return r},setValue:function(u){r=""+u},stopTracking:function(){e._valueTracker=null,delete e[t]}}}}function pr(e){e._valueTracker||(e._valueTracker=qc(e))}function Ss(e){if(!e)return!1;var t=e._valueTracker;if(!t)return!0;var n=t.getValue(),r="";return e&&(r=ks(e)?e.checked?"true":"false":e.value),e=r,e!==n?(t.setValue(e),!0):!1}function Ar(e){if(e=e||(typeof document<"u"?document:void 0),typeof e>"u")return null;try{return e.activeElement||e.body}catch{return e.body}}function so(e,t){var n=t.checked;return Q({},t,{defaultChecked:void 0,defaultValue:void 0,value:void 0,checked:n??e._wrapperState.initialChecked})}function Ju(e,t){var n=t.defaultValue==null?"":t.defaultValue,r=t.checked!=null?t.checked:t.defaultChecked;n=ht(t.value!=null?t.value:n),e._wrapperState={initialChecked:r,initialValue:n,controlled:t.type==="checkbox"||t.type==="radio"?t.checked!=null:t.value!=null}}function Ns(e,t){t=t.checked,t!=null&&nu(e,"checked",t,!1)}function ao(e,t){Ns(e,t);var n=ht(t.value),r=t.type;if(n!=null)r==="number"?(n===0&&e.value===""||e.value!=n)&&(e.value=""+n):e.value!==""+n&&(e.value=""+n);else if(r==="submit"||r==="reset"){e.removeAttribute("value");return}t.hasOwnProperty("value")?co(e,t.type,n):t.hasOwnProperty("defaultValue")&&co(e,t.type,ht(t.defaultValue)),t.checked==null&&t.defaultChecked!=null&&(e.defaultChecked=!!t.defaultChecked)}function qu(e,t,n){if(t.hasOwnProperty("value")||t.hasOwnProperty("defaultValue")){var r=t.type;if(!(r!=="submit"&&r!=="reset"||t.value!==void 0&&t.value!==null))return;t=""+e._wrapperState.initialValue,n||t===e.value||(e.value=t),e.defaultValue=t}n=e.name,n!==""&&(e.name=""),e.defaultChecked=!!e._wrapperState.initialChecked,n!==""&&(e.name=n)}function co(e,t,n){(t!=="number"||Ar(e.ownerDocument)!==e)&&(n==null?e.defaultValue=""+e._wrapperState.initialValue:e.defaultValue!==""+n&&(e.defaultValue=""+n))}var Tn=Array.isArray;function en(e,t,n,r){if(e=e.options,t){t={};for(var l=0;l<n.length;l++)t["$"+n[l]]=!0;for(n=0;n<e.length;n++)l=t.hasOwnProperty("$"+e[n].value),e[n].selected!==l&&(e[n].selected=l),l&&r&&(e[n].defaultSelected=!0)}else{for(n=""+ht(n),t=null,l=0;l<e.length;l++){if(e[l].value===n){e[l].selected=!0,r&&(e[l].defaultSelected=!0);return}t!==null||e[l].disabled||(t=e[l])}t!==null&&(t.selected=!0)}}function fo(e,t){if(t.dangerouslySetInnerHTML!=null)throw Error(x(91));return Q({},t,{value:void 0,defaultValue:void 0,children:""+e._wrapperState.initialValue})}function bu(e,t){var n=t.value;if(n==null){if(n=t.children,t=t.defaultValue,n!=null){if(t!=null)throw Error(x(92));if(Tn(n)){if(1<n.length)throw Error(x(93));n=n[0]}t=n}t==null&&(t=""),n=t}e._wrapperState={initialValue:ht(n)}}function Es(e,t){var n=ht(t.value),r=ht(t.defaultValue);n!=null&&(n=""+n,n!==e.value&&(e.value=n),t.defaultValue==null&&e.defaultValue!==n&&(e.defaultValue=n)),r!=null&&(e.defaultValue=""+r)}function ei(e){var t=e.textContent;t===e._wrapperState.initialValue&&t!==""&&t!==null&&(e.value=t)}function Cs(e){switch(e){case"svg":return"http://www.w3.org/2000/svg";case"math":return"http://www.w3.org/1998/Math/MathML";default:return"http://www.w3.org/1999/xhtml"}}function po(e,t){return e==null||e==="http://www.w3.org/1999/xhtml"?Cs(t):e==="http://www.w3.org/2000/svg"&&t==="foreignObject"?"http://www.w3.org/1999/xhtml":e}var mr,js=function(e){return typeof MSApp<"u"&&MSApp.execUnsafeLocalFunction?function(t,n,r,l){MSApp.execUnsafeLocalFunction(function(){return e(t,n,r,l)})}:e}(function(e,t){if(e.namespaceURI!=="http://www.w3.org/2000/svg"||"innerHTML"in e)e.innerHTML=t;else{for(mr=mr||document.createElement("div"),mr.innerHTML="<svg>"+t.valueOf().toString()+"</svg>",t=mr.firstChild;e.firstChild;)e.removeChild(e.firstChild);for(;t.firstChild;)e.appendChild(t.firstChild)}});function Bn(e,t){if(t){var n=e.firstChild;if(n&&n===e.lastChild&&n.nodeType===3){n.nodeValue=t;return}}e.textContent=t}var Rn={animationIterationCount:!0,aspectRatio:!0,borderImageOutset:!0,borderImageSlice:!0,borderImageWidth:!0,boxFlex:!0,boxFlexGroup:!0,boxOrdinalGroup:!0,columnCount:!0,columns:!0,flex:!0,flexGrow:!0,flexPositive:!0,flexShrink:!0,flexNegative:!0,flexOrder:!0,gridArea:!0,gridRow:!0,gridRowEnd:!0,gridRowSpan:!0,gridRowStart:!0,gridColumn:!0,gridColumnEnd:!0,gridColumnSpan:!0,gridColumnStart:!0,fontWeight:!0,lineClamp:!0,lineHeight:!0,opacity:!0,order:!0,orphans:!0,tabSize:!0,widows:!0,zIndex:!0,zoom:!0,fillOpacity:!0,floodOpacity:!0,stopOpacity:!0,strokeDasharray:!0,strokeDashoffset:!0,strokeMiterlimit:!0,strokeOpacity:!0,strokeWidth:!0},bc=["Webkit","ms","Moz","O"];Object.keys(Rn).forEach(function(e){bc.forEach(function(t){t=t+e.charAt(0).toUpperCase()+e.substring(1),Rn[t]=Rn[e]})});function _s(e,t,n){return t==null||typeof t=="boolean"||t===""?"":n||typeof t!="number"||t===0||Rn.hasOwnProperty(e)&&Rn[e]?(""+t).trim():t+"px"}function Ps(e,t){e=e.style;for(var n in t)if(t.hasOwnProperty(n)){var r=n.indexOf("--")===0,l=_s(n,t[n],r);n==="float"&&(n="cssFloat"),r?e.setProperty(n,l):e[n]=l}}var ed=Q({menuitem:!0},{area:!0,base:!0,br:!0,col:!0,embed:!0,hr:!0,img:!0,input:!0,keygen:!0,link:!0,meta:!0,param:!0,source:!0,track:!0,wbr:!0});function mo(e,t){if(t){if(ed[e]&&(t.children!=null||t.dangerouslySetInnerHTML!=null))throw Error(x(137,e));if(t.dangerouslySetInnerHTML!=null){if(t.children!=null)throw Error(x(60));if(typeof t.dangerouslySetInnerHTML!="object"||!("__html"in t.dangerouslySetInnerHTML))throw Error(x(61))}if(t.style!=null&&typeof t.style!="object")throw Error(x(62))}}function vo(e,t){if(e.indexOf("-")===-1)return typeof t.is=="string";switch(e){case"annotation-xml":case"color-profile":case"font-face":case"font-face-src":case"font-face-uri":case"font-face-format":case"font-face-name":case"missing-glyph":return!1;default:return!0}}var ho=null;function uu(e){return e=e.target||e.srcElement||window,e.correspondingUseElement&&(e=e.correspondingUseElement),e.nodeType===3?e.parentNode:e}var go=null,tn=null,nn=null;function ti(e){if(e=ir(e)){if(typeof go!="function")throw Error(x(280));var t=e.stateNode;t&&(t=gl(t),go(e.stateNode,e.type,t))}}function Ts(e){tn?nn?nn.push(e):nn=[e]:tn=e}function zs(){if(tn){var e=tn,t=nn;if(nn=tn=null,ti(e),t)for(e=0;e<t.length;e++)ti(t[e])}}function Ls(e,t){return e(t)}function Rs(){}var Rl=!1;function Ms(e,t,n){if(Rl)return e(t,n);Rl=!0;try{return Ls(e,t,n)}finally{Rl=!1,(tn!==null||nn!==null)&&(Rs(),zs())}}function Wn(e,t){var n=e.stateNode;if(n===null)return null;var r=gl(n);if(r===null)return null;n=r[t];e:switch(t){case"onClick":case"onClickCapture":case"onDoubleClick":case"onDoubleClickCapture":case"onMouseDown":case"onMouseDownCapture":case"onMouseMove":case"onMouseMoveCapture":case"onMouseUp":case"onMouseUpCapture":case"onMouseEnter":(r=!r.disabled)||(e=e.type,r=!(e==="button"||e==="input"||e==="select"||e==="textarea")),e=!r;break e;default:e=!1}if(e)return null;if(n&&typeof n!="function")throw Error(x(231,t,typeof n));return n}var yo=!1;if(Ge)try{var kn={};Object.defineProperty(kn,"passive",{get:function(){yo=!0}}),window.addEventListener("test",kn,kn),window.removeEventListener("test",kn,kn)}catch{yo=!1}function td(e,t,n,r,l,o,u,i,s){var d=Array.prototype.slice.call(arguments,3);try{t.apply(n,d)}catch(h){this.onError(h)}}var Mn=!1,Vr=null,Br=!1,xo=null,nd={onError:function(e){Mn=!0,Vr=e}};function rd(e,t,n,r,l,o,u,i,s){Mn=!1,Vr=null,td.apply(nd,arguments)}function ld(e,t,n,r,l,o,u,i,s){if(rd.apply(this,arguments),Mn){if(Mn){var d=Vr;Mn=!1,Vr=null}else throw Error(x(198));Br||(Br=!0,xo=d)}}function Ft(e){var t=e,n=e;if(e.alternate)for(;t.return;)t=t.return;else{e=t;do t=e,t.flags&4098&&(n=t.return),e=t.return;while(e)}return t.tag===3?n:null}function Ds(e){if(e.tag===13){var t=e.memoizedState;if(t===null&&(e=e.alternate,e!==null&&(t=e.memoizedState)),t!==null)return t.dehydrated}return null}function ni(e){if(Ft(e)!==e)throw Error(x(188))}function od(e){var t=e.alternate;if(!t){if(t=Ft(e),t===null)throw Error(x(188));return t!==e?null:e}for(var n=e,r=t;;){var l=n.return;if(l===null)break;var o=l.alternate;if(o===null){if(r=l.return,r!==null){n=r;continue}break}if(l.child===o.child){for(o=l.child;o;){if(o===n)return ni(l),e;if(o===r)return ni(l),t;o=o.sibling}throw Error(x(188))}if(n.return!==r.return)n=l,r=o;else{for(var u=!1,i=l.child;i;){if(i===n){u=!0,n=l,r=o;break}if(i===r){u=!0,r=l,n=o;break}i=i.sibling}if(!u){for(i=o.child;i;){if(i===n){u=!0,n=o,r=l;break}if(i===r){u=!0,r=o,n=l;break}i=i.sibling}if(!u)throw Error(x(189))}}if(n.alternate!==r)throw Error(x(190))}if(n.tag!==3)throw Error(x(188));return n.stateNode.current===n?e:t}function Is(e){return e=od(e),e!==null?Os(e):null}function Os(e){if(e.tag===5||e.tag===6)return e;for(e=e.child;e!==null;){var t=Os(e);if(t!==null)return t;e=e.sibling}return null}var Fs=ke.unstable_scheduleCallback,ri=ke.unstable_cancelCallback,ud=ke.unstable_shouldYield,id=ke.unstable_requestPaint,X=ke.unstable_now,sd=ke.unstable_getCurrentPriorityLevel,iu=ke.unstable_ImmediatePriority,$s=ke.unstable_UserBlockingPriority,Wr=ke.unstable_NormalPriority,ad=ke.unstable_LowPriority,Us=ke.unstable_IdlePriority,pl=null,Be=null;function cd(e){if(Be&&typeof Be.onCommitFiberRoot=="function")try{Be.onCommitFiberRoot(pl,e,void 0,(e.current.flags&128)===128)}catch{}}var Oe=Math.clz32?Math.clz32:pd,dd=Math.log,fd=Math.LN2;function pd(e){return e>>>=0,e===0?32:31-(dd(e)/fd|0)|0}var vr=64,hr=4194304;function zn(e){switch(e&-e){case 1:return 1;case 2:return 2;case 4:return 4;case 8:return 8;case 16:return 16;case 32:return 32;case 64:case 128:case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:case 262144:case 524288:case 1048576:case 2097152:return e&4194240;case 4194304:case 8388608:case 16777216:case 33554432:case 67108864:return e&130023424;case 134217728:return 134217728;case 268435456:return 268435456;case 536870912:return 536870912;case 1073741824:return 1073741824;default:return e}}function Hr(e,t){var n=e.pendingLanes;if(n===0)return 0;var r=0,l=e.suspendedLanes,o=e.pingedLanes,u=n&268435455;if(u!==0){var i=u&~l;i!==0?r=zn(i):(o&=u,o!==0&&(r=zn(o)))}else u=n&~l,u!==0?r=zn(u):o!==0&&(r=zn(o));if(r===0)return 0;if(t!==0&&t!==r&&!(t&l)&&(l=r&-r,o=t&-t,l>=o||l===16&&(o&4194240)!==0))return t;if(r&4&&(r|=n&16),t=e.entangledLanes,t!==0)for(e=e.entanglements,t&=r;0<t;)n=31-Oe(t),l=1<<n,r|=e[n],t&=~l;return r}function md(e,t){switch(e){case 1:case 2:case 4:return t+250;case 8:case 16:case 32:case 64:case 128:case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:case 262144:case 524288:case 1048576:case 2097152:return t+5e3;case 4194304:case 8388608:case 16777216:case 33554432:case 67108864:return-1;case 134217728:case 268435456:case 536870912:case 1073741824:return-1;default:return-1}}function vd(e,t){for(var n=e.suspendedLanes,r=e.pingedLanes,l=e.expirationTimes,o=e.pendingLanes;0<o;){var u=31-Oe(o),i=1<<u,s=l[u];s===-1?(!(i&n)||i&r)&&(l[u]=md(i,t)):s<=t&&(e.expiredLanes|=i),o&=~i}}function wo(e){return e=e.pendingLanes&-1073741825,e!==0?e:e&1073741824?1073741824:0}function As(){var e=vr;return vr<<=1,!(vr&4194240)&&(vr=64),e}function Ml(e){for(var t=[],n=0;31>n;n++)t.push(e);return t}function or(e,t,n){e.pendingLanes|=t,t!==536870912&&(e.suspendedLanes=0,e.pingedLanes=0),e=e.eventTimes,t=31-Oe(t),e[t]=n}function hd(e,t){var n=e.pendingLanes&~t;e.pendingLanes=t,e.suspendedLanes=0,e.pingedLanes=0,e.expiredLanes&=t,e.mutableReadLanes&=t,e.entangledLanes&=t,t=e.entanglements;var r=e.eventTimes;for(e=e.expirationTimes;0<n;){var l=31-Oe(n),o=1<<l;t[l]=0,r[l]=-1,e[l]=-1,n&=~o}}function su(e,t){var n=e.entangledLanes|=t;for(e=e.entanglements;n;){var r=31-Oe(n),l=1<<r;l&t|e[r]&t&&(e[r]|=t),n&=~l}}var $=0;function Vs(e){return e&=-e,1<e?4<e?e&268435455?16:536870912:4:1}var Bs,au,Ws,Hs,Qs,ko=!1,gr=[],st=null,at=null,ct=null,Hn=new Map,Qn=new Map,lt=[],gd="mousedown mouseup touchcancel touchend touchstart auxclick dblclick pointercancel pointerdown pointerup dragend dragstart drop compositionend compositionstart keydown keypress keyup input textInput copy cut paste click change contextmenu reset submit".split(" ");function li(e,t){switch(e){case"focusin":case"focusout":st=null;break;case"dragenter":case"dragleave":at=null;break;case"mouseover":case"mouseout":ct=null;break;case"pointerover":case"pointerout":Hn.delete(t.pointerId);break;case"gotpointercapture":case"lostpointercapture":Qn.delete(t.pointerId)}}function Sn(e,t,n,r,l,o){return e===null||e.nativeEvent!==o?(e={blockedOn:t,domEventName:n,eventSystemFlags:r,nativeEvent:o,targetContainers:[l]},t!==null&&(t=ir(t),t!==null&&au(t)),e):(e.eventSystemFlags|=r,t=e.targetContainers,l!==null&&t.indexOf(l)===-1&&t.push(l),e)}function yd(e,t,n,r,l){switch(t){case"focusin":return st=Sn(st,e,t,n,r,l),!0;case"dragenter":return at=Sn(at,e,t,n,r,l),!0;case"mouseover":return ct=Sn(ct,e,t,n,r,l),!0;case"pointerover":var o=l.pointerId;return Hn.set(o,Sn(Hn.get(o)||null,e,t,n,r,l)),!0;case"gotpointercapture":return o=l.pointerId,Qn.set(o,Sn(Qn.get(o)||null,e,t,n,r,l)),!0}return!1}function Ks(e){var t=Ct(e.target);if(t!==null){var n=Ft(t);if(n!==null){if(t=n.tag,t===13){if(t=Ds(n),t!==null){e.blockedOn=t,Qs(e.priority,function(){Ws(n)});return}}else if(t===3&&n.stateNode.current.memoizedState.isDehydrated){e.blockedOn=n.tag===3?n.stateNode.containerInfo:null;return}}}e.blockedOn=null}function zr(e){if(e.blockedOn!==null)return!1;for(var t=e.targetContainers;0<t.length;){var n=So(e.domEventName,e.eventSystemFlags,t[0],e.nativeEvent);if(n===null){n=e.nativeEvent;var r=new n.constructor(n.type,n);ho=r,n.target.dispatchEvent(r),ho=null}else return t=ir(n),t!==null&&au(t),e.blockedOn=n,!1;t.shift()}return!0}function oi(e,t,n){zr(e)&&n.delete(t)}function xd(){ko=!1,st!==null&&zr(st)&&(st=null),at!==null&&zr(at)&&(at=null),ct!==null&&zr(ct)&&(ct=null),Hn.forEach(oi),Qn.forEach(oi)}function Nn(e,t){e.blockedOn===t&&(e.blockedOn=null,ko||(ko=!0,ke.unstable_scheduleCallback(ke.unstable_NormalPriority,xd)))}function Kn(e){function t(l){return Nn(l,e)}if(0<gr.length){Nn(gr[0],e);for(var n=1;n<gr.length;n++){var r=gr[n];r.blockedOn===e&&(r.blockedOn=null)}}for(st!==null&&Nn(st,e),at!==null&&Nn(at,e),ct!==null&&Nn(ct,e),Hn.forEach(t),Qn.forEach(t),n=0;n<lt.length;n++)r=lt[n],r.blockedOn===e&&(r.blockedOn=null);for(;0<lt.length&&(n=lt[0],n.blockedOn===null);)Ks(n),n.blockedOn===null&&lt.shift()}var rn=be.ReactCurrentBatchConfig,Qr=!0;function wd(e,t,n,r){var l=$,o=rn.transition;rn.transition=null;try{$=1,cu(e,t,n,r)}finally{$=l,rn.transition=o}}function kd(e,t,n,r){var l=$,o=rn.transition;rn.transition=null;try{$=4,cu(e,t,n,r)}finally{$=l,rn.transition=o}}function cu(e,t,n,r){if(Qr){var l=So(e,t,n,r);if(l===null)Wl(e,t,r,Kr,n),li(e,r);else if(yd(l,e,t,n,r))r.stopPropagation();else if(li(e,r),t&4&&-1<gd.indexOf(e)){for(;l!==null;){var o=ir(l);if(o!==null&&Bs(o),o=So(e,t,n,r),o===null&&Wl(e,t,r,Kr,n),o===l)break;l=o}l!==null&&r.stopPropagation()}else Wl(e,t,r,null,n)}}var Kr=null;function So(e,t,n,r){if(Kr=null,e=uu(r),e=Ct(e),e!==null)if(t=Ft(e),t===null)e=null;else if(n=t.tag,n===13){if(e=Ds(t),e!==null)return e;e=null}else if(n===3){if(t.stateNode.current.memoizedState.isDehydrated)return t.tag===3?t.stateNode.containerInfo:null;e=null}else t!==e&&(e=null);return Kr=e,null}function Ys(e){switch(e){case"cancel":case"click":case"close":case"contextmenu":case"copy":case"cut":case"auxclick":case"dblclick":case"dragend":case"dragstart":case"drop":case"focusin":case"focusout":case"input":case"invalid":case"keydown":case"keypress":case"keyup":case"mousedown":case"mouseup":case"paste":case"pause":case"play":case"pointercancel":case"pointerdown":case"pointerup":case"ratechange":case"reset":case"resize":case"seeked":case"submit":case"touchcancel":case"touchend":case"touchstart":case"volumechange":case"change":case"selectionchange":case"textInput":case"compositionstart":case"compositionend":case"compositionupdate":case"beforeblur":case"afterblur":case"beforeinput":case"blur":case"fullscreenchange":case"focus":case"hashchange":case"popstate":case"select":case"selectstart":return 1;case"drag":case"dragenter":case"dragexit":case"dragleave":case"dragover":case"mousemove":case"mouseout":case"mouseover":case"pointermove":case"pointerout":case"pointerover":case"scroll":case"toggle":case"touchmove":case"wheel":case"mouseenter":case"mouseleave":case"pointerenter":case"pointerleave":return 4;case"message":switch(sd()){case iu:return 1;case $s:return 4;case Wr:case ad:return 16;case Us:return 536870912;default:return 16}default:return 16}}var ut=null,du=null,Lr=null;function Xs(){if(Lr)return Lr;var e,t=du,n=t.length,r,l="value"in ut?ut.value:ut.textContent,o=l.length;for(e=0;e<n&&t[e]===l[e];e++);var u=n-e;for(r=1;r<=u&&t[n-r]===l[o-r];r++);return Lr=l.slice(e,1<r?1-r:void 0)}function Rr(e){var t=e.keyCode;return"charCode"in e?(e=e.charCode,e===0&&t===13&&(e=13)):e=t,e===10&&(e=13),32<=e||e===13?e:0}function yr(){return!0}function ui(){return!1}function Ne(e){function t(n,r,l,o,u){this._reactName=n,this._targetInst=l,this.type=r,this.nativeEvent=o,this.target=u,this.currentTarget=null;for(var i in e)e.hasOwnProperty(i)&&(n=e[i],this[i]=n?n(o):o[i]);return this.isDefaultPrevented=(o.defaultPrevented!=null?o.defaultPrevented:o.returnValue===!1)?yr:ui,this.isPropagationStopped=ui,this}return Q(t.prototype,{preventDefault:function(){this.defaultPrevented=!0;var n=this.nativeEvent;n&&(n.preventDefault?n.preventDefault():typeof n.returnValue!="unknown"&&(n.returnValue=!1),this.isDefaultPrevented=yr)},stopPropagation:function(){var n=this.nativeEvent;n&&(n.stopPropagation?n.stopPropagation():typeof n.cancelBubble!="unknown"&&(n.cancelBubble=!0),this.isPropagationStopped=yr)},persist:function(){},isPersistent:yr}),t}var vn={eventPhase:0,bubbles:0,cancelable:0,timeStamp:function(e){return e.timeStamp||Date.now()},defaultPrevented:0,isTrusted:0},fu=Ne(vn),ur=Q({},vn,{view:0,detail:0}),Sd=Ne(ur),Dl,Il,En,ml=Q({},ur,{screenX:0,screenY:0,clientX:0,clientY:0,pageX:0,pageY:0,ctrlKey:0,shiftKey:0,altKey:0,metaKey:0,getModifierState:pu,button:0,buttons:0,relatedTarget:function(e){return e.relatedTarget===void 0?e.fromElement===e.srcElement?e.toElement:e.fromElement:e.relatedTarget},movementX:function(e){return"movementX"in e?e.movementX:(e!==En&&(En&&e.type==="mousemove"?(Dl=e.screenX-En.screenX,Il=e.screenY-En.screenY):Il=Dl=0,En=e),Dl)},movementY:function(e){return"movementY"in e?e.movementY:Il}}),ii=Ne(ml),Nd=Q({},ml,{dataTransfer:0}),Ed=Ne(Nd),Cd=Q({},ur,{relatedTarget:0}),Ol=Ne(Cd),jd=Q({},vn,{animationName:0,elapsedTime:0,pseudoElement:0}),_d=Ne(jd),Pd=Q({},vn,{clipboardData:function(e){return"clipboardData"in e?e.clipboardData:window.clipboardData}}),Td=Ne(Pd),zd=Q({},vn,{data:0}),si=Ne(zd),Ld={Esc:"Escape",Spacebar:" ",Left:"ArrowLeft",Up:"ArrowUp",Right:"ArrowRight",Down:"ArrowDown",Del:"Delete",Win:"OS",Menu:"ContextMenu",Apps:"ContextMenu",Scroll:"ScrollLock",MozPrintableKey:"Unidentified"},Rd={8:"Backspace",9:"Tab",12:"Clear",13:"Enter",16:"Shift",17:"Control",18:"Alt",19:"Pause",20:"CapsLock",27:"Escape",32:" ",33:"PageUp",34:"PageDown",35:"End",36:"Home",37:"ArrowLeft",38:"ArrowUp",39:"ArrowRight",40:"ArrowDown",45:"Insert",46:"Delete",112:"F1",113:"F2",114:"F3",115:"F4",116:"F5",117:"F6",118:"F7",119:"F8",120:"F9",121:"F10",122:"F11",123:"F12",144:"NumLock",145:"ScrollLock",224:"Meta"},Md={Alt:"altKey",Control:"ctrlKey",Meta:"metaKey",Shift:"shiftKey"};function Dd(e){var t=this.nativeEvent;return t.getModifierState?t.getModifierState(e):(e=Md[e])?!!t[e]:!1}function pu(){return Dd}var Id=Q({},ur,{key:function(e){if(e.key){var t=Ld[e.key]||e.key;if(t!=="Unidentified")return t}return e.type==="keypress"?(e=Rr(e),e===13?"Enter":String.fromCharCode(e)):e.type==="keydown"||e.type==="keyup"?Rd[e.keyCode]||"Unidentified":""},code:0,location:0,ctrlKey:0,shiftKey:0,altKey:0,metaKey:0,repeat:0,locale:0,getModifierState:pu,charCode:function(e){return e.type==="keypress"?Rr(e):0},keyCode:function(e){return e.type==="keydown"||e.type==="keyup"?e.keyCode:0},which:function(e){return e.type==="keypress"?Rr(e):e.type==="keydown"||e.type==="keyup"?e.keyCode:0}}),Od=Ne(Id),Fd=Q({},ml,{pointerId:0,width:0,height:0,pressure:0,tangentialPressure:0,tiltX:0,tiltY:0,twist:0,pointerType:0,isPrimary:0}),ai=Ne(Fd),$d=Q({},ur,{touches:0,targetTouches:0,changedTouches:0,altKey:0,metaKey:0,ctrlKey:0,shiftKey:0,getModifierState:pu}),Ud=Ne($d),Ad=Q({},vn,{propertyName:0,elapsedTime:0,pseudoElement:0}),Vd=Ne(Ad),Bd=Q({},ml,{deltaX:function(e){return"deltaX"in e?e.deltaX:"wheelDeltaX"in e?-e.wheelDeltaX:0},deltaY:function(e){return"deltaY"in e?e.deltaY:"wheelDeltaY"in e?-e.wheelDeltaY:"wheelDelta"in e?-e.wheelDelta:0},deltaZ:0,deltaMode:0}),Wd=Ne(Bd),Hd=[9,13,27,32],mu=Ge&&"CompositionEvent"in window,Dn=null;Ge&&"documentMode"in document&&(Dn=document.documentMode);var Qd=Ge&&"TextEvent"in window&&!Dn,Gs=Ge&&(!mu||Dn&&8<Dn&&11>=Dn),ci=" ",di=!1;function Zs(e,t){switch(e){case"keyup":return Hd.indexOf(t.keyCode)!==-1;case"keydown":return t.keyCode!==229;case"keypress":case"mousedown":case"focusout":return!0;default:return!1}}function Js(e){return e=e.detail,typeof e=="object"&&"data"in e?e.data:null}var Wt=!1;function Kd(e,t){switch(e){case"compositionend":return Js(t);case"keypress":return t.which!==32?null:(di=!0,ci);case"textInput":return e=t.data,e===ci&&di?null:e;default:return null}}function Yd(e,t){if(Wt)return e==="compositionend"||!mu&&Zs(e,t)?(e=Xs(),Lr=du=ut=null,Wt=!1,e):null;switch(e){case"paste":return null;case"keypress":if(!(t.ctrlKey||t.altKey||t.metaKey)||t.ctrlKey&&t.altKey){if(t.char&&1<t.char.length)return t.char;if(t.which)return String.fromCharCode(t.which)}return null;case"compositionend":return Gs&&t.locale!=="ko"?null:t.data;default:return null}}var Xd={color:!0,date:!0,datetime:!0,"datetime-local":!0,email:!0,month:!0,number:!0,password:!0,range:!0,search:!0,tel:!0,text:!0,time:!0,url:!0,week:!0};function fi(e){var t=e&&e.nodeName&&e.nodeName.toLowerCase();return t==="input"?!!Xd[e.type]:t==="textarea"}function qs(e,t,n,r){Ts(r),t=Yr(t,"onChange"),0<t.length&&(n=new fu("onChange","change",null,n,r),e.push({event:n,listeners:t}))}var In=null,Yn=null;function Gd(e){aa(e,0)}function vl(e){var t=Kt(e);if(Ss(t))return e}function Zd(e,t){if(e==="change")return t}var bs=!1;if(Ge){var Fl;if(Ge){var $l="oninput"in document;if(!$l){var pi=document.createElement("div");pi.setAttribute("oninput","return;"),$l=typeof pi.oninput=="function"}Fl=$l}else Fl=!1;bs=Fl&&(!document.documentMode||9<document.documentMode)}function mi(){In&&(In.detachEvent("onpropertychange",ea),Yn=In=null)}function ea(e){if(e.propertyName==="value"&&vl(Yn)){var t=[];qs(t,Yn,e,uu(e)),Ms(Gd,t)}}function Jd(e,t,n){e==="focusin"?(mi(),In=t,Yn=n,In.attachEvent("onpropertychange",ea)):e==="focusout"&&mi()}function qd(e){if(e==="selectionchange"||e==="keyup"||e==="keydown")return vl(Yn)}function bd(e,t){if(e==="click")return vl(t)}function ef(e,t){if(e==="input"||e==="change")return vl(t)}function tf(e,t){return e===t&&(e!==0||1/e===1/t)||e!==e&&t!==t}var $e=typeof Object.is=="function"?Object.is:tf;function Xn(e,t){if($e(e,t))return!0;if(typeof e!="object"||e===null||typeof t!="object"||t===null)return!1;var n=Object.keys(e),r=Object.keys(t);if(n.length!==r.length)return!1;for(r=0;r<n.length;r++){var l=n[r];if(!ro.call(t,l)||!$e(e[l],t[l]))return!1}return!0}function vi(e){for(;e&&e.firstChild;)e=e.firstChild;return e}function hi(e,t){var n=vi(e);e=0;for(var r;n;){if(n.nodeType===3){if(r=e+n.textContent.length,e<=t&&r>=t)return{node:n,offset:t-e};e=r}e:{for(;n;){if(n.nextSibling){n=n.nextSibling;break e}n=n.parentNode}n=void 0}n=vi(n)}}function ta(e,t){return e&&t?e===t?!0:e&&e.nodeType===3?!1:t&&t.nodeType===3?ta(e,t.parentNode):"contains"in e?e.contains(t):e.compareDocumentPosition?!!(e.compareDocumentPosition(t)&16):!1:!1}function na(){for(var e=window,t=Ar();t instanceof e.HTMLIFrameElement;){try{var n=typeof t.contentWindow.location.href=="string"}catch{n=!1}if(n)e=t.contentWindow;else break;t=Ar(e.document)}return t}function vu(e){var t=e&&e.nodeName&&e.nodeName.toLowerCase();return t&&(t==="input"&&(e.type==="text"||e.type==="search"||e.type==="tel"||e.type==="url"||e.type==="password")||t==="textarea"||e.contentEditable==="true")}function nf(e){var t=na(),n=e.focusedElem,r=e.selectionRange;if(t!==n&&n&&n.ownerDocument&&ta(n.ownerDocument.documentElement,n)){if(r!==null&&vu(n)){if(t=r.start,e=r.end,e===void 0&&(e=t),"selectionStart"in n)n.selectionStart=t,n.selectionEnd=Math.min(e,n.value.length);else if(e=(t=n.ownerDocument||document)&&t.defaultView||window,e.getSelection){e=e.getSelection();var l=n.textContent.length,o=Math.min(r.start,l);r=r.end===void 0?o:Math.min(r.end,l),!e.extend&&o>r&&(l=r,r=o,o=l),l=hi(n,o);var u=hi(n,r);l&&u&&(e.rangeCount!==1||e.anchorNode!==l.node||e.anchorOffset!==l.offset||e.focusNode!==u.node||e.focusOffset!==u.offset)&&(t=t.createRange(),t.setStart(l.node,l.offset),e.removeAllRanges(),o>r?(e.addRange(t),e.extend(u.node,u.offset)):(t.setEnd(u.node,u.offset),e.addRange(t)))}}for(t=[],e=n;e=e.parentNode;)e.nodeType===1&&t.push({element:e,left:e.scrollLeft,top:e.scrollTop});for(typeof n.focus=="function"&&n.focus(),n=0;n<t.length;n++)e=t[n],e.element.scrollLeft=e.left,e.element.scrollTop=e.top}}var rf=Ge&&"documentMode"in document&&11>=document.documentMode,Ht=null,No=null,On=null,Eo=!1;function gi(e,t,n){var r=n.window===n?n.document:n.nodeType===9?n:n.ownerDocument;Eo||Ht==null||Ht!==Ar(r)||(r=Ht,"selectionStart"in r&&vu(r)?r={start:r.selectionStart,end:r.selectionEnd}:(r=(r.ownerDocument&&r.ownerDocument.defaultView||window).getSelection(),r={anchorNode:r.anchorNode,anchorOffset:r.anchorOffset,focusNode:r.focusNode,focusOffset:r.focusOffset}),On&&Xn(On,r)||(On=r,r=Yr(No,"onSelect"),0<r.length&&(t=new fu("onSelect","select",null,t,n),e.push({event:t,listeners:r}),t.target=Ht)))}function xr(e,t){var n={};return n[e.toLowerCase()]=t.toLowerCase(),n["Webkit"+e]="webkit"+t,n["Moz"+e]="moz"+t,n}var Qt={animationend:xr("Animation","AnimationEnd"),animationiteration:xr("Animation","AnimationIteration"),animationstart:xr("Animation","AnimationStart"),transitionend:xr("Transition","TransitionEnd")},Ul={},ra={};Ge&&(ra=document.createElement("div").style,"AnimationEvent"in window||(delete Qt.animationend.animation,delete Qt.animationiteration.animation,delete Qt.animationstart.animation),"TransitionEvent"in window||delete Qt.transitionend.transition);function hl(e){if(Ul[e])return Ul[e];if(!Qt[e])return e;var t=Qt[e],n;for(n in t)if(t.hasOwnProperty(n)&&n in ra)return Ul[e]=t[n];return e}var la=hl("animationend"),oa=hl("animationiteration"),ua=hl("animationstart"),ia=hl("transitionend"),sa=new Map,yi="abort auxClick cancel canPlay canPlayThrough click close contextMenu copy cut drag dragEnd dragEnter dragExit dragLeave dragOver dragStart drop durationChange emptied encrypted ended error gotPointerCapture input invalid keyDown keyPress keyUp load loadedData loadedMetadata loadStart lostPointerCapture mouseDown mouseMove mouseOut mouseOver mouseUp paste pause play playing pointerCancel pointerDown pointerMove pointerOut pointerOver pointerUp progress rateChange reset resize seeked seeking stalled submit suspend timeUpdate touchCancel touchEnd touchStart volumeChange scroll toggle touchMove waiting wheel".split(" ");function yt(e,t){sa.set(e,t),Ot(t,[e])}for(var Al=0;Al<yi.length;Al++){var Vl=yi[Al],lf=Vl.toLowerCase(),of=Vl[0].toUpperCase()+Vl.slice(1);yt(lf,"on"+of)}yt(la,"onAnimationEnd");yt(oa,"onAnimationIteration");yt(ua,"onAnimationStart");yt("dblclick","onDoubleClick");yt("focusin","onFocus");yt("focusout","onBlur");yt(ia,"onTransitionEnd");un("onMouseEnter",["mouseout","mouseover"]);un("onMouseLeave",["mouseout","mouseover"]);un("onPointerEnter",["pointerout","pointerover"]);un("onPointerLeave",["pointerout","pointerover"]);Ot("onChange","change click focusin focusout input keydown keyup selectionchange".split(" "));Ot("onSelect","focusout contextmenu dragend focusin keydown keyup mousedown mouseup selectionchange".split(" "));Ot("onBeforeInput",["compositionend","keypress","textInput","paste"]);Ot("onCompositionEnd","compositionend focusout keydown keypress keyup mousedown".split(" "));Ot("onCompositionStart","compositionstart focusout keydown keypress keyup mousedown".split(" "));Ot("onCompositionUpdate","compositionupdate focusout keydown keypress keyup mousedown".split(" "));var Ln="abort canplay canplaythrough durationchange emptied encrypted ended error loadeddata loadedmetadata loadstart pause play playing progress ratechange resize seeked seeking stalled suspend timeupdate volumechange waiting".split(" "),uf=new Set("cancel close invalid load scroll toggle".split(" ").concat(Ln));function xi(e,t,n){var r=e.type||"unknown-event";e.currentTarget=n,ld(r,t,void 0,e),e.currentTarget=null}function aa(e,t){t=(t&4)!==0;for(var n=0;n<e.length;n++){var r=e[n],l=r.event;r=r.listeners;e:{var o=void 0;if(t)for(var u=r.length-1;0<=u;u--){var i=r[u],s=i.instance,d=i.currentTarget;if(i=i.listener,s!==o&&l.isPropagationStopped())break e;xi(l,i,d),o=s}else for(u=0;u<r.length;u++){if(i=r[u],s=i.instance,d=i.currentTarget,i=i.listener,s!==o&&l.isPropagationStopped())break e;xi(l,i,d),o=s}}}if(Br)throw e=xo,Br=!1,xo=null,e}function A(e,t){var n=t[To];n===void 0&&(n=t[To]=new Set);var r=e+"__bubble";n.has(r)||(ca(t,e,2,!1),n.add(r))}function Bl(e,t,n){var r=0;t&&(r|=4),ca(n,e,r,t)}var wr="_reactListening"+Math.random().toString(36).slice(2);function Gn(e){if(!e[wr]){e[wr]=!0,gs.forEach(function(n){n!=="selectionchange"&&(uf.has(n)||Bl(n,!1,e),Bl(n,!0,e))});var t=e.nodeType===9?e:e.ownerDocument;t===null||t[wr]||(t[wr]=!0,Bl("selectionchange",!1,t))}}function ca(e,t,n,r){switch(Ys(t)){case 1:var l=wd;break;case 4:l=kd;break;default:l=cu}n=l.bind(null,t,n,e),l=void 0,!yo||t!=="touchstart"&&t!=="touchmove"&&t!=="wheel"||(l=!0),r?l!==void 0?e.addEventListener(t,n,{capture:!0,passive:l}):e.addEventListener(t,n,!0):l!==void 0?e.addEventListener(t,n,{passive:l}):e.addEventListener(t,n,!1)}function Wl(e,t,n,r,l){var o=r;if(!(t&1)&&!(t&2)&&r!==null)e:for(;;){if(r===null)return;var u=r.tag;if(u===3||u===4){var i=r.stateNode.containerInfo;if(i===l||i.nodeType===8&&i.parentNode===l)break;if(u===4)for(u=r.return;u!==null;){var s=u.tag;if((s===3||s===4)&&(s=u.stateNode.containerInfo,s===l||s.nodeType===8&&s.parentNode===l))return;u=u.return}for(;i!==null;){if(u=Ct(i),u===null)return;if(s=u.tag,s===5||s===6){r=o=u;continue e}i=i.parentNode}}r=r.return}Ms(function(){var d=o,h=uu(n),v=[];e:{var m=sa.get(e);if(m!==void 0){var k=fu,S=e;switch(e){case"keypress":if(Rr(n)===0)break e;case"keydown":case"keyup":k=Od;break;case"focusin":S="focus",k=Ol;break;case"focusout":S="blur",k=Ol;break;case"beforeblur":case"afterblur":k=Ol;break;case"click":if(n.button===2)break e;case"auxclick":case"dblclick":case"mousedown":case"mousemove":case"mouseup":case"mouseout":case"mouseover":case"contextmenu":k=ii;break;case"drag":case"dragend":case"dragenter":case"dragexit":case"dragleave":case"dragover":case"dragstart":case"drop":k=Ed;break;case"touchcancel":case"touchend":case"touchmove":case"touchstart":k=Ud;break;case la:case oa:case ua:k=_d;break;case ia:k=Vd;break;case"scroll":k=Sd;break;case"wheel":k=Wd;break;case"copy":case"cut":case"paste":k=Td;break;case"gotpointercapture":case"lostpointercapture":case"pointercancel":case"pointerdown":case"pointermove":case"pointerout":case"pointerover":case"pointerup":k=ai}var E=(t&4)!==0,z=!E&&e==="scroll",f=E?m!==null?m+"Capture":null:m;E=[];for(var c=d,p;c!==null;){p=c;var y=p.stateNode;if(p.tag===5&&y!==null&&(p=y,f!==null&&(y=Wn(c,f),y!=null&&E.push(Zn(c,y,p)))),z)break;c=c.return}0<E.length&&(m=new k(m,S,null,n,h),v.push({event:m,listeners:E}))}}if(!(t&7)){e:{if(m=e==="mouseover"||e==="pointerover",k=e==="mouseout"||e==="pointerout",m&&n!==ho&&(S=n.relatedTarget||n.fromElement)&&(Ct(S)||S[Ze]))break e;if((k||m)&&(m=h.window===h?h:(m=h.ownerDocument)?m.defaultView||m.parentWindow:window,k?(S=n.relatedTarget||n.toElement,k=d,S=S?Ct(S):null,S!==null&&(z=Ft(S),S!==z||S.tag!==5&&S.tag!==6)&&(S=null)):(k=null,S=d),k!==S)){if(E=ii,y="onMouseLeave",f="onMouseEnter",c="mouse",(e==="pointerout"||e==="pointerover")&&(E=ai,y="onPointerLeave",f="onPointerEnter",c="pointer"),z=k==null?m:Kt(k),p=S==null?m:Kt(S),m=new E(y,c+"leave",k,n,h),m.target=z,m.relatedTarget=p,y=null,Ct(h)===d&&(E=new E(f,c+"enter",S,n,h),E.target=p,E.relatedTarget=z,y=E),z=y,k&&S)t:{for(E=k,f=S,c=0,p=E;p;p=Ut(p))c++;for(p=0,y=f;y;y=Ut(y))p++;for(;0<c-p;)E=Ut(E),c--;for(;0<p-c;)f=Ut(f),p--;for(;c--;){if(E===f||f!==null&&E===f.alternate)break t;E=Ut(E),f=Ut(f)}E=null}else E=null;k!==null&&wi(v,m,k,E,!1),S!==null&&z!==null&&wi(v,z,S,E,!0)}}e:{if(m=d?Kt(d):window,k=m.nodeName&&m.nodeName.toLowerCase(),k==="select"||k==="input"&&m.type==="file")var g=Zd;else if(fi(m))if(bs)g=ef;else{g=qd;var w=Jd}else(k=m.nodeName)&&k.toLowerCase()==="input"&&(m.type==="checkbox"||m.type==="radio")&&(g=bd);if(g&&(g=g(e,d))){qs(v,g,n,h);break e}w&&w(e,m,d),e==="focusout"&&(w=m._wrapperState)&&w.controlled&&m.type==="number"&&co(m,"number",m.value)}switch(w=d?Kt(d):window,e){case"focusin":(fi(w)||w.contentEditable==="true")&&(Ht=w,No=d,On=null);break;case"focusout":On=No=Ht=null;break;case"mousedown":Eo=!0;break;case"contextmenu":case"mouseup":case"dragend":Eo=!1,gi(v,n,h);break;case"selectionchange":if(rf)break;case"keydown":case"keyup":gi(v,n,h)}var C;if(mu)e:{switch(e){case"compositionstart":var j="onCompositionStart";break e;case"compositionend":j="onCompositionEnd";break e;case"compositionupdate":j="onCompositionUpdate";break e}j=void 0}else Wt?Zs(e,n)&&(j="onCompositionEnd"):e==="keydown"&&n.keyCode===229&&(j="onCompositionStart");j&&(Gs&&n.locale!=="ko"&&(Wt||j!=="onCompositionStart"?j==="onCompositionEnd"&&Wt&&(C=Xs()):(ut=h,du="value"in ut?ut.value:ut.textContent,Wt=!0)),w=Yr(d,j),0<w.length&&(j=new si(j,e,null,n,h),v.push({event:j,listeners:w}),C?j.data=C:(C=Js(n),C!==null&&(j.data=C)))),(C=Qd?Kd(e,n):Yd(e,n))&&(d=Yr(d,"onBeforeInput"),0<d.length&&(h=new si("onBeforeInput","beforeinput",null,n,h),v.push({event:h,listeners:d}),h.data=C))}aa(v,t)})}function Zn(e,t,n){return{instance:e,listener:t,currentTarget:n}}function Yr(e,t){for(var n=t+"Capture",r=[];e!==null;){var l=e,o=l.stateNode;l.tag===5&&o!==null&&(l=o,o=Wn(e,n),o!=null&&r.unshift(Zn(e,o,l)),o=Wn(e,t),o!=null&&r.push(Zn(e,o,l))),e=e.return}return r}function Ut(e){if(e===null)return null;do e=e.return;while(e&&e.tag!==5);return e||null}function wi(e,t,n,r,l){for(var o=t._reactName,u=[];n!==null&&n!==r;){var i=n,s=i.alternate,d=i.stateNode;if(s!==null&&s===r)break;i.tag===5&&d!==null&&(i=d,l?(s=Wn(n,o),s!=null&&u.unshift(Zn(n,s,i))):l||(s=Wn(n,o),s!=null&&u.push(Zn(n,s,i)))),n=n.return}u.length!==0&&e.push({event:t,listeners:u})}var sf=/\r\n?/g,af=/\u0000|\uFFFD/g;function ki(e){return(typeof e=="string"?e:""+e).replace(sf,`
-`).replace(af,"")}function kr(e,t,n){if(t=ki(t),ki(e)!==t&&n)throw Error(x(425))}function Xr(){}var Co=null,jo=null;function _o(e,t){return e==="textarea"||e==="noscript"||typeof t.children=="string"||typeof t.children=="number"||typeof t.dangerouslySetInnerHTML=="object"&&t.dangerouslySetInnerHTML!==null&&t.dangerouslySetInnerHTML.__html!=null}var Po=typeof setTimeout=="function"?setTimeout:void 0,cf=typeof clearTimeout=="function"?clearTimeout:void 0,Si=typeof Promise=="function"?Promise:void 0,df=typeof queueMicrotask=="function"?queueMicrotask:typeof Si<"u"?function(e){return Si.resolve(null).then(e).catch(ff)}:Po;function ff(e){setTimeout(function(){throw e})}function Hl(e,t){var n=t,r=0;do{var l=n.nextSibling;if(e.removeChild(n),l&&l.nodeType===8)if(n=l.data,n==="/$"){if(r===0){e.removeChild(l),Kn(t);return}r--}else n!=="$"&&n!=="$?"&&n!=="$!"||r++;n=l}while(n);Kn(t)}function dt(e){for(;e!=null;e=e.nextSibling){var t=e.nodeType;if(t===1||t===3)break;if(t===8){if(t=e.data,t==="$"||t==="$!"||t==="$?")break;if(t==="/$")return null}}return e}function Ni(e){e=e.previousSibling;for(var t=0;e;){if(e.nodeType===8){var n=e.data;if(n==="$"||n==="$!"||n==="$?"){if(t===0)return e;t--}else n==="/$"&&t++}e=e.previousSibling}return null}var hn=Math.random().toString(36).slice(2),Ve="__reactFiber$"+hn,Jn="__reactProps$"+hn,Ze="__reactContainer$"+hn,To="__reactEvents$"+hn,pf="__reactListeners$"+hn,mf="__reactHandles$"+hn;function Ct(e){var t=e[Ve];if(t)return t;for(var n=e.parentNode;n;){if(t=n[Ze]||n[Ve]){if(n=t.alternate,t.child!==null||n!==null&&n.child!==null)for(e=Ni(e);e!==null;){if(n=e[Ve])return n;e=Ni(e)}return t}e=n,n=e.parentNode}return null}function ir(e){return e=e[Ve]||e[Ze],!e||e.tag!==5&&e.tag!==6&&e.tag!==13&&e.tag!==3?null:e}function Kt(e){if(e.tag===5||e.tag===6)return e.stateNode;throw Error(x(33))}function gl(e){return e[Jn]||null}var zo=[],Yt=-1;function xt(e){return{current:e}}function V(e){0>Yt||(e.current=zo[Yt],zo[Yt]=null,Yt--)}function U(e,t){Yt++,zo[Yt]=e.current,e.current=t}var gt={},ue=xt(gt),me=xt(!1),Lt=gt;function sn(e,t){var n=e.type.contextTypes;if(!n)return gt;var r=e.stateNode;if(r&&r.__reactInternalMemoizedUnmaskedChildContext===t)return r.__reactInternalMemoizedMaskedChildContext;var l={},o;for(o in n)l[o]=t[o];return r&&(e=e.stateNode,e.__reactInternalMemoizedUnmaskedChildContext=t,e.__reactInternalMemoizedMaskedChildContext=l),l}function ve(e){return e=e.childContextTypes,e!=null}function Gr(){V(me),V(ue)}function Ei(e,t,n){if(ue.current!==gt)throw Error(x(168));U(ue,t),U(me,n)}function da(e,t,n){var r=e.stateNode;if(t=t.childContextTypes,typeof r.getChildContext!="function")return n;r=r.getChildContext();for(var l in r)if(!(l in t))throw Error(x(108,Jc(e)||"Unknown",l));return Q({},n,r)}function Zr(e){return e=(e=e.stateNode)&&e.__reactInternalMemoizedMergedChildContext||gt,Lt=ue.current,U(ue,e),U(me,me.current),!0}function Ci(e,t,n){var r=e.stateNode;if(!r)throw Error(x(169));n?(e=da(e,t,Lt),r.__reactInternalMemoizedMergedChildContext=e,V(me),V(ue),U(ue,e)):V(me),U(me,n)}var Qe=null,yl=!1,Ql=!1;function fa(e){Qe===null?Qe=[e]:Qe.push(e)}function vf(e){yl=!0,fa(e)}function wt(){if(!Ql&&Qe!==null){Ql=!0;var e=0,t=$;try{var n=Qe;for($=1;e<n.length;e++){var r=n[e];do r=r(!0);while(r!==null)}Qe=null,yl=!1}catch(l){throw Qe!==null&&(Qe=Qe.slice(e+1)),Fs(iu,wt),l}finally{$=t,Ql=!1}}return null}var Xt=[],Gt=0,Jr=null,qr=0,Ce=[],je=0,Rt=null,Ke=1,Ye="";function Nt(e,t){Xt[Gt++]=qr,Xt[Gt++]=Jr,Jr=e,qr=t}function pa(e,t,n){Ce[je++]=Ke,Ce[je++]=Ye,Ce[je++]=Rt,Rt=e;var r=Ke;e=Ye;var l=32-Oe(r)-1;r&=~(1<<l),n+=1;var o=32-Oe(t)+l;if(30<o){var u=l-l%5;o=(r&(1<<u)-1).toString(32),r>>=u,l-=u,Ke=1<<32-Oe(t)+l|n<<l|r,Ye=o+e}else Ke=1<<o|n<<l|r,Ye=e}function hu(e){e.return!==null&&(Nt(e,1),pa(e,1,0))}function gu(e){for(;e===Jr;)Jr=Xt[--Gt],Xt[Gt]=null,qr=Xt[--Gt],Xt[Gt]=null;for(;e===Rt;)Rt=Ce[--je],Ce[je]=null,Ye=Ce[--je],Ce[je]=null,Ke=Ce[--je],Ce[je]=null}var we=null,xe=null,B=!1,Ie=null;function ma(e,t){var n=_e(5,null,null,0);n.elementType="DELETED",n.stateNode=t,n.return=e,t=e.deletions,t===null?(e.deletions=[n],e.flags|=16):t.push(n)}function ji(e,t){switch(e.tag){case 5:var n=e.type;return t=t.nodeType!==1||n.toLowerCase()!==t.nodeName.toLowerCase()?null:t,t!==null?(e.stateNode=t,we=e,xe=dt(t.firstChild),!0):!1;case 6:return t=e.pendingProps===""||t.nodeType!==3?null:t,t!==null?(e.stateNode=t,we=e,xe=null,!0):!1;case 13:return t=t.nodeType!==8?null:t,t!==null?(n=Rt!==null?{id:Ke,overflow:Ye}:null,e.memoizedState={dehydrated:t,treeContext:n,retryLane:1073741824},n=_e(18,null,null,0),n.stateNode=t,n.return=e,e.child=n,we=e,xe=null,!0):!1;default:return!1}}function Lo(e){return(e.mode&1)!==0&&(e.flags&128)===0}function Ro(e){if(B){var t=xe;if(t){var n=t;if(!ji(e,t)){if(Lo(e))throw Error(x(418));t=dt(n.nextSibling);var r=we;t&&ji(e,t)?ma(r,n):(e.flags=e.flags&-4097|2,B=!1,we=e)}}else{if(Lo(e))throw Error(x(418));e.flags=e.flags&-4097|2,B=!1,we=e}}}function _i(e){for(e=e.return;e!==null&&e.tag!==5&&e.tag!==3&&e.tag!==13;)e=e.return;we=e}function Sr(e){if(e!==we)return!1;if(!B)return _i(e),B=!0,!1;var t;if((t=e.tag!==3)&&!(t=e.tag!==5)&&(t=e.type,t=t!=="head"&&t!=="body"&&!_o(e.type,e.memoizedProps)),t&&(t=xe)){if(Lo(e))throw va(),Error(x(418));for(;t;)ma(e,t),t=dt(t.nextSibling)}if(_i(e),e.tag===13){if(e=e.memoizedState,e=e!==null?e.dehydrated:null,!e)throw Error(x(317));e:{for(e=e.nextSibling,t=0;e;){if(e.nodeType===8){var n=e.data;if(n==="/$"){if(t===0){xe=dt(e.nextSibling);break e}t--}else n!=="$"&&n!=="$!"&&n!=="$?"||t++}e=e.nextSibling}xe=null}}else xe=we?dt(e.stateNode.nextSibling):null;return!0}function va(){for(var e=xe;e;)e=dt(e.nextSibling)}function an(){xe=we=null,B=!1}function yu(e){Ie===null?Ie=[e]:Ie.push(e)}var hf=be.ReactCurrentBatchConfig;function Cn(e,t,n){if(e=n.ref,e!==null&&typeof e!="function"&&typeof e!="object"){if(n._owner){if(n=n._owner,n){if(n.tag!==1)throw Error(x(309));var r=n.stateNode}if(!r)throw Error(x(147,e));var l=r,o=""+e;return t!==null&&t.ref!==null&&typeof t.ref=="function"&&t.ref._stringRef===o?t.ref:(t=function(u){var i=l.refs;u===null?delete i[o]:i[o]=u},t._stringRef=o,t)}if(typeof e!="string")throw Error(x(284));if(!n._owner)throw Error(x(290,e))}return e}function Nr(e,t){throw e=Object.prototype.toString.call(t),Error(x(31,e==="[object Object]"?"object with keys {"+Object.keys(t).join(", ")+"}":e))}function Pi(e){var t=e._init;return t(e._payload)}function ha(e){function t(f,c){if(e){var p=f.deletions;p===null?(f.deletions=[c],f.flags|=16):p.push(c)}}function n(f,c){if(!e)return null;for(;c!==null;)t(f,c),c=c.sibling;return null}function r(f,c){for(f=new Map;c!==null;)c.key!==null?f.set(c.key,c):f.set(c.index,c),c=c.sibling;return f}function l(f,c){return f=vt(f,c),f.index=0,f.sibling=null,f}function o(f,c,p){return f.index=p,e?(p=f.alternate,p!==null?(p=p.index,p<c?(f.flags|=2,c):p):(f.flags|=2,c)):(f.flags|=1048576,c)}function u(f){return e&&f.alternate===null&&(f.flags|=2),f}function i(f,c,p,y){return c===null||c.tag!==6?(c=ql(p,f.mode,y),c.return=f,c):(c=l(c,p),c.return=f,c)}function s(f,c,p,y){var g=p.type;return g===Bt?h(f,c,p.props.children,y,p.key):c!==null&&(c.elementType===g||typeof g=="object"&&g!==null&&g.$$typeof===nt&&Pi(g)===c.type)?(y=l(c,p.props),y.ref=Cn(f,c,p),y.return=f,y):(y=Ur(p.type,p.key,p.props,null,f.mode,y),y.ref=Cn(f,c,p),y.return=f,y)}function d(f,c,p,y){return c===null||c.tag!==4||c.stateNode.containerInfo!==p.containerInfo||c.stateNode.implementation!==p.implementation?(c=bl(p,f.mode,y),c.return=f,c):(c=l(c,p.children||[]),c.return=f,c)}function h(f,c,p,y,g){return c===null||c.tag!==7?(c=zt(p,f.mode,y,g),c.return=f,c):(c=l(c,p),c.return=f,c)}function v(f,c,p){if(typeof c=="string"&&c!==""||typeof c=="number")return c=ql(""+c,f.mode,p),c.return=f,c;if(typeof c=="object"&&c!==null){switch(c.$$typeof){case fr:return p=Ur(c.type,c.key,c.props,null,f.mode,p),p.ref=Cn(f,null,c),p.return=f,p;case Vt:return c=bl(c,f.mode,p),c.return=f,c;case nt:var y=c._init;return v(f,y(c._payload),p)}if(Tn(c)||wn(c))return c=zt(c,f.mode,p,null),c.return=f,c;Nr(f,c)}return null}function m(f,c,p,y){var g=c!==null?c.key:null;if(typeof p=="string"&&p!==""||typeof p=="number")return g!==null?null:i(f,c,""+p,y);if(typeof p=="object"&&p!==null){switch(p.$$typeof){case fr:return p.key===g?s(f,c,p,y):null;case Vt:return p.key===g?d(f,c,p,y):null;case nt:return g=p._init,m(f,c,g(p._payload),y)}if(Tn(p)||wn(p))return g!==null?null:h(f,c,p,y,null);Nr(f,p)}return null}function k(f,c,p,y,g){if(typeof y=="string"&&y!==""||typeof y=="number")return f=f.get(p)||null,i(c,f,""+y,g);if(typeof y=="object"&&y!==null){switch(y.$$typeof){case fr:return f=f.get(y.key===null?p:y.key)||null,s(c,f,y,g);case Vt:return f=f.get(y.key===null?p:y.key)||null,d(c,f,y,g);case nt:var w=y._init;return k(f,c,p,w(y._payload),g)}if(Tn(y)||wn(y))return f=f.get(p)||null,h(c,f,y,g,null);Nr(c,y)}return null}function S(f,c,p,y){for(var g=null,w=null,C=c,j=c=0,O=null;C!==null&&j<p.length;j++){C.index>j?(O=C,C=null):O=C.sibling;var T=m(f,C,p[j],y);if(T===null){C===null&&(C=O);break}e&&C&&T.alternate===null&&t(f,C),c=o(T,c,j),w===null?g=T:w.sibling=T,w=T,C=O}if(j===p.length)return n(f,C),B&&Nt(f,j),g;if(C===null){for(;j<p.length;j++)C=v(f,p[j],y),C!==null&&(c=o(C,c,j),w===null?g=C:w.sibling=C,w=C);return B&&Nt(f,j),g}for(C=r(f,C);j<p.length;j++)O=k(C,f,j,p[j],y),O!==null&&(e&&O.alternate!==null&&C.delete(O.key===null?j:O.key),c=o(O,c,j),w===null?g=O:w.sibling=O,w=O);return e&&C.forEach(function(ie){return t(f,ie)}),B&&Nt(f,j),g}function E(f,c,p,y){var g=wn(p);if(typeof g!="function")throw Error(x(150));if(p=g.call(p),p==null)throw Error(x(151));for(var w=g=null,C=c,j=c=0,O=null,T=p.next();C!==null&&!T.done;j++,T=p.next()){C.index>j?(O=C,C=null):O=C.sibling;var ie=m(f,C,T.value,y);if(ie===null){C===null&&(C=O);break}e&&C&&ie.alternate===null&&t(f,C),c=o(ie,c,j),w===null?g=ie:w.sibling=ie,w=ie,C=O}if(T.done)return n(f,C),B&&Nt(f,j),g;if(C===null){for(;!T.done;j++,T=p.next())T=v(f,T.value,y),T!==null&&(c=o(T,c,j),w===null?g=T:w.sibling=T,w=T);return B&&Nt(f,j),g}for(C=r(f,C);!T.done;j++,T=p.next())T=k(C,f,j,T.value,y),T!==null&&(e&&T.alternate!==null&&C.delete(T.key===null?j:T.key),c=o(T,c,j),w===null?g=T:w.sibling=T,w=T);return e&&C.forEach(function(Y){return t(f,Y)}),B&&Nt(f,j),g}function z(f,c,p,y){if(typeof p=="object"&&p!==null&&p.type===Bt&&p.key===null&&(p=p.props.children),typeof p=="object"&&p!==null){switch(p.$$typeof){case fr:e:{for(var g=p.key,w=c;w!==null;){if(w.key===g){if(g=p.type,g===Bt){if(w.tag===7){n(f,w.sibling),c=l(w,p.props.children),c.return=f,f=c;break e}}else if(w.elementType===g||typeof g=="object"&&g!==null&&g.$$typeof===nt&&Pi(g)===w.type){n(f,w.sibling),c=l(w,p.props),c.ref=Cn(f,w,p),c.return=f,f=c;break e}n(f,w);break}else t(f,w);w=w.sibling}p.type===Bt?(c=zt(p.props.children,f.mode,y,p.key),c.return=f,f=c):(y=Ur(p.type,p.key,p.props,null,f.mode,y),y.ref=Cn(f,c,p),y.return=f,f=y)}return u(f);case Vt:e:{for(w=p.key;c!==null;){if(c.key===w)if(c.tag===4&&c.stateNode.containerInfo===p.containerInfo&&c.stateNode.implementation===p.implementation){n(f,c.sibling),c=l(c,p.children||[]),c.return=f,f=c;break e}else{n(f,c);break}else t(f,c);c=c.sibling}c=bl(p,f.mode,y),c.return=f,f=c}return u(f);case nt:return w=p._init,z(f,c,w(p._payload),y)}if(Tn(p))return S(f,c,p,y);if(wn(p))return E(f,c,p,y);Nr(f,p)}return typeof p=="string"&&p!==""||typeof p=="number"?(p=""+p,c!==null&&c.tag===6?(n(f,c.sibling),c=l(c,p),c.return=f,f=c):(n(f,c),c=ql(p,f.mode,y),c.return=f,f=c),u(f)):n(f,c)}return z}var cn=ha(!0),ga=ha(!1),br=xt(null),el=null,Zt=null,xu=null;function wu(){xu=Zt=el=null}function ku(e){var t=br.current;V(br),e._currentValue=t}function Mo(e,t,n){for(;e!==null;){var r=e.alternate;if((e.childLanes&t)!==t?(e.childLanes|=t,r!==null&&(r.childLanes|=t)):r!==null&&(r.childLanes&t)!==t&&(r.childLanes|=t),e===n)break;e=e.return}}function ln(e,t){el=e,xu=Zt=null,e=e.dependencies,e!==null&&e.firstContext!==null&&(e.lanes&t&&(pe=!0),e.firstContext=null)}function Te(e){var t=e._currentValue;if(xu!==e)if(e={context:e,memoizedValue:t,next:null},Zt===null){if(el===null)throw Error(x(308));Zt=e,el.dependencies={lanes:0,firstContext:e}}else Zt=Zt.next=e;return t}var jt=null;function Su(e){jt===null?jt=[e]:jt.push(e)}function ya(e,t,n,r){var l=t.interleaved;return l===null?(n.next=n,Su(t)):(n.next=l.next,l.next=n),t.interleaved=n,Je(e,r)}function Je(e,t){e.lanes|=t;var n=e.alternate;for(n!==null&&(n.lanes|=t),n=e,e=e.return;e!==null;)e.childLanes|=t,n=e.alternate,n!==null&&(n.childLanes|=t),n=e,e=e.return;return n.tag===3?n.stateNode:null}var rt=!1;function Nu(e){e.updateQueue={baseState:e.memoizedState,firstBaseUpdate:null,lastBaseUpdate:null,shared:{pending:null,interleaved:null,lanes:0},effects:null}}function xa(e,t){e=e.updateQueue,t.updateQueue===e&&(t.updateQueue={baseState:e.baseState,firstBaseUpdate:e.firstBaseUpdate,lastBaseUpdate:e.lastBaseUpdate,shared:e.shared,effects:e.effects})}function Xe(e,t){return{eventTime:e,lane:t,tag:0,payload:null,callback:null,next:null}}function ft(e,t,n){var r=e.updateQueue;if(r===null)return null;if(r=r.shared,I&2){var l=r.pending;return l===null?t.next=t:(t.next=l.next,l.next=t),r.pending=t,Je(e,n)}return l=r.interleaved,l===null?(t.next=t,Su(r)):(t.next=l.next,l.next=t),r.interleaved=t,Je(e,n)}function Mr(e,t,n){if(t=t.updateQueue,t!==null&&(t=t.shared,(n&4194240)!==0)){var r=t.lanes;r&=e.pendingLanes,n|=r,t.lanes=n,su(e,n)}}function Ti(e,t){var n=e.updateQueue,r=e.alternate;if(r!==null&&(r=r.updateQueue,n===r)){var l=null,o=null;if(n=n.firstBaseUpdate,n!==null){do{var u={eventTime:n.eventTime,lane:n.lane,tag:n.tag,payload:n.payload,callback:n.callback,next:null};o===null?l=o=u:o=o.next=u,n=n.next}while(n!==null);o===null?l=o=t:o=o.next=t}else l=o=t;n={baseState:r.baseState,firstBaseUpdate:l,lastBaseUpdate:o,shared:r.shared,effects:r.effects},e.updateQueue=n;return}e=n.lastBaseUpdate,e===null?n.firstBaseUpdate=t:e.next=t,n.lastBaseUpdate=t}function tl(e,t,n,r){var l=e.updateQueue;rt=!1;var o=l.firstBaseUpdate,u=l.lastBaseUpdate,i=l.shared.pending;if(i!==null){l.shared.pending=null;var s=i,d=s.next;s.next=null,u===null?o=d:u.next=d,u=s;var h=e.alternate;h!==null&&(h=h.updateQueue,i=h.lastBaseUpdate,i!==u&&(i===null?h.firstBaseUpdate=d:i.next=d,h.lastBaseUpdate=s))}if(o!==null){var v=l.baseState;u=0,h=d=s=null,i=o;do{var m=i.lane,k=i.eventTime;if((r&m)===m){h!==null&&(h=h.next={eventTime:k,lane:0,tag:i.tag,payload:i.payload,callback:i.callback,next:null});e:{var S=e,E=i;switch(m=t,k=n,E.tag){case 1:if(S=E.payload,typeof S=="function"){v=S.call(k,v,m);break e}v=S;break e;case 3:S.flags=S.flags&-65537|128;case 0:if(S=E.payload,m=typeof S=="function"?S.call(k,v,m):S,m==null)break e;v=Q({},v,m);break e;case 2:rt=!0}}i.callback!==null&&i.lane!==0&&(e.flags|=64,m=l.effects,m===null?l.effects=[i]:m.push(i))}else k={eventTime:k,lane:m,tag:i.tag,payload:i.payload,callback:i.callback,next:null},h===null?(d=h=k,s=v):h=h.next=k,u|=m;if(i=i.next,i===null){if(i=l.shared.pending,i===null)break;m=i,i=m.next,m.next=null,l.lastBaseUpdate=m,l.shared.pending=null}}while(!0);if(h===null&&(s=v),l.baseState=s,l.firstBaseUpdate=d,l.lastBaseUpdate=h,t=l.shared.interleaved,t!==null){l=t;do u|=l.lane,l=l.next;while(l!==t)}else o===null&&(l.shared.lanes=0);Dt|=u,e.lanes=u,e.memoizedState=v}}function zi(e,t,n){if(e=t.effects,t.effects=null,e!==null)for(t=0;t<e.length;t++){var r=e[t],l=r.callback;if(l!==null){if(r.callback=null,r=n,typeof l!="function")throw Error(x(191,l));l.call(r)}}}var sr={},We=xt(sr),qn=xt(sr),bn=xt(sr);function _t(e){if(e===sr)throw Error(x(174));return e}function Eu(e,t){switch(U(bn,t),U(qn,e),U(We,sr),e=t.nodeType,e){case 9:case 11:t=(t=t.documentElement)?t.namespaceURI:po(null,"");break;default:e=e===8?t.parentNode:t,t=e.namespaceURI||null,e=e.tagName,t=po(t,e)}V(We),U(We,t)}function dn(){V(We),V(qn),V(bn)}function wa(e){_t(bn.current);var t=_t(We.current),n=po(t,e.type);t!==n&&(U(qn,e),U(We,n))}function Cu(e){qn.current===e&&(V(We),V(qn))}var W=xt(0);function nl(e){for(var t=e;t!==null;){if(t.tag===13){var n=t.memoizedState;if(n!==null&&(n=n.dehydrated,n===null||n.data==="$?"||n.data==="$!"))return t}else if(t.tag===19&&t.memoizedProps.revealOrder!==void 0){if(t.flags&128)return t}else if(t.child!==null){t.child.return=t,t=t.child;continue}if(t===e)break;for(;t.sibling===null;){if(t.return===null||t.return===e)return null;t=t.return}t.sibling.return=t.return,t=t.sibling}return null}var Kl=[];function ju(){for(var e=0;e<Kl.length;e++)Kl[e]._workInProgressVersionPrimary=null;Kl.length=0}var Dr=be.ReactCurrentDispatcher,Yl=be.ReactCurrentBatchConfig,Mt=0,H=null,Z=null,q=null,rl=!1,Fn=!1,er=0,gf=0;function re(){throw Error(x(321))}function _u(e,t){if(t===null)return!1;for(var n=0;n<t.length&&n<e.length;n++)if(!$e(e[n],t[n]))return!1;return!0}function Pu(e,t,n,r,l,o){if(Mt=o,H=t,t.memoizedState=null,t.updateQueue=null,t.lanes=0,Dr.current=e===null||e.memoizedState===null?kf:Sf,e=n(r,l),Fn){o=0;do{if(Fn=!1,er=0,25<=o)throw Error(x(301));o+=1,q=Z=null,t.updateQueue=null,Dr.current=Nf,e=n(r,l)}while(Fn)}if(Dr.current=ll,t=Z!==null&&Z.next!==null,Mt=0,q=Z=H=null,rl=!1,t)throw Error(x(300));return e}function Tu(){var e=er!==0;return er=0,e}function Ae(){var e={memoizedState:null,baseState:null,baseQueue:null,queue:null,next:null};return q===null?H.memoizedState=q=e:q=q.next=e,q}function ze(){if(Z===null){var e=H.alternate;e=e!==null?e.memoizedState:null}else e=Z.next;var t=q===null?H.memoizedState:q.next;if(t!==null)q=t,Z=e;else{if(e===null)throw Error(x(310));Z=e,e={memoizedState:Z.memoizedState,baseState:Z.baseState,baseQueue:Z.baseQueue,queue:Z.queue,next:null},q===null?H.memoizedState=q=e:q=q.next=e}return q}function tr(e,t){return typeof t=="function"?t(e):t}function Xl(e){var t=ze(),n=t.queue;if(n===null)throw Error(x(311));n.lastRenderedReducer=e;var r=Z,l=r.baseQueue,o=n.pending;if(o!==null){if(l!==null){var u=l.next;l.next=o.next,o.next=u}r.baseQueue=l=o,n.pending=null}if(l!==null){o=l.next,r=r.baseState;var i=u=null,s=null,d=o;do{var h=d.lane;if((Mt&h)===h)s!==null&&(s=s.next={lane:0,action:d.action,hasEagerState:d.hasEagerState,eagerState:d.eagerState,next:null}),r=d.hasEagerState?d.eagerState:e(r,d.action);else{var v={lane:h,action:d.action,hasEagerState:d.hasEagerState,eagerState:d.eagerState,next:null};s===null?(i=s=v,u=r):s=s.next=v,H.lanes|=h,Dt|=h}d=d.next}while(d!==null&&d!==o);s===null?u=r:s.next=i,$e(r,t.memoizedState)||(pe=!0),t.memoizedState=r,t.baseState=u,t.baseQueue=s,n.lastRenderedState=r}if(e=n.interleaved,e!==null){l=e;do o=l.lane,H.lanes|=o,Dt|=o,l=l.next;while(l!==e)}else l===null&&(n.lanes=0);return[t.memoizedState,n.dispatch]}function Gl(e){var t=ze(),n=t.queue;if(n===null)throw Error(x(311));n.lastRenderedReducer=e;var r=n.dispatch,l=n.pending,o=t.memoizedState;if(l!==null){n.pending=null;var u=l=l.next;do o=e(o,u.action),u=u.next;while(u!==l);$e(o,t.memoizedState)||(pe=!0),t.memoizedState=o,t.baseQueue===null&&(t.baseState=o),n.lastRenderedState=o}return[o,r]}function ka(){}function Sa(e,t){var n=H,r=ze(),l=t(),o=!$e(r.memoizedState,l);if(o&&(r.memoizedState=l,pe=!0),r=r.queue,zu(Ca.bind(null,n,r,e),[e]),r.getSnapshot!==t||o||q!==null&&q.memoizedState.tag&1){if(n.flags|=2048,nr(9,Ea.bind(null,n,r,l,t),void 0,null),b===null)throw Error(x(349));Mt&30||Na(n,t,l)}return l}function Na(e,t,n){e.flags|=16384,e={getSnapshot:t,value:n},t=H.updateQueue,t===null?(t={lastEffect:null,stores:null},H.updateQueue=t,t.stores=[e]):(n=t.stores,n===null?t.stores=[e]:n.push(e))}function Ea(e,t,n,r){t.value=n,t.getSnapshot=r,ja(t)&&_a(e)}function Ca(e,t,n){return n(function(){ja(t)&&_a(e)})}function ja(e){var t=e.getSnapshot;e=e.value;try{var n=t();return!$e(e,n)}catch{return!0}}function _a(e){var t=Je(e,1);t!==null&&Fe(t,e,1,-1)}function Li(e){var t=Ae();return typeof e=="function"&&(e=e()),t.memoizedState=t.baseState=e,e={pending:null,interleaved:null,lanes:0,dispatch:null,lastRenderedReducer:tr,lastRenderedState:e},t.queue=e,e=e.dispatch=wf.bind(null,H,e),[t.memoizedState,e]}function nr(e,t,n,r){return e={tag:e,create:t,destroy:n,deps:r,next:null},t=H.updateQueue,t===null?(t={lastEffect:null,stores:null},H.updateQueue=t,t.lastEffect=e.next=e):(n=t.lastEffect,n===null?t.lastEffect=e.next=e:(r=n.next,n.next=e,e.next=r,t.lastEffect=e)),e}function Pa(){return ze().memoizedState}function Ir(e,t,n,r){var l=Ae();H.flags|=e,l.memoizedState=nr(1|t,n,void 0,r===void 0?null:r)}function xl(e,t,n,r){var l=ze();r=r===void 0?null:r;var o=void 0;if(Z!==null){var u=Z.memoizedState;if(o=u.destroy,r!==null&&_u(r,u.deps)){l.memoizedState=nr(t,n,o,r);return}}H.flags|=e,l.memoizedState=nr(1|t,n,o,r)}function Ri(e,t){return Ir(8390656,8,e,t)}function zu(e,t){return xl(2048,8,e,t)}function Ta(e,t){return xl(4,2,e,t)}function za(e,t){return xl(4,4,e,t)}function La(e,t){if(typeof t=="function")return e=e(),t(e),function(){t(null)};if(t!=null)return e=e(),t.current=e,function(){t.current=null}}function Ra(e,t,n){return n=n!=null?n.concat([e]):null,xl(4,4,La.bind(null,t,e),n)}function Lu(){}function Ma(e,t){var n=ze();t=t===void 0?null:t;var r=n.memoizedState;return r!==null&&t!==null&&_u(t,r[1])?r[0]:(n.memoizedState=[e,t],e)}function Da(e,t){var n=ze();t=t===void 0?null:t;var r=n.memoizedState;return r!==null&&t!==null&&_u(t,r[1])?r[0]:(e=e(),n.memoizedState=[e,t],e)}function Ia(e,t,n){return Mt&21?($e(n,t)||(n=As(),H.lanes|=n,Dt|=n,e.baseState=!0),t):(e.baseState&&(e.baseState=!1,pe=!0),e.memoizedState=n)}function yf(e,t){var n=$;$=n!==0&&4>n?n:4,e(!0);var r=Yl.transition;Yl.transition={};try{e(!1),t()}finally{$=n,Yl.transition=r}}function Oa(){return ze().memoizedState}function xf(e,t,n){var r=mt(e);if(n={lane:r,action:n,hasEagerState:!1,eagerState:null,next:null},Fa(e))$a(t,n);else if(n=ya(e,t,n,r),n!==null){var l=ae();Fe(n,e,r,l),Ua(n,t,r)}}function wf(e,t,n){var r=mt(e),l={lane:r,action:n,hasEagerState:!1,eagerState:null,next:null};if(Fa(e))$a(t,l);else{var o=e.alternate;if(e.lanes===0&&(o===null||o.lanes===0)&&(o=t.lastRenderedReducer,o!==null))try{var u=t.lastRenderedState,i=o(u,n);if(l.hasEagerState=!0,l.eagerState=i,$e(i,u)){var s=t.interleaved;s===null?(l.next=l,Su(t)):(l.next=s.next,s.next=l),t.interleaved=l;return}}catch{}finally{}n=ya(e,t,l,r),n!==null&&(l=ae(),Fe(n,e,r,l),Ua(n,t,r))}}function Fa(e){var t=e.alternate;return e===H||t!==null&&t===H}function $a(e,t){Fn=rl=!0;var n=e.pending;n===null?t.next=t:(t.next=n.next,n.next=t),e.pending=t}function Ua(e,t,n){if(n&4194240){var r=t.lanes;r&=e.pendingLanes,n|=r,t.lanes=n,su(e,n)}}var ll={readContext:Te,useCallback:re,useContext:re,useEffect:re,useImperativeHandle:re,useInsertionEffect:re,useLayoutEffect:re,useMemo:re,useReducer:re,useRef:re,useState:re,useDebugValue:re,useDeferredValue:re,useTransition:re,useMutableSource:re,useSyncExternalStore:re,useId:re,unstable_isNewReconciler:!1},kf={readContext:Te,useCallback:function(e,t){return Ae().memoizedState=[e,t===void 0?null:t],e},useContext:Te,useEffect:Ri,useImperativeHandle:function(e,t,n){return n=n!=null?n.concat([e]):null,Ir(4194308,4,La.bind(null,t,e),n)},useLayoutEffect:function(e,t){return Ir(4194308,4,e,t)},useInsertionEffect:function(e,t){return Ir(4,2,e,t)},useMemo:function(e,t){var n=Ae();return t=t===void 0?null:t,e=e(),n.memoizedState=[e,t],e},useReducer:function(e,t,n){var r=Ae();return t=n!==void 0?n(t):t,r.memoizedState=r.baseState=t,e={pending:null,interleaved:null,lanes:0,dispatch:null,lastRenderedReducer:e,lastRenderedState:t},r.queue=e,e=e.dispatch=xf.bind(null,H,e),[r.memoizedState,e]},useRef:function(e){var t=Ae();return e={current:e},t.memoizedState=e},useState:Li,useDebugValue:Lu,useDeferredValue:function(e){return Ae().memoizedState=e},useTransition:function(){var e=Li(!1),t=e[0];return e=yf.bind(null,e[1]),Ae().memoizedState=e,[t,e]},useMutableSource:function(){},useSyncExternalStore:function(e,t,n){var r=H,l=Ae();if(B){if(n===void 0)throw Error(x(407));n=n()}else{if(n=t(),b===null)throw Error(x(349));Mt&30||Na(r,t,n)}l.memoizedState=n;var o={value:n,getSnapshot:t};return l.queue=o,Ri(Ca.bind(null,r,o,e),[e]),r.flags|=2048,nr(9,Ea.bind(null,r,o,n,t),void 0,null),n},useId:function(){var e=Ae(),t=b.identifierPrefix;if(B){var n=Ye,r=Ke;n=(r&~(1<<32-Oe(r)-1)).toString(32)+n,t=":"+t+"R"+n,n=er++,0<n&&(t+="H"+n.toString(32)),t+=":"}else n=gf++,t=":"+t+"r"+n.toString(32)+":";return e.memoizedState=t},unstable_isNewReconciler:!1},Sf={readContext:Te,useCallback:Ma,useContext:Te,useEffect:zu,useImperativeHandle:Ra,useInsertionEffect:Ta,useLayoutEffect:za,useMemo:Da,useReducer:Xl,useRef:Pa,useState:function(){return Xl(tr)},useDebugValue:Lu,useDeferredValue:function(e){var t=ze();return Ia(t,Z.memoizedState,e)},useTransition:function(){var e=Xl(tr)[0],t=ze().memoizedState;return[e,t]},useMutableSource:ka,useSyncExternalStore:Sa,useId:Oa,unstable_isNewReconciler:!1},Nf={readContext:Te,useCallback:Ma,useContext:Te,useEffect:zu,useImperativeHandle:Ra,useInsertionEffect:Ta,useLayoutEffect:za,useMemo:Da,useReducer:Gl,useRef:Pa,useState:function(){return Gl(tr)},useDebugValue:Lu,useDeferredValue:function(e){var t=ze();return Z===null?t.memoizedState=e:Ia(t,Z.memoizedState,e)},useTransition:function(){var e=Gl(tr)[0],t=ze().memoizedState;return[e,t]},useMutableSource:ka,useSyncExternalStore:Sa,useId:Oa,unstable_isNewReconciler:!1};function Me(e,t){if(e&&e.defaultProps){t=Q({},t),e=e.defaultProps;for(var n in e)t[n]===void 0&&(t[n]=e[n]);return t}return t}function Do(e,t,n,r){t=e.memoizedState,n=n(r,t),n=n==null?t:Q({},t,n),e.memoizedState=n,e.lanes===0&&(e.updateQueue.baseState=n)}var wl={isMounted:function(e){return(e=e._reactInternals)?Ft(e)===e:!1},enqueueSetState:function(e,t,n){e=e._reactInternals;var r=ae(),l=mt(e),o=Xe(r,l);o.payload=t,n!=null&&(o.callback=n),t=ft(e,o,l),t!==null&&(Fe(t,e,l,r),Mr(t,e,l))},enqueueReplaceState:function(e,t,n){e=e._reactInternals;var r=ae(),l=mt(e),o=Xe(r,l);o.tag=1,o.payload=t,n!=null&&(o.callback=n),t=ft(e,o,l),t!==null&&(Fe(t,e,l,r),Mr(t,e,l))},enqueueForceUpdate:function(e,t){e=e._reactInternals;var n=ae(),r=mt(e),l=Xe(n,r);l.tag=2,t!=null&&(l.callback=t),t=ft(e,l,r),t!==null&&(Fe(t,e,r,n),Mr(t,e,r))}};function Mi(e,t,n,r,l,o,u){return e=e.stateNode,typeof e.shouldComponentUpdate=="function"?e.shouldComponentUpdate(r,o,u):t.prototype&&t.prototype.isPureReactComponent?!Xn(n,r)||!Xn(l,o):!0}function Aa(e,t,n){var r=!1,l=gt,o=t.contextType;return typeof o=="object"&&o!==null?o=Te(o):(l=ve(t)?Lt:ue.current,r=t.contextTypes,o=(r=r!=null)?sn(e,l):gt),t=new t(n,o),e.memoizedState=t.state!==null&&t.state!==void 0?t.state:null,t.updater=wl,e.stateNode=t,t._reactInternals=e,r&&(e=e.stateNode,e.__reactInternalMemoizedUnmaskedChildContext=l,e.__reactInternalMemoizedMaskedChildContext=o),t}function Di(e,t,n,r){e=t.state,typeof t.componentWillReceiveProps=="function"&&t.componentWillReceiveProps(n,r),typeof t.UNSAFE_componentWillReceiveProps=="function"&&t.UNSAFE_componentWillReceiveProps(n,r),t.state!==e&&wl.enqueueReplaceState(t,t.state,null)}function Io(e,t,n,r){var l=e.stateNode;l.props=n,l.state=e.memoizedState,l.refs={},Nu(e);var o=t.contextType;typeof o=="object"&&o!==null?l.context=Te(o):(o=ve(t)?Lt:ue.current,l.context=sn(e,o)),l.state=e.memoizedState,o=t.getDerivedStateFromProps,typeof o=="function"&&(Do(e,t,o,n),l.state=e.memoizedState),typeof t.getDerivedStateFromProps=="function"||typeof l.getSnapshotBeforeUpdate=="function"||typeof l.UNSAFE_componentWillMount!="function"&&typeof l.componentWillMount!="function"||(t=l.state,typeof l.componentWillMount=="function"&&l.componentWillMount(),typeof l.UNSAFE_componentWillMount=="function"&&l.UNSAFE_componentWillMount(),t!==l.state&&wl.enqueueReplaceState(l,l.state,null),tl(e,n,l,r),l.state=e.memoizedState),typeof l.componentDidMount=="function"&&(e.flags|=4194308)}function fn(e,t){try{var n="",r=t;do n+=Zc(r),r=r.return;while(r);var l=n}catch(o){l=`
-Error generating stack: `+o.message+`
-`+o.stack}return{value:e,source:t,stack:l,digest:null}}function Zl(e,t,n){return{value:e,source:null,stack:n??null,digest:t??null}}function Oo(e,t){try{console.error(t.value)}catch(n){setTimeout(function(){throw n})}}var Ef=typeof WeakMap=="function"?WeakMap:Map;function Va(e,t,n){n=Xe(-1,n),n.tag=3,n.payload={element:null};var r=t.value;return n.callback=function(){ul||(ul=!0,Ko=r),Oo(e,t)},n}function Ba(e,t,n){n=Xe(-1,n),n.tag=3;var r=e.type.getDerivedStateFromError;if(typeof r=="function"){var l=t.value;n.payload=function(){return r(l)},n.callback=function(){Oo(e,t)}}var o=e.stateNode;return o!==null&&typeof o.componentDidCatch=="function"&&(n.callback=function(){Oo(e,t),typeof r!="function"&&(pt===null?pt=new Set([this]):pt.add(this));var u=t.stack;this.componentDidCatch(t.value,{componentStack:u!==null?u:""})}),n}function Ii(e,t,n){var r=e.pingCache;if(r===null){r=e.pingCache=new Ef;var l=new Set;r.set(t,l)}else l=r.get(t),l===void 0&&(l=new Set,r.set(t,l));l.has(n)||(l.add(n),e=$f.bind(null,e,t,n),t.then(e,e))}function Oi(e){do{var t;if((t=e.tag===13)&&(t=e.memoizedState,t=t!==null?t.dehydrated!==null:!0),t)return e;e=e.return}while(e!==null);return null}function Fi(e,t,n,r,l){return e.mode&1?(e.flags|=65536,e.lanes=l,e):(e===t?e.flags|=65536:(e.flags|=128,n.flags|=131072,n.flags&=-52805,n.tag===1&&(n.alternate===null?n.tag=17:(t=Xe(-1,1),t.tag=2,ft(n,t,1))),n.lanes|=1),e)}var Cf=be.ReactCurrentOwner,pe=!1;function se(e,t,n,r){t.child=e===null?ga(t,null,n,r):cn(t,e.child,n,r)}function $i(e,t,n,r,l){n=n.render;var o=t.ref;return ln(t,l),r=Pu(e,t,n,r,o,l),n=Tu(),e!==null&&!pe?(t.updateQueue=e.updateQueue,t.flags&=-2053,e.lanes&=~l,qe(e,t,l)):(B&&n&&hu(t),t.flags|=1,se(e,t,r,l),t.child)}function Ui(e,t,n,r,l){if(e===null){var o=n.type;return typeof o=="function"&&!Uu(o)&&o.defaultProps===void 0&&n.compare===null&&n.defaultProps===void 0?(t.tag=15,t.type=o,Wa(e,t,o,r,l)):(e=Ur(n.type,null,r,t,t.mode,l),e.ref=t.ref,e.return=t,t.child=e)}if(o=e.child,!(e.lanes&l)){var u=o.memoizedProps;if(n=n.compare,n=n!==null?n:Xn,n(u,r)&&e.ref===t.ref)return qe(e,t,l)}return t.flags|=1,e=vt(o,r),e.ref=t.ref,e.return=t,t.child=e}function Wa(e,t,n,r,l){if(e!==null){var o=e.memoizedProps;if(Xn(o,r)&&e.ref===t.ref)if(pe=!1,t.pendingProps=r=o,(e.lanes&l)!==0)e.flags&131072&&(pe=!0);else return t.lanes=e.lanes,qe(e,t,l)}return Fo(e,t,n,r,l)}function Ha(e,t,n){var r=t.pendingProps,l=r.children,o=e!==null?e.memoizedState:null;if(r.mode==="hidden")if(!(t.mode&1))t.memoizedState={baseLanes:0,cachePool:null,transitions:null},U(qt,ye),ye|=n;else{if(!(n&1073741824))return e=o!==null?o.baseLanes|n:n,t.lanes=t.childLanes=1073741824,t.memoizedState={baseLanes:e,cachePool:null,transitions:null},t.updateQueue=null,U(qt,ye),ye|=e,null;t.memoizedState={baseLanes:0,cachePool:null,transitions:null},r=o!==null?o.baseLanes:n,U(qt,ye),ye|=r}else o!==null?(r=o.baseLanes|n,t.memoizedState=null):r=n,U(qt,ye),ye|=r;return se(e,t,l,n),t.child}function Qa(e,t){var n=t.ref;(e===null&&n!==null||e!==null&&e.ref!==n)&&(t.flags|=512,t.flags|=2097152)}function Fo(e,t,n,r,l){var o=ve(n)?Lt:ue.current;return o=sn(t,o),ln(t,l),n=Pu(e,t,n,r,o,l),r=Tu(),e!==null&&!pe?(t.updateQueue=e.updateQueue,t.flags&=-2053,e.lanes&=~l,qe(e,t,l)):(B&&r&&hu(t),t.flags|=1,se(e,t,n,l),t.child)}function Ai(e,t,n,r,l){if(ve(n)){var o=!0;Zr(t)}else o=!1;if(ln(t,l),t.stateNode===null)Or(e,t),Aa(t,n,r),Io(t,n,r,l),r=!0;else if(e===null){var u=t.stateNode,i=t.memoizedProps;u.props=i;var s=u.context,d=n.contextType;typeof d=="object"&&d!==null?d=Te(d):(d=ve(n)?Lt:ue.current,d=sn(t,d));var h=n.getDerivedStateFromProps,v=typeof h=="function"||typeof u.getSnapshotBeforeUpdate=="function";v||typeof u.UNSAFE_componentWillReceiveProps!="function"&&typeof u.componentWillReceiveProps!="function"||(i!==r||s!==d)&&Di(t,u,r,d),rt=!1;var m=t.memoizedState;u.state=m,tl(t,r,u,l),s=t.memoizedState,i!==r||m!==s||me.current||rt?(typeof h=="function"&&(Do(t,n,h,r),s=t.memoizedState),(i=rt||Mi(t,n,i,r,m,s,d))?(v||typeof u.UNSAFE_componentWillMount!="function"&&typeof u.componentWillMount!="function"||(typeof u.componentWillMount=="function"&&u.componentWillMount(),typeof u.UNSAFE_componentWillMount=="function"&&u.UNSAFE_componentWillMount()),typeof u.componentDidMount=="function"&&(t.flags|=4194308)):(typeof u.componentDidMount=="function"&&(t.flags|=4194308),t.memoizedProps=r,t.memoizedState=s),u.props=r,u.state=s,u.context=d,r=i):(typeof u.componentDidMount=="function"&&(t.flags|=4194308),r=!1)}else{u=t.stateNode,xa(e,t),i=t.memoizedProps,d=t.type===t.elementType?i:Me(t.type,i),u.props=d,v=t.pendingProps,m=u.context,s=n.contextType,typeof s=="object"&&s!==null?s=Te(s):(s=ve(n)?Lt:ue.current,s=sn(t,s));var k=n.getDerivedStateFromProps;(h=typeof k=="function"||typeof u.getSnapshotBeforeUpdate=="function")||typeof u.UNSAFE_componentWillReceiveProps!="function"&&typeof u.componentWillReceiveProps!="function"||(i!==v||m!==s)&&Di(t,u,r,s),rt=!1,m=t.memoizedState,u.state=m,tl(t,r,u,l);var S=t.memoizedState;i!==v||m!==S||me.current||rt?(typeof k=="function"&&(Do(t,n,k,r),S=t.memoizedState),(d=rt||Mi(t,n,d,r,m,S,s)||!1)?(h||typeof u.UNSAFE_componentWillUpdate!="function"&&typeof u.componentWillUpdate!="function"||(typeof u.componentWillUpdate=="function"&&u.componentWillUpdate(r,S,s),typeof u.UNSAFE_componentWillUpdate=="function"&&u.UNSAFE_componentWillUpdate(r,S,s)),typeof u.componentDidUpdate=="function"&&(t.flags|=4),typeof u.getSnapshotBeforeUpdate=="function"&&(t.flags|=1024)):(typeof u.componentDidUpdate!="function"||i===e.memoizedProps&&m===e.memoizedState||(t.flags|=4),typeof u.getSnapshotBeforeUpdate!="function"||i===e.memoizedProps&&m===e.memoizedState||(t.flags|=1024),t.memoizedProps=r,t.memoizedState=S),u.props=r,u.state=S,u.context=s,r=d):(typeof u.componentDidUpdate!="function"||i===e.memoizedProps&&m===e.memoizedState||(t.flags|=4),typeof u.getSnapshotBeforeUpdate!="function"||i===e.memoizedProps&&m===e.memoizedState||(t.flags|=1024),r=!1)}return $o(e,t,n,r,o,l)}function $o(e,t,n,r,l,o){Qa(e,t);var u=(t.flags&128)!==0;if(!r&&!u)return l&&Ci(t,n,!1),qe(e,t,o);r=t.stateNode,Cf.current=t;var i=u&&typeof n.getDerivedStateFromError!="function"?null:r.render();return t.flags|=1,e!==null&&u?(t.child=cn(t,e.child,null,o),t.child=cn(t,null,i,o)):se(e,t,i,o),t.memoizedState=r.state,l&&Ci(t,n,!0),t.child}function Ka(e){var t=e.stateNode;t.pendingContext?Ei(e,t.pendingContext,t.pendingContext!==t.context):t.context&&Ei(e,t.context,!1),Eu(e,t.containerInfo)}function Vi(e,t,n,r,l){return an(),yu(l),t.flags|=256,se(e,t,n,r),t.child}var Uo={dehydrated:null,treeContext:null,retryLane:0};function Ao(e){return{baseLanes:e,cachePool:null,transitions:null}}function Ya(e,t,n){var r=t.pendingProps,l=W.current,o=!1,u=(t.flags&128)!==0,i;if((i=u)||(i=e!==null&&e.memoizedState===null?!1:(l&2)!==0),i?(o=!0,t.flags&=-129):(e===null||e.memoizedState!==null)&&(l|=1),U(W,l&1),e===null)return Ro(t),e=t.memoizedState,e!==null&&(e=e.dehydrated,e!==null)?(t.mode&1?e.data==="$!"?t.lanes=8:t.lanes=1073741824:t.lanes=1,null):(u=r.children,e=r.fallback,o?(r=t.mode,o=t.child,u={mode:"hidden",children:u},!(r&1)&&o!==null?(o.childLanes=0,o.pendingProps=u):o=Nl(u,r,0,null),e=zt(e,r,n,null),o.return=t,e.return=t,o.sibling=e,t.child=o,t.child.memoizedState=Ao(n),t.memoizedState=Uo,e):Ru(t,u));if(l=e.memoizedState,l!==null&&(i=l.dehydrated,i!==null))return jf(e,t,u,r,i,l,n);if(o){o=r.fallback,u=t.mode,l=e.child,i=l.sibling;var s={mode:"hidden",children:r.children};return!(u&1)&&t.child!==l?(r=t.child,r.childLanes=0,r.pendingProps=s,t.deletions=null):(r=vt(l,s),r.subtreeFlags=l.subtreeFlags&14680064),i!==null?o=vt(i,o):(o=zt(o,u,n,null),o.flags|=2),o.return=t,r.return=t,r.sibling=o,t.child=r,r=o,o=t.child,u=e.child.memoizedState,u=u===null?Ao(n):{baseLanes:u.baseLanes|n,cachePool:null,transitions:u.transitions},o.memoizedState=u,o.childLanes=e.childLanes&~n,t.memoizedState=Uo,r}return o=e.child,e=o.sibling,r=vt(o,{mode:"visible",children:r.children}),!(t.mode&1)&&(r.lanes=n),r.return=t,r.sibling=null,e!==null&&(n=t.deletions,n===null?(t.deletions=[e],t.flags|=16):n.push(e)),t.child=r,t.memoizedState=null,r}function Ru(e,t){return t=Nl({mode:"visible",children:t},e.mode,0,null),t.return=e,e.child=t}function Er(e,t,n,r){return r!==null&&yu(r),cn(t,e.child,null,n),e=Ru(t,t.pendingProps.children),e.flags|=2,t.memoizedState=null,e}function jf(e,t,n,r,l,o,u){if(n)return t.flags&256?(t.flags&=-257,r=Zl(Error(x(422))),Er(e,t,u,r)):t.memoizedState!==null?(t.child=e.child,t.flags|=128,null):(o=r.fallback,l=t.mode,r=Nl({mode:"visible",children:r.children},l,0,null),o=zt(o,l,u,null),o.flags|=2,r.return=t,o.return=t,r.sibling=o,t.child=r,t.mode&1&&cn(t,e.child,null,u),t.child.memoizedState=Ao(u),t.memoizedState=Uo,o);if(!(t.mode&1))return Er(e,t,u,null);if(l.data==="$!"){if(r=l.nextSibling&&l.nextSibling.dataset,r)var i=r.dgst;return r=i,o=Error(x(419)),r=Zl(o,r,void 0),Er(e,t,u,r)}if(i=(u&e.childLanes)!==0,pe||i){if(r=b,r!==null){switch(u&-u){case 4:l=2;break;case 16:l=8;break;case 64:case 128:case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:case 262144:case 524288:case 1048576:case 2097152:case 4194304:case 8388608:case 16777216:case 33554432:case 67108864:l=32;break;case 536870912:l=268435456;break;default:l=0}l=l&(r.suspendedLanes|u)?0:l,l!==0&&l!==o.retryLane&&(o.retryLane=l,Je(e,l),Fe(r,e,l,-1))}return $u(),r=Zl(Error(x(421))),Er(e,t,u,r)}return l.data==="$?"?(t.flags|=128,t.child=e.child,t=Uf.bind(null,e),l._reactRetry=t,null):(e=o.treeContext,xe=dt(l.nextSibling),we=t,B=!0,Ie=null,e!==null&&(Ce[je++]=Ke,Ce[je++]=Ye,Ce[je++]=Rt,Ke=e.id,Ye=e.overflow,Rt=t),t=Ru(t,r.children),t.flags|=4096,t)}function Bi(e,t,n){e.lanes|=t;var r=e.alternate;r!==null&&(r.lanes|=t),Mo(e.return,t,n)}function Jl(e,t,n,r,l){var o=e.memoizedState;o===null?e.memoizedState={isBackwards:t,rendering:null,renderingStartTime:0,last:r,tail:n,tailMode:l}:(o.isBackwards=t,o.rendering=null,o.renderingStartTime=0,o.last=r,o.tail=n,o.tailMode=l)}function Xa(e,t,n){var r=t.pendingProps,l=r.revealOrder,o=r.tail;if(se(e,t,r.children,n),r=W.current,r&2)r=r&1|2,t.flags|=128;else{if(e!==null&&e.flags&128)e:for(e=t.child;e!==null;){if(e.tag===13)e.memoizedState!==null&&Bi(e,n,t);else if(e.tag===19)Bi(e,n,t);else if(e.child!==null){e.child.return=e,e=e.child;continue}if(e===t)break e;for(;e.sibling===null;){if(e.return===null||e.return===t)break e;e=e.return}e.sibling.return=e.return,e=e.sibling}r&=1}if(U(W,r),!(t.mode&1))t.memoizedState=null;else switch(l){case"forwards":for(n=t.child,l=null;n!==null;)e=n.alternate,e!==null&&nl(e)===null&&(l=n),n=n.sibling;n=l,n===null?(l=t.child,t.child=null):(l=n.sibling,n.sibling=null),Jl(t,!1,l,n,o);break;case"backwards":for(n=null,l=t.child,t.child=null;l!==null;){if(e=l.alternate,e!==null&&nl(e)===null){t.child=l;break}e=l.sibling,l.sibling=n,n=l,l=e}Jl(t,!0,n,null,o);break;case"together":Jl(t,!1,null,null,void 0);break;default:t.memoizedState=null}return t.child}function Or(e,t){!(t.mode&1)&&e!==null&&(e.alternate=null,t.alternate=null,t.flags|=2)}function qe(e,t,n){if(e!==null&&(t.dependencies=e.dependencies),Dt|=t.lanes,!(n&t.childLanes))return null;if(e!==null&&t.child!==e.child)throw Error(x(153));if(t.child!==null){for(e=t.child,n=vt(e,e.pendingProps),t.child=n,n.return=t;e.sibling!==null;)e=e.sibling,n=n.sibling=vt(e,e.pendingProps),n.return=t;n.sibling=null}return t.child}function _f(e,t,n){switch(t.tag){case 3:Ka(t),an();break;case 5:wa(t);break;case 1:ve(t.type)&&Zr(t);break;case 4:Eu(t,t.stateNode.containerInfo);break;case 10:var r=t.type._context,l=t.memoizedProps.value;U(br,r._currentValue),r._currentValue=l;break;case 13:if(r=t.memoizedState,r!==null)return r.dehydrated!==null?(U(W,W.current&1),t.flags|=128,null):n&t.child.childLanes?Ya(e,t,n):(U(W,W.current&1),e=qe(e,t,n),e!==null?e.sibling:null);U(W,W.current&1);break;case 19:if(r=(n&t.childLanes)!==0,e.flags&128){if(r)return Xa(e,t,n);t.flags|=128}if(l=t.memoizedState,l!==null&&(l.rendering=null,l.tail=null,l.lastEffect=null),U(W,W.current),r)break;return null;case 22:case 23:return t.lanes=0,Ha(e,t,n)}return qe(e,t,n)}var Ga,Vo,Za,Ja;Ga=function(e,t){for(var n=t.child;n!==null;){if(n.tag===5||n.tag===6)e.appendChild(n.stateNode);else if(n.tag!==4&&n.child!==null){n.child.return=n,n=n.child;continue}if(n===t)break;for(;n.sibling===null;){if(n.return===null||n.return===t)return;n=n.return}n.sibling.return=n.return,n=n.sibling}};Vo=function(){};Za=function(e,t,n,r){var l=e.memoizedProps;if(l!==r){e=t.stateNode,_t(We.current);var o=null;switch(n){case"input":l=so(e,l),r=so(e,r),o=[];break;case"select":l=Q({},l,{value:void 0}),r=Q({},r,{value:void 0}),o=[];break;case"textarea":l=fo(e,l),r=fo(e,r),o=[];break;default:typeof l.onClick!="function"&&typeof r.onClick=="function"&&(e.onclick=Xr)}mo(n,r);var u;n=null;for(d in l)if(!r.hasOwnProperty(d)&&l.hasOwnProperty(d)&&l[d]!=null)if(d==="style"){var i=l[d];for(u in i)i.hasOwnProperty(u)&&(n||(n={}),n[u]="")}else d!=="dangerouslySetInnerHTML"&&d!=="children"&&d!=="suppressContentEditableWarning"&&d!=="suppressHydrationWarning"&&d!=="autoFocus"&&(Vn.hasOwnProperty(d)?o||(o=[]):(o=o||[]).push(d,null));for(d in r){var s=r[d];if(i=l!=null?l[d]:void 0,r.hasOwnProperty(d)&&s!==i&&(s!=null||i!=null))if(d==="style")if(i){for(u in i)!i.hasOwnProperty(u)||s&&s.hasOwnProperty(u)||(n||(n={}),n[u]="");for(u in s)s.hasOwnProperty(u)&&i[u]!==s[u]&&(n||(n={}),n[u]=s[u])}else n||(o||(o=[]),o.push(d,n)),n=s;else d==="dangerouslySetInnerHTML"?(s=s?s.__html:void 0,i=i?i.__html:void 0,s!=null&&i!==s&&(o=o||[]).push(d,s)):d==="children"?typeof s!="string"&&typeof s!="number"||(o=o||[]).push(d,""+s):d!=="suppressContentEditableWarning"&&d!=="suppressHydrationWarning"&&(Vn.hasOwnProperty(d)?(s!=null&&d==="onScroll"&&A("scroll",e),o||i===s||(o=[])):(o=o||[]).push(d,s))}n&&(o=o||[]).push("style",n);var d=o;(t.updateQueue=d)&&(t.flags|=4)}};Ja=function(e,t,n,r){n!==r&&(t.flags|=4)};function jn(e,t){if(!B)switch(e.tailMode){case"hidden":t=e.tail;for(var n=null;t!==null;)t.alternate!==null&&(n=t),t=t.sibling;n===null?e.tail=null:n.sibling=null;break;case"collapsed":n=e.tail;for(var r=null;n!==null;)n.alternate!==null&&(r=n),n=n.sibling;r===null?t||e.tail===null?e.tail=null:e.tail.sibling=null:r.sibling=null}}function le(e){var t=e.alternate!==null&&e.alternate.child===e.child,n=0,r=0;if(t)for(var l=e.child;l!==null;)n|=l.lanes|l.childLanes,r|=l.subtreeFlags&14680064,r|=l.flags&14680064,l.return=e,l=l.sibling;else for(l=e.child;l!==null;)n|=l.lanes|l.childLanes,r|=l.subtreeFlags,r|=l.flags,l.return=e,l=l.sibling;return e.subtreeFlags|=r,e.childLanes=n,t}function Pf(e,t,n){var r=t.pendingProps;switch(gu(t),t.tag){case 2:case 16:case 15:case 0:case 11:case 7:case 8:case 12:case 9:case 14:return le(t),null;case 1:return ve(t.type)&&Gr(),le(t),null;case 3:return r=t.stateNode,dn(),V(me),V(ue),ju(),r.pendingContext&&(r.context=r.pendingContext,r.pendingContext=null),(e===null||e.child===null)&&(Sr(t)?t.flags|=4:e===null||e.memoizedState.isDehydrated&&!(t.flags&256)||(t.flags|=1024,Ie!==null&&(Go(Ie),Ie=null))),Vo(e,t),le(t),null;case 5:Cu(t);var l=_t(bn.current);if(n=t.type,e!==null&&t.stateNode!=null)Za(e,t,n,r,l),e.ref!==t.ref&&(t.flags|=512,t.flags|=2097152);else{if(!r){if(t.stateNode===null)throw Error(x(166));return le(t),null}if(e=_t(We.current),Sr(t)){r=t.stateNode,n=t.type;var o=t.memoizedProps;switch(r[Ve]=t,r[Jn]=o,e=(t.mode&1)!==0,n){case"dialog":A("cancel",r),A("close",r);break;case"iframe":case"object":case"embed":A("load",r);break;case"video":case"audio":for(l=0;l<Ln.length;l++)A(Ln[l],r);break;case"source":A("error",r);break;case"img":case"image":case"link":A("error",r),A("load",r);break;case"details":A("toggle",r);break;case"input":Ju(r,o),A("invalid",r);break;case"select":r._wrapperState={wasMultiple:!!o.multiple},A("invalid",r);break;case"textarea":bu(r,o),A("invalid",r)}mo(n,o),l=null;for(var u in o)if(o.hasOwnProperty(u)){var i=o[u];u==="children"?typeof i=="string"?r.textContent!==i&&(o.suppressHydrationWarning!==!0&&kr(r.textContent,i,e),l=["children",i]):typeof i=="number"&&r.textContent!==""+i&&(o.suppressHydrationWarning!==!0&&kr(r.textContent,i,e),l=["children",""+i]):Vn.hasOwnProperty(u)&&i!=null&&u==="onScroll"&&A("scroll",r)}switch(n){case"input":pr(r),qu(r,o,!0);break;case"textarea":pr(r),ei(r);break;case"select":case"option":break;default:typeof o.onClick=="function"&&(r.onclick=Xr)}r=l,t.updateQueue=r,r!==null&&(t.flags|=4)}else{u=l.nodeType===9?l:l.ownerDocument,e==="http://www.w3.org/1999/xhtml"&&(e=Cs(n)),e==="http://www.w3.org/1999/xhtml"?n==="script"?(e=u.createElement("div"),e.innerHTML="<script><\/script>",e=e.removeChild(e.firstChild)):typeof r.is=="string"?e=u.createElement(n,{is:r.is}):(e=u.createElement(n),n==="select"&&(u=e,r.multiple?u.multiple=!0:r.size&&(u.size=r.size))):e=u.createElementNS(e,n),e[Ve]=t,e[Jn]=r,Ga(e,t,!1,!1),t.stateNode=e;e:{switch(u=vo(n,r),n){case"dialog":A("cancel",e),A("close",e),l=r;break;case"iframe":case"object":case"embed":A("load",e),l=r;break;case"video":case"audio":for(l=0;l<Ln.length;l++)A(Ln[l],e);l=r;break;case"source":A("error",e),l=r;break;case"img":case"image":case"link":A("error",e),A("load",e),l=r;break;case"details":A("toggle",e),l=r;break;case"input":Ju(e,r),l=so(e,r),A("invalid",e);break;case"option":l=r;break;case"select":e._wrapperState={wasMultiple:!!r.multiple},l=Q({},r,{value:void 0}),A("invalid",e);break;case"textarea":bu(e,r),l=fo(e,r),A("invalid",e);break;default:l=r}mo(n,l),i=l;for(o in i)if(i.hasOwnProperty(o)){var s=i[o];o==="style"?Ps(e,s):o==="dangerouslySetInnerHTML"?(s=s?s.__html:void 0,s!=null&&js(e,s)):o==="children"?typeof s=="string"?(n!=="textarea"||s!=="")&&Bn(e,s):typeof s=="number"&&Bn(e,""+s):o!=="suppressContentEditableWarning"&&o!=="suppressHydrationWarning"&&o!=="autoFocus"&&(Vn.hasOwnProperty(o)?s!=null&&o==="onScroll"&&A("scroll",e):s!=null&&nu(e,o,s,u))}switch(n){case"input":pr(e),qu(e,r,!1);break;case"textarea":pr(e),ei(e);break;case"option":r.value!=null&&e.setAttribute("value",""+ht(r.value));break;case"select":e.multiple=!!r.multiple,o=r.value,o!=null?en(e,!!r.multiple,o,!1):r.defaultValue!=null&&en(e,!!r.multiple,r.defaultValue,!0);break;default:typeof l.onClick=="function"&&(e.onclick=Xr)}switch(n){case"button":case"input":case"select":case"textarea":r=!!r.autoFocus;break e;case"img":r=!0;break e;default:r=!1}}r&&(t.flags|=4)}t.ref!==null&&(t.flags|=512,t.flags|=2097152)}return le(t),null;case 6:if(e&&t.stateNode!=null)Ja(e,t,e.memoizedProps,r);else{if(typeof r!="string"&&t.stateNode===null)throw Error(x(166));if(n=_t(bn.current),_t(We.current),Sr(t)){if(r=t.stateNode,n=t.memoizedProps,r[Ve]=t,(o=r.nodeValue!==n)&&(e=we,e!==null))switch(e.tag){case 3:kr(r.nodeValue,n,(e.mode&1)!==0);break;case 5:e.memoizedProps.suppressHydrationWarning!==!0&&kr(r.nodeValue,n,(e.mode&1)!==0)}o&&(t.flags|=4)}else r=(n.nodeType===9?n:n.ownerDocument).createTextNode(r),r[Ve]=t,t.stateNode=r}return le(t),null;case 13:if(V(W),r=t.memoizedState,e===null||e.memoizedState!==null&&e.memoizedState.dehydrated!==null){if(B&&xe!==null&&t.mode&1&&!(t.flags&128))va(),an(),t.flags|=98560,o=!1;else if(o=Sr(t),r!==null&&r.dehydrated!==null){if(e===null){if(!o)throw Error(x(318));if(o=t.memoizedState,o=o!==null?o.dehydrated:null,!o)throw Error(x(317));o[Ve]=t}else an(),!(t.flags&128)&&(t.memoizedState=null),t.flags|=4;le(t),o=!1}else Ie!==null&&(Go(Ie),Ie=null),o=!0;if(!o)return t.flags&65536?t:null}return t.flags&128?(t.lanes=n,t):(r=r!==null,r!==(e!==null&&e.memoizedState!==null)&&r&&(t.child.flags|=8192,t.mode&1&&(e===null||W.current&1?J===0&&(J=3):$u())),t.updateQueue!==null&&(t.flags|=4),le(t),null);case 4:return dn(),Vo(e,t),e===null&&Gn(t.stateNode.containerInfo),le(t),null;case 10:return ku(t.type._context),le(t),null;case 17:return ve(t.type)&&Gr(),le(t),null;case 19:if(V(W),o=t.memoizedState,o===null)return le(t),null;if(r=(t.flags&128)!==0,u=o.rendering,u===null)if(r)jn(o,!1);else{if(J!==0||e!==null&&e.flags&128)for(e=t.child;e!==null;){if(u=nl(e),u!==null){for(t.flags|=128,jn(o,!1),r=u.updateQueue,r!==null&&(t.updateQueue=r,t.flags|=4),t.subtreeFlags=0,r=n,n=t.child;n!==null;)o=n,e=r,o.flags&=14680066,u=o.alternate,u===null?(o.childLanes=0,o.lanes=e,o.child=null,o.subtreeFlags=0,o.memoizedProps=null,o.memoizedState=null,o.updateQueue=null,o.dependencies=null,o.stateNode=null):(o.childLanes=u.childLanes,o.lanes=u.lanes,o.child=u.child,o.subtreeFlags=0,o.deletions=null,o.memoizedProps=u.memoizedProps,o.memoizedState=u.memoizedState,o.updateQueue=u.updateQueue,o.type=u.type,e=u.dependencies,o.dependencies=e===null?null:{lanes:e.lanes,firstContext:e.firstContext}),n=n.sibling;return U(W,W.current&1|2),t.child}e=e.sibling}o.tail!==null&&X()>pn&&(t.flags|=128,r=!0,jn(o,!1),t.lanes=4194304)}else{if(!r)if(e=nl(u),e!==null){if(t.flags|=128,r=!0,n=e.updateQueue,n!==null&&(t.updateQueue=n,t.flags|=4),jn(o,!0),o.tail===null&&o.tailMode==="hidden"&&!u.alternate&&!B)return le(t),null}else 2*X()-o.renderingStartTime>pn&&n!==1073741824&&(t.flags|=128,r=!0,jn(o,!1),t.lanes=4194304);o.isBackwards?(u.sibling=t.child,t.child=u):(n=o.last,n!==null?n.sibling=u:t.child=u,o.last=u)}return o.tail!==null?(t=o.tail,o.rendering=t,o.tail=t.sibling,o.renderingStartTime=X(),t.sibling=null,n=W.current,U(W,r?n&1|2:n&1),t):(le(t),null);case 22:case 23:return Fu(),r=t.memoizedState!==null,e!==null&&e.memoizedState!==null!==r&&(t.flags|=8192),r&&t.mode&1?ye&1073741824&&(le(t),t.subtreeFlags&6&&(t.flags|=8192)):le(t),null;case 24:return null;case 25:return null}throw Error(x(156,t.tag))}function Tf(e,t){switch(gu(t),t.tag){case 1:return ve(t.type)&&Gr(),e=t.flags,e&65536?(t.flags=e&-65537|128,t):null;case 3:return dn(),V(me),V(ue),ju(),e=t.flags,e&65536&&!(e&128)?(t.flags=e&-65537|128,t):null;case 5:return Cu(t),null;case 13:if(V(W),e=t.memoizedState,e!==null&&e.dehydrated!==null){if(t.alternate===null)throw Error(x(340));an()}return e=t.flags,e&65536?(t.flags=e&-65537|128,t):null;case 19:return V(W),null;case 4:return dn(),null;case 10:return ku(t.type._context),null;case 22:case 23:return Fu(),null;case 24:return null;default:return null}}var Cr=!1,oe=!1,zf=typeof WeakSet=="function"?WeakSet:Set,P=null;function Jt(e,t){var n=e.ref;if(n!==null)if(typeof n=="function")try{n(null)}catch(r){K(e,t,r)}else n.current=null}function Bo(e,t,n){try{n()}catch(r){K(e,t,r)}}var Wi=!1;function Lf(e,t){if(Co=Qr,e=na(),vu(e)){if("selectionStart"in e)var n={start:e.selectionStart,end:e.selectionEnd};else e:{n=(n=e.ownerDocument)&&n.defaultView||window;var r=n.getSelection&&n.getSelection();if(r&&r.rangeCount!==0){n=r.anchorNode;var l=r.anchorOffset,o=r.focusNode;r=r.focusOffset;try{n.nodeType,o.nodeType}catch{n=null;break e}var u=0,i=-1,s=-1,d=0,h=0,v=e,m=null;t:for(;;){for(var k;v!==n||l!==0&&v.nodeType!==3||(i=u+l),v!==o||r!==0&&v.nodeType!==3||(s=u+r),v.nodeType===3&&(u+=v.nodeValue.length),(k=v.firstChild)!==null;)m=v,v=k;for(;;){if(v===e)break t;if(m===n&&++d===l&&(i=u),m===o&&++h===r&&(s=u),(k=v.nextSibling)!==null)break;v=m,m=v.parentNode}v=k}n=i===-1||s===-1?null:{start:i,end:s}}else n=null}n=n||{start:0,end:0}}else n=null;for(jo={focusedElem:e,selectionRange:n},Qr=!1,P=t;P!==null;)if(t=P,e=t.child,(t.subtreeFlags&1028)!==0&&e!==null)e.return=t,P=e;else for(;P!==null;){t=P;try{var S=t.alternate;if(t.flags&1024)switch(t.tag){case 0:case 11:case 15:break;case 1:if(S!==null){var E=S.memoizedProps,z=S.memoizedState,f=t.stateNode,c=f.getSnapshotBeforeUpdate(t.elementType===t.type?E:Me(t.type,E),z);f.__reactInternalSnapshotBeforeUpdate=c}break;case 3:var p=t.stateNode.containerInfo;p.nodeType===1?p.textContent="":p.nodeType===9&&p.documentElement&&p.removeChild(p.documentElement);break;case 5:case 6:case 4:case 17:break;default:throw Error(x(163))}}catch(y){K(t,t.return,y)}if(e=t.sibling,e!==null){e.return=t.return,P=e;break}P=t.return}return S=Wi,Wi=!1,S}function $n(e,t,n){var r=t.updateQueue;if(r=r!==null?r.lastEffect:null,r!==null){var l=r=r.next;do{if((l.tag&e)===e){var o=l.destroy;l.destroy=void 0,o!==void 0&&Bo(t,n,o)}l=l.next}while(l!==r)}}function kl(e,t){if(t=t.updateQueue,t=t!==null?t.lastEffect:null,t!==null){var n=t=t.next;do{if((n.tag&e)===e){var r=n.create;n.destroy=r()}n=n.next}while(n!==t)}}function Wo(e){var t=e.ref;if(t!==null){var n=e.stateNode;switch(e.tag){case 5:e=n;break;default:e=n}typeof t=="function"?t(e):t.current=e}}function qa(e){var t=e.alternate;t!==null&&(e.alternate=null,qa(t)),e.child=null,e.deletions=null,e.sibling=null,e.tag===5&&(t=e.stateNode,t!==null&&(delete t[Ve],delete t[Jn],delete t[To],delete t[pf],delete t[mf])),e.stateNode=null,e.return=null,e.dependencies=null,e.memoizedProps=null,e.memoizedState=null,e.pendingProps=null,e.stateNode=null,e.updateQueue=null}function ba(e){return e.tag===5||e.tag===3||e.tag===4}function Hi(e){e:for(;;){for(;e.sibling===null;){if(e.return===null||ba(e.return))return null;e=e.return}for(e.sibling.return=e.return,e=e.sibling;e.tag!==5&&e.tag!==6&&e.tag!==18;){if(e.flags&2||e.child===null||e.tag===4)continue e;e.child.return=e,e=e.child}if(!(e.flags&2))return e.stateNode}}function Ho(e,t,n){var r=e.tag;if(r===5||r===6)e=e.stateNode,t?n.nodeType===8?n.parentNode.insertBefore(e,t):n.insertBefore(e,t):(n.nodeType===8?(t=n.parentNode,t.insertBefore(e,n)):(t=n,t.appendChild(e)),n=n._reactRootContainer,n!=null||t.onclick!==null||(t.onclick=Xr));else if(r!==4&&(e=e.child,e!==null))for(Ho(e,t,n),e=e.sibling;e!==null;)Ho(e,t,n),e=e.sibling}function Qo(e,t,n){var r=e.tag;if(r===5||r===6)e=e.stateNode,t?n.insertBefore(e,t):n.appendChild(e);else if(r!==4&&(e=e.child,e!==null))for(Qo(e,t,n),e=e.sibling;e!==null;)Qo(e,t,n),e=e.sibling}var ee=null,De=!1;function et(e,t,n){for(n=n.child;n!==null;)ec(e,t,n),n=n.sibling}function ec(e,t,n){if(Be&&typeof Be.onCommitFiberUnmount=="function")try{Be.onCommitFiberUnmount(pl,n)}catch{}switch(n.tag){case 5:oe||Jt(n,t);case 6:var r=ee,l=De;ee=null,et(e,t,n),ee=r,De=l,ee!==null&&(De?(e=ee,n=n.stateNode,e.nodeType===8?e.parentNode.removeChild(n):e.removeChild(n)):ee.removeChild(n.stateNode));break;case 18:ee!==null&&(De?(e=ee,n=n.stateNode,e.nodeType===8?Hl(e.parentNode,n):e.nodeType===1&&Hl(e,n),Kn(e)):Hl(ee,n.stateNode));break;case 4:r=ee,l=De,ee=n.stateNode.containerInfo,De=!0,et(e,t,n),ee=r,De=l;break;case 0:case 11:case 14:case 15:if(!oe&&(r=n.updateQueue,r!==null&&(r=r.lastEffect,r!==null))){l=r=r.next;do{var o=l,u=o.destroy;o=o.tag,u!==void 0&&(o&2||o&4)&&Bo(n,t,u),l=l.next}while(l!==r)}et(e,t,n);break;case 1:if(!oe&&(Jt(n,t),r=n.stateNode,typeof r.componentWillUnmount=="function"))try{r.props=n.memoizedProps,r.state=n.memoizedState,r.componentWillUnmount()}catch(i){K(n,t,i)}et(e,t,n);break;case 21:et(e,t,n);break;case 22:n.mode&1?(oe=(r=oe)||n.memoizedState!==null,et(e,t,n),oe=r):et(e,t,n);break;default:et(e,t,n)}}function Qi(e){var t=e.updateQueue;if(t!==null){e.updateQueue=null;var n=e.stateNode;n===null&&(n=e.stateNode=new zf),t.forEach(function(r){var l=Af.bind(null,e,r);n.has(r)||(n.add(r),r.then(l,l))})}}function Re(e,t){var n=t.deletions;if(n!==null)for(var r=0;r<n.length;r++){var l=n[r];try{var o=e,u=t,i=u;e:for(;i!==null;){switch(i.tag){case 5:ee=i.stateNode,De=!1;break e;case 3:ee=i.stateNode.containerInfo,De=!0;break e;case 4:ee=i.stateNode.containerInfo,De=!0;break e}i=i.return}if(ee===null)throw Error(x(160));ec(o,u,l),ee=null,De=!1;var s=l.alternate;s!==null&&(s.return=null),l.return=null}catch(d){K(l,t,d)}}if(t.subtreeFlags&12854)for(t=t.child;t!==null;)tc(t,e),t=t.sibling}function tc(e,t){var n=e.alternate,r=e.flags;switch(e.tag){case 0:case 11:case 14:case 15:if(Re(t,e),Ue(e),r&4){try{$n(3,e,e.return),kl(3,e)}catch(E){K(e,e.return,E)}try{$n(5,e,e.return)}catch(E){K(e,e.return,E)}}break;case 1:Re(t,e),Ue(e),r&512&&n!==null&&Jt(n,n.return);break;case 5:if(Re(t,e),Ue(e),r&512&&n!==null&&Jt(n,n.return),e.flags&32){var l=e.stateNode;try{Bn(l,"")}catch(E){K(e,e.return,E)}}if(r&4&&(l=e.stateNode,l!=null)){var o=e.memoizedProps,u=n!==null?n.memoizedProps:o,i=e.type,s=e.updateQueue;if(e.updateQueue=null,s!==null)try{i==="input"&&o.type==="radio"&&o.name!=null&&Ns(l,o),vo(i,u);var d=vo(i,o);for(u=0;u<s.length;u+=2){var h=s[u],v=s[u+1];h==="style"?Ps(l,v):h==="dangerouslySetInnerHTML"?js(l,v):h==="children"?Bn(l,v):nu(l,h,v,d)}switch(i){case"input":ao(l,o);break;case"textarea":Es(l,o);break;case"select":var m=l._wrapperState.wasMultiple;l._wrapperState.wasMultiple=!!o.multiple;var k=o.value;k!=null?en(l,!!o.multiple,k,!1):m!==!!o.multiple&&(o.defaultValue!=null?en(l,!!o.multiple,o.defaultValue,!0):en(l,!!o.multiple,o.multiple?[]:"",!1))}l[Jn]=o}catch(E){K(e,e.return,E)}}break;case 6:if(Re(t,e),Ue(e),r&4){if(e.stateNode===null)throw Error(x(162));l=e.stateNode,o=e.memoizedProps;try{l.nodeValue=o}catch(E){K(e,e.return,E)}}break;case 3:if(Re(t,e),Ue(e),r&4&&n!==null&&n.memoizedState.isDehydrated)try{Kn(t.containerInfo)}catch(E){K(e,e.return,E)}break;case 4:Re(t,e),Ue(e);break;case 13:Re(t,e),Ue(e),l=e.child,l.flags&8192&&(o=l.memoizedState!==null,l.stateNode.isHidden=o,!o||l.alternate!==null&&l.alternate.memoizedState!==null||(Iu=X())),r&4&&Qi(e);break;case 22:if(h=n!==null&&n.memoizedState!==null,e.mode&1?(oe=(d=oe)||h,Re(t,e),oe=d):Re(t,e),Ue(e),r&8192){if(d=e.memoizedState!==null,(e.stateNode.isHidden=d)&&!h&&e.mode&1)for(P=e,h=e.child;h!==null;){for(v=P=h;P!==null;){switch(m=P,k=m.child,m.tag){case 0:case 11:case 14:case 15:$n(4,m,m.return);break;case 1:Jt(m,m.return);var S=m.stateNode;if(typeof S.componentWillUnmount=="function"){r=m,n=m.return;try{t=r,S.props=t.memoizedProps,S.state=t.memoizedState,S.componentWillUnmount()}catch(E){K(r,n,E)}}break;case 5:Jt(m,m.return);break;case 22:if(m.memoizedState!==null){Yi(v);continue}}k!==null?(k.return=m,P=k):Yi(v)}h=h.sibling}e:for(h=null,v=e;;){if(v.tag===5){if(h===null){h=v;try{l=v.stateNode,d?(o=l.style,typeof o.setProperty=="function"?o.setProperty("display","none","important"):o.display="none"):(i=v.stateNode,s=v.memoizedProps.style,u=s!=null&&s.hasOwnProperty("display")?s.display:null,i.style.display=_s("display",u))}catch(E){K(e,e.return,E)}}}else if(v.tag===6){if(h===null)try{v.stateNode.nodeValue=d?"":v.memoizedProps}catch(E){K(e,e.return,E)}}else if((v.tag!==22&&v.tag!==23||v.memoizedState===null||v===e)&&v.child!==null){v.child.return=v,v=v.child;continue}if(v===e)break e;for(;v.sibling===null;){if(v.return===null||v.return===e)break e;h===v&&(h=null),v=v.return}h===v&&(h=null),v.sibling.return=v.return,v=v.sibling}}break;case 19:Re(t,e),Ue(e),r&4&&Qi(e);break;case 21:break;default:Re(t,e),Ue(e)}}function Ue(e){var t=e.flags;if(t&2){try{e:{for(var n=e.return;n!==null;){if(ba(n)){var r=n;break e}n=n.return}throw Error(x(160))}switch(r.tag){case 5:var l=r.stateNode;r.flags&32&&(Bn(l,""),r.flags&=-33);var o=Hi(e);Qo(e,o,l);break;case 3:case 4:var u=r.stateNode.containerInfo,i=Hi(e);Ho(e,i,u);break;default:throw Error(x(161))}}catch(s){K(e,e.return,s)}e.flags&=-3}t&4096&&(e.flags&=-4097)}function Rf(e,t,n){P=e,nc(e)}function nc(e,t,n){for(var r=(e.mode&1)!==0;P!==null;){var l=P,o=l.child;if(l.tag===22&&r){var u=l.memoizedState!==null||Cr;if(!u){var i=l.alternate,s=i!==null&&i.memoizedState!==null||oe;i=Cr;var d=oe;if(Cr=u,(oe=s)&&!d)for(P=l;P!==null;)u=P,s=u.child,u.tag===22&&u.memoizedState!==null?Xi(l):s!==null?(s.return=u,P=s):Xi(l);for(;o!==null;)P=o,nc(o),o=o.sibling;P=l,Cr=i,oe=d}Ki(e)}else l.subtreeFlags&8772&&o!==null?(o.return=l,P=o):Ki(e)}}function Ki(e){for(;P!==null;){var t=P;if(t.flags&8772){var n=t.alternate;try{if(t.flags&8772)switch(t.tag){case 0:case 11:case 15:oe||kl(5,t);break;case 1:var r=t.stateNode;if(t.flags&4&&!oe)if(n===null)r.componentDidMount();else{var l=t.elementType===t.type?n.memoizedProps:Me(t.type,n.memoizedProps);r.componentDidUpdate(l,n.memoizedState,r.__reactInternalSnapshotBeforeUpdate)}var o=t.updateQueue;o!==null&&zi(t,o,r);break;case 3:var u=t.updateQueue;if(u!==null){if(n=null,t.child!==null)switch(t.child.tag){case 5:n=t.child.stateNode;break;case 1:n=t.child.stateNode}zi(t,u,n)}break;case 5:var i=t.stateNode;if(n===null&&t.flags&4){n=i;var s=t.memoizedProps;switch(t.type){case"button":case"input":case"select":case"textarea":s.autoFocus&&n.focus();break;case"img":s.src&&(n.src=s.src)}}break;case 6:break;case 4:break;case 12:break;case 13:if(t.memoizedState===null){var d=t.alternate;if(d!==null){var h=d.memoizedState;if(h!==null){var v=h.dehydrated;v!==null&&Kn(v)}}}break;case 19:case 17:case 21:case 22:case 23:case 25:break;default:throw Error(x(163))}oe||t.flags&512&&Wo(t)}catch(m){K(t,t.return,m)}}if(t===e){P=null;break}if(n=t.sibling,n!==null){n.return=t.return,P=n;break}P=t.return}}function Yi(e){for(;P!==null;){var t=P;if(t===e){P=null;break}var n=t.sibling;if(n!==null){n.return=t.return,P=n;break}P=t.return}}function Xi(e){for(;P!==null;){var t=P;try{switch(t.tag){case 0:case 11:case 15:var n=t.return;try{kl(4,t)}catch(s){K(t,n,s)}break;case 1:var r=t.stateNode;if(typeof r.componentDidMount=="function"){var l=t.return;try{r.componentDidMount()}catch(s){K(t,l,s)}}var o=t.return;try{Wo(t)}catch(s){K(t,o,s)}break;case 5:var u=t.return;try{Wo(t)}catch(s){K(t,u,s)}}}catch(s){K(t,t.return,s)}if(t===e){P=null;break}var i=t.sibling;if(i!==null){i.return=t.return,P=i;break}P=t.return}}var Mf=Math.ceil,ol=be.ReactCurrentDispatcher,Mu=be.ReactCurrentOwner,Pe=be.ReactCurrentBatchConfig,I=0,b=null,G=null,te=0,ye=0,qt=xt(0),J=0,rr=null,Dt=0,Sl=0,Du=0,Un=null,fe=null,Iu=0,pn=1/0,He=null,ul=!1,Ko=null,pt=null,jr=!1,it=null,il=0,An=0,Yo=null,Fr=-1,$r=0;function ae(){return I&6?X():Fr!==-1?Fr:Fr=X()}function mt(e){return e.mode&1?I&2&&te!==0?te&-te:hf.transition!==null?($r===0&&($r=As()),$r):(e=$,e!==0||(e=window.event,e=e===void 0?16:Ys(e.type)),e):1}function Fe(e,t,n,r){if(50<An)throw An=0,Yo=null,Error(x(185));or(e,n,r),(!(I&2)||e!==b)&&(e===b&&(!(I&2)&&(Sl|=n),J===4&&ot(e,te)),he(e,r),n===1&&I===0&&!(t.mode&1)&&(pn=X()+500,yl&&wt()))}function he(e,t){var n=e.callbackNode;vd(e,t);var r=Hr(e,e===b?te:0);if(r===0)n!==null&&ri(n),e.callbackNode=null,e.callbackPriority=0;else if(t=r&-r,e.callbackPriority!==t){if(n!=null&&ri(n),t===1)e.tag===0?vf(Gi.bind(null,e)):fa(Gi.bind(null,e)),df(function(){!(I&6)&&wt()}),n=null;else{switch(Vs(r)){case 1:n=iu;break;case 4:n=$s;break;case 16:n=Wr;break;case 536870912:n=Us;break;default:n=Wr}n=cc(n,rc.bind(null,e))}e.callbackPriority=t,e.callbackNode=n}}function rc(e,t){if(Fr=-1,$r=0,I&6)throw Error(x(327));var n=e.callbackNode;if(on()&&e.callbackNode!==n)return null;var r=Hr(e,e===b?te:0);if(r===0)return null;if(r&30||r&e.expiredLanes||t)t=sl(e,r);else{t=r;var l=I;I|=2;var o=oc();(b!==e||te!==t)&&(He=null,pn=X()+500,Tt(e,t));do try{Of();break}catch(i){lc(e,i)}while(!0);wu(),ol.current=o,I=l,G!==null?t=0:(b=null,te=0,t=J)}if(t!==0){if(t===2&&(l=wo(e),l!==0&&(r=l,t=Xo(e,l))),t===1)throw n=rr,Tt(e,0),ot(e,r),he(e,X()),n;if(t===6)ot(e,r);else{if(l=e.current.alternate,!(r&30)&&!Df(l)&&(t=sl(e,r),t===2&&(o=wo(e),o!==0&&(r=o,t=Xo(e,o))),t===1))throw n=rr,Tt(e,0),ot(e,r),he(e,X()),n;switch(e.finishedWork=l,e.finishedLanes=r,t){case 0:case 1:throw Error(x(345));case 2:Et(e,fe,He);break;case 3:if(ot(e,r),(r&130023424)===r&&(t=Iu+500-X(),10<t)){if(Hr(e,0)!==0)break;if(l=e.suspendedLanes,(l&r)!==r){ae(),e.pingedLanes|=e.suspendedLanes&l;break}e.timeoutHandle=Po(Et.bind(null,e,fe,He),t);break}Et(e,fe,He);break;case 4:if(ot(e,r),(r&4194240)===r)break;for(t=e.eventTimes,l=-1;0<r;){var u=31-Oe(r);o=1<<u,u=t[u],u>l&&(l=u),r&=~o}if(r=l,r=X()-r,r=(120>r?120:480>r?480:1080>r?1080:1920>r?1920:3e3>r?3e3:4320>r?4320:1960*Mf(r/1960))-r,10<r){e.timeoutHandle=Po(Et.bind(null,e,fe,He),r);break}Et(e,fe,He);break;case 5:Et(e,fe,He);break;default:throw Error(x(329))}}}return he(e,X()),e.callbackNode===n?rc.bind(null,e):null}function Xo(e,t){var n=Un;return e.current.memoizedState.isDehydrated&&(Tt(e,t).flags|=256),e=sl(e,t),e!==2&&(t=fe,fe=n,t!==null&&Go(t)),e}function Go(e){fe===null?fe=e:fe.push.apply(fe,e)}function Df(e){for(var t=e;;){if(t.flags&16384){var n=t.updateQueue;if(n!==null&&(n=n.stores,n!==null))for(var r=0;r<n.length;r++){var l=n[r],o=l.getSnapshot;l=l.value;try{if(!$e(o(),l))return!1}catch{return!1}}}if(n=t.child,t.subtreeFlags&16384&&n!==null)n.return=t,t=n;else{if(t===e)break;for(;t.sibling===null;){if(t.return===null||t.return===e)return!0;t=t.return}t.sibling.return=t.return,t=t.sibling}}return!0}function ot(e,t){for(t&=~Du,t&=~Sl,e.suspendedLanes|=t,e.pingedLanes&=~t,e=e.expirationTimes;0<t;){var n=31-Oe(t),r=1<<n;e[n]=-1,t&=~r}}function Gi(e){if(I&6)throw Error(x(327));on();var t=Hr(e,0);if(!(t&1))return he(e,X()),null;var n=sl(e,t);if(e.tag!==0&&n===2){var r=wo(e);r!==0&&(t=r,n=Xo(e,r))}if(n===1)throw n=rr,Tt(e,0),ot(e,t),he(e,X()),n;if(n===6)throw Error(x(345));return e.finishedWork=e.current.alternate,e.finishedLanes=t,Et(e,fe,He),he(e,X()),null}function Ou(e,t){var n=I;I|=1;try{return e(t)}finally{I=n,I===0&&(pn=X()+500,yl&&wt())}}function It(e){it!==null&&it.tag===0&&!(I&6)&&on();var t=I;I|=1;var n=Pe.transition,r=$;try{if(Pe.transition=null,$=1,e)return e()}finally{$=r,Pe.transition=n,I=t,!(I&6)&&wt()}}function Fu(){ye=qt.current,V(qt)}function Tt(e,t){e.finishedWork=null,e.finishedLanes=0;var n=e.timeoutHandle;if(n!==-1&&(e.timeoutHandle=-1,cf(n)),G!==null)for(n=G.return;n!==null;){var r=n;switch(gu(r),r.tag){case 1:r=r.type.childContextTypes,r!=null&&Gr();break;case 3:dn(),V(me),V(ue),ju();break;case 5:Cu(r);break;case 4:dn();break;case 13:V(W);break;case 19:V(W);break;case 10:ku(r.type._context);break;case 22:case 23:Fu()}n=n.return}if(b=e,G=e=vt(e.current,null),te=ye=t,J=0,rr=null,Du=Sl=Dt=0,fe=Un=null,jt!==null){for(t=0;t<jt.length;t++)if(n=jt[t],r=n.interleaved,r!==null){n.interleaved=null;var l=r.next,o=n.pending;if(o!==null){var u=o.next;o.next=l,r.next=u}n.pending=r}jt=null}return e}function lc(e,t){do{var n=G;try{if(wu(),Dr.current=ll,rl){for(var r=H.memoizedState;r!==null;){var l=r.queue;l!==null&&(l.pending=null),r=r.next}rl=!1}if(Mt=0,q=Z=H=null,Fn=!1,er=0,Mu.current=null,n===null||n.return===null){J=1,rr=t,G=null;break}e:{var o=e,u=n.return,i=n,s=t;if(t=te,i.flags|=32768,s!==null&&typeof s=="object"&&typeof s.then=="function"){var d=s,h=i,v=h.tag;if(!(h.mode&1)&&(v===0||v===11||v===15)){var m=h.alternate;m?(h.updateQueue=m.updateQueue,h.memoizedState=m.memoizedState,h.lanes=m.lanes):(h.updateQueue=null,h.memoizedState=null)}var k=Oi(u);if(k!==null){k.flags&=-257,Fi(k,u,i,o,t),k.mode&1&&Ii(o,d,t),t=k,s=d;var S=t.updateQueue;if(S===null){var E=new Set;E.add(s),t.updateQueue=E}else S.add(s);break e}else{if(!(t&1)){Ii(o,d,t),$u();break e}s=Error(x(426))}}else if(B&&i.mode&1){var z=Oi(u);if(z!==null){!(z.flags&65536)&&(z.flags|=256),Fi(z,u,i,o,t),yu(fn(s,i));break e}}o=s=fn(s,i),J!==4&&(J=2),Un===null?Un=[o]:Un.push(o),o=u;do{switch(o.tag){case 3:o.flags|=65536,t&=-t,o.lanes|=t;var f=Va(o,s,t);Ti(o,f);break e;case 1:i=s;var c=o.type,p=o.stateNode;if(!(o.flags&128)&&(typeof c.getDerivedStateFromError=="function"||p!==null&&typeof p.componentDidCatch=="function"&&(pt===null||!pt.has(p)))){o.flags|=65536,t&=-t,o.lanes|=t;var y=Ba(o,i,t);Ti(o,y);break e}}o=o.return}while(o!==null)}ic(n)}catch(g){t=g,G===n&&n!==null&&(G=n=n.return);continue}break}while(!0)}function oc(){var e=ol.current;return ol.current=ll,e===null?ll:e}function $u(){(J===0||J===3||J===2)&&(J=4),b===null||!(Dt&268435455)&&!(Sl&268435455)||ot(b,te)}function sl(e,t){var n=I;I|=2;var r=oc();(b!==e||te!==t)&&(He=null,Tt(e,t));do try{If();break}catch(l){lc(e,l)}while(!0);if(wu(),I=n,ol.current=r,G!==null)throw Error(x(261));return b=null,te=0,J}function If(){for(;G!==null;)uc(G)}function Of(){for(;G!==null&&!ud();)uc(G)}function uc(e){var t=ac(e.alternate,e,ye);e.memoizedProps=e.pendingProps,t===null?ic(e):G=t,Mu.current=null}function ic(e){var t=e;do{var n=t.alternate;if(e=t.return,t.flags&32768){if(n=Tf(n,t),n!==null){n.flags&=32767,G=n;return}if(e!==null)e.flags|=32768,e.subtreeFlags=0,e.deletions=null;else{J=6,G=null;return}}else if(n=Pf(n,t,ye),n!==null){G=n;return}if(t=t.sibling,t!==null){G=t;return}G=t=e}while(t!==null);J===0&&(J=5)}function Et(e,t,n){var r=$,l=Pe.transition;try{Pe.transition=null,$=1,Ff(e,t,n,r)}finally{Pe.transition=l,$=r}return null}function Ff(e,t,n,r){do on();while(it!==null);if(I&6)throw Error(x(327));n=e.finishedWork;var l=e.finishedLanes;if(n===null)return null;if(e.finishedWork=null,e.finishedLanes=0,n===e.current)throw Error(x(177));e.callbackNode=null,e.callbackPriority=0;var o=n.lanes|n.childLanes;if(hd(e,o),e===b&&(G=b=null,te=0),!(n.subtreeFlags&2064)&&!(n.flags&2064)||jr||(jr=!0,cc(Wr,function(){return on(),null})),o=(n.flags&15990)!==0,n.subtreeFlags&15990||o){o=Pe.transition,Pe.transition=null;var u=$;$=1;var i=I;I|=4,Mu.current=null,Lf(e,n),tc(n,e),nf(jo),Qr=!!Co,jo=Co=null,e.current=n,Rf(n),id(),I=i,$=u,Pe.transition=o}else e.current=n;if(jr&&(jr=!1,it=e,il=l),o=e.pendingLanes,o===0&&(pt=null),cd(n.stateNode),he(e,X()),t!==null)for(r=e.onRecoverableError,n=0;n<t.length;n++)l=t[n],r(l.value,{componentStack:l.stack,digest:l.digest});if(ul)throw ul=!1,e=Ko,Ko=null,e;return il&1&&e.tag!==0&&on(),o=e.pendingLanes,o&1?e===Yo?An++:(An=0,Yo=e):An=0,wt(),null}function on(){if(it!==null){var e=Vs(il),t=Pe.transition,n=$;try{if(Pe.transition=null,$=16>e?16:e,it===null)var r=!1;else{if(e=it,it=null,il=0,I&6)throw Error(x(331));var l=I;for(I|=4,P=e.current;P!==null;){var o=P,u=o.child;if(P.flags&16){var i=o.deletions;if(i!==null){for(var s=0;s<i.length;s++){var d=i[s];for(P=d;P!==null;){var h=P;switch(h.tag){case 0:case 11:case 15:$n(8,h,o)}var v=h.child;if(v!==null)v.return=h,P=v;else for(;P!==null;){h=P;var m=h.sibling,k=h.return;if(qa(h),h===d){P=null;break}if(m!==null){m.return=k,P=m;break}P=k}}}var S=o.alternate;if(S!==null){var E=S.child;if(E!==null){S.child=null;do{var z=E.sibling;E.sibling=null,E=z}while(E!==null)}}P=o}}if(o.subtreeFlags&2064&&u!==null)u.return=o,P=u;else e:for(;P!==null;){if(o=P,o.flags&2048)switch(o.tag){case 0:case 11:case 15:$n(9,o,o.return)}var f=o.sibling;if(f!==null){f.return=o.return,P=f;break e}P=o.return}}var c=e.current;for(P=c;P!==null;){u=P;var p=u.child;if(u.subtreeFlags&2064&&p!==null)p.return=u,P=p;else e:for(u=c;P!==null;){if(i=P,i.flags&2048)try{switch(i.tag){case 0:case 11:case 15:kl(9,i)}}catch(g){K(i,i.return,g)}if(i===u){P=null;break e}var y=i.sibling;if(y!==null){y.return=i.return,P=y;break e}P=i.return}}if(I=l,wt(),Be&&typeof Be.onPostCommitFiberRoot=="function")try{Be.onPostCommitFiberRoot(pl,e)}catch{}r=!0}return r}finally{$=n,Pe.transition=t}}return!1}function Zi(e,t,n){t=fn(n,t),t=Va(e,t,1),e=ft(e,t,1),t=ae(),e!==null&&(or(e,1,t),he(e,t))}function K(e,t,n){if(e.tag===3)Zi(e,e,n);else for(;t!==null;){if(t.tag===3){Zi(t,e,n);break}else if(t.tag===1){var r=t.stateNode;if(typeof t.type.getDerivedStateFromError=="function"||typeof r.componentDidCatch=="function"&&(pt===null||!pt.has(r))){e=fn(n,e),e=Ba(t,e,1),t=ft(t,e,1),e=ae(),t!==null&&(or(t,1,e),he(t,e));break}}t=t.return}}function $f(e,t,n){var r=e.pingCache;r!==null&&r.delete(t),t=ae(),e.pingedLanes|=e.suspendedLanes&n,b===e&&(te&n)===n&&(J===4||J===3&&(te&130023424)===te&&500>X()-Iu?Tt(e,0):Du|=n),he(e,t)}function sc(e,t){t===0&&(e.mode&1?(t=hr,hr<<=1,!(hr&130023424)&&(hr=4194304)):t=1);var n=ae();e=Je(e,t),e!==null&&(or(e,t,n),he(e,n))}function Uf(e){var t=e.memoizedState,n=0;t!==null&&(n=t.retryLane),sc(e,n)}function Af(e,t){var n=0;switch(e.tag){case 13:var r=e.stateNode,l=e.memoizedState;l!==null&&(n=l.retryLane);break;case 19:r=e.stateNode;break;default:throw Error(x(314))}r!==null&&r.delete(t),sc(e,n)}var ac;ac=function(e,t,n){if(e!==null)if(e.memoizedProps!==t.pendingProps||me.current)pe=!0;else{if(!(e.lanes&n)&&!(t.flags&128))return pe=!1,_f(e,t,n);pe=!!(e.flags&131072)}else pe=!1,B&&t.flags&1048576&&pa(t,qr,t.index);switch(t.lanes=0,t.tag){case 2:var r=t.type;Or(e,t),e=t.pendingProps;var l=sn(t,ue.current);ln(t,n),l=Pu(null,t,r,e,l,n);var o=Tu();return t.flags|=1,typeof l=="object"&&l!==null&&typeof l.render=="function"&&l.$$typeof===void 0?(t.tag=1,t.memoizedState=null,t.updateQueue=null,ve(r)?(o=!0,Zr(t)):o=!1,t.memoizedState=l.state!==null&&l.state!==void 0?l.state:null,Nu(t),l.updater=wl,t.stateNode=l,l._reactInternals=t,Io(t,r,e,n),t=$o(null,t,r,!0,o,n)):(t.tag=0,B&&o&&hu(t),se(null,t,l,n),t=t.child),t;case 16:r=t.elementType;e:{switch(Or(e,t),e=t.pendingProps,l=r._init,r=l(r._payload),t.type=r,l=t.tag=Bf(r),e=Me(r,e),l){case 0:t=Fo(null,t,r,e,n);break e;case 1:t=Ai(null,t,r,e,n);break e;case 11:t=$i(null,t,r,e,n);break e;case 14:t=Ui(null,t,r,Me(r.type,e),n);break e}throw Error(x(306,r,""))}return t;case 0:return r=t.type,l=t.pendingProps,l=t.elementType===r?l:Me(r,l),Fo(e,t,r,l,n);case 1:return r=t.type,l=t.pendingProps,l=t.elementType===r?l:Me(r,l),Ai(e,t,r,l,n);case 3:e:{if(Ka(t),e===null)throw Error(x(387));r=t.pendingProps,o=t.memoizedState,l=o.element,xa(e,t),tl(t,r,null,n);var u=t.memoizedState;if(r=u.element,o.isDehydrated)if(o={element:r,isDehydrated:!1,cache:u.cache,pendingSuspenseBoundaries:u.pendingSuspenseBoundaries,transitions:u.transitions},t.updateQueue.baseState=o,t.memoizedState=o,t.flags&256){l=fn(Error(x(423)),t),t=Vi(e,t,r,n,l);break e}else if(r!==l){l=fn(Error(x(424)),t),t=Vi(e,t,r,n,l);break e}else for(xe=dt(t.stateNode.containerInfo.firstChild),we=t,B=!0,Ie=null,n=ga(t,null,r,n),t.child=n;n;)n.flags=n.flags&-3|4096,n=n.sibling;else{if(an(),r===l){t=qe(e,t,n);break e}se(e,t,r,n)}t=t.child}return t;case 5:return wa(t),e===null&&Ro(t),r=t.type,l=t.pendingProps,o=e!==null?e.memoizedProps:null,u=l.children,_o(r,l)?u=null:o!==null&&_o(r,o)&&(t.flags|=32),Qa(e,t),se(e,t,u,n),t.child;case 6:return e===null&&Ro(t),null;case 13:return Ya(e,t,n);case 4:return Eu(t,t.stateNode.containerInfo),r=t.pendingProps,e===null?t.child=cn(t,null,r,n):se(e,t,r,n),t.child;case 11:return r=t.type,l=t.pendingProps,l=t.elementType===r?l:Me(r,l),$i(e,t,r,l,n);case 7:return se(e,t,t.pendingProps,n),t.child;case 8:return se(e,t,t.pendingProps.children,n),t.child;case 12:return se(e,t,t.pendingProps.children,n),t.child;case 10:e:{if(r=t.type._context,l=t.pendingProps,o=t.memoizedProps,u=l.value,U(br,r._currentValue),r._currentValue=u,o!==null)if($e(o.value,u)){if(o.children===l.children&&!me.current){t=qe(e,t,n);break e}}else for(o=t.child,o!==null&&(o.return=t);o!==null;){var i=o.dependencies;if(i!==null){u=o.child;for(var s=i.firstContext;s!==null;){if(s.context===r){if(o.tag===1){s=Xe(-1,n&-n),s.tag=2;var d=o.updateQueue;if(d!==null){d=d.shared;var h=d.pending;h===null?s.next=s:(s.next=h.next,h.next=s),d.pending=s}}o.lanes|=n,s=o.alternate,s!==null&&(s.lanes|=n),Mo(o.return,n,t),i.lanes|=n;break}s=s.next}}else if(o.tag===10)u=o.type===t.type?null:o.child;else if(o.tag===18){if(u=o.return,u===null)throw Error(x(341));u.lanes|=n,i=u.alternate,i!==null&&(i.lanes|=n),Mo(u,n,t),u=o.sibling}else u=o.child;if(u!==null)u.return=o;else for(u=o;u!==null;){if(u===t){u=null;break}if(o=u.sibling,o!==null){o.return=u.return,u=o;break}u=u.return}o=u}se(e,t,l.children,n),t=t.child}return t;case 9:return l=t.type,r=t.pendingProps.children,ln(t,n),l=Te(l),r=r(l),t.flags|=1,se(e,t,r,n),t.child;case 14:return r=t.type,l=Me(r,t.pendingProps),l=Me(r.type,l),Ui(e,t,r,l,n);case 15:return Wa(e,t,t.type,t.pendingProps,n);case 17:return r=t.type,l=t.pendingProps,l=t.elementType===r?l:Me(r,l),Or(e,t),t.tag=1,ve(r)?(e=!0,Zr(t)):e=!1,ln(t,n),Aa(t,r,l),Io(t,r,l,n),$o(null,t,r,!0,e,n);case 19:return Xa(e,t,n);case 22:return Ha(e,t,n)}throw Error(x(156,t.tag))};function cc(e,t){return Fs(e,t)}function Vf(e,t,n,r){this.tag=e,this.key=n,this.sibling=this.child=this.return=this.stateNode=this.type=this.elementType=null,this.index=0,this.ref=null,this.pendingProps=t,this.dependencies=this.memoizedState=this.updateQueue=this.memoizedProps=null,this.mode=r,this.subtreeFlags=this.flags=0,this.deletions=null,this.childLanes=this.lanes=0,this.alternate=null}function _e(e,t,n,r){return new Vf(e,t,n,r)}function Uu(e){return e=e.prototype,!(!e||!e.isReactComponent)}function Bf(e){if(typeof e=="function")return Uu(e)?1:0;if(e!=null){if(e=e.$$typeof,e===lu)return 11;if(e===ou)return 14}return 2}function vt(e,t){var n=e.alternate;return n===null?(n=_e(e.tag,t,e.key,e.mode),n.elementType=e.elementType,n.type=e.type,n.stateNode=e.stateNode,n.alternate=e,e.alternate=n):(n.pendingProps=t,n.type=e.type,n.flags=0,n.subtreeFlags=0,n.deletions=null),n.flags=e.flags&14680064,n.childLanes=e.childLanes,n.lanes=e.lanes,n.child=e.child,n.memoizedProps=e.memoizedProps,n.memoizedState=e.memoizedState,n.updateQueue=e.updateQueue,t=e.dependencies,n.dependencies=t===null?null:{lanes:t.lanes,firstContext:t.firstContext},n.sibling=e.sibling,n.index=e.index,n.ref=e.ref,n}function Ur(e,t,n,r,l,o){var u=2;if(r=e,typeof e=="function")Uu(e)&&(u=1);else if(typeof e=="string")u=5;else e:switch(e){case Bt:return zt(n.children,l,o,t);case ru:u=8,l|=8;break;case lo:return e=_e(12,n,t,l|2),e.elementType=lo,e.lanes=o,e;case oo:return e=_e(13,n,t,l),e.elementType=oo,e.lanes=o,e;case uo:return e=_e(19,n,t,l),e.elementType=uo,e.lanes=o,e;case ws:return Nl(n,l,o,t);default:if(typeof e=="object"&&e!==null)switch(e.$$typeof){case ys:u=10;break e;case xs:u=9;break e;case lu:u=11;break e;case ou:u=14;break e;case nt:u=16,r=null;break e}throw Error(x(130,e==null?e:typeof e,""))}return t=_e(u,n,t,l),t.elementType=e,t.type=r,t.lanes=o,t}function zt(e,t,n,r){return e=_e(7,e,r,t),e.lanes=n,e}function Nl(e,t,n,r){return e=_e(22,e,r,t),e.elementType=ws,e.lanes=n,e.stateNode={isHidden:!1},e}function ql(e,t,n){return e=_e(6,e,null,t),e.lanes=n,e}function bl(e,t,n){return t=_e(4,e.children!==null?e.children:[],e.key,t),t.lanes=n,t.stateNode={containerInfo:e.containerInfo,pendingChildren:null,implementation:e.implementation},t}function Wf(e,t,n,r,l){this.tag=t,this.containerInfo=e,this.finishedWork=this.pingCache=this.current=this.pendingChildren=null,this.timeoutHandle=-1,this.callbackNode=this.pendingContext=this.context=null,this.callbackPriority=0,this.eventTimes=Ml(0),this.expirationTimes=Ml(-1),this.entangledLanes=this.finishedLanes=this.mutableReadLanes=this.expiredLanes=this.pingedLanes=this.suspendedLanes=this.pendingLanes=0,this.entanglements=Ml(0),this.identifierPrefix=r,this.onRecoverableError=l,this.mutableSourceEagerHydrationData=null}function Au(e,t,n,r,l,o,u,i,s){return e=new Wf(e,t,n,i,s),t===1?(t=1,o===!0&&(t|=8)):t=0,o=_e(3,null,null,t),e.current=o,o.stateNode=e,o.memoizedState={element:r,isDehydrated:n,cache:null,transitions:null,pendingSuspenseBoundaries:null},Nu(o),e}function Hf(e,t,n){var r=3<arguments.length&&arguments[3]!==void 0?arguments[3]:null;return{$$typeof:Vt,key:r==null?null:""+r,children:e,containerInfo:t,implementation:n}}function dc(e){if(!e)return gt;e=e._reactInternals;e:{if(Ft(e)!==e||e.tag!==1)throw Error(x(170));var t=e;do{switch(t.tag){case 3:t=t.stateNode.context;break e;case 1:if(ve(t.type)){t=t.stateNode.__reactInternalMemoizedMergedChildContext;break e}}t=t.return}while(t!==null);throw Error(x(171))}if(e.tag===1){var n=e.type;if(ve(n))return da(e,n,t)}return t}function fc(e,t,n,r,l,o,u,i,s){return e=Au(n,r,!0,e,l,o,u,i,s),e.context=dc(null),n=e.current,r=ae(),l=mt(n),o=Xe(r,l),o.callback=t??null,ft(n,o,l),e.current.lanes=l,or(e,l,r),he(e,r),e}function El(e,t,n,r){var l=t.current,o=ae(),u=mt(l);return n=dc(n),t.context===null?t.context=n:t.pendingContext=n,t=Xe(o,u),t.payload={element:e},r=r===void 0?null:r,r!==null&&(t.callback=r),e=ft(l,t,u),e!==null&&(Fe(e,l,u,o),Mr(e,l,u)),u}function al(e){if(e=e.current,!e.child)return null;switch(e.child.tag){case 5:return e.child.stateNode;default:return e.child.stateNode}}function Ji(e,t){if(e=e.memoizedState,e!==null&&e.dehydrated!==null){var n=e.retryLane;e.retryLane=n!==0&&n<t?n:t}}function Vu(e,t){Ji(e,t),(e=e.alternate)&&Ji(e,t)}function Qf(){return null}var pc=typeof reportError=="function"?reportError:function(e){console.error(e)};function Bu(e){this._internalRoot=e}Cl.prototype.render=Bu.prototype.render=function(e){var t=this._internalRoot;if(t===null)throw Error(x(409));El(e,t,null,null)};Cl.prototype.unmount=Bu.prototype.unmount=function(){var e=this._internalRoot;if(e!==null){this._internalRoot=null;var t=e.containerInfo;It(function(){El(null,e,null,null)}),t[Ze]=null}};function Cl(e){this._internalRoot=e}Cl.prototype.unstable_scheduleHydration=function(e){if(e){var t=Hs();e={blockedOn:null,target:e,priority:t};for(var n=0;n<lt.length&&t!==0&&t<lt[n].priority;n++);lt.splice(n,0,e),n===0&&Ks(e)}};function Wu(e){return!(!e||e.nodeType!==1&&e.nodeType!==9&&e.nodeType!==11)}function jl(e){return!(!e||e.nodeType!==1&&e.nodeType!==9&&e.nodeType!==11&&(e.nodeType!==8||e.nodeValue!==" react-mount-point-unstable "))}function qi(){}function Kf(e,t,n,r,l){if(l){if(typeof r=="function"){var o=r;r=function(){var d=al(u);o.call(d)}}var u=fc(t,r,e,0,null,!1,!1,"",qi);return e._reactRootContainer=u,e[Ze]=u.current,Gn(e.nodeType===8?e.parentNode:e),It(),u}for(;l=e.lastChild;)e.removeChild(l);if(typeof r=="function"){var i=r;r=function(){var d=al(s);i.call(d)}}var s=Au(e,0,!1,null,null,!1,!1,"",qi);return e._reactRootContainer=s,e[Ze]=s.current,Gn(e.nodeType===8?e.parentNode:e),It(function(){El(t,s,n,r)}),s}function _l(e,t,n,r,l){var o=n._reactRootContainer;if(o){var u=o;if(typeof l=="function"){var i=l;l=function(){var s=al(u);i.call(s)}}El(t,u,e,l)}else u=Kf(n,t,e,l,r);return al(u)}Bs=function(e){switch(e.tag){case 3:var t=e.stateNode;if(t.current.memoizedState.isDehydrated){var n=zn(t.pendingLanes);n!==0&&(su(t,n|1),he(t,X()),!(I&6)&&(pn=X()+500,wt()))}break;case 13:It(function(){var r=Je(e,1);if(r!==null){var l=ae();Fe(r,e,1,l)}}),Vu(e,1)}};au=function(e){if(e.tag===13){var t=Je(e,134217728);if(t!==null){var n=ae();Fe(t,e,134217728,n)}Vu(e,134217728)}};Ws=function(e){if(e.tag===13){var t=mt(e),n=Je(e,t);if(n!==null){var r=ae();Fe(n,e,t,r)}Vu(e,t)}};Hs=function(){return $};Qs=function(e,t){var n=$;try{return $=e,t()}finally{$=n}};go=function(e,t,n){switch(t){case"input":if(ao(e,n),t=n.name,n.type==="radio"&&t!=null){for(n=e;n.parentNode;)n=n.parentNode;for(n=n.querySelectorAll("input[name="+JSON.stringify(""+t)+'][type="radio"]'),t=0;t<n.length;t++){var r=n[t];if(r!==e&&r.form===e.form){var l=gl(r);if(!l)throw Error(x(90));Ss(r),ao(r,l)}}}break;case"textarea":Es(e,n);break;case"select":t=n.value,t!=null&&en(e,!!n.multiple,t,!1)}};Ls=Ou;Rs=It;var Yf={usingClientEntryPoint:!1,Events:[ir,Kt,gl,Ts,zs,Ou]},_n={findFiberByHostInstance:Ct,bundleType:0,version:"18.3.1",rendererPackageName:"react-dom"},Xf={bundleType:_n.bundleType,version:_n.version,rendererPackageName:_n.rendererPackageName,rendererConfig:_n.rendererConfig,overrideHookState:null,overrideHookStateDeletePath:null,overrideHookStateRenamePath:null,overrideProps:null,overridePropsDeletePath:null,overridePropsRenamePath:null,setErrorHandler:null,setSuspenseHandler:null,scheduleUpdate:null,currentDispatcherRef:be.ReactCurrentDispatcher,findHostInstanceByFiber:function(e){return e=Is(e),e===null?null:e.stateNode},findFiberByHostInstance:_n.findFiberByHostInstance||Qf,findHostInstancesForRefresh:null,scheduleRefresh:null,scheduleRoot:null,setRefreshHandler:null,getCurrentFiber:null,reconcilerVersion:"18.3.1-next-f1338f8080-20240426"};if(typeof __REACT_DEVTOOLS_GLOBAL_HOOK__<"u"){var _r=__REACT_DEVTOOLS_GLOBAL_HOOK__;if(!_r.isDisabled&&_r.supportsFiber)try{pl=_r.inject(Xf),Be=_r}catch{}}Se.__SECRET_INTERNALS_DO_NOT_USE_OR_YOU_WILL_BE_FIRED=Yf;Se.createPortal=function(e,t){var n=2<arguments.length&&arguments[2]!==void 0?arguments[2]:null;if(!Wu(t))throw Error(x(200));return Hf(e,t,null,n)};Se.createRoot=function(e,t){if(!Wu(e))throw Error(x(299));var n=!1,r="",l=pc;return t!=null&&(t.unstable_strictMode===!0&&(n=!0),t.identifierPrefix!==void 0&&(r=t.identifierPrefix),t.onRecoverableError!==void 0&&(l=t.onRecoverableError)),t=Au(e,1,!1,null,null,n,!1,r,l),e[Ze]=t.current,Gn(e.nodeType===8?e.parentNode:e),new Bu(t)};Se.findDOMNode=function(e){if(e==null)return null;if(e.nodeType===1)return e;var t=e._reactInternals;if(t===void 0)throw typeof e.render=="function"?Error(x(188)):(e=Object.keys(e).join(","),Error(x(268,e)));return e=Is(t),e=e===null?null:e.stateNode,e};Se.flushSync=function(e){return It(e)};Se.hydrate=function(e,t,n){if(!jl(t))throw Error(x(200));return _l(null,e,t,!0,n)};Se.hydrateRoot=function(e,t,n){if(!Wu(e))throw Error(x(405));var r=n!=null&&n.hydratedSources||null,l=!1,o="",u=pc;if(n!=null&&(n.unstable_strictMode===!0&&(l=!0),n.identifierPrefix!==void 0&&(o=n.identifierPrefix),n.onRecoverableError!==void 0&&(u=n.onRecoverableError)),t=fc(t,null,e,1,n??null,l,!1,o,u),e[Ze]=t.current,Gn(e),r)for(e=0;e<r.length;e++)n=r[e],l=n._getVersion,l=l(n._source),t.mutableSourceEagerHydrationData==null?t.mutableSourceEagerHydrationData=[n,l]:t.mutableSourceEagerHydrationData.push(n,l);return new Cl(t)};Se.render=function(e,t,n){if(!jl(t))throw Error(x(200));return _l(null,e,t,!1,n)};Se.unmountComponentAtNode=function(e){if(!jl(e))throw Error(x(40));return e._reactRootContainer?(It(function(){_l(null,null,e,!1,function(){e._reactRootContainer=null,e[Ze]=null})}),!0):!1};Se.unstable_batchedUpdates=Ou;Se.unstable_renderSubtreeIntoContainer=function(e,t,n,r){if(!jl(n))throw Error(x(200));if(e==null||e._reactInternals===void 0)throw Error(x(38));return _l(e,t,n,!1,r)};Se.version="18.3.1-next-f1338f8080-20240426";function mc(){if(!(typeof __REACT_DEVTOOLS_GLOBAL_HOOK__>"u"||typeof __REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE!="function"))try{__REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE(mc)}catch(e){console.error(e)}}mc(),ms.exports=Se;var Gf=ms.exports,bi=Gf;no.createRoot=bi.createRoot,no.hydrateRoot=bi.hydrateRoot;const Zf=["","/agent-monitor"];async function Hu(e){for(const t of Zf){const n=await fetch(`${t}/api${e}`);if(n.ok)return n.json()}throw new Error(`API failed: ${e}`)}const Jf=e=>Hu(`/runs?${e.toString()}`),qf=e=>Hu(`/runs/${e}`),bf=e=>Hu(`/reports/dashboard?${e.toString()}`);function ep(e){return a.jsxs("header",{className:"sticky top-0 z-50 flex items-center justify-between gap-4 border-b border-[var(--border)] bg-[linear-gradient(180deg,var(--surface-tint-2),var(--surface-tint-0))] bg-[var(--surface)] px-4 py-3 md:px-8 md:py-3",children:[a.jsxs("div",{className:"flex min-w-0 items-center gap-2.5",children:[a.jsx("img",{className:"h-[42px] w-[42px] rounded-lg border border-[var(--border)] bg-[var(--surface-tint-1)] p-1",src:"/logo.svg",alt:"Agent Monitor logo"}),a.jsxs("div",{className:"min-w-0",children:[a.jsx("h1",{className:"text-base font-semibold leading-tight",children:"Agent Monitor"}),a.jsxs("div",{className:"flex items-center gap-1.5",children:[a.jsx("span",{className:"h-1.5 w-1.5 rounded-full bg-[var(--green)] shadow-[0_0_6px_var(--green)]"}),a.jsx("span",{className:"truncate font-mono text-[0.72rem] text-[var(--text-3)]",children:e.lastUpdate?`updated ${e.lastUpdate}`:"loading…"})]})]})]}),a.jsxs("div",{className:"ml-auto flex items-center gap-2",children:[a.jsxs("div",{className:"inline-flex items-center gap-2 rounded-[10px] border border-[var(--border)] bg-[var(--surface-2)] p-1",children:[a.jsxs("div",{className:"flex gap-1 rounded-lg border border-[var(--border)] bg-[var(--surface)] p-0.5",role:"tablist","aria-label":"View mode toggle",children:[a.jsx("button",{className:`h-8 rounded-md border px-3 font-mono text-[0.7rem] ${e.laneMode==="list"?"border-[var(--accent-active-border)] bg-[var(--accent-active-bg)] text-[var(--accent-active-text)]":"border-transparent text-[var(--text-3)]"}`,onClick:()=>e.setLaneMode("list"),children:"List"}),a.jsx("button",{className:`h-8 rounded-md border px-3 font-mono text-[0.7rem] ${e.laneMode==="lanes"?"border-[var(--accent-active-border)] bg-[var(--accent-active-bg)] text-[var(--accent-active-text)]":"border-transparent text-[var(--text-3)]"}`,onClick:()=>e.setLaneMode("lanes"),children:"Lanes"})]}),a.jsxs("div",{className:"flex items-center gap-2 font-mono text-[0.72rem] text-[var(--text-3)]",children:[a.jsx("span",{className:"text-[0.68rem] uppercase tracking-wide",children:"Auto"}),a.jsxs("select",{className:"h-8 rounded-md border border-[var(--border)] bg-[var(--surface-2)] px-2.5 pr-7 font-mono text-[0.72rem]",value:e.interval,onChange:t=>e.setIntervalSec(Number(t.target.value)),children:[a.jsx("option",{value:0,children:"manual"}),a.jsx("option",{value:5,children:"5s"}),a.jsx("option",{value:10,children:"10s"}),a.jsx("option",{value:30,children:"30s"})]})]})]}),a.jsx("button",{className:"inline-flex h-8 w-8 items-center justify-center rounded-lg border border-[var(--border)] bg-[var(--surface-2)] font-mono text-sm",onClick:e.toggleTheme,"aria-label":"Toggle color theme",children:e.dark?"☼":"☾"}),a.jsx("button",{className:"inline-flex h-8 w-8 items-center justify-center rounded-lg border border-[var(--border)] bg-[var(--surface-2)] font-mono text-sm",onClick:e.refresh,"aria-label":"Refresh runs",children:"↻"})]})]})}const vc=(e=0)=>{const t=Math.max(0,Math.floor(e/1e3)),n=Math.floor(t/3600),r=Math.floor(t%3600/60),l=t%60;return n?`${n}h ${r}m`:r?`${r}m ${l}s`:`${l}s`},Pt=(e,t=Date.now())=>{const n=e.lastHeartbeatAt??e.startedAt??t,r=t-n;return e.status==="running"?r<2*6e4?"running":r<10*6e4?"quiet":"stalled":"dead"},tp={running:"var(--green)",quiet:"var(--amber)",stalled:"var(--orange)",dead:"var(--red)",done:"var(--blue)",failed:"var(--red)",timeout:"var(--orange)",unknown:"var(--text-3)"};function np({runs:e,selectedAgent:t,setSelectedAgent:n}){const r=Array.from(new Set(e.map(o=>o.agentId))).sort(),l=new Map;return e.forEach(o=>l.set(o.agentId,[...l.get(o.agentId)||[],o])),a.jsxs("aside",{className:"w-[220px] shrink-0 border-r border-[var(--border)] bg-[var(--surface)] px-2 py-3 max-lg:w-full max-lg:overflow-x-auto max-lg:border-r-0 max-lg:border-b max-lg:px-3 max-lg:py-2",children:[a.jsx("div",{className:"px-2 pb-2 text-[0.62rem] uppercase tracking-[0.12em] text-[var(--text-3)] max-lg:hidden",children:"Agents"}),a.jsxs("div",{className:"space-y-1 max-lg:flex max-lg:min-w-max max-lg:gap-1.5 max-lg:space-y-0",children:[a.jsxs("button",{type:"button",className:`flex w-full items-center gap-2 rounded-md px-2 py-1.5 text-left text-[0.8rem] transition hover:bg-[var(--surface-2)] max-lg:w-auto max-lg:whitespace-nowrap ${t==="all"?"bg-[var(--surface-2)] ring-1 ring-[var(--accent-active-border-soft)]":""}`,onClick:()=>n("all"),children:[a.jsx("span",{className:"h-1.5 w-1.5 rounded-full bg-[var(--blue)]"}),a.jsx("span",{className:"text-[var(--text)]",children:"all agents"}),a.jsx("span",{className:"ml-auto rounded bg-[var(--surface-3)] px-1.5 py-0.5 font-mono text-[0.65rem] text-[var(--text-3)]",children:e.length})]}),r.map(o=>{const u=l.get(o)||[],i=u[0],s=i?i.status==="running"?Pt(i):i.status:"dead";return a.jsxs("button",{type:"button",className:`flex w-full items-center gap-2 rounded-md px-2 py-1.5 text-left text-[0.8rem] transition hover:bg-[var(--surface-2)] max-lg:w-auto max-lg:whitespace-nowrap ${t===o?"bg-[var(--surface-2)] ring-1 ring-[var(--accent-active-border-soft)]":""}`,onClick:()=>n(o),children:[a.jsx("span",{className:"h-1.5 w-1.5 rounded-full",style:{background:tp[s]||"var(--text-3)"}}),a.jsx("span",{className:"truncate",children:o}),a.jsx("span",{className:"ml-auto rounded bg-[var(--surface-3)] px-1.5 py-0.5 font-mono text-[0.65rem] text-[var(--text-3)]",children:u.length})]},o)})]})]})}const eo=e=>e.toLocaleString();function rp({runs:e}){const t={running:e.filter(l=>Pt(l)==="running").length,quiet:e.filter(l=>Pt(l)==="quiet").length,stalled:e.filter(l=>Pt(l)==="stalled").length,dead:e.filter(l=>Pt(l)==="dead").length,total:e.length},n=e.reduce((l,o)=>(l.input+=o.inputTokens??0,l.output+=o.outputTokens??0,l.total+=o.totalTokens??(o.inputTokens??0)+(o.outputTokens??0),(o.inputTokens!=null||o.outputTokens!=null||o.totalTokens!=null)&&(l.withData+=1),l),{input:0,output:0,total:0,withData:0}),r=[{label:"Running",value:t.running},{label:"Quiet",value:t.quiet},{label:"Stalled",value:t.stalled},{label:"Dead",value:t.dead},{label:"Total",value:t.total}];return a.jsxs(a.Fragment,{children:[a.jsx("div",{className:"mb-3 grid grid-cols-5 gap-3 max-lg:grid-cols-2",children:r.map(l=>a.jsxs("div",{className:"rounded-lg border border-[var(--border)] bg-[var(--surface)]/95 p-4",children:[a.jsx("div",{className:"text-[0.68rem] uppercase tracking-[0.07em] text-[var(--text-3)]",children:l.label}),a.jsx("div",{className:"mt-1 font-mono text-[1.3rem] font-semibold text-[var(--text)]",children:l.value})]},l.label))}),a.jsxs("div",{className:"mb-6 grid grid-cols-3 gap-3 max-lg:grid-cols-1",children:[a.jsxs("div",{className:"rounded-lg border border-[var(--border)] bg-[var(--surface)]/95 p-4",children:[a.jsx("div",{className:"text-[0.68rem] uppercase tracking-[0.07em] text-[var(--text-3)]",children:"Window Input Tokens"}),a.jsx("div",{className:"mt-1 font-mono text-[1.3rem] font-semibold text-[var(--text)]",children:eo(n.input)})]}),a.jsxs("div",{className:"rounded-lg border border-[var(--border)] bg-[var(--surface)]/95 p-4",children:[a.jsx("div",{className:"text-[0.68rem] uppercase tracking-[0.07em] text-[var(--text-3)]",children:"Window Output Tokens"}),a.jsx("div",{className:"mt-1 font-mono text-[1.3rem] font-semibold text-[var(--text)]",children:eo(n.output)})]}),a.jsxs("div",{className:"rounded-lg border border-[var(--border)] bg-[var(--surface)]/95 p-4",children:[a.jsx("div",{className:"text-[0.68rem] uppercase tracking-[0.07em] text-[var(--text-3)]",children:"Window Total Tokens"}),a.jsx("div",{className:"mt-1 font-mono text-[1.3rem] font-semibold text-[var(--text)]",children:eo(n.total)}),a.jsxs("div",{className:"mt-1.5 font-mono text-[0.64rem] text-[var(--text-3)]",children:[n.withData," / ",e.length," runs reporting tokens"]})]})]})]})}const hc=e=>{const t=e.totalTokens,n=e.inputTokens,r=e.outputTokens;return t!=null?`${t.toLocaleString()} tok`:n!=null||r!=null?`${(n??0).toLocaleString()} in / ${(r??0).toLocaleString()} out`:"tokens unavailable"},gc=e=>(e.task||"").replace(/\s+/g," ").trim()||"No task summary available",cl={running:"border border-emerald-500/30 bg-emerald-500/10 text-emerald-300/80",quiet:"border border-amber-500/30 bg-amber-500/10 text-amber-300/80",stalled:"border border-orange-500/30 bg-orange-500/10 text-orange-300/80",dead:"border border-rose-500/30 bg-rose-500/10 text-rose-300/80",done:"border border-sky-500/30 bg-sky-500/10 text-sky-300/80",failed:"border border-rose-500/30 bg-rose-500/10 text-rose-300/80",timeout:"border border-orange-500/30 bg-orange-500/10 text-orange-300/80",unknown:"border border-[var(--border)] bg-[var(--surface-3)] text-[var(--text-3)]"};function yc(e){return e.status==="running"?Pt(e):e.status}function lp({runs:e,laneMode:t,onSelect:n}){if(t==="list")return a.jsx("div",{className:"flex flex-col gap-2.5",children:e.map(l=>a.jsx(op,{run:l,onSelect:n},l.runId))});const r=Array.from(new Set(e.map(l=>l.agentId)));return a.jsx("div",{className:"flex gap-3 overflow-x-auto pb-3 max-lg:flex-col",children:r.map(l=>{const o=e.filter(u=>u.agentId===l);return a.jsxs("section",{className:"min-w-[312px] max-w-[392px] flex-shrink-0 overflow-hidden rounded-xl border border-[var(--border)]/85 bg-[var(--surface)]/95 shadow-[inset_0_1px_0_rgba(255,255,255,0.015)] max-lg:max-w-none",children:[a.jsxs("header",{className:"flex items-center justify-between border-b border-[var(--border)]/85 bg-[var(--surface-2)]/40 px-3.5 py-2.5",children:[a.jsx("span",{className:"truncate text-[0.79rem] font-semibold tracking-[0.01em] text-[var(--text-2)]",children:l}),a.jsxs("span",{className:"font-mono text-[0.64rem] text-[var(--text-3)]",children:[o.length," runs"]})]}),a.jsx("div",{className:"flex max-h-[70vh] flex-col gap-2 overflow-y-auto p-2.5",children:o.map(u=>a.jsx(up,{run:u,onSelect:n},u.runId))})]},l)})})}const xc="border border-[rgba(45,49,61,0.72)] rounded-xl shadow-none transition hover:border-[var(--border-hover)]";function op({run:e,onSelect:t}){const n=yc(e);return a.jsxs("button",{type:"button",className:`grid w-full grid-cols-[84px_1fr_auto] items-center gap-3 ${xc} bg-[var(--surface)] px-4 py-3 text-left font-sans hover:bg-[var(--surface-2)]/40 max-lg:grid-cols-1 max-lg:gap-2 max-lg:px-3.5 max-lg:py-3`,onClick:()=>t(e.runId),children:[a.jsxs("div",{className:"flex flex-col items-start gap-1 max-lg:flex-row max-lg:items-center",children:[a.jsx("span",{className:`inline-flex rounded-full px-2 py-0.5 font-mono text-[0.58rem] font-medium uppercase tracking-[0.06em] ${cl[n]||cl.unknown}`,children:n}),a.jsx("span",{className:"font-mono text-[0.64rem] text-[var(--text-3)]",children:vc(e.runtimeMs)})]}),a.jsxs("div",{className:"min-w-0",children:[a.jsx("div",{className:"truncate text-[0.84rem] font-semibold text-[var(--text)]",children:e.label||e.agentId}),a.jsx("p",{className:"mt-0.5 truncate text-[0.7rem] text-[var(--text-2)]",children:gc(e)}),a.jsxs("div",{className:"mt-1.5 flex items-center gap-1.5 font-mono text-[0.62rem] text-[var(--text-3)]",children:[a.jsx("span",{className:"truncate",children:e.agentId}),a.jsx("span",{"aria-hidden":!0,children:"•"}),a.jsx("span",{className:"truncate",children:e.model||"model"}),a.jsx("span",{"aria-hidden":!0,children:"•"}),a.jsx("span",{children:hc(e)})]})]}),a.jsx("div",{className:"font-mono text-[0.64rem] text-[var(--text-3)] max-lg:text-left",children:new Date(e.startedAt).toLocaleString()})]})}function up({run:e,onSelect:t}){const n=yc(e);return a.jsxs("button",{type:"button",className:`w-full ${xc} bg-[var(--surface)] px-3 py-2.5 text-left font-sans hover:bg-[var(--surface-2)]/40`,onClick:()=>t(e.runId),children:[a.jsxs("div",{className:"mb-1 flex items-start justify-between gap-2",children:[a.jsxs("div",{className:"min-w-0",children:[a.jsx("div",{className:"truncate text-[0.8rem] font-semibold text-[var(--text)]",children:e.label||e.agentId}),a.jsx("p",{className:"mt-0.5 truncate text-[0.67rem] text-[var(--text-2)]",children:gc(e)})]}),a.jsx("span",{className:`inline-flex flex-shrink-0 rounded-full px-1.5 py-0.5 font-mono text-[0.56rem] font-medium uppercase tracking-[0.06em] ${cl[n]||cl.unknown}`,children:n})]}),a.jsxs("div",{className:"flex items-center gap-1.5 font-mono text-[0.6rem] text-[var(--text-3)]",children:[a.jsx("span",{children:vc(e.runtimeMs)}),a.jsx("span",{"aria-hidden":!0,children:"•"}),a.jsx("span",{className:"truncate",children:e.model||"model"}),a.jsx("span",{"aria-hidden":!0,children:"•"}),a.jsx("span",{className:"truncate",children:hc(e)})]})]})}function ip({run:e,close:t}){var n;return e?a.jsx("div",{className:"fixed inset-0 z-[180] bg-[var(--sheet-backdrop)]",onClick:t,children:a.jsxs("aside",{className:"fixed right-0 top-0 z-[190] flex h-screen w-[min(680px,92vw)] flex-col overflow-auto border-l border-[var(--border)] bg-[var(--surface)] p-4 shadow-[var(--sheet-shadow)]",onClick:r=>r.stopPropagation(),children:[a.jsxs("div",{className:"mb-3 flex items-center justify-between",children:[a.jsx("h3",{className:"text-sm font-semibold",children:"Run detail"}),a.jsx("button",{className:"h-8 rounded-md border border-[var(--border)] bg-[var(--surface-2)] px-3 font-mono text-[0.72rem]",onClick:t,children:"Close"})]}),a.jsxs("div",{className:"space-y-3",children:[a.jsxs("div",{className:"rounded-lg border border-[var(--border)] bg-[var(--surface-2)] p-3 text-sm",children:[a.jsxs("div",{children:[a.jsx("b",{children:"Agent:"})," ",e.agentId]}),a.jsxs("div",{children:[a.jsx("b",{children:"Run:"})," ",e.runId]}),a.jsxs("div",{children:[a.jsx("b",{children:"Task:"})," ",e.task]})]}),a.jsx("div",{className:"space-y-2",children:(n=e.messages)==null?void 0:n.map((r,l)=>a.jsx(sp,{role:r.role,text:r.text,tools:r.toolCalls||[]},l))})]})]})}):null}function sp({role:e,text:t,tools:n}){return a.jsxs("div",{className:"rounded-lg border border-[var(--border)] bg-[var(--surface-2)] p-3",children:[a.jsx("div",{className:"mb-2 font-mono text-[0.68rem] uppercase tracking-[0.08em] text-[var(--text-3)]",children:e}),a.jsx("pre",{className:"whitespace-pre-wrap text-sm",children:t}),n.length>0&&a.jsx("div",{className:"mt-3 space-y-2",children:n.map((r,l)=>a.jsx(ap,{tool:r},l))})]})}function ap({tool:e}){const[t,n]=F.useState(!1),[r,l]=F.useState(!1),o=JSON.stringify(e.arguments??{},null,2),u=JSON.stringify(e.result??{},null,2);return a.jsxs("div",{className:"rounded border border-[var(--border)] bg-[var(--surface)] p-2",children:[a.jsxs("div",{className:"text-sm font-medium",children:["Tool: ",e.name||"unknown"]}),a.jsxs("button",{className:"mt-2 h-7 rounded-md border border-[var(--border)] bg-[var(--surface-2)] px-2 font-mono text-[0.7rem]",onClick:()=>n(i=>!i),children:["Args ",t?"−":"+"]}),t&&a.jsx("pre",{className:"mt-2 max-h-56 overflow-auto rounded bg-[var(--surface-3)] p-2 text-xs",children:o}),a.jsxs("button",{className:"mt-2 h-7 rounded-md border border-[var(--border)] bg-[var(--surface-2)] px-2 font-mono text-[0.7rem]",onClick:()=>l(i=>!i),children:["Result ",r?"−":"+"]}),r&&a.jsx("pre",{className:"mt-2 max-h-56 overflow-auto rounded bg-[var(--surface-3)] p-2 text-xs",children:u})]})}const wc=24*60*60*1e3,bt=e=>{const t=e.getFullYear(),n=String(e.getMonth()+1).padStart(2,"0"),r=String(e.getDate()).padStart(2,"0");return`${t}-${n}-${r}`},dl=()=>bt(new Date);function At(e,t=dl()){const n=e.start<=t?e.start:t,r=e.end<=t?e.end:t,l=r>=n?r:n;return{start:n,end:l}}function es(e){const t=new Date,n=bt(t);if(e==="daily"){const l=new Date(t.getFullYear(),t.getMonth(),1);return{start:bt(l),end:n}}if(e==="weekly"){const l=t.getDay(),o=l===0?-6:1-l,u=new Date(t);return u.setDate(t.getDate()+o),{start:bt(u),end:n}}const r=new Date(t.getFullYear(),0,1);return{start:bt(r),end:n}}function cp(e,t){const n=new Date(`${e}T00:00:00`),r=new Date(`${t}T00:00:00`);return Math.max(1,Math.floor((r.getTime()-n.getTime())/wc)+1)}function dp(e,t){const n=new Map(e.map(i=>[i.period,i])),r=Array.from(new Set(e.flatMap(i=>i.agents.map(s=>s.agentId)))).sort(),l=[],o=new Date(`${t.start}T00:00:00`),u=new Date(`${t.end}T00:00:00`);for(let i=o.getTime();i<=u.getTime();i+=wc){const s=bt(new Date(i)),d=n.get(s);if(d){const h=r.map(v=>d.agents.find(m=>m.agentId===v)||{agentId:v,runCount:0,inputTokens:0,outputTokens:0,totalTokens:0});l.push({period:s,totalTokens:h.reduce((v,m)=>v+m.totalTokens,0),runCount:h.reduce((v,m)=>v+m.runCount,0),agents:h})}else{const h=r.map(v=>({agentId:v,runCount:0,inputTokens:0,outputTokens:0,totalTokens:0}));l.push({period:s,totalTokens:0,runCount:0,agents:h})}}return l}function fp(e,t,n){var l;const r=((l=e==null?void 0:e.series.usageStacked)==null?void 0:l.items)??[];return t!=="daily"?r:dp(r,n)}const tt=["#60a5fa","#34d399","#c084fc","#f59e0b","#ef4444","#14b8a6","#f97316","#eab308","#818cf8","#22d3ee"],St=e=>new Intl.NumberFormat().format(Math.round(e||0));function pp(e,t){return t==="tokens"?e.totalTokens:e.runCount}function mp({data:e,period:t,onPeriodChange:n,range:r,onRangeChange:l,onPrevWeek:o,onNextWeek:u}){var y;const[i,s]=F.useState({}),[d,h]=F.useState(null),[v,m]=F.useState("tokens"),k=F.useMemo(()=>fp(e,t,r),[e,t,r]),S=F.useMemo(()=>{const g=new Set;return k.forEach(w=>w.agents.forEach(C=>g.add(C.agentId))),[...g]},[k]),E=((y=e==null?void 0:e.breakdowns)==null?void 0:y.agentUsagePie)??[],z=e==null?void 0:e.allTime,f=Math.max(1,...k.map(g=>g.agents.filter(w=>!i[w.agentId]).reduce((w,C)=>w+C.totalTokens,0))),c=F.useMemo(()=>{var w;return[...((w=e==null?void 0:e.breakdowns)==null?void 0:w.leaderboard)??[]].sort((C,j)=>v==="tokens"?j.totalTokens-C.totalTokens:j.runCount-C.runCount)},[e,v]),p=Math.max(1,E.reduce((g,w)=>g+w.totalTokens,0));return a.jsxs("div",{className:"grid grid-cols-2 gap-4 max-lg:grid-cols-1",children:[a.jsxs("div",{className:"col-span-full rounded-lg border border-[var(--border)] bg-[var(--surface)] p-4",children:[a.jsxs("div",{className:"mb-3 flex items-center justify-between gap-2",children:[a.jsx("div",{className:"text-sm font-semibold",children:"Usage by period (stacked by agent)"}),a.jsx("div",{className:"flex gap-1 rounded-lg border border-[var(--border)] bg-[var(--surface-2)] p-0.5",children:["daily","weekly","monthly"].map(g=>a.jsx("button",{className:`h-8 rounded-md border px-3 font-mono text-[0.7rem] ${t===g?"border-[var(--accent-active-border)] bg-[var(--accent-active-bg)] text-[var(--accent-active-text)]":"border-transparent text-[var(--text-3)]"}`,onClick:()=>n(g),children:g},g))})]}),a.jsxs("div",{className:"mb-3 grid grid-cols-1 gap-2 md:grid-cols-[1fr_auto] md:items-end",children:[a.jsxs("div",{className:"grid grid-cols-1 gap-2 sm:grid-cols-2",children:[a.jsxs("label",{className:"flex flex-col gap-1 text-[0.65rem] uppercase tracking-[0.08em] text-[var(--text-3)]",children:["Start date",a.jsx("input",{type:"date",max:dl(),value:r.start,onChange:g=>l({...r,start:g.target.value}),className:"h-9 rounded-lg border border-[var(--border)] bg-[var(--surface-2)] px-3 font-mono text-[0.75rem] text-[var(--text)]"})]}),a.jsxs("label",{className:"flex flex-col gap-1 text-[0.65rem] uppercase tracking-[0.08em] text-[var(--text-3)]",children:["End date",a.jsx("input",{type:"date",max:dl(),value:r.end,onChange:g=>l({...r,end:g.target.value}),className:"h-9 rounded-lg border border-[var(--border)] bg-[var(--surface-2)] px-3 font-mono text-[0.75rem] text-[var(--text)]"})]})]}),t==="weekly"?a.jsxs("div",{className:"flex items-center gap-1 rounded-lg border border-[var(--border)] bg-[var(--surface-2)] p-0.5",children:[a.jsx("button",{className:"h-8 rounded-md border border-transparent px-3 font-mono text-[0.7rem] text-[var(--text-2)] hover:border-[var(--border)]",onClick:o,children:"← prev week"}),a.jsx("button",{className:"h-8 rounded-md border border-transparent px-3 font-mono text-[0.7rem] text-[var(--text-2)] hover:border-[var(--border)]",onClick:u,children:"next week →"})]}):null]}),a.jsx("div",{className:"mb-3 flex flex-wrap gap-1.5",children:S.map((g,w)=>a.jsxs("button",{className:"inline-flex items-center rounded-md border border-[var(--border)] bg-[var(--surface-2)] px-2 py-1 font-mono text-[0.68rem]",onClick:()=>s(C=>({...C,[g]:!C[g]})),children:[a.jsx("span",{className:"mr-1 inline-block h-2 w-2 rounded-full",style:{background:tt[w%tt.length],opacity:i[g]?.4:1}}),g]},g))}),a.jsxs("div",{className:"relative",onMouseLeave:()=>h(null),children:[a.jsx("div",{className:"grid grid-cols-[repeat(auto-fit,minmax(90px,1fr))] gap-3",children:k.map(g=>{let w=0;const C=g.agents.filter(j=>!i[j.agentId]).reduce((j,O)=>j+O.totalTokens,0);return a.jsxs("div",{className:"flex flex-col items-center gap-2",children:[a.jsx("div",{className:"font-mono text-[0.68rem] text-[var(--text-2)]",children:St(C)}),a.jsx("div",{className:"relative h-32 w-full max-w-[84px] overflow-hidden rounded border border-[var(--border)] bg-[var(--surface-3)]",children:g.agents.map((j,O)=>{if(i[j.agentId])return null;const T=j.totalTokens/f*100,ie=w/f*100;return w+=j.totalTokens,a.jsx("div",{className:"absolute inset-x-0",style:{bottom:`${ie}%`,height:`${T}%`,background:tt[O%tt.length]},onMouseMove:Y=>h({x:Y.clientX+8,y:Y.clientY+8,text:`${j.agentId} • ${St(j.totalTokens)} tokens • ${j.runCount} runs`})},j.agentId)})}),a.jsx("div",{className:"font-mono text-[0.72rem] text-[var(--text-2)]",children:g.period})]},g.period)})}),d?a.jsx("div",{className:"fixed z-[210] rounded-md border border-[var(--border)] bg-[var(--surface)] px-2 py-1 font-mono text-[0.7rem]",style:{left:d.x,top:d.y},children:d.text}):null]})]}),a.jsxs("div",{className:"rounded-lg border border-[var(--border)] bg-[var(--surface)] p-4",children:[a.jsx("div",{className:"mb-3 text-sm font-semibold",children:"All-time token usage"}),a.jsxs("div",{className:"grid grid-cols-3 gap-2 max-md:grid-cols-1",children:[a.jsx(to,{label:"Input",value:St((z==null?void 0:z.inputTokens)||0)}),a.jsx(to,{label:"Output",value:St((z==null?void 0:z.outputTokens)||0)}),a.jsx(to,{label:"Total",value:St((z==null?void 0:z.totalTokens)||0),sub:`${St((z==null?void 0:z.runCount)||0)} runs`})]})]}),a.jsxs("div",{className:"rounded-lg border border-[var(--border)] bg-[var(--surface)] p-4",children:[a.jsx("div",{className:"mb-3 text-sm font-semibold",children:"All-time split by agent"}),a.jsxs("div",{className:"grid grid-cols-[160px_1fr] items-center gap-3 max-md:grid-cols-1",children:[a.jsx("svg",{viewBox:"0 0 42 42",className:"h-40 w-40 -rotate-90 max-md:mx-auto",children:(()=>{let g=0;return E.map((w,C)=>{const j=w.totalTokens/p*100,O=`${j} ${100-j}`,T=a.jsx("circle",{cx:"21",cy:"21",r:"15.915",fill:"transparent",stroke:tt[C%tt.length],strokeWidth:"6",strokeDasharray:O,strokeDashoffset:-g},w.agentId);return g+=j,T})})()}),a.jsx("div",{className:"space-y-1 text-xs",children:E.map((g,w)=>a.jsxs("div",{className:"flex items-center justify-between gap-2",children:[a.jsxs("span",{children:[a.jsx("span",{className:"mr-1 inline-block h-2 w-2 rounded-full",style:{background:tt[w%tt.length]}}),g.agentId]}),a.jsxs("span",{className:"text-[var(--text-3)]",children:[Math.round(g.totalTokens/p*100),"%"]})]},g.agentId))})]})]}),a.jsxs("div",{className:"rounded-lg border border-[var(--border)] bg-[var(--surface)] p-4",children:[a.jsxs("div",{className:"mb-3 flex items-center justify-between",children:[a.jsx("div",{className:"text-sm font-semibold",children:"Leaderboard"}),a.jsxs("div",{className:"flex gap-1 rounded-lg border border-[var(--border)] bg-[var(--surface-2)] p-0.5",children:[a.jsx("button",{className:`h-8 rounded-md border px-3 font-mono text-[0.7rem] ${v==="tokens"?"border-[var(--accent-active-border)] bg-[var(--accent-active-bg)] text-[var(--accent-active-text)]":"border-transparent text-[var(--text-3)]"}`,onClick:()=>m("tokens"),children:"tokens"}),a.jsx("button",{className:`h-8 rounded-md border px-3 font-mono text-[0.7rem] ${v==="runs"?"border-[var(--accent-active-border)] bg-[var(--accent-active-bg)] text-[var(--accent-active-text)]":"border-transparent text-[var(--text-3)]"}`,onClick:()=>m("runs"),children:"runs"})]})]}),a.jsx("div",{className:"space-y-2",children:c.map((g,w)=>a.jsxs("div",{className:"grid grid-cols-[52px_1fr_auto] items-center gap-2 rounded-md border border-[var(--border)] bg-[var(--surface-2)] px-2.5 py-2",children:[a.jsxs("div",{className:"font-mono text-[0.72rem] text-[var(--text-3)]",children:["#",w+1]}),a.jsx("div",{className:"text-[0.82rem]",children:g.agentId}),a.jsx("div",{className:"font-mono text-[0.8rem]",children:St(pp(g,v))})]},g.agentId))})]})]})}function to({label:e,value:t,sub:n}){return a.jsxs("div",{className:"rounded-lg border border-l-[3px] border-l-[var(--blue)] border-[var(--border)] bg-[var(--surface-2)] p-3",children:[a.jsx("div",{className:"text-[0.7rem] uppercase tracking-[0.08em] text-[var(--text-3)]",children:e}),a.jsx("div",{className:"mt-1 font-mono text-lg font-bold",children:t}),n?a.jsx("div",{className:"font-mono text-[0.65rem] text-[var(--text-3)]",children:n}):null]})}const ts="agent-monitor-theme",ns="agent-monitor-filters-v1";function vp(){const e=new URLSearchParams(window.location.search),t=(()=>{try{return JSON.parse(localStorage.getItem(ns)||"{}")}catch{return{}}})(),[n,r]=F.useState(e.get("page")||t.page||"monitor"),[l,o]=F.useState(e.get("laneMode")||t.laneMode||"list"),[u,i]=F.useState(10),[s,d]=F.useState([]),[h,v]=F.useState(),[m,k]=F.useState(),[S,E]=F.useState(e.get("agent")||t.agent||"all"),[z,f]=F.useState(e.get("status")||t.status||"all"),[c,p]=F.useState(()=>localStorage.getItem(ts)!=="light"),[y,g]=F.useState(e.get("q")||t.q||""),[w,C]=F.useState(e.get("window")||t.window||"24"),[j,O]=F.useState(""),[T,ie]=F.useState(e.get("period")||t.period||"daily"),[Y,Le]=F.useState(()=>{const N=es(e.get("period")||t.period||"daily");return At({start:e.get("start")||t.start||N.start,end:e.get("end")||t.end||N.end})});F.useEffect(()=>{document.documentElement.classList.toggle("dark",c),localStorage.setItem(ts,c?"dark":"light")},[c]),F.useEffect(()=>{const N={page:n,laneMode:l,agent:S,status:z,q:y,window:w,period:T,start:Y.start,end:Y.end};localStorage.setItem(ns,JSON.stringify(N));const M=new URLSearchParams;Object.entries(N).forEach(([Ee,ge])=>{ge&&ge!=="all"&&M.set(Ee,String(ge))});const R=`${window.location.pathname}${M.toString()?`?${M.toString()}`:""}`;window.history.replaceState({},"",R)},[n,l,S,z,y,w,T,Y]);const $t=async()=>{const N=new URLSearchParams({limit:"250",offset:"0"}),M=await Jf(N);d(M.items),O(new Date().toLocaleTimeString());const R=At(Y);(R.start!==Y.start||R.end!==Y.end)&&Le(R);const Ee=String(cp(R.start,R.end)),ge=T==="daily"?Ee:T==="weekly"?"16":"12",xn=await bf(new URLSearchParams({days:n==="reporting"?Ee:"1",period:T,bucketCount:ge,scope:"all",includeRunning:"1",includeStaleRunning:"1",startDate:R.start,endDate:R.end}));v(xn)};F.useEffect(()=>{if($t(),u<=0)return;const N=setInterval($t,u*1e3);return()=>clearInterval(N)},[u,n,T,Y]);const ar=F.useMemo(()=>{let N=[...s];if(S!=="all"&&(N=N.filter(R=>R.agentId===S)),z!=="all"&&(N=N.filter(R=>(R.status==="running"?Pt(R):R.status)===z)),w!=="0"){const R=Date.now()-Number(w)*36e5;N=N.filter(Ee=>!Ee.startedAt||Ee.startedAt>=R)}const M=y.trim().toLowerCase();return M&&(N=N.filter(R=>`${R.label||""} ${R.task||""} ${R.agentId||""} ${R.model||""}`.toLowerCase().includes(M))),N},[s,S,z,w,y]),gn=async N=>k(await qf(N)),yn=N=>{ie(N),Le(At(es(N)))},_=()=>{const N=new Date(`${Y.start}T00:00:00`),M=new Date(`${Y.end}T00:00:00`);N.setDate(N.getDate()-7),M.setDate(M.getDate()-7),Le(At({start:N.toISOString().slice(0,10),end:M.toISOString().slice(0,10)}))},L=()=>{const N=new Date(`${Y.start}T00:00:00`),M=new Date(`${Y.end}T00:00:00`);N.setDate(N.getDate()+7),M.setDate(M.getDate()+7),Le(At({start:N.toISOString().slice(0,10),end:M.toISOString().slice(0,10)},dl()))};return a.jsxs("div",{children:[a.jsx(ep,{laneMode:l,setLaneMode:o,interval:u,setIntervalSec:i,dark:c,toggleTheme:()=>p(N=>!N),refresh:$t,lastUpdate:j}),a.jsxs("div",{className:"flex gap-1 border-b border-[var(--border)] bg-[var(--surface)] px-4 py-2 md:px-8",children:[a.jsx("button",{className:`rounded-lg border px-3 py-1.5 font-mono text-[0.72rem] ${n==="monitor"?"border-[var(--accent-active-border-soft)] bg-[var(--accent-active-bg-soft)] text-[var(--text)]":"border-transparent text-[var(--text-2)]"}`,onClick:()=>r("monitor"),children:"Monitor"}),a.jsx("button",{className:`rounded-lg border px-3 py-1.5 font-mono text-[0.72rem] ${n==="reporting"?"border-[var(--accent-active-border-soft)] bg-[var(--accent-active-bg-soft)] text-[var(--text)]":"border-transparent text-[var(--text-2)]"}`,onClick:()=>r("reporting"),children:"Reporting"})]}),n==="monitor"?a.jsxs("div",{className:"flex min-h-[calc(100vh-94px)] max-lg:flex-col",children:[a.jsx(np,{runs:s,selectedAgent:S,setSelectedAgent:E,stateFilter:z,setStateFilter:f}),a.jsxs("main",{className:"flex-1 overflow-y-auto px-4 py-5 md:px-8 md:py-6",children:[a.jsx(rp,{runs:ar}),a.jsxs("div",{className:"mb-6 grid grid-cols-[minmax(0,1.8fr)_repeat(3,minmax(0,1fr))] gap-3 rounded-[10px] border border-[var(--border)] bg-[linear-gradient(180deg,var(--surface-tint-1),var(--surface-tint-0))] p-3 max-lg:grid-cols-1",children:[a.jsxs("div",{className:"flex min-w-0 flex-col gap-1.5",children:[a.jsx("label",{className:"pl-0.5 font-mono text-[0.65rem] uppercase tracking-[0.08em] text-[var(--text-3)]",children:"Search"}),a.jsx("input",{className:"h-9 w-full rounded-lg border border-[var(--border)] bg-[var(--surface-2)] px-3 font-mono text-[0.78rem]",value:y,onChange:N=>g(N.target.value),placeholder:"Search label, task, agent, or model"})]}),a.jsxs("div",{className:"flex min-w-0 flex-col gap-1.5",children:[a.jsx("label",{className:"pl-0.5 font-mono text-[0.65rem] uppercase tracking-[0.08em] text-[var(--text-3)]",children:"Status"}),a.jsxs("select",{className:"h-9 w-full rounded-lg border border-[var(--border)] bg-[var(--surface-2)] px-3 font-mono text-[0.78rem]",value:z,onChange:N=>f(N.target.value),children:[a.jsx("option",{value:"all",children:"all statuses"}),a.jsx("option",{value:"running",children:"running"}),a.jsx("option",{value:"quiet",children:"quiet"}),a.jsx("option",{value:"stalled",children:"stalled"}),a.jsx("option",{value:"dead",children:"dead"})]})]}),a.jsxs("div",{className:"flex min-w-0 flex-col gap-1.5",children:[a.jsx("label",{className:"pl-0.5 font-mono text-[0.65rem] uppercase tracking-[0.08em] text-[var(--text-3)]",children:"Time window"}),a.jsxs("select",{className:"h-9 w-full rounded-lg border border-[var(--border)] bg-[var(--surface-2)] px-3 font-mono text-[0.78rem]",value:w,onChange:N=>C(N.target.value),children:[a.jsx("option",{value:"0",children:"all time"}),a.jsx("option",{value:"1",children:"last 1h"}),a.jsx("option",{value:"6",children:"last 6h"}),a.jsx("option",{value:"24",children:"last 24h"}),a.jsx("option",{value:"168",children:"last 7d"})]})]}),a.jsxs("div",{className:"flex min-w-0 flex-col gap-1.5",children:[a.jsx("label",{className:"pl-0.5 font-mono text-[0.65rem] uppercase tracking-[0.08em] text-[var(--text-3)]",children:"Actions"}),a.jsx("button",{className:"h-9 rounded-lg border border-[var(--border)] bg-[var(--surface-2)] px-3 font-mono text-[0.76rem] text-[var(--text-2)]",onClick:()=>{g(""),f("all"),C("24"),E("all")},children:"Clear filters"})]})]}),a.jsx(lp,{runs:ar,laneMode:l,onSelect:gn})]})]}):a.jsx("main",{className:"mx-auto max-w-[1240px] px-4 py-6 md:px-8",children:a.jsx(mp,{data:h,period:T,onPeriodChange:yn,range:Y,onRangeChange:N=>Le(At(N)),onPrevWeek:_,onNextWeek:L})}),a.jsx(ip,{run:m,close:()=>k(void 0)})]})}no.createRoot(document.getElementById("root")).render(a.jsx(Fc.StrictMode,{children:a.jsx(vp,{})}));